@@ -0,0 +1,140 @@
+"""partition transaction_events by month
+
+Revision ID: b7d2e4f6a8c1
+Revises: 7146515fc608
+Create Date: 2025-10-18 09:00:00.000000
+
+Rebuilds transaction_events as a table declaratively range-partitioned by
+event_timestamp, one partition per month plus a default partition. Existing
+rows are copied into the matching monthly partitions. Further partitions are
+created (and expired ones detached) by app.db.partitioning maintenance.
+
+"""
+from datetime import date, datetime, timezone
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a8c1'
+down_revision: Union[str, None] = '7146515fc608'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_MONTHS = 3
+
+INDEXES = [
+    ('idx_transaction_events_category', ['event_category']),
+    ('idx_transaction_events_category_status', ['event_category', 'status', 'event_timestamp']),
+    ('idx_transaction_events_correlation', ['correlation_id']),
+    ('idx_transaction_events_event_type', ['event_type']),
+    ('idx_transaction_events_operation', ['operation_name']),
+    ('idx_transaction_events_status', ['status']),
+    ('idx_transaction_events_timestamp', ['event_timestamp']),
+    ('idx_transaction_events_transaction_id', ['transaction_id']),
+    ('idx_transaction_events_tx_type_time', ['transaction_id', 'event_type', 'event_timestamp']),
+    ('idx_transaction_events_user_id', ['user_id']),
+    ('ix_transaction_events_is_active', ['is_active']),
+]
+
+# The partitioned PK leads with event_timestamp, so lookups by id alone
+# need their own (non-unique, partitioned) index
+ID_INDEX = 'idx_transaction_events_id'
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _months(first: date, last: date) -> List[date]:
+    months = []
+    current = date(first.year, first.month, 1)
+    while current <= last:
+        months.append(current)
+        current = _next_month(current)
+    return months
+
+
+def _drop_indexes(table: str) -> None:
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def _create_indexes(table: str) -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.rename_table('transaction_events', 'transaction_events_unpartitioned')
+    _drop_indexes('transaction_events_unpartitioned')
+    op.execute(
+        'ALTER TABLE transaction_events_unpartitioned '
+        'RENAME CONSTRAINT transaction_events_pkey TO transaction_events_unpartitioned_pkey'
+    )
+
+    op.execute(
+        'CREATE TABLE transaction_events ('
+        'LIKE transaction_events_unpartitioned INCLUDING DEFAULTS INCLUDING COMMENTS'
+        ') PARTITION BY RANGE (event_timestamp)'
+    )
+    op.create_primary_key('transaction_events_pkey', 'transaction_events', ['event_timestamp', 'id'])
+    op.create_foreign_key(
+        'transaction_events_transaction_id_fkey',
+        'transaction_events', 'transaction_headers',
+        ['transaction_id'], ['id'],
+        ondelete='CASCADE',
+    )
+    _create_indexes('transaction_events')
+    op.create_index(ID_INDEX, 'transaction_events', ['id'], unique=False)
+
+    today = datetime.now(timezone.utc).date()
+    oldest = bind.execute(
+        sa.text('SELECT min(event_timestamp) FROM transaction_events_unpartitioned')
+    ).scalar()
+    first = oldest.astimezone(timezone.utc).date() if oldest else today
+    last = date(today.year, today.month, 1)
+    for _ in range(PREMAKE_MONTHS):
+        last = _next_month(last)
+
+    for month in _months(first, last):
+        op.execute(
+            f"CREATE TABLE transaction_events_p{month:%Y_%m} PARTITION OF transaction_events "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        )
+    op.execute('CREATE TABLE transaction_events_default PARTITION OF transaction_events DEFAULT')
+
+    op.execute('INSERT INTO transaction_events SELECT * FROM transaction_events_unpartitioned')
+    op.drop_table('transaction_events_unpartitioned')
+
+
+def downgrade() -> None:
+    op.rename_table('transaction_events', 'transaction_events_partitioned')
+    _drop_indexes('transaction_events_partitioned')
+    op.drop_index(ID_INDEX, table_name='transaction_events_partitioned')
+    op.execute(
+        'ALTER TABLE transaction_events_partitioned '
+        'RENAME CONSTRAINT transaction_events_pkey TO transaction_events_partitioned_pkey'
+    )
+
+    op.execute(
+        'CREATE TABLE transaction_events ('
+        'LIKE transaction_events_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS)'
+    )
+    op.create_primary_key('transaction_events_pkey', 'transaction_events', ['id'])
+    op.create_foreign_key(
+        'transaction_events_transaction_id_fkey',
+        'transaction_events', 'transaction_headers',
+        ['transaction_id'], ['id'],
+        ondelete='CASCADE',
+    )
+    _create_indexes('transaction_events')
+
+    op.execute('INSERT INTO transaction_events SELECT * FROM transaction_events_partitioned')
+    # Dropping the parent drops all of its partitions
+    op.drop_table('transaction_events_partitioned')
@@ -0,0 +1,177 @@
+"""partition stock_movements by month and add balance snapshots
+
+Revision ID: c4e8f1a3b5d7
+Revises: b7d2e4f6a8c1
+Create Date: 2025-10-18 10:00:00.000000
+
+Rebuilds stock_movements as a table range-partitioned by movement_date, one
+partition per month plus a default partition, and creates
+stock_balance_snapshots for the per-(item, location, month) roll-ups written
+by the ledger compaction job. Snapshots are backfilled by the job's first run.
+
+"""
+from datetime import date, datetime, timezone
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8f1a3b5d7'
+down_revision: Union[str, None] = 'b7d2e4f6a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_MONTHS = 3
+
+INDEXES = [
+    ('idx_stock_movement_date', ['movement_date']),
+    ('idx_stock_movement_item', ['item_id']),
+    ('idx_stock_movement_item_date', ['item_id', 'movement_date']),
+    ('idx_stock_movement_location', ['location_id']),
+    ('idx_stock_movement_location_date', ['location_id', 'movement_date']),
+    ('idx_stock_movement_stock_level', ['stock_level_id']),
+    ('idx_stock_movement_transaction', ['transaction_header_id', 'transaction_line_id']),
+    ('idx_stock_movement_type', ['movement_type']),
+    ('ix_stock_movements_is_active', ['is_active']),
+]
+
+# The partitioned PK leads with movement_date, so lookups by id alone
+# need their own (non-unique, partitioned) index
+ID_INDEX = 'idx_stock_movement_id'
+
+FOREIGN_KEYS = [
+    ('fk_stock_movement_approved_by', 'users', 'approved_by_id'),
+    ('fk_stock_movement_item', 'items', 'item_id'),
+    ('fk_stock_movement_location', 'locations', 'location_id'),
+    ('fk_stock_movement_performed_by', 'users', 'performed_by_id'),
+    ('fk_stock_movement_stock_level', 'stock_levels', 'stock_level_id'),
+    ('fk_stock_movement_transaction_header', 'transaction_headers', 'transaction_header_id'),
+    ('fk_stock_movement_transaction_line', 'transaction_lines', 'transaction_line_id'),
+]
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _months(first: date, last: date) -> List[date]:
+    months = []
+    current = date(first.year, first.month, 1)
+    while current <= last:
+        months.append(current)
+        current = _next_month(current)
+    return months
+
+
+def _drop_indexes(table: str) -> None:
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def _create_indexes(table: str) -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def _drop_foreign_keys(table: str) -> None:
+    for name, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+
+def _create_foreign_keys(table: str) -> None:
+    for name, referent, column in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referent, [column], ['id'])
+
+
+def _rebuild_stock_movements(old: str, partitioned: bool) -> None:
+    """Move stock_movements aside as ``old`` and recreate it from it."""
+    op.rename_table('stock_movements', old)
+    _drop_indexes(old)
+    if not partitioned:
+        op.drop_index(ID_INDEX, table_name=old)
+    _drop_foreign_keys(old)
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT stock_movements_pkey TO {old}_pkey')
+
+    op.execute(
+        'CREATE TABLE stock_movements ('
+        f'LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS'
+        ')' + (' PARTITION BY RANGE (movement_date)' if partitioned else '')
+    )
+    op.create_primary_key(
+        'stock_movements_pkey', 'stock_movements',
+        ['movement_date', 'id'] if partitioned else ['id']
+    )
+    _create_foreign_keys('stock_movements')
+    _create_indexes('stock_movements')
+    if partitioned:
+        op.create_index(ID_INDEX, 'stock_movements', ['id'], unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    _rebuild_stock_movements('stock_movements_unpartitioned', partitioned=True)
+
+    today = datetime.now(timezone.utc).date()
+    oldest = bind.execute(
+        sa.text('SELECT min(movement_date) FROM stock_movements_unpartitioned')
+    ).scalar()
+    first = oldest.astimezone(timezone.utc).date() if oldest else today
+    last = date(today.year, today.month, 1)
+    for _ in range(PREMAKE_MONTHS):
+        last = _next_month(last)
+
+    for month in _months(first, last):
+        op.execute(
+            f"CREATE TABLE stock_movements_p{month:%Y_%m} PARTITION OF stock_movements "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        )
+    op.execute('CREATE TABLE stock_movements_default PARTITION OF stock_movements DEFAULT')
+
+    op.execute('INSERT INTO stock_movements SELECT * FROM stock_movements_unpartitioned')
+    op.drop_table('stock_movements_unpartitioned')
+
+    op.create_table('stock_balance_snapshots',
+    sa.Column('item_id', sa.UUID(), nullable=False, comment='Item the snapshot covers'),
+    sa.Column('location_id', sa.UUID(), nullable=False, comment='Location the snapshot covers'),
+    sa.Column('period_start', sa.Date(), nullable=False, comment='First day of the (UTC) month the snapshot covers'),
+    sa.Column('opening_quantity', sa.Numeric(precision=12, scale=2), nullable=False, comment='Quantity before the first movement of the month'),
+    sa.Column('closing_quantity', sa.Numeric(precision=12, scale=2), nullable=False, comment='Quantity after the last movement of the month'),
+    sa.Column('movement_count', sa.Integer(), nullable=False, comment='Number of movements in the month'),
+    sa.Column('total_increase', sa.Numeric(precision=14, scale=2), nullable=False, comment='Sum of positive quantity changes'),
+    sa.Column('total_decrease', sa.Numeric(precision=14, scale=2), nullable=False, comment='Sum of negative quantity changes (as a positive number)'),
+    sa.Column('movements_by_type', sa.JSON(), nullable=False, comment='Movement count per movement type'),
+    sa.Column('quantity_by_type', sa.JSON(), nullable=False, comment='Absolute quantity moved per movement type'),
+    sa.Column('compacted_at', sa.DateTime(timezone=True), nullable=False, comment='When the month was last compacted'),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], name='fk_stock_balance_snapshot_item'),
+    sa.ForeignKeyConstraint(['location_id'], ['locations.id'], name='fk_stock_balance_snapshot_location'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('item_id', 'location_id', 'period_start', name='uq_stock_balance_snapshot_period')
+    )
+    op.create_index('idx_stock_balance_snapshot_period', 'stock_balance_snapshots', ['period_start'], unique=False)
+    op.create_index('idx_stock_balance_snapshot_location_period', 'stock_balance_snapshots', ['location_id', 'period_start'], unique=False)
+    op.create_index(op.f('ix_stock_balance_snapshots_is_active'), 'stock_balance_snapshots', ['is_active'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_stock_balance_snapshots_is_active'), table_name='stock_balance_snapshots')
+    op.drop_index('idx_stock_balance_snapshot_location_period', table_name='stock_balance_snapshots')
+    op.drop_index('idx_stock_balance_snapshot_period', table_name='stock_balance_snapshots')
+    op.drop_table('stock_balance_snapshots')
+
+    _rebuild_stock_movements('stock_movements_partitioned', partitioned=False)
+
+    op.execute('INSERT INTO stock_movements SELECT * FROM stock_movements_partitioned')
+    # Dropping the parent drops all of its partitions
+    op.drop_table('stock_movements_partitioned')
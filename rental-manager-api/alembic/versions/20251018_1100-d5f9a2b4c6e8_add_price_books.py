@@ -0,0 +1,98 @@
+"""add effective-dated price books and cache versions
+
+Revision ID: d5f9a2b4c6e8
+Revises: c4e8f1a3b5d7
+Create Date: 2025-10-18 11:00:00.000000
+
+Creates price_books / price_book_entries for per-location, per-customer-segment
+rate tables and cache_versions, whose 'price_books' row is bumped on every
+price book edit so workers recompile their in-memory rate lookup.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f9a2b4c6e8'
+down_revision: Union[str, None] = 'c4e8f1a3b5d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns():
+    return [
+        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('created_by', sa.String(length=255), nullable=True),
+        sa.Column('updated_by', sa.String(length=255), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('price_books',
+    sa.Column('name', sa.String(length=100), nullable=False, comment='Price book name'),
+    sa.Column('code', sa.String(length=30), nullable=False, comment='Unique price book code'),
+    sa.Column('description', sa.Text(), nullable=True, comment='Price book description'),
+    sa.Column('location_id', sa.UUID(), nullable=True, comment='Location the book is limited to (all locations if null)'),
+    sa.Column('customer_segment', sa.String(length=20), nullable=True, comment='Customer tier the book is limited to (all customers if null)'),
+    sa.Column('effective_from', sa.Date(), nullable=False, comment='First day the rates apply'),
+    sa.Column('effective_to', sa.Date(), nullable=True, comment='First day the rates no longer apply (open-ended if null)'),
+    sa.Column('priority', sa.Integer(), nullable=False, comment='Higher wins between books of the same scope'),
+    *_base_columns(),
+    sa.CheckConstraint('effective_to IS NULL OR effective_to > effective_from', name='check_price_book_effective_range'),
+    sa.CheckConstraint("customer_segment IS NULL OR customer_segment IN ('BRONZE', 'SILVER', 'GOLD', 'PLATINUM')", name='check_price_book_customer_segment'),
+    sa.ForeignKeyConstraint(['location_id'], ['locations.id'], name='fk_price_book_location'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_price_books_code'), 'price_books', ['code'], unique=True)
+    op.create_index('idx_price_book_scope', 'price_books', ['location_id', 'customer_segment', 'effective_from'], unique=False)
+    op.create_index(op.f('ix_price_books_is_active'), 'price_books', ['is_active'], unique=False)
+
+    op.create_table('price_book_entries',
+    sa.Column('price_book_id', sa.UUID(), nullable=False, comment='Owning price book'),
+    sa.Column('item_id', sa.UUID(), nullable=False, comment='Priced item'),
+    sa.Column('rental_rate_per_day', sa.Numeric(precision=10, scale=2), nullable=False, comment='Daily rental rate'),
+    sa.Column('weekly_rate', sa.Numeric(precision=10, scale=2), nullable=True, comment='Rate for 7 days'),
+    sa.Column('monthly_rate', sa.Numeric(precision=10, scale=2), nullable=True, comment='Rate for 30 days'),
+    sa.Column('sale_price', sa.Numeric(precision=10, scale=2), nullable=True, comment='Selling price'),
+    sa.Column('security_deposit', sa.Numeric(precision=10, scale=2), nullable=True, comment='Deposit per unit; item default if null'),
+    *_base_columns(),
+    sa.CheckConstraint('rental_rate_per_day >= 0', name='check_price_book_entry_rate_positive'),
+    sa.ForeignKeyConstraint(['price_book_id'], ['price_books.id'], name='fk_price_book_entry_book', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], name='fk_price_book_entry_item'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('price_book_id', 'item_id', name='uq_price_book_entry_item')
+    )
+    op.create_index(op.f('ix_price_book_entries_item_id'), 'price_book_entries', ['item_id'], unique=False)
+    op.create_index(op.f('ix_price_book_entries_is_active'), 'price_book_entries', ['is_active'], unique=False)
+
+    op.create_table('cache_versions',
+    sa.Column('namespace', sa.String(length=100), nullable=False, comment='Cached data set'),
+    sa.Column('version', sa.BigInteger(), nullable=False, comment='Incremented on every edit'),
+    *_base_columns(),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('namespace')
+    )
+    op.create_index(op.f('ix_cache_versions_is_active'), 'cache_versions', ['is_active'], unique=False)
+
+    # Seed the counter so concurrent first edits only ever UPDATE it
+    op.execute("INSERT INTO cache_versions (namespace, version, is_active) VALUES ('price_books', 1, true)")
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cache_versions_is_active'), table_name='cache_versions')
+    op.drop_table('cache_versions')
+    op.drop_index(op.f('ix_price_book_entries_is_active'), table_name='price_book_entries')
+    op.drop_index(op.f('ix_price_book_entries_item_id'), table_name='price_book_entries')
+    op.drop_table('price_book_entries')
+    op.drop_index(op.f('ix_price_books_is_active'), table_name='price_books')
+    op.drop_index('idx_price_book_scope', table_name='price_books')
+    op.drop_index(op.f('ix_price_books_code'), table_name='price_books')
+    op.drop_table('price_books')
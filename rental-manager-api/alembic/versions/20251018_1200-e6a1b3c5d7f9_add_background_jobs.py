@@ -0,0 +1,59 @@
+"""add background jobs
+
+Revision ID: e6a1b3c5d7f9
+Revises: d5f9a2b4c6e8
+Create Date: 2025-10-18 12:00:00.000000
+
+Creates background_jobs, the persistent record of long-running operations
+(bulk imports) with progress counters and a per-row error report that
+clients poll while the job runs.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a1b3c5d7f9'
+down_revision: Union[str, None] = 'd5f9a2b4c6e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('background_jobs',
+    sa.Column('job_type', sa.String(length=50), nullable=False, comment='Kind of operation, e.g. item_import'),
+    sa.Column('status', sa.String(length=20), nullable=False, comment='PENDING, RUNNING, COMPLETED or FAILED'),
+    sa.Column('total_rows', sa.Integer(), nullable=True, comment='Input size, once known'),
+    sa.Column('processed_rows', sa.Integer(), nullable=False, comment='Rows handled so far'),
+    sa.Column('succeeded_rows', sa.Integer(), nullable=False, comment='Rows inserted'),
+    sa.Column('updated_rows', sa.Integer(), nullable=False, comment='Rows that updated an existing record'),
+    sa.Column('skipped_rows', sa.Integer(), nullable=False, comment='Rows left unchanged'),
+    sa.Column('failed_rows', sa.Integer(), nullable=False, comment='Rows rejected'),
+    sa.Column('errors', sa.JSON(), nullable=True, comment='Per-row errors: [{row, field, message}]'),
+    sa.Column('result', sa.JSON(), nullable=True, comment='Job-specific summary'),
+    sa.Column('error_message', sa.Text(), nullable=True, comment='Reason the job failed'),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True, comment='When the worker picked the job up'),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True, comment='When the job completed or failed'),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_background_jobs_job_type'), 'background_jobs', ['job_type'], unique=False)
+    op.create_index('idx_background_job_status_created', 'background_jobs', ['status', 'created_at'], unique=False)
+    op.create_index(op.f('ix_background_jobs_is_active'), 'background_jobs', ['is_active'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_background_jobs_is_active'), table_name='background_jobs')
+    op.drop_index('idx_background_job_status_created', table_name='background_jobs')
+    op.drop_index(op.f('ix_background_jobs_job_type'), table_name='background_jobs')
+    op.drop_table('background_jobs')
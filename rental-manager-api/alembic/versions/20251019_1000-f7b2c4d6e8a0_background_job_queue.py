@@ -0,0 +1,35 @@
+"""background job queue
+
+Revision ID: f7b2c4d6e8a0
+Revises: e6a1b3c5d7f9
+Create Date: 2025-10-19 10:00:00.000000
+
+Turns background_jobs into a work queue: the handler payload, a unique
+client idempotency key and a cancellation flag.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b2c4d6e8a0'
+down_revision: Union[str, None] = 'e6a1b3c5d7f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('background_jobs', sa.Column('payload', sa.JSON(), nullable=True, comment='Handler input, e.g. item ids and the operation'))
+    op.add_column('background_jobs', sa.Column('idempotency_key', sa.String(length=255), nullable=True, comment='Client-supplied key; resubmitting it returns the existing job'))
+    op.add_column('background_jobs', sa.Column('cancel_requested', sa.Boolean(), server_default=sa.false(), nullable=False, comment='Set by a cancel request; the handler stops at its next checkpoint'))
+    op.create_unique_constraint('background_jobs_idempotency_key_key', 'background_jobs', ['idempotency_key'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('background_jobs_idempotency_key_key', 'background_jobs', type_='unique')
+    op.drop_column('background_jobs', 'cancel_requested')
+    op.drop_column('background_jobs', 'idempotency_key')
+    op.drop_column('background_jobs', 'payload')
@@ -0,0 +1,51 @@
+"""add item rental block history
+
+Revision ID: a8c3d5e7f9b1
+Revises: f7b2c4d6e8a0
+Create Date: 2025-10-19 12:00:00.000000
+
+Persists item rental block changes, which were previously only logged,
+so the bulk toggle and the auto-unblock sweep can write them in bulk.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3d5e7f9b1'
+down_revision: Union[str, None] = 'f7b2c4d6e8a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('item_rental_block_history',
+    sa.Column('item_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Item whose rental status changed'),
+    sa.Column('is_blocked', sa.Boolean(), nullable=False, comment='Rental blocked after the change'),
+    sa.Column('previous_status', sa.Boolean(), nullable=False, comment='Rental blocked before the change'),
+    sa.Column('remarks', sa.Text(), nullable=True, comment='Reason given for the change'),
+    sa.Column('changed_by', postgresql.UUID(as_uuid=True), nullable=True, comment='User who made the change (null for automatic changes)'),
+    sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, comment='When the change was made'),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], name='fk_item_rental_block_history_item', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_item_rental_block_history_item_changed', 'item_rental_block_history', ['item_id', 'changed_at'], unique=False)
+    op.create_index(op.f('ix_item_rental_block_history_is_active'), 'item_rental_block_history', ['is_active'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_item_rental_block_history_is_active'), table_name='item_rental_block_history')
+    op.drop_index('idx_item_rental_block_history_item_changed', table_name='item_rental_block_history')
+    op.drop_table('item_rental_block_history')
@@ -0,0 +1,67 @@
+"""add customer credit exposures
+
+Revision ID: b9d4e6f8a0c2
+Revises: a8c3d5e7f9b1
+Create Date: 2025-10-19 14:00:00.000000
+
+Per-customer outstanding sales balance and due dates, maintained by sale
+creation, payment and cancellation so the credit check reads one row.
+Backfilled here from the open sales; reconciled nightly afterwards.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d4e6f8a0c2'
+down_revision: Union[str, None] = 'a8c3d5e7f9b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customer_credit_exposures',
+    sa.Column('customer_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Customer the exposure belongs to'),
+    sa.Column('outstanding_balance', sa.Numeric(precision=15, scale=2), nullable=False, comment='Sum of balance due over open sales'),
+    sa.Column('open_sales_count', sa.Integer(), nullable=False, comment='Number of open sales'),
+    sa.Column('oldest_due_date', sa.Date(), nullable=True, comment='Earliest due date among open sales'),
+    sa.Column('overdue_count', sa.Integer(), nullable=False, comment='Open sales past their due date (exact as of the last reconcile)'),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], name='fk_customer_credit_exposure_customer', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('customer_id')
+    )
+    op.create_index(op.f('ix_customer_credit_exposures_is_active'), 'customer_credit_exposures', ['is_active'], unique=False)
+
+    op.execute("""
+        INSERT INTO customer_credit_exposures
+            (customer_id, outstanding_balance, open_sales_count, oldest_due_date, overdue_count, is_active)
+        SELECT customer_id,
+               SUM(total_amount - paid_amount),
+               COUNT(*),
+               MIN(due_date),
+               COUNT(*) FILTER (WHERE due_date < CURRENT_DATE),
+               true
+        FROM transaction_headers
+        WHERE transaction_type = 'SALE'
+          AND status != 'CANCELLED'
+          AND payment_status != 'PAID'
+          AND customer_id IS NOT NULL
+        GROUP BY customer_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_customer_credit_exposures_is_active'), table_name='customer_credit_exposures')
+    op.drop_table('customer_credit_exposures')
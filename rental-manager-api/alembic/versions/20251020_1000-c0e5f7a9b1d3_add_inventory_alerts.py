@@ -0,0 +1,71 @@
+"""add inventory alerts
+
+Revision ID: c0e5f7a9b1d3
+Revises: b9d4e6f8a0c2
+Create Date: 2025-10-20 10:00:00.000000
+
+Materialized inventory alerts maintained by the alert engine, with a
+partial unique index that keeps one live alert per condition and subject.
+Also indexes the unit dates the periodic sweep filters on. The table is
+filled by the sweep, which runs when the scheduler starts.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0e5f7a9b1d3'
+down_revision: Union[str, None] = 'b9d4e6f8a0c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('inventory_alerts',
+    sa.Column('alert_type', sa.String(length=30), nullable=False, comment='InventoryAlertType'),
+    sa.Column('severity', sa.String(length=20), nullable=False, comment='InventoryAlertSeverity'),
+    sa.Column('status', sa.String(length=20), nullable=False, comment='InventoryAlertStatus'),
+    sa.Column('subject_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Stock level (LOW_STOCK) or inventory unit the alert is about'),
+    sa.Column('item_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Item the alert is about'),
+    sa.Column('location_id', postgresql.UUID(as_uuid=True), nullable=True, comment='Location of the stock level or unit'),
+    sa.Column('message', sa.Text(), nullable=False, comment='Human-readable alert text'),
+    sa.Column('quantity', sa.Numeric(precision=10, scale=2), nullable=True, comment='Available quantity (LOW_STOCK)'),
+    sa.Column('threshold', sa.Numeric(precision=10, scale=2), nullable=True, comment='Reorder point that was crossed (LOW_STOCK)'),
+    sa.Column('due_date', sa.DateTime(timezone=True), nullable=True, comment='Maintenance date or warranty expiry the alert is about'),
+    sa.Column('raised_at', sa.DateTime(timezone=True), nullable=False, comment='When the alert was raised'),
+    sa.Column('acknowledged_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('acknowledged_by', postgresql.UUID(as_uuid=True), nullable=True, comment='User who acknowledged the alert'),
+    sa.Column('resolved_at', sa.DateTime(timezone=True), nullable=True, comment='When the condition cleared'),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], name='fk_inventory_alert_item', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['location_id'], ['locations.id'], name='fk_inventory_alert_location', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('uq_inventory_alert_live_subject', 'inventory_alerts', ['alert_type', 'subject_id'], unique=True, postgresql_where=sa.text("status <> 'RESOLVED'"))
+    op.create_index('idx_inventory_alert_status_raised', 'inventory_alerts', ['status', 'raised_at'], unique=False)
+    op.create_index('idx_inventory_alert_location_status_raised', 'inventory_alerts', ['location_id', 'status', 'raised_at'], unique=False)
+    op.create_index(op.f('ix_inventory_alerts_is_active'), 'inventory_alerts', ['is_active'], unique=False)
+
+    op.create_index('idx_inventory_unit_next_maintenance', 'inventory_units', ['next_maintenance_date'], unique=False)
+    op.create_index('idx_inventory_unit_warranty_expiry', 'inventory_units', ['warranty_expiry'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_inventory_unit_warranty_expiry', table_name='inventory_units')
+    op.drop_index('idx_inventory_unit_next_maintenance', table_name='inventory_units')
+    op.drop_index(op.f('ix_inventory_alerts_is_active'), table_name='inventory_alerts')
+    op.drop_index('idx_inventory_alert_location_status_raised', table_name='inventory_alerts')
+    op.drop_index('idx_inventory_alert_status_raised', table_name='inventory_alerts')
+    op.drop_index('uq_inventory_alert_live_subject', table_name='inventory_alerts')
+    op.drop_table('inventory_alerts')
@@ -0,0 +1,49 @@
+"""add entity stat counters
+
+Revision ID: d1f6a8b0c2e4
+Revises: c0e5f7a9b1d3
+Create Date: 2025-10-21 09:00:00.000000
+
+Counter table behind the master-data stats endpoints. The counters are
+filled by the statistics reconcile, which runs when the scheduler starts
+and corrects any counts written before it.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f6a8b0c2e4'
+down_revision: Union[str, None] = 'c0e5f7a9b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('entity_stat_counters',
+    sa.Column('entity', sa.String(length=50), nullable=False, comment="Counted table, e.g. 'items'"),
+    sa.Column('dimension', sa.String(length=50), nullable=False, comment='Counted attribute or measure'),
+    sa.Column('bucket', sa.String(length=255), nullable=False, comment="Attribute value ('' for measures)"),
+    sa.Column('count', sa.BigInteger(), nullable=False, comment='Rows in the bucket (non-null values for a measure)'),
+    sa.Column('total', sa.Numeric(precision=18, scale=2), nullable=False, comment="Sum of a measure's values"),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('entity', 'dimension', 'bucket', name='uq_entity_stat_counter')
+    )
+    op.create_index(op.f('ix_entity_stat_counters_is_active'), 'entity_stat_counters', ['is_active'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_entity_stat_counters_is_active'), table_name='entity_stat_counters')
+    op.drop_table('entity_stat_counters')
+    op.execute("DELETE FROM cache_versions WHERE namespace LIKE 'stats:%'")
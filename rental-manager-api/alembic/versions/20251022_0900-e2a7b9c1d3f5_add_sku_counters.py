@@ -0,0 +1,49 @@
+"""add sku counters
+
+Revision ID: e2a7b9c1d3f5
+Revises: d1f6a8b0c2e4
+Create Date: 2025-10-22 09:00:00.000000
+
+Counter table for generated item SKUs and a case-insensitive unique index
+on items.sku. Counters are created on first use, starting after the
+highest number existing SKUs took from the same template, so no backfill
+is needed. The index creation fails if two items differ only in SKU case;
+resolve those first.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7b9c1d3f5'
+down_revision: Union[str, None] = 'd1f6a8b0c2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sku_counters',
+    sa.Column('template', sa.String(length=255), nullable=False, comment='SKU template the counter numbers'),
+    sa.Column('next_value', sa.BigInteger(), nullable=False, comment='First number not yet handed out'),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False, comment='UUID primary key generated by PostgreSQL'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=255), nullable=True),
+    sa.Column('updated_by', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('template')
+    )
+    op.create_index(op.f('ix_sku_counters_is_active'), 'sku_counters', ['is_active'], unique=False)
+    op.create_index('uq_item_sku_upper', 'items', [sa.text('upper(sku)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_item_sku_upper', table_name='items')
+    op.drop_index(op.f('ix_sku_counters_is_active'), table_name='sku_counters')
+    op.drop_table('sku_counters')
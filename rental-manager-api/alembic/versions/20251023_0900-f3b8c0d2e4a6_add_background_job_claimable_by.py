@@ -0,0 +1,30 @@
+"""add background job claimable_by
+
+Revision ID: f3b8c0d2e4a6
+Revises: e2a7b9c1d3f5
+Create Date: 2025-10-23 09:00:00.000000
+
+Host restriction for queued jobs whose input is on one host's disk, such as
+file imports reading a spooled upload. Existing jobs stay claimable by any
+worker.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8c0d2e4a6'
+down_revision: Union[str, None] = 'e2a7b9c1d3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('background_jobs', sa.Column('claimable_by', sa.String(length=255), nullable=True, comment="Host whose workers may claim the job; any worker when empty"))
+
+
+def downgrade() -> None:
+    op.drop_column('background_jobs', 'claimable_by')
@@ -1,12 +1,12 @@
 from typing import Optional, Annotated
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.database import get_db
+from app.core.database import get_db, get_lean_session_factory, get_read_db, get_report_db
 from app.core.redis import get_redis, RedisManager
 from app.core.security import security_manager
+from app.crud import statements
 from app.models.user import User
 from app.schemas.common import PaginationParams
 
@@ -17,10 +17,13 @@ security = HTTPBearer()
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    session_factory: Annotated[async_sessionmaker, Depends(get_lean_session_factory)]
 ) -> User:
     """
     Get current authenticated user from JWT token
+
+    The user is read in its own autocommit session, closed before the
+    endpoint runs, so read-only endpoints add no transaction round trips.
     """
     token = credentials.credentials
     
@@ -34,10 +37,9 @@ async def get_current_user(
         )
     
     # Get user from database
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    async with session_factory() as session:
+        result = await session.execute(statements.user_by_id(user_id))
+        user = result.scalar_one_or_none()
     
     if not user:
         raise HTTPException(
@@ -148,6 +150,8 @@ async def get_request_id(request: Request) -> str:
 
 # Dependency injection types
 DatabaseDep = Annotated[AsyncSession, Depends(get_db)]
+ReadDatabaseDep = Annotated[AsyncSession, Depends(get_read_db)]
+ReportDatabaseDep = Annotated[AsyncSession, Depends(get_report_db)]
 RedisDep = Annotated[RedisManager, Depends(get_redis)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 ActiveUser = Annotated[User, Depends(get_current_active_user)]
@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 from typing import Any
 
-from app.api.v1.endpoints import auth, users, customers, suppliers, companies, contact_persons, categories, unit_of_measurement, brands, items, locations, analytics
+from app.api.v1.endpoints import auth, users, customers, suppliers, companies, contact_persons, categories, unit_of_measurement, brands, items, locations, analytics, rentals, price_books, jobs
 from app.api.v1.endpoints.inventory import router as inventory_router
 from app.core.config import settings
 
@@ -35,4 +35,7 @@ api_router.include_router(brands.router, prefix="/brands", tags=["brands"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
 api_router.include_router(locations.router, prefix="/locations", tags=["locations"])
 api_router.include_router(inventory_router, prefix="/inventory", tags=["inventory"])
-api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
\ No newline at end of file
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(rentals.router, prefix="/rentals", tags=["rentals"])
+api_router.include_router(price_books.router, prefix="/price-books", tags=["price-books"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
\ No newline at end of file
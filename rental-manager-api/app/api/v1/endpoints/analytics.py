@@ -8,7 +8,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_report_db, get_current_user
 from app.models.user import User
 
 router = APIRouter()
@@ -50,7 +50,7 @@ MOCK_RECENT_ACTIVITY = [
 async def get_dashboard_overview(
     start_date: Optional[date] = Query(None, description="Start date for data range"),
     end_date: Optional[date] = Query(None, description="End date for data range"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -90,7 +90,7 @@ async def get_dashboard_overview(
 async def get_dashboard_financial(
     start_date: Optional[date] = Query(None, description="Start date for data range"),
     end_date: Optional[date] = Query(None, description="End date for data range"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -149,7 +149,7 @@ async def get_dashboard_financial(
 async def get_dashboard_operational(
     start_date: Optional[date] = Query(None, description="Start date for data range"),
     end_date: Optional[date] = Query(None, description="End date for data range"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -188,7 +188,7 @@ async def get_dashboard_operational(
 
 @router.get("/dashboard/inventory")
 async def get_dashboard_inventory(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -228,7 +228,7 @@ async def get_dashboard_inventory(
 async def get_dashboard_customers(
     start_date: Optional[date] = Query(None, description="Start date for data range"),
     end_date: Optional[date] = Query(None, description="End date for data range"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -265,7 +265,7 @@ async def get_dashboard_customers(
 
 @router.get("/dashboard/kpis")
 async def get_dashboard_kpis(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -315,7 +315,7 @@ async def get_dashboard_kpis(
 @router.get("/dashboard/recent-activity")
 async def get_dashboard_recent_activity(
     limit: int = Query(10, description="Number of recent activities to return"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -403,7 +403,7 @@ async def export_dashboard_data(
     start_date: Optional[date] = Query(None, description="Start date for data range"),
     end_date: Optional[date] = Query(None, description="End date for data range"),
     format: str = Query("csv", description="Export format (csv, excel, pdf)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_report_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
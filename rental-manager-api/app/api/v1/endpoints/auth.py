@@ -42,7 +42,7 @@ async def register(
     user = User(
         email=user_in.email,
         username=user_in.username,
-        hashed_password=security_manager.get_password_hash(user_in.password),
+        hashed_password=await security_manager.get_password_hash_async(user_in.password),
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         phone=user_in.phone,
@@ -73,7 +73,16 @@ async def login(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not security_manager.verify_password(user_data.password, user.hashed_password):
+    verified = False
+    if user:
+        verified, new_hash = await security_manager.verify_and_update_password(
+            user_data.password, user.hashed_password
+        )
+        if verified and new_hash:
+            # Stored hash uses an outdated bcrypt cost; saved with the request's commit
+            user.hashed_password = new_hash
+    
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email/username or password",
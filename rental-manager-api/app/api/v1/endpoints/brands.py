@@ -1,6 +1,6 @@
 from typing import Optional, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 
 from app.services.brand import BrandService
@@ -10,11 +10,18 @@ from app.schemas.brand import (
     BrandBulkOperation, BrandBulkResult, BrandExport,
     BrandImport, BrandImportResult
 )
-from app.core.dependencies import get_brand_service, get_current_user_id
+from app.core.dependencies import get_brand_service, get_brand_read_service, get_current_user_id, get_idempotency_key
+from app.core.response_cache import CachedRoute, cached_route
+from app.models.brand import Brand
 from app.core.errors import (
     NotFoundError, ConflictError, ValidationError,
     BusinessRuleError
 )
+from app.schemas.background_job import BackgroundJobResponse
+from app.services.bulk_import import ImportFileFormat, detect_format, spool_upload
+from app.core.streaming_export import (
+    ExportFormat, SessionFactory, get_export_session_factory, streaming_export_response
+)
 
 
 router = APIRouter()
@@ -44,7 +51,7 @@ async def create_brand(
 @router.get("/{brand_id}", response_model=BrandResponse)
 async def get_brand(
     brand_id: UUID,
-    service: BrandService = Depends(get_brand_service)
+    service: BrandService = Depends(get_brand_read_service)
 ):
     """Get a brand by ID."""
     try:
@@ -67,7 +74,7 @@ async def list_brands(
     sort_field: str = Query("name", description="Sort field"),
     sort_direction: str = Query("asc", description="Sort direction (asc/desc)"),
     include_inactive: bool = Query(False, description="Include inactive brands"),
-    service: BrandService = Depends(get_brand_service)
+    service: BrandService = Depends(get_brand_read_service)
 ):
     """List brands with pagination and filtering."""
     try:
@@ -151,7 +158,7 @@ async def search_brands(
     q: str = Query(..., min_length=1, description="Search term"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     include_inactive: bool = Query(False, description="Include inactive brands"),
-    service: BrandService = Depends(get_brand_service)
+    service: BrandService = Depends(get_brand_read_service)
 ):
     """Search brands by name, code, or description."""
     return await service.search_brands(
@@ -163,10 +170,11 @@ async def search_brands(
 
 @router.get("/active/", response_model=List[BrandSummary])
 async def get_active_brands(
-    service: BrandService = Depends(get_brand_service)
+    service: BrandService = Depends(get_brand_read_service),
+    cache: CachedRoute = Depends(cached_route(Brand))
 ):
     """Get all active brands."""
-    return await service.get_active_brands()
+    return await cache.respond(List[BrandSummary], service.get_active_brands)
 
 
 @router.get("/stats/", response_model=BrandStats)
@@ -232,6 +240,20 @@ async def export_brands(
     return await service.export_brands(include_inactive=include_inactive)
 
 
+@router.get("/export/stream")
+async def stream_export_brands(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    include_inactive: bool = Query(False, description="Include inactive brands"),
+    search: Optional[str] = Query(None, description="Search in name, code, or description"),
+    service: BrandService = Depends(get_brand_read_service),
+    session_factory: SessionFactory = Depends(get_export_session_factory)
+):
+    """Stream every matching brand as CSV or NDJSON, without a row cap."""
+    query = service.repository.export_query(filters={"search": search}, include_inactive=include_inactive)
+    return streaming_export_response(session_factory, query, "brands", format, gzip)
+
+
 @router.post("/import", response_model=BrandImportResult)
 async def import_brands(
     import_data: List[BrandImport],
@@ -245,4 +267,29 @@ async def import_brands(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
+        )
+
+
+@router.post("/import/jobs", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_brands_file(
+    file: UploadFile = File(..., description="CSV or NDJSON file with one brand per row"),
+    format: Optional[ImportFileFormat] = Query(None, description="File format (default: from the file extension)"),
+    service: BrandService = Depends(get_brand_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """Import brands from an uploaded file in the background; poll /jobs/{id} for progress."""
+    path = await spool_upload(file)
+    try:
+        return await service.start_import_job(
+            path,
+            detect_format(file.filename, format),
+            created_by=current_user_id,
+            idempotency_key=idempotency_key
+        )
+    except ConflictError as e:
+        path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
         )
\ No newline at end of file
@@ -3,8 +3,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_user
+from app.core.dependencies import get_idempotency_key
+from app.core.response_cache import CachedRoute, cached_route
 from app.crud.category import CategoryRepository
+from app.models.category import Category
 from app.services.category import CategoryService
 from app.schemas.category import (
     CategoryCreate, CategoryUpdate, CategoryMove, CategoryResponse, 
@@ -17,6 +20,7 @@ from app.core.errors import (
     BusinessRuleError
 )
 from app.models.user import User
+from app.schemas.background_job import BackgroundJobResponse
 
 
 router = APIRouter()
@@ -28,6 +32,11 @@ def get_category_service(db: AsyncSession = Depends(get_db)) -> CategoryService:
     return CategoryService(repository)
 
 
+def get_category_read_service(db: AsyncSession = Depends(get_read_db)) -> CategoryService:
+    """Get category service instance for list and detail endpoints."""
+    return CategoryService(CategoryRepository(db))
+
+
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreate,
@@ -59,7 +68,7 @@ async def create_category(
 
 @router.get("/parents/", response_model=List[CategorySummary])
 async def get_parent_categories(
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Get all categories that are not marked as leaf (is_leaf = False)."""
     return await service.get_parent_categories()
@@ -68,7 +77,7 @@ async def get_parent_categories(
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get_category(
     category_id: UUID,
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Get a category by ID."""
     try:
@@ -96,7 +105,7 @@ async def list_categories(
     sort_field: str = Query("name", description="Field to sort by"),
     sort_direction: str = Query("asc", description="Sort direction (asc/desc)"),
     include_inactive: bool = Query(False, description="Include inactive categories"),
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """List categories with pagination, filtering, and sorting."""
     # Create filter object
@@ -220,19 +229,20 @@ async def delete_category(
 async def get_category_tree(
     root_id: Optional[UUID] = Query(None, description="Root category ID (None for full tree)"),
     include_inactive: bool = Query(False, description="Include inactive categories"),
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service),
+    cache: CachedRoute = Depends(cached_route(Category))
 ):
     """Get hierarchical category tree."""
-    return await service.get_category_tree(
-        root_id=root_id,
-        include_inactive=include_inactive
+    return await cache.respond(
+        List[CategoryTree],
+        lambda: service.get_category_tree(root_id=root_id, include_inactive=include_inactive)
     )
 
 
 @router.get("/{category_id}/hierarchy", response_model=CategoryHierarchy)
 async def get_category_hierarchy(
     category_id: UUID,
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Get category hierarchy information."""
     try:
@@ -249,7 +259,7 @@ async def search_categories(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     include_inactive: bool = Query(False, description="Include inactive categories"),
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Search categories by name or path."""
     return await service.search_categories(
@@ -261,7 +271,7 @@ async def search_categories(
 
 @router.get("/roots/", response_model=List[CategorySummary])
 async def get_root_categories(
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Get all root categories."""
     return await service.get_root_categories()
@@ -269,7 +279,7 @@ async def get_root_categories(
 
 @router.get("/leaves/", response_model=List[CategorySummary])
 async def get_leaf_categories(
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Get all leaf categories."""
     return await service.get_leaf_categories()
@@ -278,7 +288,7 @@ async def get_leaf_categories(
 @router.get("/{parent_id}/children", response_model=List[CategorySummary])
 async def get_category_children(
     parent_id: UUID,
-    service: CategoryService = Depends(get_category_service)
+    service: CategoryService = Depends(get_category_read_service)
 ):
     """Get direct children of a category."""
     try:
@@ -317,6 +327,27 @@ async def bulk_category_operation(
         )
 
 
+@router.post("/bulk-operation/jobs", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def bulk_category_operation_job(
+    operation: CategoryBulkOperation,
+    service: CategoryService = Depends(get_category_service),
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """Run a bulk category operation in the background; poll /jobs/{id} for progress."""
+    try:
+        return await service.start_bulk_operation_job(
+            operation=operation,
+            updated_by=current_user.username,
+            idempotency_key=idempotency_key
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+
 @router.get("/{category_id}/validate/{operation}", response_model=CategoryValidation)
 async def validate_category_operation(
     category_id: UUID,
@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 
 from app.services.company import CompanyService
 from app.schemas.company import (
@@ -25,6 +25,10 @@ async def get_company_service(session: AsyncSession = Depends(get_db)) -> Compan
     repository = CompanyRepository(session)
     return CompanyService(repository)
 
+async def get_company_read_service(session: AsyncSession = Depends(get_read_db)) -> CompanyService:
+    from app.crud.company import CompanyRepository
+    return CompanyService(CompanyRepository(session))
+
 router = APIRouter(tags=["company"])
 
 
@@ -67,7 +71,7 @@ async def create_company(
 @router.get("/{company_id}", response_model=CompanyResponse)
 async def get_company(
     company_id: UUID,
-    service: CompanyService = Depends(get_company_service)
+    service: CompanyService = Depends(get_company_read_service)
 ):
     """Get a company by ID."""
     try:
@@ -92,7 +96,7 @@ async def list_companies(
     sort_field: str = Query("company_name", description="Field to sort by"),
     sort_direction: str = Query("asc", description="Sort direction (asc/desc)"),
     include_inactive: bool = Query(False, description="Include inactive companies"),
-    service: CompanyService = Depends(get_company_service)
+    service: CompanyService = Depends(get_company_read_service)
 ):
     """List companies with pagination, filtering, and sorting."""
     # Create filter object
@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.errors import ValidationError, NotFoundError, ConflictError
 from app.services.contact_person import ContactPersonService
 from app.schemas.contact_person import (
@@ -23,6 +23,11 @@ def get_contact_person_service(session: AsyncSession = Depends(get_db)) -> Conta
     return ContactPersonService(session)
 
 
+def get_contact_person_read_service(session: AsyncSession = Depends(get_read_db)) -> ContactPersonService:
+    """Dependency to get ContactPersonService for list and detail endpoints."""
+    return ContactPersonService(session)
+
+
 @router.post("/", response_model=ContactPersonResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact_person(
     contact_data: ContactPersonCreate,
@@ -58,7 +63,7 @@ async def create_contact_person(
 @router.get("/{contact_id}", response_model=ContactPersonResponse)
 async def get_contact_person(
     contact_id: UUID,
-    service: ContactPersonService = Depends(get_contact_person_service)
+    service: ContactPersonService = Depends(get_contact_person_read_service)
 ):
     """Get a contact person by ID."""
     contact = await service.get_contact_person(contact_id)
@@ -110,7 +115,7 @@ async def list_contact_persons(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=1000, description="Number of records to return"),
     active_only: bool = Query(True, description="Only return active contacts"),
-    service: ContactPersonService = Depends(get_contact_person_service)
+    service: ContactPersonService = Depends(get_contact_person_read_service)
 ):
     """
     List contact persons with pagination.
@@ -156,7 +161,7 @@ async def get_contacts_by_company(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=1000, description="Number of records to return"),
     active_only: bool = Query(True, description="Only return active contacts"),
-    service: ContactPersonService = Depends(get_contact_person_service)
+    service: ContactPersonService = Depends(get_contact_person_read_service)
 ):
     """Get contact persons by company name."""
     try:
@@ -175,7 +180,7 @@ async def get_primary_contacts(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=1000, description="Number of records to return"),
     active_only: bool = Query(True, description="Only return active contacts"),
-    service: ContactPersonService = Depends(get_contact_person_service)
+    service: ContactPersonService = Depends(get_contact_person_read_service)
 ):
     """Get all primary contact persons."""
     try:
@@ -218,7 +223,7 @@ async def get_contact_person_statistics(
 @router.get("/recent/contacts", response_model=List[ContactPersonResponse])
 async def get_recent_contacts(
     limit: int = Query(10, ge=1, le=50, description="Number of recent contacts to return"),
-    service: ContactPersonService = Depends(get_contact_person_service)
+    service: ContactPersonService = Depends(get_contact_person_read_service)
 ):
     """Get recently created contact persons."""
     try:
@@ -230,7 +235,7 @@ async def get_recent_contacts(
 @router.get("/email/{email}", response_model=ContactPersonResponse)
 async def get_contact_by_email(
     email: str,
-    service: ContactPersonService = Depends(get_contact_person_service)
+    service: ContactPersonService = Depends(get_contact_person_read_service)
 ):
     """Get a contact person by email address."""
     try:
@@ -6,9 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.errors import NotFoundError, ValidationError, ConflictError
 from app.shared.dependencies import get_db
 from app.services.customer import CustomerService
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db
 from app.models.user import User
-from app.models.customer import CustomerType, CustomerStatus, BlacklistStatus, CreditRating
+from app.models.customer import CustomerType, CustomerStatus, CustomerTier, BlacklistStatus, CreditRating
 from app.schemas.customer import (
     CustomerCreate, CustomerUpdate, CustomerResponse, CustomerStatusUpdate,
     CustomerBlacklistUpdate, CustomerCreditUpdate, CustomerSearchRequest,
@@ -16,6 +16,9 @@ from app.schemas.customer import (
     CustomerContactCreate, CustomerContactResponse, CustomerDetailResponse
 )
 from app.core.permissions_enhanced import CustomerPermissions
+from app.core.streaming_export import (
+    ExportFormat, SessionFactory, get_export_session_factory, streaming_export_response
+)
 
 
 router = APIRouter(tags=["Customer Management"])
@@ -26,6 +29,10 @@ async def get_customer_service(session: AsyncSession = Depends(get_db)) -> Custo
     return CustomerService(session)
 
 
+async def get_customer_read_service(session: AsyncSession = Depends(get_read_db)) -> CustomerService:
+    return CustomerService(session)
+
+
 # Customer CRUD endpoints
 @router.post("/", 
     response_model=CustomerResponse, 
@@ -55,7 +62,7 @@ async def list_customers(
     customer_status: Optional[CustomerStatus] = Query(None, description="Filter by status"),
     blacklist_status: Optional[BlacklistStatus] = Query(None, description="Filter by blacklist status"),
     active_only: bool = Query(True, description="Show only active customers"),
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """List customers with optional filtering. Requires CUSTOMER_VIEW permission."""
@@ -77,7 +84,7 @@ async def search_customers(
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     active_only: bool = Query(True, description="Show only active customers"),
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Search customers by name, code, or email. Requires CUSTOMER_VIEW permission."""
@@ -124,12 +131,37 @@ async def get_customer_statistics(
     return await service.get_customer_statistics()
 
 
+@router.get("/export",
+    dependencies=[CustomerPermissions.VIEW])
+async def export_customers(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    customer_type: Optional[CustomerType] = Query(None, description="Filter by customer type"),
+    customer_status: Optional[CustomerStatus] = Query(None, description="Filter by status"),
+    customer_tier: Optional[CustomerTier] = Query(None, description="Filter by tier"),
+    blacklist_status: Optional[BlacklistStatus] = Query(None, description="Filter by blacklist status"),
+    active_only: bool = Query(True, description="Export only active customers"),
+    service: CustomerService = Depends(get_customer_read_service),
+    session_factory: SessionFactory = Depends(get_export_session_factory),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every matching customer as CSV or NDJSON. Requires CUSTOMER_VIEW permission."""
+    query = service.repository.export_query(
+        customer_type=customer_type,
+        customer_status=customer_status,
+        customer_tier=customer_tier,
+        blacklist_status=blacklist_status,
+        active_only=active_only
+    )
+    return streaming_export_response(session_factory, query, "customers", format, gzip)
+
+
 @router.get("/{customer_id}", 
     response_model=CustomerResponse,
     dependencies=[CustomerPermissions.VIEW])
 async def get_customer(
     customer_id: UUID,
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get customer by ID. Requires CUSTOMER_VIEW permission."""
@@ -145,7 +177,7 @@ async def get_customer(
     dependencies=[CustomerPermissions.VIEW])
 async def get_customer_by_code(
     customer_code: str,
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get customer by code. Requires CUSTOMER_VIEW permission."""
@@ -254,7 +286,7 @@ async def get_customers_by_type(
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     active_only: bool = Query(True, description="Show only active customers"),
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get customers by type. Requires CUSTOMER_VIEW permission."""
@@ -274,7 +306,7 @@ async def get_customers_by_blacklist_status(
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     active_only: bool = Query(True, description="Show only active customers"),
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get customers by blacklist status. Requires CUSTOMER_VIEW permission."""
@@ -294,7 +326,7 @@ async def get_customers_by_city(
     city: str,
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get customers by city. Requires CUSTOMER_VIEW permission."""
@@ -312,7 +344,7 @@ async def get_customers_by_state(
     state: str,
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
-    service: CustomerService = Depends(get_customer_service),
+    service: CustomerService = Depends(get_customer_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get customers by state. Requires CUSTOMER_VIEW permission."""
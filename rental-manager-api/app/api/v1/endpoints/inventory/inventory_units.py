@@ -11,7 +11,7 @@ from datetime import datetime, date
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_user
 from app.services.inventory.inventory_service import InventoryService
 from app.schemas.inventory.inventory_unit import (
     InventoryUnitCreate,
@@ -44,7 +44,7 @@ async def list_inventory_units(
     sku: Optional[str] = None,
     is_rental_blocked: Optional[bool] = None,
     customer_id: Optional[UUID] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List inventory units with filtering.
@@ -105,7 +105,7 @@ async def list_inventory_units(
 @router.get("/{unit_id}", response_model=InventoryUnitResponse)
 async def get_inventory_unit(
     unit_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get specific inventory unit.
@@ -135,7 +135,7 @@ async def get_inventory_unit(
 @router.get("/serial/{serial_number}", response_model=InventoryUnitResponse)
 async def get_unit_by_serial(
     serial_number: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get inventory unit by serial number.
@@ -171,7 +171,7 @@ async def get_units_by_sku(
     status: Optional[InventoryUnitStatus] = None,
     location_id: Optional[UUID] = None,
     limit: int = Query(100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get inventory units by SKU.
@@ -551,7 +551,7 @@ async def record_maintenance(
 @router.get("/{unit_id}/history", response_model=dict)
 async def get_unit_history(
     unit_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get complete history for a unit.
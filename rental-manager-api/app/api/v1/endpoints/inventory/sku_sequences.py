@@ -10,7 +10,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_user
 from app.schemas.inventory.sku_sequence import (
     SKUSequenceCreate,
     SKUSequenceUpdate,
@@ -34,7 +34,7 @@ async def list_sku_sequences(
     brand_id: Optional[UUID] = None,
     category_id: Optional[UUID] = None,
     is_active: Optional[bool] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List SKU sequences.
@@ -91,7 +91,7 @@ async def list_sku_sequences(
 @router.get("/active", response_model=List[SKUSequenceResponse])
 async def get_active_sequences(
     limit: int = Query(100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all active SKU sequences.
@@ -116,7 +116,7 @@ async def get_active_sequences(
 @router.get("/{sequence_id}", response_model=SKUSequenceResponse)
 async def get_sku_sequence(
     sequence_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get specific SKU sequence.
@@ -147,7 +147,7 @@ async def get_sku_sequence(
 async def get_sequences_by_brand(
     brand_id: UUID,
     limit: int = Query(100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all sequences for a brand.
@@ -175,7 +175,7 @@ async def get_sequences_by_brand(
 async def get_sequences_by_category(
     category_id: UUID,
     limit: int = Query(100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all sequences for a category.
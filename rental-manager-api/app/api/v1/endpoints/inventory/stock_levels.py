@@ -12,7 +12,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_report_db, get_current_user
 from app.services.inventory.inventory_service import InventoryService
 from app.schemas.inventory.stock_level import (
     StockLevelCreate,
@@ -21,11 +21,15 @@ from app.schemas.inventory.stock_level import (
     StockLevelFilter,
     StockAdjustment,
     TransferRequest,
-    StockSummaryResponse,
-    LowStockAlert
+    StockSummaryResponse
 )
+from app.schemas.inventory.base import InventoryAlertResponse
 from app.schemas.inventory.common import PaginatedResponse
+from app.models.inventory.enums import StockStatus, InventoryAlertType, InventoryAlertSeverity
 from app.models.user import User
+from app.core.streaming_export import (
+    ExportFormat, SessionFactory, get_export_session_factory, streaming_export_response
+)
 
 
 router = APIRouter()
@@ -39,7 +43,7 @@ async def list_stock_levels(
     location_id: Optional[UUID] = None,
     low_stock_only: bool = False,
     include_zero: bool = True,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List stock levels with optional filtering.
@@ -95,7 +99,7 @@ async def get_stock_summary(
     location_id: Optional[UUID] = None,
     category_id: Optional[UUID] = None,
     brand_id: Optional[UUID] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_report_db)
 ):
     """
     Get aggregated stock summary.
@@ -119,36 +123,122 @@ async def get_stock_summary(
     return summary
 
 
-@router.get("/alerts", response_model=List[LowStockAlert])
+@router.get("/alerts", response_model=List[InventoryAlertResponse])
 async def get_stock_alerts(
     location_id: Optional[UUID] = None,
-    severity: Optional[str] = Query(None, regex="^(critical|warning|info)$"),
-    db: AsyncSession = Depends(get_db)
+    alert_type: Optional[InventoryAlertType] = None,
+    severity: Optional[InventoryAlertSeverity] = None,
+    include_acknowledged: bool = Query(True, description="Include acknowledged alerts"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_report_db)
 ):
     """
-    Get inventory alerts.
+    Get live inventory alerts, newest first.
     
     Returns alerts for:
     - Low stock items
     - Items needing maintenance
-    - Expired warranties
+    - Warranties about to expire
+    
+    Alerts are kept up to date as stock changes, so this reads the alert
+    table instead of scanning inventory.
     """
     service = InventoryService()
     
     alerts = await service.get_inventory_alerts(
         db,
         location_id=location_id,
-        severity=severity
+        alert_type=alert_type,
+        severity=severity,
+        include_acknowledged=include_acknowledged,
+        skip=skip,
+        limit=limit
     )
     
     return alerts
 
 
+@router.post("/alerts/{alert_id}/acknowledge", response_model=InventoryAlertResponse)
+async def acknowledge_stock_alert(
+    alert_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Acknowledge an alert.
+    
+    The alert stays live until its condition clears; an acknowledged low
+    stock alert is opened again if the stock runs out.
+    """
+    service = InventoryService()
+    
+    try:
+        alert = await service.acknowledge_alert(
+            db,
+            alert_id=alert_id,
+            acknowledged_by=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    
+    if not alert:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Alert {alert_id} not found"
+        )
+    
+    await db.commit()
+    return alert
+
+
+@router.get("/export")
+async def export_stock_levels(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    item_id: Optional[UUID] = None,
+    location_id: Optional[UUID] = None,
+    stock_status: Optional[StockStatus] = None,
+    low_stock_only: bool = False,
+    session_factory: SessionFactory = Depends(get_export_session_factory)
+):
+    """
+    Stream stock levels as CSV or NDJSON.
+    
+    Rows are read through a server-side cursor and written as they arrive,
+    so the export has no row cap and constant memory use.
+    
+    Args:
+        format: Export format (csv, ndjson)
+        gzip: Gzip-compress the download
+        item_id: Filter by item
+        location_id: Filter by location
+        stock_status: Filter by stock status
+        low_stock_only: Only levels at or below their reorder point
+        
+    Returns:
+        Streaming file download
+    """
+    from app.crud.inventory import stock_level as crud_stock_level
+    
+    filter_obj = StockLevelFilter(
+        item_id=item_id,
+        location_id=location_id,
+        stock_status=stock_status,
+        is_low_stock=low_stock_only or None
+    )
+    query = crud_stock_level.export_query(filter_params=filter_obj)
+    return streaming_export_response(session_factory, query, "stock-levels", format, gzip)
+
+
 @router.get("/{item_id}/{location_id}", response_model=StockLevelResponse)
 async def get_stock_level(
     item_id: UUID,
     location_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get stock level for specific item at location.
@@ -474,7 +564,7 @@ async def check_availability(
     quantity: Decimal = Query(..., gt=0),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Check item availability.
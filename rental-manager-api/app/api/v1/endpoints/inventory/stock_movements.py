@@ -6,20 +6,24 @@ Provides endpoints for viewing inventory movement audit trails.
 
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime, date
+from datetime import datetime, date, time
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_report_db, get_current_user
 from app.schemas.inventory.stock_movement import (
     StockMovementResponse,
+    StockItemLedgerResponse,
     StockMovementFilter,
     StockMovementSummary,
     MovementTypeStats
 )
 from app.schemas.inventory.common import PaginatedResponse
 from app.models.inventory.enums import StockMovementType
+from app.core.streaming_export import (
+    ExportFormat, SessionFactory, get_export_session_factory, streaming_export_response
+)
 
 
 router = APIRouter()
@@ -36,7 +40,7 @@ async def list_stock_movements(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     created_by: Optional[UUID] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List stock movements with filtering.
@@ -99,7 +103,7 @@ async def get_movement_summary(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     group_by: str = Query("day", regex="^(day|week|month|year)$"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_report_db)
 ):
     """
     Get aggregated movement summary.
@@ -136,7 +140,7 @@ async def get_movement_statistics(
     location_id: Optional[UUID] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_report_db)
 ):
     """
     Get movement statistics by type.
@@ -165,10 +169,52 @@ async def get_movement_statistics(
     return stats
 
 
+@router.get("/export")
+async def export_movements(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    item_id: Optional[UUID] = None,
+    location_id: Optional[UUID] = None,
+    movement_type: Optional[StockMovementType] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    session_factory: SessionFactory = Depends(get_export_session_factory)
+):
+    """
+    Export movement history.
+    
+    Streams the ledger oldest first through a server-side cursor, so the
+    export has no row cap and constant memory use.
+    
+    Args:
+        format: Export format (csv, ndjson)
+        gzip: Gzip-compress the download
+        item_id: Filter by item
+        location_id: Filter by location
+        movement_type: Filter by movement type
+        start_date: Start of period
+        end_date: End of period (inclusive)
+        
+    Returns:
+        Streaming file download
+    """
+    from app.crud.inventory import stock_movement as crud_movement
+    
+    filter_obj = StockMovementFilter(
+        item_id=item_id,
+        location_id=location_id,
+        movement_type=movement_type,
+        date_from=datetime.combine(start_date, time.min) if start_date else None,
+        date_to=datetime.combine(end_date, time.max) if end_date else None
+    )
+    query = crud_movement.export_query(filter_params=filter_obj)
+    return streaming_export_response(session_factory, query, "stock-movements", format, gzip)
+
+
 @router.get("/{movement_id}", response_model=StockMovementResponse)
 async def get_stock_movement(
     movement_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get specific stock movement.
@@ -199,9 +245,10 @@ async def get_stock_movement(
 async def get_item_movement_history(
     item_id: UUID,
     location_id: Optional[UUID] = None,
+    since: Optional[datetime] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get movement history for specific item.
@@ -209,6 +256,7 @@ async def get_item_movement_history(
     Args:
         item_id: Item ID
         location_id: Optional location filter
+        since: Only movements on or after this time
         skip: Number of records to skip
         limit: Maximum number of records
         
@@ -221,6 +269,7 @@ async def get_item_movement_history(
         db,
         item_id=item_id,
         location_id=location_id,
+        date_from=since,
         skip=skip,
         limit=limit
     )
@@ -228,13 +277,44 @@ async def get_item_movement_history(
     return movements
 
 
+@router.get("/item/{item_id}/ledger", response_model=StockItemLedgerResponse)
+async def get_item_ledger(
+    item_id: UUID,
+    location_id: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get compacted balances and recent movements for specific item.
+    
+    Args:
+        item_id: Item ID
+        location_id: Optional location filter
+        limit: Maximum number of recent movements
+        
+    Returns:
+        Latest monthly balance snapshot per location plus the movements
+        recorded since the last compacted month
+    """
+    from app.crud.inventory import stock_movement as crud_movement
+    
+    ledger = await crud_movement.get_item_ledger(
+        db,
+        item_id=item_id,
+        location_id=location_id,
+        limit=limit
+    )
+    
+    return ledger
+
+
 @router.get("/location/{location_id}/history", response_model=List[StockMovementResponse])
 async def get_location_movement_history(
     location_id: UUID,
     item_id: Optional[UUID] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get movement history for specific location.
@@ -264,7 +344,7 @@ async def get_location_movement_history(
 @router.get("/transaction/{transaction_id}/movements", response_model=List[StockMovementResponse])
 async def get_transaction_movements(
     transaction_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all movements for a transaction.
@@ -291,7 +371,7 @@ async def get_recent_movements(
     location_id: Optional[UUID] = None,
     movement_type: Optional[StockMovementType] = None,
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get recent stock movements.
@@ -306,58 +386,13 @@ async def get_recent_movements(
         Recent movements
     """
     from app.crud.inventory import stock_movement as crud_movement
-    from datetime import timedelta
-    
-    start_date = datetime.utcnow() - timedelta(hours=hours)
     
-    filter_obj = StockMovementFilter(
+    movements = await crud_movement.get_recent_movements(
+        db,
+        hours=hours,
         location_id=location_id,
         movement_type=movement_type,
-        start_date=start_date.date()
-    )
-    
-    movements = await crud_movement.get_filtered(
-        db,
-        filter_obj=filter_obj,
-        skip=0,
         limit=limit
     )
     
     return movements
-
-
-@router.get("/export", response_model=dict)
-async def export_movements(
-    format: str = Query("csv", regex="^(csv|excel|json)$"),
-    item_id: Optional[UUID] = None,
-    location_id: Optional[UUID] = None,
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    Export movement history.
-    
-    Args:
-        format: Export format (csv, excel, json)
-        item_id: Filter by item
-        location_id: Filter by location
-        start_date: Start of period
-        end_date: End of period
-        
-    Returns:
-        Export file URL or data
-    """
-    # This would typically generate a file and return a download URL
-    # For now, return a placeholder
-    return {
-        "status": "pending",
-        "format": format,
-        "message": "Export functionality to be implemented",
-        "filters": {
-            "item_id": str(item_id) if item_id else None,
-            "location_id": str(location_id) if location_id else None,
-            "start_date": str(start_date) if start_date else None,
-            "end_date": str(end_date) if end_date else None
-        }
-    }
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import Optional, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 
 from app.services.item import ItemService
@@ -12,16 +12,28 @@ from app.schemas.item import (
     ItemRentalStatusRequest, ItemRentalStatusResponse,
     ItemBulkOperation, ItemBulkResult, ItemExport,
     ItemImport, ItemImportResult, ItemAvailabilityCheck,
-    ItemAvailabilityResponse, ItemPricingUpdate, ItemDuplicate
+    ItemAvailabilityResponse, ItemPricingUpdate, ItemDuplicate,
+    ItemSkuRegenerate, ItemSkuRegenerateResult
 )
 from app.core.dependencies import (
-    get_item_service, get_item_rental_blocking_service, 
-    get_sku_generator, get_current_user_id
+    get_item_service, get_item_read_service, get_item_report_service, get_item_rental_blocking_service,
+    get_item_rental_blocking_read_service, 
+    get_sku_generator, get_current_user_id, get_idempotency_key
 )
+from app.core.response_cache import CachedRoute, cached_route
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.item import Item
+from app.models.unit_of_measurement import UnitOfMeasurement
 from app.core.errors import (
     NotFoundError, ConflictError, ValidationError,
     BusinessRuleError
 )
+from app.schemas.background_job import BackgroundJobResponse
+from app.services.bulk_import import ImportFileFormat, detect_format, spool_upload
+from app.core.streaming_export import (
+    ExportFormat, SessionFactory, get_export_session_factory, streaming_export_response
+)
 
 
 router = APIRouter()
@@ -51,11 +63,12 @@ async def create_item(
 @router.get("/{item_id}", response_model=ItemResponse)
 async def get_item(
     item_id: UUID,
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service),
+    cache: CachedRoute = Depends(cached_route(Item, Brand, Category, UnitOfMeasurement))
 ):
     """Get an item by ID."""
     try:
-        return await service.get_item(item_id)
+        return await cache.respond(ItemResponse, lambda: service.get_item(item_id))
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -66,7 +79,7 @@ async def get_item(
 @router.get("/sku/{sku}", response_model=ItemResponse)
 async def get_item_by_sku(
     sku: str,
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service)
 ):
     """Get an item by SKU."""
     try:
@@ -101,7 +114,7 @@ async def list_items(
     sort_field: str = Query("item_name", description="Sort field"),
     sort_direction: str = Query("asc", description="Sort direction (asc/desc)"),
     include_inactive: bool = Query(False, description="Include inactive items"),
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service)
 ):
     """List items with pagination and filtering."""
     try:
@@ -197,7 +210,7 @@ async def search_items(
     search_term: str,
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     include_inactive: bool = Query(False, description="Include inactive items"),
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service)
 ):
     """Search items by name, SKU, or description."""
     try:
@@ -245,7 +258,7 @@ async def get_rental_history(
     item_id: UUID,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=200, description="Maximum records to return"),
-    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_service)
+    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_read_service)
 ):
     """Get rental blocking history for an item."""
     try:
@@ -272,7 +285,7 @@ async def get_rental_history(
 async def check_availability(
     item_id: UUID,
     quantity_needed: int = Query(1, ge=1, description="Quantity needed"),
-    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_service)
+    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_read_service)
 ):
     """Check item availability for rental or sale."""
     try:
@@ -367,6 +380,26 @@ async def regenerate_sku(
         )
 
 
+@router.post("/regenerate-skus", response_model=ItemSkuRegenerateResult)
+async def regenerate_skus(
+    request: ItemSkuRegenerate,
+    service: ItemService = Depends(get_item_service)
+):
+    """Regenerate the SKUs of many items; with dry_run, only return the diff."""
+    try:
+        return await service.regenerate_skus(request)
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except KeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown pattern field: {e}"
+        )
+
+
 # Bulk Operations
 @router.post("/bulk-operation", response_model=ItemBulkResult)
 async def bulk_operation(
@@ -387,6 +420,27 @@ async def bulk_operation(
         )
 
 
+@router.post("/bulk-operation/jobs", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def bulk_operation_job(
+    operation: ItemBulkOperation,
+    service: ItemService = Depends(get_item_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """Run a bulk operation in the background; poll /jobs/{id} for progress."""
+    try:
+        return await service.start_bulk_operation_job(
+            operation=operation,
+            updated_by=current_user_id,
+            idempotency_key=idempotency_key
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+
 # Bulk Rental Status Operations
 @router.post("/bulk-rental-status", response_model=ItemBulkResult)
 async def bulk_rental_status(
@@ -411,11 +465,36 @@ async def bulk_rental_status(
         )
 
 
+@router.post("/bulk-rental-status/jobs", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def bulk_rental_status_job(
+    item_ids: List[UUID],
+    is_rental_blocked: bool,
+    remarks: Optional[str] = None,
+    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_service),
+    current_user_id: str = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """Toggle rental status for many items in the background; poll /jobs/{id} for progress."""
+    try:
+        return await service.start_bulk_toggle_job(
+            item_ids=item_ids,
+            is_rental_blocked=is_rental_blocked,
+            remarks=remarks,
+            changed_by=UUID(current_user_id),
+            idempotency_key=idempotency_key
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+
 # Special Item Lists
 @router.get("/rentable/", response_model=List[ItemSummary])
 async def get_rentable_items(
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum results"),
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service)
 ):
     """Get items available for rental."""
     return await service.get_rentable_items(limit=limit)
@@ -424,7 +503,7 @@ async def get_rentable_items(
 @router.get("/salable/", response_model=List[ItemSummary])
 async def get_salable_items(
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum results"),
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service)
 ):
     """Get items available for sale."""
     return await service.get_salable_items(limit=limit)
@@ -434,7 +513,7 @@ async def get_salable_items(
 async def get_blocked_items(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=200, description="Maximum records to return"),
-    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_service)
+    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_read_service)
 ):
     """Get items blocked from rental."""
     try:
@@ -456,7 +535,7 @@ async def get_blocked_items(
 @router.get("/maintenance-due/", response_model=List[ItemSummary])
 async def get_maintenance_due_items(
     days_threshold: int = Query(180, ge=1, description="Days since last maintenance"),
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_read_service)
 ):
     """Get items that need maintenance."""
     return await service.get_maintenance_due_items(days_threshold=days_threshold)
@@ -465,7 +544,7 @@ async def get_maintenance_due_items(
 # Statistics and Analytics
 @router.get("/statistics/", response_model=ItemStats)
 async def get_item_statistics(
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_report_service)
 ):
     """Get comprehensive item statistics."""
     return await service.get_item_statistics()
@@ -555,15 +634,65 @@ async def import_items(
         )
 
 
+@router.post("/import/jobs", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_items_file(
+    file: UploadFile = File(..., description="CSV or NDJSON file with one item per row"),
+    format: Optional[ImportFileFormat] = Query(None, description="File format (default: from the file extension)"),
+    service: ItemService = Depends(get_item_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """Import items from an uploaded file in the background; poll /jobs/{id} for progress."""
+    path = await spool_upload(file)
+    try:
+        return await service.start_import_job(
+            path,
+            detect_format(file.filename, format),
+            created_by=current_user_id,
+            idempotency_key=idempotency_key
+        )
+    except ConflictError as e:
+        path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+
 @router.get("/export/", response_model=List[ItemExport])
 async def export_items(
     include_inactive: bool = Query(False, description="Include inactive items"),
-    service: ItemService = Depends(get_item_service)
+    service: ItemService = Depends(get_item_report_service)
 ):
     """Export items data."""
     return await service.export_items(include_inactive=include_inactive)
 
 
+@router.get("/export/stream")
+async def stream_export_items(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    include_inactive: bool = Query(False, description="Include inactive items"),
+    brand_id: Optional[UUID] = Query(None, description="Filter by brand"),
+    category_id: Optional[UUID] = Query(None, description="Filter by category"),
+    is_rentable: Optional[bool] = Query(None, description="Filter by rentable"),
+    is_salable: Optional[bool] = Query(None, description="Filter by salable"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    service: ItemService = Depends(get_item_read_service),
+    session_factory: SessionFactory = Depends(get_export_session_factory)
+):
+    """Stream every matching item as CSV or NDJSON, without a row cap."""
+    filters = {
+        "brand_id": brand_id,
+        "category_id": category_id,
+        "is_rentable": is_rentable,
+        "is_salable": is_salable,
+        "status": status
+    }
+    query = service.repository.export_query(filters=filters, include_inactive=include_inactive)
+    return streaming_export_response(session_factory, query, "items", format, gzip)
+
+
 # Maintenance Operations
 @router.post("/maintenance/auto-unblock-expired/")
 async def auto_unblock_expired_items(
@@ -589,6 +718,31 @@ async def auto_unblock_expired_items(
         )
 
 
+@router.post(
+    "/maintenance/auto-unblock-expired/jobs",
+    response_model=BackgroundJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def auto_unblock_expired_items_job(
+    auto_unblock_after_days: int = Query(90, ge=1, description="Days after which to auto-unblock"),
+    service: ItemRentalBlockingService = Depends(get_item_rental_blocking_service),
+    current_user_id: str = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """Run the auto-unblock sweep in the background; poll /jobs/{id} for progress."""
+    try:
+        return await service.start_auto_unblock_job(
+            auto_unblock_after_days=auto_unblock_after_days,
+            requested_by=current_user_id,
+            idempotency_key=idempotency_key
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+
 @router.get("/validation/rental-unblock/{item_id}")
 async def validate_rental_unblock(
     item_id: UUID,
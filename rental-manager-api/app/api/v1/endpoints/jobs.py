@@ -0,0 +1,67 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.models.background_job import JobStatus
+from app.services.background_job import BackgroundJobService
+from app.schemas.background_job import BackgroundJobResponse
+from app.core.dependencies import get_background_job_service, get_background_job_read_service
+from app.core.errors import NotFoundError, ValidationError
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[BackgroundJobResponse])
+async def list_jobs(
+    job_type: Optional[str] = Query(None, description="Filter by job type"),
+    job_status: Optional[JobStatus] = Query(None, alias="status", description="Filter by status"),
+    created_by: Optional[str] = Query(None, description="Filter by submitting user"),
+    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of jobs to return"),
+    service: BackgroundJobService = Depends(get_background_job_read_service)
+):
+    """List background jobs, newest first."""
+    return await service.list_jobs(
+        job_type=job_type,
+        status=job_status,
+        created_by=created_by,
+        skip=skip,
+        limit=limit
+    )
+
+
+@router.get("/{job_id}", response_model=BackgroundJobResponse)
+async def get_job(
+    job_id: UUID,
+    service: BackgroundJobService = Depends(get_background_job_read_service)
+):
+    """Poll a background job's status, progress and per-row errors."""
+    try:
+        return await service.get_job(job_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.post("/{job_id}/cancel", response_model=BackgroundJobResponse)
+async def cancel_job(
+    job_id: UUID,
+    service: BackgroundJobService = Depends(get_background_job_service)
+):
+    """Cancel a queued job, or stop a running one after its current chunk."""
+    try:
+        return await service.cancel_job(job_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
@@ -18,8 +18,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.redis import get_redis, RedisManager
+from app.core.response_cache import CachedRoute, cached_route
+from app.models.location import Location
 from app.services.location import LocationService
 from app.schemas.location import (
     LocationCreate, LocationUpdate, LocationResponse, LocationSearch,
@@ -32,7 +34,9 @@ from app.core.errors import (
     BusinessRuleError, DatabaseError
 )
 from app.api.deps import get_current_user
+from app.core.dependencies import get_idempotency_key
 from app.models.user import User
+from app.schemas.background_job import BackgroundJobResponse
 
 router = APIRouter(tags=["locations"])
 
@@ -46,6 +50,14 @@ async def get_location_service(
     return LocationService(db, redis)
 
 
+async def get_location_read_service(
+    db: AsyncSession = Depends(get_read_db),
+    redis: RedisManager = Depends(get_redis)
+) -> LocationService:
+    """Get location service for list and detail endpoints."""
+    return LocationService(db, redis)
+
+
 # ==================== Core CRUD Operations ====================
 
 @router.post("/", response_model=LocationResponse, status_code=status.HTTP_201_CREATED)
@@ -107,7 +119,7 @@ async def create_location(
 async def get_location(
     location_id: UUID,
     use_cache: bool = Query(True, description="Whether to use cache"),
-    service: LocationService = Depends(get_location_service)
+    service: LocationService = Depends(get_location_read_service)
 ):
     """
     Get a location by ID.
@@ -128,7 +140,7 @@ async def get_location(
 async def get_location_by_code(
     location_code: str,
     use_cache: bool = Query(True, description="Whether to use cache"),
-    service: LocationService = Depends(get_location_service)
+    service: LocationService = Depends(get_location_read_service)
 ):
     """
     Get a location by its unique code.
@@ -315,7 +327,7 @@ async def list_locations(
     # Caching
     use_cache: bool = Query(True, description="Whether to use cache"),
     
-    service: LocationService = Depends(get_location_service)
+    service: LocationService = Depends(get_location_read_service)
 ):
     """
     List locations with filtering, pagination, and sorting.
@@ -418,7 +430,8 @@ async def find_nearby_locations(
 async def get_location_hierarchy(
     location_id: UUID,
     include_children: bool = Query(True, description="Include child locations"),
-    service: LocationService = Depends(get_location_service)
+    service: LocationService = Depends(get_location_read_service),
+    cache: CachedRoute = Depends(cached_route(Location))
 ):
     """
     Get location with its hierarchical structure (parent and children).
@@ -427,7 +440,10 @@ async def get_location_hierarchy(
     - **include_children**: Whether to include child locations in response
     """
     try:
-        return await service.get_location_hierarchy(location_id, include_children)
+        return await cache.respond(
+            LocationWithChildren,
+            lambda: service.get_location_hierarchy(location_id, include_children)
+        )
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -438,7 +454,7 @@ async def get_location_hierarchy(
 @router.get("/{location_id}/path", response_model=List[LocationResponse])
 async def get_location_path(
     location_id: UUID,
-    service: LocationService = Depends(get_location_service)
+    service: LocationService = Depends(get_location_read_service)
 ):
     """
     Get the full hierarchy path from root to the specified location.
@@ -516,6 +532,46 @@ async def bulk_create_locations(
         )
 
 
+@router.post("/bulk/jobs", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def bulk_create_locations_job(
+    bulk_data: LocationBulkCreate,
+    request: Request,
+    service: LocationService = Depends(get_location_service),
+    current_user: Optional[User] = Depends(get_current_user),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key)
+):
+    """
+    Bulk create locations in the background.
+    
+    Returns the queued job straight away; poll **/jobs/{id}** for progress.
+    Locations are created in committed chunks. Takes the same body and is
+    subject to the same rate limit as **/bulk**.
+    """
+    try:
+        requester_id = None
+        if current_user:
+            requester_id = current_user.id
+        elif hasattr(request, 'client') and request.client:
+            requester_id = request.client.host
+        
+        return await service.start_bulk_create_job(
+            bulk_data,
+            created_by=current_user.id if current_user else None,
+            requester_id=requester_id,
+            idempotency_key=idempotency_key
+        )
+    except BusinessRuleError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={"message": str(e), "error_code": e.error_code, "context": e.context}
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "error_code": e.error_code, "details": e.details}
+        )
+
+
 # ==================== Capacity Operations ====================
 
 @router.patch("/{location_id}/capacity", response_model=LocationResponse)
@@ -0,0 +1,193 @@
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.services.price_book import PriceBookService
+from app.schemas.price_book import (
+    PriceBookCreate, PriceBookUpdate, PriceBookResponse, PriceBookList,
+    PriceBookEntriesUpsert, PriceBookEntryResponse, ResolvedPriceResponse
+)
+from app.models.customer import CustomerTier
+from app.core.dependencies import get_price_book_service, get_price_book_read_service, get_current_user_id
+from app.core.errors import NotFoundError, ConflictError, ValidationError
+
+
+router = APIRouter()
+
+
+@router.post("/", response_model=PriceBookResponse, status_code=status.HTTP_201_CREATED)
+async def create_price_book(
+    book_data: PriceBookCreate,
+    service: PriceBookService = Depends(get_price_book_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id)
+):
+    """Create a new price book."""
+    try:
+        return await service.create_price_book(book_data, created_by=current_user_id)
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/", response_model=PriceBookList)
+async def list_price_books(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    location_id: Optional[UUID] = Query(None, description="Filter by location scope"),
+    customer_segment: Optional[CustomerTier] = Query(None, description="Filter by customer segment scope"),
+    effective_on: Optional[date] = Query(None, description="Only books in effect on this date"),
+    include_inactive: bool = Query(False, description="Include inactive price books"),
+    service: PriceBookService = Depends(get_price_book_read_service)
+):
+    """List price books with pagination and filtering."""
+    return await service.list_price_books(
+        page=page,
+        page_size=page_size,
+        location_id=location_id,
+        customer_segment=customer_segment.value if customer_segment else None,
+        effective_on=effective_on,
+        include_inactive=include_inactive
+    )
+
+
+@router.get("/resolve", response_model=ResolvedPriceResponse)
+async def resolve_price(
+    item_id: UUID = Query(..., description="Item to price"),
+    on: Optional[date] = Query(None, description="Date the rate applies on (default today)"),
+    location_id: Optional[UUID] = Query(None, description="Location context"),
+    customer_segment: Optional[CustomerTier] = Query(None, description="Customer segment context"),
+    service: PriceBookService = Depends(get_price_book_read_service)
+):
+    """Resolve the price book rate in effect for an item."""
+    try:
+        rate, version = await service.resolve_price(
+            item_id,
+            on or date.today(),
+            location_id=location_id,
+            customer_segment=customer_segment.value if customer_segment else None
+        )
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return ResolvedPriceResponse(
+        item_id=rate.item_id,
+        price_book_id=rate.price_book_id,
+        rental_rate_per_day=rate.rental_rate_per_day,
+        weekly_rate=rate.weekly_rate,
+        monthly_rate=rate.monthly_rate,
+        sale_price=rate.sale_price,
+        security_deposit=rate.security_deposit,
+        version=version
+    )
+
+
+@router.get("/{book_id}", response_model=PriceBookResponse)
+async def get_price_book(
+    book_id: UUID,
+    service: PriceBookService = Depends(get_price_book_read_service)
+):
+    """Get a price book by ID."""
+    try:
+        return await service.get_price_book(book_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.put("/{book_id}", response_model=PriceBookResponse)
+async def update_price_book(
+    book_id: UUID,
+    book_data: PriceBookUpdate,
+    service: PriceBookService = Depends(get_price_book_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id)
+):
+    """Update a price book."""
+    try:
+        return await service.update_price_book(book_id, book_data, updated_by=current_user_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_price_book(
+    book_id: UUID,
+    service: PriceBookService = Depends(get_price_book_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id)
+):
+    """Soft delete a price book."""
+    try:
+        await service.delete_price_book(book_id, deleted_by=current_user_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.get("/{book_id}/entries", response_model=List[PriceBookEntryResponse])
+async def get_price_book_entries(
+    book_id: UUID,
+    service: PriceBookService = Depends(get_price_book_read_service)
+):
+    """List the item rates of a price book."""
+    try:
+        return await service.get_entries(book_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.put("/{book_id}/entries", response_model=List[PriceBookEntryResponse])
+async def upsert_price_book_entries(
+    book_id: UUID,
+    entries_data: PriceBookEntriesUpsert,
+    service: PriceBookService = Depends(get_price_book_service),
+    current_user_id: Optional[str] = Depends(get_current_user_id)
+):
+    """Insert or replace item rates in a price book."""
+    try:
+        return await service.upsert_entries(book_id, entries_data, updated_by=current_user_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.delete("/{book_id}/entries/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_price_book_entry(
+    book_id: UUID,
+    item_id: UUID,
+    service: PriceBookService = Depends(get_price_book_service)
+):
+    """Remove an item's rates from a price book."""
+    try:
+        await service.delete_entry(book_id, item_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.services.transaction.pricing_engine import QuoteLine, RentalPricingEngine
+from app.schemas.transaction import RentalQuoteRequest, RentalQuoteResponse
+from app.core.dependencies import get_rental_pricing_engine
+from app.core.errors import NotFoundError, ValidationError
+
+
+router = APIRouter()
+
+
+@router.post("/quote", response_model=RentalQuoteResponse)
+async def quote_rental(
+    quote_request: RentalQuoteRequest,
+    engine: RentalPricingEngine = Depends(get_rental_pricing_engine)
+):
+    """
+    Price a rental order without creating it.
+
+    All lines are priced together with a single item lookup, so large
+    orders (hundreds of lines) can be quoted in one call.
+    """
+    lines = [
+        QuoteLine(
+            item_id=line.item_id,
+            quantity=line.quantity,
+            daily_rate=line.daily_rate,
+            discount_percent=line.discount_percent,
+        )
+        for line in quote_request.items
+    ]
+    try:
+        return await engine.quote(
+            lines,
+            start_date=quote_request.rental_start_date,
+            end_date=quote_request.rental_end_date,
+            strategy=quote_request.pricing_strategy,
+            location_id=quote_request.location_id,
+            customer_segment=quote_request.customer_segment.value if quote_request.customer_segment else None,
+        )
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={"message": str(e), **e.details}
+        )
@@ -4,13 +4,16 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError, ValidationError, ConflictError
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_user
 from app.services.supplier import SupplierService
 from app.models.supplier import SupplierType, SupplierStatus
 from app.schemas.supplier import (
     SupplierCreate, SupplierUpdate, SupplierResponse, SupplierStatusUpdate
 )
 from app.models.user import User
+from app.core.streaming_export import (
+    ExportFormat, SessionFactory, get_export_session_factory, streaming_export_response
+)
 
 
 router = APIRouter(tags=["Supplier Management"])
@@ -21,6 +24,10 @@ async def get_supplier_service(session: AsyncSession = Depends(get_db)) -> Suppl
     return SupplierService(session)
 
 
+async def get_supplier_read_service(session: AsyncSession = Depends(get_read_db)) -> SupplierService:
+    return SupplierService(session)
+
+
 # Supplier CRUD endpoints
 @router.post("/", 
     response_model=SupplierResponse, 
@@ -47,7 +54,7 @@ async def list_suppliers(
     supplier_type: Optional[SupplierType] = Query(None, description="Filter by supplier type"),
     supplier_status: Optional[SupplierStatus] = Query(None, description="Filter by status"),
     active_only: bool = Query(True, description="Show only active suppliers"),
-    service: SupplierService = Depends(get_supplier_service),
+    service: SupplierService = Depends(get_supplier_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """List suppliers with optional filtering."""
@@ -67,7 +74,7 @@ async def search_suppliers(
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     active_only: bool = Query(True, description="Show only active suppliers"),
-    service: SupplierService = Depends(get_supplier_service),
+    service: SupplierService = Depends(get_supplier_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Search suppliers by name, code, or email."""
@@ -88,11 +95,33 @@ async def get_supplier_statistics(
     return await service.get_supplier_statistics()
 
 
+@router.get("/export")
+async def export_suppliers(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    supplier_type: Optional[SupplierType] = Query(None, description="Filter by supplier type"),
+    supplier_status: Optional[SupplierStatus] = Query(None, description="Filter by status"),
+    country: Optional[str] = Query(None, description="Filter by country"),
+    active_only: bool = Query(True, description="Export only active suppliers"),
+    service: SupplierService = Depends(get_supplier_read_service),
+    session_factory: SessionFactory = Depends(get_export_session_factory),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every matching supplier as CSV or NDJSON."""
+    query = service.repository.export_query(
+        supplier_type=supplier_type,
+        status=supplier_status,
+        country=country,
+        active_only=active_only
+    )
+    return streaming_export_response(session_factory, query, "suppliers", format, gzip)
+
+
 @router.get("/{supplier_id}", 
     response_model=SupplierResponse)
 async def get_supplier(
     supplier_id: UUID,
-    service: SupplierService = Depends(get_supplier_service),
+    service: SupplierService = Depends(get_supplier_read_service),
     current_user: User = Depends(get_current_user)
 ):
     """Get supplier by ID."""
@@ -73,7 +73,7 @@ router = APIRouter(prefix="/transactions", tags=["transactions"])
 @router.get("", response_model=List[TransactionHeaderResponse])
 async def list_transactions(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
@@ -112,7 +112,7 @@ async def list_transactions(
 @router.get("/{transaction_id}", response_model=TransactionHeaderResponse)
 async def get_transaction(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     transaction_id: UUID = Path(..., description="Transaction ID"),
     include_lines: bool = Query(True, description="Include transaction lines"),
@@ -140,7 +140,7 @@ async def get_transaction(
 @router.get("/{transaction_id}/events", response_model=List[TransactionEventResponse])
 async def get_transaction_events(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     transaction_id: UUID = Path(..., description="Transaction ID"),
     event_category: Optional[str] = Query(None, description="Filter by event category"),
@@ -211,7 +211,7 @@ async def create_purchase(
 @router.get("/purchases", response_model=List[PurchaseResponse])
 async def list_purchases(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -239,7 +239,7 @@ async def list_purchases(
 @router.get("/purchases/{purchase_id}", response_model=PurchaseResponse)
 async def get_purchase(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     purchase_id: UUID,
     include_details: bool = Query(True),
@@ -326,7 +326,7 @@ async def create_sale(
 @router.get("/sales", response_model=List[SalesResponse])
 async def list_sales(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -356,7 +356,7 @@ async def list_sales(
 @router.get("/sales/{sale_id}", response_model=SalesResponse)
 async def get_sale(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     sale_id: UUID,
     include_details: bool = Query(True),
@@ -473,7 +473,7 @@ async def create_rental(
 @router.get("/rentals", response_model=List[RentalResponse])
 async def list_rentals(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -507,7 +507,7 @@ async def list_rentals(
 @router.get("/rentals/{rental_id}", response_model=RentalResponse)
 async def get_rental(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     rental_id: UUID,
     include_lifecycle: bool = Query(True),
@@ -649,7 +649,7 @@ async def check_rental_availability(
 @router.get("/rentals/overdue", response_model=List[RentalResponse])
 async def get_overdue_rentals(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_active_user),
     location_id: Optional[UUID] = Query(None, description="Filter by location"),
 ) -> List[RentalResponse]:
@@ -795,7 +795,7 @@ async def process_vendor_credit(
 @router.get("/reports/summary")
 async def get_transaction_summary(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_report_db),
     current_user: User = Depends(deps.get_current_active_user),
     date_from: date = Query(..., description="Start date for report"),
     date_to: date = Query(..., description="End date for report"),
@@ -821,7 +821,7 @@ async def get_transaction_summary(
 @router.get("/reports/sales")
 async def get_sales_report(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_report_db),
     current_user: User = Depends(deps.get_current_active_user),
     date_from: date = Query(...),
     date_to: date = Query(...),
@@ -845,7 +845,7 @@ async def get_sales_report(
 @router.get("/reports/rental-utilization")
 async def get_rental_utilization_report(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_report_db),
     current_user: User = Depends(deps.get_current_active_user),
     date_from: date = Query(...),
     date_to: date = Query(...),
@@ -867,7 +867,7 @@ async def get_rental_utilization_report(
 @router.get("/reports/purchase-returns")
 async def get_purchase_return_report(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_report_db),
     current_user: User = Depends(deps.get_current_active_user),
     date_from: date = Query(...),
     date_to: date = Query(...),
@@ -891,7 +891,7 @@ async def get_purchase_return_report(
 @router.get("/reports/overdue")
 async def get_overdue_report(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_report_db),
     current_user: User = Depends(deps.get_current_active_user),
     location_id: Optional[UUID] = None,
 ) -> Dict[str, Any]:
@@ -5,7 +5,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_read_db, get_current_active_user
+from app.core.response_cache import CachedRoute, cached_route
+from app.models.unit_of_measurement import UnitOfMeasurement
 from app.models.user import User
 from app.services.unit_of_measurement import unit_of_measurement_service
 from app.schemas.unit_of_measurement import (
@@ -50,7 +52,7 @@ async def create_unit_of_measurement(
 @router.get("/{unit_id}", response_model=UnitOfMeasurementResponse)
 async def get_unit_of_measurement(
     unit_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get a unit of measurement by ID."""
@@ -74,7 +76,7 @@ async def list_units_of_measurement(
     sort_field: str = Query("name", description="Field to sort by"),
     sort_direction: str = Query("asc", description="Sort direction (asc/desc)"),
     include_inactive: bool = Query(False, description="Include inactive units"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """List units of measurement with pagination, filtering, and sorting."""
@@ -166,7 +168,7 @@ async def search_units_of_measurement(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     include_inactive: bool = Query(False, description="Include inactive units"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Search units of measurement by name, code, or description."""
@@ -180,11 +182,15 @@ async def search_units_of_measurement(
 
 @router.get("/active/", response_model=List[UnitOfMeasurementSummary])
 async def get_active_units_of_measurement(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+    cache: CachedRoute = Depends(cached_route(UnitOfMeasurement))
 ):
     """Get all active units of measurement."""
-    return await unit_of_measurement_service.get_active_units(db)
+    return await cache.respond(
+        List[UnitOfMeasurementSummary],
+        lambda: unit_of_measurement_service.get_active_units(db)
+    )
 
 
 @router.get("/stats/", response_model=UnitOfMeasurementStats)
@@ -13,6 +13,7 @@ import asyncio
 
 from redis import asyncio as aioredis
 from app.core.config import settings
+from app.core.metrics import record_cache_lookup, redis_command_duration
 
 
 class CacheManager:
@@ -80,7 +81,9 @@ class CacheManager:
         """Get value from cache."""
         client = await self.get_client()
         try:
-            value = await client.get(key)
+            with redis_command_duration.time(command="get"):
+                value = await client.get(key)
+            record_cache_lookup("rental", bool(value))
             if value:
                 return pickle.loads(value)
         except Exception as e:
@@ -93,7 +96,8 @@ class CacheManager:
         client = await self.get_client()
         try:
             serialized = pickle.dumps(value)
-            await client.setex(key, ttl, serialized)
+            with redis_command_duration.time(command="setex"):
+                await client.setex(key, ttl, serialized)
         except Exception as e:
             # Log error but don't fail
             print(f"Cache set error for {key}: {e}")
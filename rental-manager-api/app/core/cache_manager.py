@@ -11,6 +11,7 @@ from functools import wraps
 import asyncio
 from redis import asyncio as aioredis
 from app.core.config import settings
+from app.core.metrics import record_cache_lookup, redis_command_duration
 
 
 class CacheManager:
@@ -53,7 +54,9 @@ class CacheManager:
             return None
         
         try:
-            value = await self.redis_client.get(key)
+            with redis_command_duration.time(command="get"):
+                value = await self.redis_client.get(key)
+            record_cache_lookup("query", bool(value))
             if value:
                 return json.loads(value)
         except Exception as e:
@@ -74,7 +77,8 @@ class CacheManager:
         try:
             serialized = json.dumps(value, default=str)
             ttl = ttl or self.default_ttl
-            await self.redis_client.setex(key, ttl, serialized)
+            with redis_command_duration.time(command="setex"):
+                await self.redis_client.setex(key, ttl, serialized)
             return True
         except Exception as e:
             print(f"Cache set error: {e}")
@@ -1,11 +1,18 @@
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Dict, List, Optional
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy import MetaData
 import logging
+import time
 
 from app.core.config import settings
+from app.core.db_pools import BACKGROUND, INTERACTIVE, REPLICA, install_idle_ping, pool_profile, pool_utilization
+from app.core.metrics import db_pool_checkout_timeouts, db_pool_checkout_wait
+from app.core.query_profiler import query_profiler
+from app.core.read_replicas import Replica, ReplicaRouter, consistency_key, consistency_token
 
 logger = logging.getLogger(__name__)
 
@@ -24,58 +31,174 @@ metadata = MetaData(naming_convention=convention)
 Base = declarative_base(metadata=metadata)
 
 
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout wait time and timeouts, labelled by pool name."""
+
+    def connect(self):
+        pool = self._orig_logging_name or "default"
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            db_pool_checkout_timeouts.inc(pool=pool)
+            raise
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started, pool=pool)
+
+
+def _connect_args(database_url: str) -> dict:
+    """Driver options; asyncpg keeps prepared statements per connection."""
+    if "+asyncpg" in database_url:
+        return {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+    return {}
+
+
 class DatabaseManager:
     """Manages database connections and sessions"""
 
     def __init__(self):
         self.engine: Optional[AsyncEngine] = None
         self.async_session_maker: Optional[async_sessionmaker] = None
+        self._lean_session_maker: Optional[async_sessionmaker] = None
+        self.background_engine: Optional[AsyncEngine] = None
+        self._background_session_maker: Optional[async_sessionmaker] = None
+        self.replica_router: Optional[ReplicaRouter] = None
+        self.pool_profile = pool_profile(settings)
+
+    def _create_engine(self, database_url: str, pool: str = INTERACTIVE) -> AsyncEngine:
+        options = dict(
+            echo=settings.DEBUG,  # Log SQL queries in debug mode
+            query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
+            connect_args=_connect_args(database_url),
+            pool_logging_name=pool,
+        )
+        if settings.is_testing:
+            # Use NullPool for testing to avoid connection issues
+            options.update(poolclass=NullPool)
+        else:
+            options.update(
+                poolclass=InstrumentedAsyncPool,
+                pool_timeout=settings.DB_BACKGROUND_POOL_TIMEOUT if pool == BACKGROUND else settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+                **self.pool_profile.pool_args(pool),
+            )
+        engine = create_async_engine(database_url, **options)
+        # Ping only connections left idle long enough to have been dropped
+        install_idle_ping(engine, pool, settings.DB_POOL_PING_IDLE_SECONDS)
+        return engine
+
+    @staticmethod
+    def _create_session_maker(engine: AsyncEngine, lean: bool = False) -> async_sessionmaker:
+        if lean:
+            # No BEGIN/COMMIT round trips; each statement reads committed data
+            engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        return async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
 
     async def connect(self) -> None:
         """Initialize database connection"""
         try:
-            # Create async engine with connection pooling
-            self.engine = create_async_engine(
-                settings.DATABASE_URL,
-                echo=settings.DEBUG,  # Log SQL queries in debug mode
-                pool_size=20,
-                max_overflow=40,
-                pool_pre_ping=True,  # Verify connections before using
-                pool_recycle=3600,  # Recycle connections after 1 hour
-                # Use NullPool for testing to avoid connection issues
-                poolclass=NullPool if settings.is_testing else None,
-            )
+            # Separate pools for API requests and for reports, exports and jobs
+            self.engine = self._create_engine(settings.DATABASE_URL, INTERACTIVE)
+            self.background_engine = self._create_engine(settings.DATABASE_URL, BACKGROUND)
 
-            # Create async session maker
-            self.async_session_maker = async_sessionmaker(
-                self.engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-                autocommit=False,
-                autoflush=False,
-            )
+            if settings.SQL_PROFILING_ENABLED:
+                query_profiler.instrument(self.engine)
+                query_profiler.instrument(self.background_engine)
+
+            # Create async session makers
+            self.async_session_maker = self._create_session_maker(self.engine)
+            self._lean_session_maker = self._create_session_maker(self.engine, lean=True)
+            self._background_session_maker = self._create_session_maker(self.background_engine)
 
             # Test the connection
             async with self.engine.begin() as conn:
                 await conn.run_sync(lambda _: None)
 
-            logger.info("Database connection established successfully")
+            logger.info(
+                f"Database connection established successfully "
+                f"(pool profile {settings.DB_POOL_PROFILE}: {self.pool_profile})"
+            )
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
+        self.connect_replicas(settings.read_replica_urls)
+
+    def connect_replicas(self, database_urls: List[str]) -> None:
+        """
+        Set up read replicas. They are not contacted here: an unreachable
+        replica fails its lag check and reads fall back to the primary.
+        """
+        replicas = []
+        for database_url in database_urls:
+            engine = self._create_engine(database_url, REPLICA)
+            if settings.SQL_PROFILING_ENABLED:
+                query_profiler.instrument(engine)
+            replicas.append(Replica.from_engine(
+                engine, self._create_session_maker(engine), self._create_session_maker(engine, lean=True)
+            ))
+
+        self.replica_router = ReplicaRouter(
+            replicas,
+            max_lag=settings.READ_REPLICA_MAX_LAG_SECONDS,
+            sticky_seconds=settings.READ_YOUR_WRITES_SECONDS,
+            check_interval=settings.READ_REPLICA_LAG_CHECK_SECONDS,
+            secret=settings.SECRET_KEY,
+        ) if replicas else None
+        if replicas:
+            logger.info(f"Routing read-only requests across {len(replicas)} replica(s)")
+
     async def disconnect(self) -> None:
         """Close database connection"""
+        if self.replica_router:
+            await self.replica_router.dispose()
+        if self.background_engine:
+            await self.background_engine.dispose()
         if self.engine:
             await self.engine.dispose()
             logger.info("Database connection closed")
 
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+    @property
+    def lean_session_maker(self) -> Optional[async_sessionmaker]:
+        """Autocommit sessions on the interactive pool, for requests that only read"""
+        return self._lean_session_maker or self.async_session_maker
+
+    @property
+    def background_session_maker(self) -> Optional[async_sessionmaker]:
+        """Sessions on the background pool, for reports, exports and jobs"""
+        return self._background_session_maker or self.async_session_maker
+
+    def pools(self) -> Dict[str, object]:
+        """Connection pools by name, for metrics"""
+        pools = {}
+        if self.engine:
+            pools[INTERACTIVE] = self.engine.pool
+        if self.background_engine:
+            pools[BACKGROUND] = self.background_engine.pool
+        if self.replica_router:
+            for replica in self.replica_router.replicas:
+                pools[f"{REPLICA}:{replica.name}"] = replica.engine.pool
+        return pools
+
+    def interactive_utilization(self) -> float:
+        """Share of the interactive pool's connections currently checked out"""
+        if not self.engine:
+            return 0.0
+        return pool_utilization(self.engine.pool, self.pool_profile.interactive_capacity)
+
+    async def get_session(self, pool: str = INTERACTIVE) -> AsyncGenerator[AsyncSession, None]:
         """Get database session"""
         if not self.async_session_maker:
             raise RuntimeError("Database not initialized. Call connect() first.")
 
-        async with self.async_session_maker() as session:
+        session_maker = self.background_session_maker if pool == BACKGROUND else self.async_session_maker
+        async with session_maker() as session:
             try:
                 yield session
                 await session.commit()
@@ -85,6 +208,43 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    async def read_session_maker(
+        self,
+        consistency_key: Optional[str] = None,
+        pool: str = INTERACTIVE,
+        lean: bool = False,
+        consistency_token: Optional[str] = None,
+    ) -> async_sessionmaker:
+        """
+        Session maker for reads: a replica's when one is current enough, else
+        the primary's ``pool``. ``lean`` sessions run in autocommit (interactive
+        reads only); server-side cursors need the transactional kind.
+        """
+        if not self.async_session_maker:
+            raise RuntimeError("Database not initialized. Call connect() first.")
+        replica = (
+            await self.replica_router.choose(consistency_key, consistency_token) if self.replica_router else None
+        )
+        if replica:
+            return (replica.lean_session_maker or replica.session_maker) if lean else replica.session_maker
+        if pool == BACKGROUND:
+            return self.background_session_maker
+        return self.lean_session_maker if lean else self.async_session_maker
+
+    async def get_read_session(
+        self,
+        consistency_key: Optional[str] = None,
+        pool: str = INTERACTIVE,
+        lean: bool = False,
+        consistency_token: Optional[str] = None,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Session for reads only, never committed; see ``read_session_maker``"""
+        session_maker = await self.read_session_maker(consistency_key, pool, lean, consistency_token)
+        async with session_maker() as session:
+            yield session
+            if session.new or session.dirty or session.deleted:
+                logger.warning("Read-only session closed with unsaved changes; they were discarded")
+
 
 # Global database manager instance
 db_manager = DatabaseManager()
@@ -102,6 +262,56 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_lean_session_factory() -> async_sessionmaker:
+    """
+    Dependency returning the primary's autocommit session maker, for short
+    lookups that open a session and release its connection straight away.
+    """
+    if not db_manager.async_session_maker:
+        raise RuntimeError("Database not initialized. Call connect() first.")
+    return db_manager.lean_session_maker
+
+
+def request_consistency_key(request: Request) -> str:
+    """Read-your-writes key of the client making ``request``"""
+    return consistency_key(request.headers, request.client.host if request.client else None)
+
+
+def request_consistency_token(request: Request) -> Optional[str]:
+    """Read-your-writes token sent with ``request``, if any"""
+    return consistency_token(request.headers, request.cookies)
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for list and detail endpoints, which only read.
+
+    The session runs in autocommit and is never committed, which saves the
+    BEGIN and COMMIT round trips of ``get_db``; each statement sees the
+    latest committed data rather than one snapshot. It may be on a read
+    replica, which can trail the primary by up to
+    READ_REPLICA_MAX_LAG_SECONDS except for a client's own recent writes.
+    Changes added to it are not saved.
+    """
+    async for session in db_manager.get_read_session(
+        request_consistency_key(request), lean=True, consistency_token=request_consistency_token(request)
+    ):
+        yield session
+
+
+async def get_report_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Like ``get_read_db``, for reports, statistics and exports: without a
+    usable replica the session comes from the background pool, so long
+    report queries do not hold interactive connections. The session is
+    transactional, so a report reads one snapshot and may stream.
+    """
+    async for session in db_manager.get_read_session(
+        request_consistency_key(request), BACKGROUND, consistency_token=request_consistency_token(request)
+    ):
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database tables (for development/testing)"""
     if not db_manager.engine:
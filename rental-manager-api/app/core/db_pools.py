@@ -0,0 +1,137 @@
+"""
+Connection pool profiles, liveness checks and admission control.
+
+The primary database is reached through two pools:
+
+- ``interactive`` serves API requests.
+- ``background`` serves reports, exports, scheduled jobs and the background
+  job runner, so a slow export holds its own connections rather than the
+  ones checkout traffic is waiting for.
+
+Pool sizes come from a named profile (``DB_POOL_PROFILE``). ``auto`` splits
+the per-process budget ``DB_MAX_CONNECTIONS``; any single size can be
+overridden with ``DB_POOL_SIZE`` and friends.
+
+Liveness: instead of pre-pinging on every checkout, which costs a round
+trip per request, a connection is pinged only when it has sat idle in the
+pool for ``DB_POOL_PING_IDLE_SECONDS`` - the connections a server restart or
+idle timeout may have closed. Busy pools never ping. Connections older than
+``DB_POOL_RECYCLE_SECONDS`` are replaced, and a connection that fails during
+a query still invalidates the pool as before.
+
+Admission: when the interactive pool is more than
+``DB_ADMISSION_SHED_UTILIZATION`` checked out, requests on low-priority
+paths (exports, analytics, statistics) are answered 503 with
+``Retry-After`` before they take a connection, leaving the rest for
+interactive traffic.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import db_pool_stale_connections
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+REPLICA = "replica"  # read replicas are sized like the interactive pool
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    """Sizes of the interactive and background pools."""
+
+    pool_size: int
+    max_overflow: int
+    background_pool_size: int
+    background_max_overflow: int
+
+    @property
+    def interactive_capacity(self) -> int:
+        return self.pool_size + self.max_overflow
+
+    def pool_args(self, pool: str) -> Dict[str, int]:
+        """``create_engine`` sizing arguments for ``pool``."""
+        if pool == BACKGROUND:
+            return {"pool_size": self.background_pool_size, "max_overflow": self.background_max_overflow}
+        return {"pool_size": self.pool_size, "max_overflow": self.max_overflow}
+
+
+POOL_PROFILES: Dict[str, PoolProfile] = {
+    "small": PoolProfile(pool_size=5, max_overflow=5, background_pool_size=2, background_max_overflow=2),
+    "standard": PoolProfile(pool_size=20, max_overflow=20, background_pool_size=5, background_max_overflow=10),
+    "large": PoolProfile(pool_size=40, max_overflow=40, background_pool_size=10, background_max_overflow=20),
+}
+
+
+def auto_profile(max_connections: int) -> PoolProfile:
+    """
+    Split a connection budget: a quarter for background work, and half of
+    each pool kept open with the other half as overflow.
+    """
+    background = max(max_connections // 4, 2)
+    interactive = max(max_connections - background, 2)
+    return PoolProfile(
+        pool_size=(interactive + 1) // 2,
+        max_overflow=interactive // 2,
+        background_pool_size=(background + 1) // 2,
+        background_max_overflow=background // 2,
+    )
+
+
+def pool_profile(settings) -> PoolProfile:
+    """The configured profile with any explicit size overrides applied."""
+    if settings.DB_POOL_PROFILE == "auto":
+        profile = auto_profile(settings.DB_MAX_CONNECTIONS)
+    else:
+        profile = POOL_PROFILES[settings.DB_POOL_PROFILE]
+
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "background_pool_size": settings.DB_BACKGROUND_POOL_SIZE,
+        "background_max_overflow": settings.DB_BACKGROUND_MAX_OVERFLOW,
+    }
+    return replace(profile, **{field: value for field, value in overrides.items() if value is not None})
+
+
+def install_idle_ping(engine: AsyncEngine, pool: str, idle_seconds: float) -> None:
+    """
+    Ping a connection at checkout only if it sat idle in the pool for
+    ``idle_seconds``. A dead one raises ``DisconnectionError``, which makes
+    the pool discard it and check out a fresh connection instead.
+    """
+    dialect = engine.dialect
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        if dbapi_connection is not None:
+            connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        idle_since = connection_record.info.pop("idle_since", None)
+        if idle_since is None or time.monotonic() - idle_since < idle_seconds:
+            return
+        try:
+            alive = dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            logger.info(f"Idle {pool} pool connection failed its ping: {e}")
+            alive = False
+        if not alive:
+            db_pool_stale_connections.inc(pool=pool)
+            raise DisconnectionError("Connection was closed while idle in the pool")
+
+
+def pool_utilization(pool, capacity: int) -> float:
+    """Share of ``capacity`` currently checked out; 0 for pools that do not track it."""
+    if capacity <= 0 or not hasattr(pool, "checkedout"):
+        return 0.0
+    return pool.checkedout() / capacity
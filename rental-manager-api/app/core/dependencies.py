@@ -1,9 +1,9 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, get_report_db
 from app.crud.brand import BrandRepository
 from app.crud.category import CategoryRepository  
 from app.crud.unit_of_measurement import UnitOfMeasurementRepository
@@ -14,6 +14,9 @@ from app.services.unit_of_measurement import UnitOfMeasurementService
 from app.services.item import ItemService
 from app.services.item_rental_blocking import ItemRentalBlockingService
 from app.services.sku_generator import SKUGenerator
+from app.services.price_book import PriceBookService
+from app.services.background_job import BackgroundJobService
+from app.services.transaction.pricing_engine import RentalPricingEngine
 
 
 # Security scheme
@@ -127,6 +130,19 @@ async def get_current_user_id(
     return str(current_user.id) if current_user else None
 
 
+# Idempotency key for endpoints that queue background jobs
+async def get_idempotency_key(
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Resubmitting a request with the same key returns the original job"
+    )
+) -> Optional[str]:
+    """Get the client's idempotency key, if any"""
+    return idempotency_key
+
+
 # Service Dependencies
 async def get_brand_service(db: AsyncSession = Depends(get_db)) -> BrandService:
     """Get brand service instance."""
@@ -134,6 +150,11 @@ async def get_brand_service(db: AsyncSession = Depends(get_db)) -> BrandService:
     return BrandService(repository)
 
 
+async def get_brand_read_service(db: AsyncSession = Depends(get_read_db)) -> BrandService:
+    """Get brand service instance for list and detail endpoints."""
+    return BrandService(BrandRepository(db))
+
+
 async def get_category_service(db: AsyncSession = Depends(get_db)) -> CategoryService:
     """Get category service instance."""
     repository = CategoryRepository(db)
@@ -165,9 +186,51 @@ async def get_item_service(
     return ItemService(repository, sku_generator)
 
 
+async def get_item_read_service(db: AsyncSession = Depends(get_read_db)) -> ItemService:
+    """Get item service instance for list and detail endpoints."""
+    return ItemService(ItemRepository(db), SKUGenerator(db))
+
+
+async def get_item_report_service(db: AsyncSession = Depends(get_report_db)) -> ItemService:
+    """Get item service instance for statistics and exports (replica or background pool)."""
+    return ItemService(ItemRepository(db), SKUGenerator(db))
+
+
 async def get_item_rental_blocking_service(
     db: AsyncSession = Depends(get_db),
     item_repository: ItemRepository = Depends(get_item_repository)
 ) -> ItemRentalBlockingService:
     """Get item rental blocking service instance."""
-    return ItemRentalBlockingService(db, item_repository)
\ No newline at end of file
+    return ItemRentalBlockingService(db, item_repository)
+
+
+async def get_item_rental_blocking_read_service(
+    db: AsyncSession = Depends(get_read_db)
+) -> ItemRentalBlockingService:
+    """Get item rental blocking service instance for list and detail endpoints."""
+    return ItemRentalBlockingService(db, ItemRepository(db))
+
+
+async def get_rental_pricing_engine(db: AsyncSession = Depends(get_db)) -> RentalPricingEngine:
+    """Get rental pricing engine instance."""
+    return RentalPricingEngine(db)
+
+
+async def get_price_book_service(db: AsyncSession = Depends(get_db)) -> PriceBookService:
+    """Get price book service instance."""
+    return PriceBookService(db)
+
+
+async def get_price_book_read_service(db: AsyncSession = Depends(get_read_db)) -> PriceBookService:
+    """Get price book service instance for list and detail endpoints."""
+    return PriceBookService(db)
+
+
+async def get_background_job_service(db: AsyncSession = Depends(get_db)) -> BackgroundJobService:
+    """Get background job service instance."""
+    return BackgroundJobService(db)
+
+
+async def get_background_job_read_service(db: AsyncSession = Depends(get_read_db)) -> BackgroundJobService:
+    """Get background job service instance for list and detail endpoints."""
+    return BackgroundJobService(db)
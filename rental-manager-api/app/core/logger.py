@@ -1,6 +1,6 @@
 """
 Enhanced logging system for transaction debugging.
-Provides structured logging with timestamps and markdown formatting.
+Provides structured logging with timestamps and offline markdown rendering.
 """
 
 import logging
@@ -10,210 +10,246 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import traceback
 
+from app.core.logging_config import logging_manager
+
 
 class TransactionLogger:
-    """Specialized logger for transaction debugging."""
+    """
+    Specialized logger for transaction debugging.
+
+    Events are emitted as structured records through the non-blocking queue
+    pipeline in ``app.core.logging_config`` and stored as JSON lines. The
+    Markdown trace is produced offline with :func:`render_markdown` instead
+    of being written on the request path.
+    """
     
     def __init__(self, log_dir: str = "logs", log_type: str = "transaction"):
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_type = log_type
         
-        # Create log file with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.log_file = self.log_dir / f"{log_type}_{timestamp}.md"
-        
-        # Initialize markdown log file
-        self._init_markdown_log()
-        
-        # Setup Python logger
-        self.logger = logging.getLogger(f"{log_type}_logger")
-        self.logger.setLevel(logging.DEBUG)
+        # Structured event log, one JSON object per line
+        self.log_file = self.log_dir / f"{log_type}_transactions.jsonl"
         
-        # Create console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
-        # Create file handler
-        file_handler = logging.FileHandler(
-            self.log_dir / f"{log_type}_{timestamp}.log"
+        # Records also propagate to the root logger for console output
+        self.logger = logging_manager.get_queued_logger(
+            f"{log_type}_logger",
+            self.log_file,
+            level=logging.DEBUG,
+            propagate=True,
         )
-        file_handler.setLevel(logging.DEBUG)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
+    def _emit(self, level: int, message: str, event: str, **fields: Any):
+        """Enqueue a structured transaction event."""
+        fields["event"] = event
+        fields["log_type"] = self.log_type
+        self.logger.log(level, message, extra=fields)
+    
+    def render_markdown(self, output_file: Optional[Path] = None) -> str:
+        """Render this logger's structured events as a Markdown trace."""
+        logging_manager.flush()
+        return render_markdown(self.log_file, output_file, self.log_type)
+    
+    def log_transaction_start(self, transaction_data: Dict[str, Any], transaction_id: str = None):
+        """Log the start of a transaction."""
+        self._emit(
+            logging.INFO,
+            f"🔄 TRANSACTION STARTED - ID: {transaction_id}",
+            "transaction_start",
+            transaction_id=transaction_id,
+            data=transaction_data,
+        )
+    
+    def log_validation_step(self, step: str, result: bool, details: str = None):
+        """Log validation step."""
+        status = "✅ PASSED" if result else "❌ FAILED"
+        self._emit(
+            logging.INFO,
+            f"VALIDATION: {step} - {status}",
+            "validation",
+            step=step,
+            passed=result,
+            details=details,
+        )
+    
+    def log_database_operation(self, operation: str, table: str, data: Dict[str, Any] = None):
+        """Log database operation."""
+        self._emit(
+            logging.INFO,
+            f"DB OPERATION: {operation} on {table}",
+            "database_operation",
+            operation=operation,
+            table=table,
+            data=data,
         )
-        console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
-        
-        # Add handlers
-        if not self.logger.handlers:
-            self.logger.addHandler(console_handler)
-            self.logger.addHandler(file_handler)
     
-    def _init_markdown_log(self):
-        """Initialize markdown log file with header."""
-        with open(self.log_file, "w") as f:
-            f.write(f"""# {self.log_type.title()} Transaction Debug Log
+    def log_error(self, error_type: str, error_msg: str, context: Dict[str, Any] = None):
+        """Log error with context."""
+        self._emit(
+            logging.ERROR,
+            f"ERROR: {error_type} - {error_msg}",
+            "error",
+            error_type=error_type,
+            error_message=error_msg,
+            data=context,
+            stack_trace=traceback.format_exc(),
+        )
+    
+    def log_success(self, message: str, result_data: Dict[str, Any] = None):
+        """Log successful completion."""
+        self._emit(
+            logging.INFO,
+            f"SUCCESS: {message}",
+            "success",
+            title=message,
+            data=result_data,
+        )
+    
+    def log_custom(self, title: str, message: str, data: Dict[str, Any] = None, log_level: str = "info"):
+        """Log custom message."""
+        self._emit(
+            getattr(logging, log_level.upper()),
+            f"{title}: {message}",
+            "custom",
+            title=title,
+            detail=message,
+            data=data,
+        )
 
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
----
+def _json_block(label: str, data: Any) -> str:
+    """Format a JSON code block for the Markdown trace."""
+    return f"""**{label}:**
+```json
+{json.dumps(data, indent=2, default=str)}
+```
 
-## Transaction Processing Log
+"""
 
-This log tracks the complete flow of transactions and related operations.
 
-""")
+def _render_event(event: Dict[str, Any], log_type: str) -> str:
+    """Render a single structured event as a Markdown section."""
+    timestamp = event.get("time", "")
+    data = event.get("data")
+    kind = event.get("event")
     
-    def _write_markdown(self, content: str):
-        """Write content to markdown log file."""
-        with open(self.log_file, "a") as f:
-            f.write(content + "\n")
-    
-    def log_transaction_start(self, transaction_data: Dict[str, Any], transaction_id: str = None):
-        """Log the start of a transaction."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        # Console/file log
-        self.logger.info(f"🔄 TRANSACTION STARTED - ID: {transaction_id}")
-        
-        # Markdown log
-        content = f"""
-### 🔄 {self.log_type.title()} Transaction Started
+    if kind == "transaction_start":
+        data = data or {}
+        return f"""
+### 🔄 {log_type.title()} Transaction Started
 **Timestamp:** {timestamp}  
-**Transaction ID:** {transaction_id or "Not yet assigned"}
-
-**Transaction Data:**
-```json
-{json.dumps(transaction_data, indent=2, default=str)}
-```
+**Transaction ID:** {event.get("transaction_id") or "Not yet assigned"}
 
-**Items Count:** {len(transaction_data.get('items', []))}  
-**Customer/Supplier ID:** {transaction_data.get('customer_id') or transaction_data.get('supplier_id')}  
-**Location ID:** {transaction_data.get('location_id')}
+{_json_block("Transaction Data", data)}**Items Count:** {len(data.get('items', []))}  
+**Customer/Supplier ID:** {data.get('customer_id') or data.get('supplier_id')}  
+**Location ID:** {data.get('location_id')}
 
 ---
 """
-        self._write_markdown(content)
     
-    def log_validation_step(self, step: str, result: bool, details: str = None):
-        """Log validation step."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        status = "✅ PASSED" if result else "❌ FAILED"
-        
-        self.logger.info(f"VALIDATION: {step} - {status}")
-        
-        content = f"""
-#### {status} Validation: {step}
+    if kind == "validation":
+        status = "✅ PASSED" if event.get("passed") else "❌ FAILED"
+        return f"""
+#### {status} Validation: {event.get("step")}
 **Timestamp:** {timestamp}
 
-{details or "No additional details"}
+{event.get("details") or "No additional details"}
 
 """
-        self._write_markdown(content)
     
-    def log_database_operation(self, operation: str, table: str, data: Dict[str, Any] = None):
-        """Log database operation."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        self.logger.info(f"DB OPERATION: {operation} on {table}")
-        
+    if kind == "database_operation":
         content = f"""
-#### 💾 Database Operation: {operation}
+#### 💾 Database Operation: {event.get("operation")}
 **Timestamp:** {timestamp}  
-**Table:** {table}
+**Table:** {event.get("table")}
 
 """
-        
-        if data:
-            content += f"""**Data:**
-```json
-{json.dumps(data, indent=2, default=str)}
-```
-
-"""
-        
-        self._write_markdown(content)
+        return content + (_json_block("Data", data) if data else "")
     
-    def log_error(self, error_type: str, error_msg: str, context: Dict[str, Any] = None):
-        """Log error with context."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        self.logger.error(f"ERROR: {error_type} - {error_msg}")
-        
+    if kind == "error":
         content = f"""
-### ❌ ERROR: {error_type}
+### ❌ ERROR: {event.get("error_type")}
 **Timestamp:** {timestamp}  
-**Message:** {error_msg}
+**Message:** {event.get("error_message")}
 
 """
-        
-        if context:
-            content += f"""**Context:**
-```json
-{json.dumps(context, indent=2, default=str)}
-```
-
-"""
-        
-        # Add stack trace if available
-        content += f"""**Stack Trace:**
+        if data:
+            content += _json_block("Context", data)
+        return content + f"""**Stack Trace:**
 ```
-{traceback.format_exc()}
+{event.get("stack_trace", "")}
 ```
 
 ---
 """
-        
-        self._write_markdown(content)
     
-    def log_success(self, message: str, result_data: Dict[str, Any] = None):
-        """Log successful completion."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        self.logger.info(f"SUCCESS: {message}")
-        
+    if kind == "success":
         content = f"""
-### ✅ SUCCESS: {message}
+### ✅ SUCCESS: {event.get("title")}
 **Timestamp:** {timestamp}
 
 """
-        
-        if result_data:
-            content += f"""**Result Data:**
-```json
-{json.dumps(result_data, indent=2, default=str)}
-```
-
-"""
-        
-        content += "---\n"
-        self._write_markdown(content)
+        if data:
+            content += _json_block("Result Data", data)
+        return content + "---\n"
     
-    def log_custom(self, title: str, message: str, data: Dict[str, Any] = None, log_level: str = "info"):
-        """Log custom message."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        getattr(self.logger, log_level.lower())(f"{title}: {message}")
-        
-        content = f"""
-#### {title}
+    content = f"""
+#### {event.get("title", event.get("message"))}
 **Timestamp:** {timestamp}  
-**Message:** {message}
+**Message:** {event.get("detail", event.get("message"))}
 
 """
-        
-        if data:
-            content += f"""**Data:**
-```json
-{json.dumps(data, indent=2, default=str)}
-```
+    return content + (_json_block("Data", data) if data else "")
 
-"""
-        
-        self._write_markdown(content)
+
+def render_markdown(
+    log_file: Path,
+    output_file: Optional[Path] = None,
+    log_type: str = "transaction",
+) -> str:
+    """
+    Render a structured transaction log as a Markdown debug trace.
+    
+    This is an offline tool: it reads the JSON-lines file written by
+    :class:`TransactionLogger` and never runs on the request path.
+    
+    Args:
+        log_file: JSON-lines event log to read
+        output_file: Optional path the Markdown is also written to
+        log_type: Transaction type used in headings
+    
+    Returns:
+        The rendered Markdown document
+    """
+    sections = [f"""# {log_type.title()} Transaction Debug Log
+
+**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+---
+
+## Transaction Processing Log
+
+This log tracks the complete flow of transactions and related operations.
+
+"""]
+    
+    log_path = Path(log_file)
+    if log_path.exists():
+        with open(log_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                sections.append(_render_event(event, log_type) + "\n")
+    
+    markdown = "".join(sections)
+    if output_file:
+        Path(output_file).write_text(markdown)
+    return markdown
 
 
 # Create specialized loggers for different transaction types
@@ -3,130 +3,416 @@ Centralized Logging Configuration
 
 This module provides centralized configuration for all logging components
 including transaction logging, audit logging, and API request/response logging.
+
+All file and console output goes through a QueueHandler/QueueListener
+pipeline: loggers only enqueue records on the calling thread (usually the
+event loop), while a background listener thread formats them as JSON lines,
+writes them in batches and handles size- or time-based rotation.
 """
 
+import atexit
+import json
 import logging
 import logging.handlers
-import os
-from pathlib import Path
-from typing import Dict, Any, Optional
+import queue
+import threading
+import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 
 from app.core.config import settings
 
 
+# Attributes every LogRecord carries; anything else was passed via ``extra``
+_RESERVED_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
 @dataclass
 class LoggingConfig:
     """Configuration class for all logging settings."""
-    
+
     # General logging settings
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+    console_json: bool = False
+
     # File logging settings
     log_directory: str = "logs"
+    rotation: str = "size"  # "size" or "time"
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
-    
+    rotation_when: str = "midnight"
+
+    # Queue pipeline settings
+    batch_size: int = 100
+    flush_interval: float = 1.0  # seconds
+    debug_sample_rate: float = 1.0  # 1.0 keeps every DEBUG record
+
     # Transaction logging settings
     transaction_log_directory: str = "logs/transactions"
     transaction_log_enabled: bool = True
-    
+
     # API logging settings
     api_log_enabled: bool = True
     api_log_include_request_body: bool = True
     api_log_include_response_body: bool = False
     api_log_max_body_size: int = 10000
-    
+
     # Audit logging settings
     audit_log_enabled: bool = True
-    
+
     # Performance logging settings
     slow_query_threshold: float = 1.0  # seconds
     log_sql_queries: bool = False
-    
+
     # Error tracking settings
     error_tracking_enabled: bool = True
     capture_stack_traces: bool = True
 
+    @classmethod
+    def from_settings(cls) -> "LoggingConfig":
+        """Build a logging configuration from application settings."""
+        return cls(
+            log_level=settings.LOG_LEVEL,
+            console_json=settings.LOG_FORMAT == "json",
+            log_directory=settings.LOG_DIR,
+            rotation=settings.LOG_ROTATION,
+            max_file_size=settings.LOG_MAX_BYTES,
+            backup_count=settings.LOG_BACKUP_COUNT,
+            rotation_when=settings.LOG_ROTATION_WHEN,
+            batch_size=settings.LOG_BATCH_SIZE,
+            flush_interval=settings.LOG_FLUSH_INTERVAL,
+            debug_sample_rate=settings.LOG_DEBUG_SAMPLE_RATE,
+            transaction_log_directory=str(Path(settings.LOG_DIR) / "transactions"),
+        )
+
+
+class JSONFormatter(logging.Formatter):
+    """Render a record as a single JSON line, including any ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = record.stack_info
+
+        return json.dumps(payload, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of DEBUG records.
+
+    Sampling is deterministic per logger: with a rate of 0.1 every tenth
+    DEBUG record of each logger is kept. Records of INFO and above always pass.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        super().__init__()
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self._every = round(1 / self.sample_rate) if self.sample_rate > 0 else 0
+        self._counters: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.sample_rate >= 1.0:
+            return True
+        if not self._every:
+            return False
+
+        count = self._counters.get(record.name, 0)
+        self._counters[record.name] = count + 1
+        return count % self._every == 0
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps ``extra`` fields and exception text separate.
+
+    The stock handler merges the traceback into the message, which would
+    lose structure before the JSON formatter sees the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _DeferredFlushMixin:
+    """Lets a BatchingHandler suppress the per-record flush of a stream handler."""
+
+    _defer_flush = False
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
+
+class SizeRotatingFileHandler(_DeferredFlushMixin, logging.handlers.RotatingFileHandler):
+    """Size-based rotating file handler that supports batched writes."""
+
+
+class TimeRotatingFileHandler(_DeferredFlushMixin, logging.handlers.TimedRotatingFileHandler):
+    """Time-based rotating file handler that supports batched writes."""
+
+
+class BatchingHandler(logging.handlers.MemoryHandler):
+    """
+    Buffer records and hand them to the target handler in batches.
+
+    A batch is written when it reaches ``capacity`` records, when a record at
+    or above ``flush_level`` arrives, or when the oldest buffered record is
+    older than ``flush_interval`` seconds. The target stream is flushed once
+    per batch instead of once per record.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = 100,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+    ):
+        super().__init__(capacity, flushLevel=flush_level, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self._batch_started: Optional[float] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._batch_started is None:
+            self._batch_started = time.monotonic()
+        super().emit(record)
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or self.is_due()
+
+    def is_due(self) -> bool:
+        """Whether the buffered batch has waited longer than the flush interval."""
+        return (
+            self._batch_started is not None
+            and time.monotonic() - self._batch_started >= self.flush_interval
+        )
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.target or not self.buffer:
+                return
+            deferrable = isinstance(self.target, _DeferredFlushMixin)
+            if deferrable:
+                self.target._defer_flush = True
+            try:
+                for record in self.buffer:
+                    self.target.handle(record)
+            finally:
+                if deferrable:
+                    self.target._defer_flush = False
+                self.target.flush()
+                self.buffer.clear()
+                self._batch_started = None
+
+
+class _FlushRequest:
+    """Queue marker asking the listener to flush once earlier records are handled."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that also flushes due batches while the queue is idle."""
+
+    def __init__(self, log_queue: queue.SimpleQueue, *handlers: logging.Handler, flush_interval: float = 1.0):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block=block, timeout=self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                self.flush_due()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        if isinstance(record, _FlushRequest):
+            self.flush()
+            record.done.set()
+            return
+        super().handle(record)
+
+    def sync(self, timeout: float = 5.0) -> None:
+        """Wait until everything enqueued so far has been written out."""
+        if self._thread is None:
+            self.flush()
+            return
+        request = _FlushRequest()
+        self.queue.put_nowait(request)
+        request.done.wait(timeout)
+
+    def flush_due(self) -> None:
+        for handler in self.handlers:
+            if isinstance(handler, BatchingHandler) and handler.is_due():
+                handler.flush()
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed, e.g. stderr during interpreter exit
+                pass
+
 
 class LoggingManager:
     """
     Centralized logging manager for the entire application.
-    
+
     This class manages all logging configurations including:
     - Standard application logging
     - Transaction logging
     - API request/response logging
     - Audit logging
     - Error tracking
+
+    Every logger it configures only carries a QueueHandler; file I/O happens
+    on listener threads so disk latency never reaches request handling.
     """
-    
-    def __init__(self, config: Optional[LoggingConfig] = None):
+
+    def __init__(self, config: Optional[LoggingConfig] = None, configure_root: bool = True):
         """
         Initialize the logging manager.
-        
+
         Args:
             config: Logging configuration. If None, uses default configuration.
+            configure_root: Install the queue pipeline on the root logger.
         """
         self.config = config or LoggingConfig()
-        self._setup_directories()
-        self._configure_root_logger()
         self._loggers: Dict[str, logging.Logger] = {}
-        
+        self._listeners: List[BatchingQueueListener] = []
+        self._lock = threading.Lock()
+        self._setup_directories()
+        if configure_root:
+            self._configure_root_logger()
+        atexit.register(self.shutdown)
+
     def _setup_directories(self) -> None:
         """Create necessary log directories."""
         directories = [
             self.config.log_directory,
             self.config.transaction_log_directory,
         ]
-        
+
         for directory in directories:
             Path(directory).mkdir(parents=True, exist_ok=True)
-    
+
+    def _build_file_handler(self, path: Path, level: int = logging.NOTSET) -> logging.Handler:
+        """Create a batched, rotating JSON-lines file handler."""
+        if self.config.rotation == "time":
+            file_handler: logging.Handler = TimeRotatingFileHandler(
+                path,
+                when=self.config.rotation_when,
+                backupCount=self.config.backup_count,
+                utc=True,
+            )
+        else:
+            file_handler = SizeRotatingFileHandler(
+                path,
+                maxBytes=self.config.max_file_size,
+                backupCount=self.config.backup_count,
+            )
+        file_handler.setFormatter(JSONFormatter())
+
+        handler = BatchingHandler(
+            file_handler,
+            capacity=self.config.batch_size,
+            flush_interval=self.config.flush_interval,
+        )
+        handler.setLevel(level)
+        return handler
+
+    def _attach_queue(self, logger: logging.Logger, *handlers: logging.Handler) -> None:
+        """Route a logger through a new queue drained by a background listener."""
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = StructuredQueueHandler(log_queue)
+        queue_handler.addFilter(DebugSamplingFilter(self.config.debug_sample_rate))
+        logger.addHandler(queue_handler)
+
+        listener = BatchingQueueListener(
+            log_queue, *handlers, flush_interval=self.config.flush_interval
+        )
+        listener.start()
+        with self._lock:
+            self._listeners.append(listener)
+
     def _configure_root_logger(self) -> None:
         """Configure the root logger with appropriate handlers."""
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, self.config.log_level.upper()))
-        
+
         # Clear existing handlers
         root_logger.handlers.clear()
-        
+
         # Console handler
         console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter(self.config.log_format)
+        console_formatter = (
+            JSONFormatter() if self.config.console_json
+            else logging.Formatter(self.config.log_format)
+        )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
-        
+
         # File handler (rotating)
         log_file_path = Path(self.config.log_directory) / "app.log"
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file_path,
-            maxBytes=self.config.max_file_size,
-            backupCount=self.config.backup_count
-        )
-        file_formatter = logging.Formatter(self.config.log_format)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
-        
+        file_handler = self._build_file_handler(log_file_path)
+
         # Error file handler (for ERROR and CRITICAL only)
         error_log_path = Path(self.config.log_directory) / "errors.log"
-        error_handler = logging.handlers.RotatingFileHandler(
-            error_log_path,
-            maxBytes=self.config.max_file_size,
-            backupCount=self.config.backup_count
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
-    
+        error_handler = self._build_file_handler(error_log_path, logging.ERROR)
+
+        self._attach_queue(root_logger, console_handler, file_handler, error_handler)
+
+    def shutdown(self) -> None:
+        """Drain all queues and flush pending batches to disk."""
+        with self._lock:
+            listeners, self._listeners = self._listeners, []
+        for listener in listeners:
+            if listener._thread is not None:
+                listener.stop()
+            listener.flush()
+
+    def flush(self) -> None:
+        """Write out all queued and buffered records without stopping the listeners."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener.sync()
+
     def get_logger(self, name: str) -> logging.Logger:
         """
         Get or create a logger with the specified name.
-        
+
         Args:
             name: Logger name (typically __name__)
-        
+
         Returns:
             logging.Logger: Configured logger instance
         """
@@ -134,148 +420,97 @@ class LoggingManager:
             logger = logging.getLogger(name)
             logger.setLevel(getattr(logging, self.config.log_level.upper()))
             self._loggers[name] = logger
-        
+
         return self._loggers[name]
-    
+
+    def get_queued_logger(
+        self,
+        name: str,
+        file_path: Path,
+        level: int = logging.INFO,
+        propagate: bool = False,
+    ) -> logging.Logger:
+        """
+        Get a logger that writes JSON lines to its own file through the queue.
+
+        Args:
+            name: Logger name
+            file_path: Destination file; rotated per the configuration
+            level: Minimum level recorded
+            propagate: Also pass records to the root logger
+
+        Returns:
+            logging.Logger: Queue-backed logger
+        """
+        if name not in self._loggers:
+            logger = logging.getLogger(name)
+            logger.setLevel(level)
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            self._attach_queue(logger, self._build_file_handler(Path(file_path)))
+            logger.propagate = propagate
+            self._loggers[name] = logger
+
+        return self._loggers[name]
+
     def get_transaction_logger(self) -> logging.Logger:
         """
         Get logger for transaction operations.
-        
+
         Returns:
             logging.Logger: Transaction logger
         """
         if not self.config.transaction_log_enabled:
             return logging.getLogger("transaction.disabled")
-        
-        logger_name = "transaction"
-        if logger_name not in self._loggers:
-            logger = logging.getLogger(logger_name)
-            logger.setLevel(logging.INFO)
-            
-            # Transaction-specific file handler
-            trans_log_path = Path(self.config.transaction_log_directory) / "transactions.log"
-            handler = logging.handlers.RotatingFileHandler(
-                trans_log_path,
-                maxBytes=self.config.max_file_size,
-                backupCount=self.config.backup_count
-            )
-            
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-            # Prevent propagation to root logger to avoid duplicate logs
-            logger.propagate = False
-            
-            self._loggers[logger_name] = logger
-        
-        return self._loggers[logger_name]
-    
+
+        # Separate file; no propagation to root to avoid duplicate logs
+        return self.get_queued_logger(
+            "transaction",
+            Path(self.config.transaction_log_directory) / "transactions.log",
+        )
+
     def get_api_logger(self) -> logging.Logger:
         """
         Get logger for API requests and responses.
-        
+
         Returns:
             logging.Logger: API logger
         """
         if not self.config.api_log_enabled:
             return logging.getLogger("api.disabled")
-        
-        logger_name = "api"
-        if logger_name not in self._loggers:
-            logger = logging.getLogger(logger_name)
-            logger.setLevel(logging.INFO)
-            
-            # API-specific file handler
-            api_log_path = Path(self.config.log_directory) / "api.log"
-            handler = logging.handlers.RotatingFileHandler(
-                api_log_path,
-                maxBytes=self.config.max_file_size,
-                backupCount=self.config.backup_count
-            )
-            
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-            logger.propagate = False
-            self._loggers[logger_name] = logger
-        
-        return self._loggers[logger_name]
-    
+
+        return self.get_queued_logger(
+            "api", Path(self.config.log_directory) / "api.log"
+        )
+
     def get_audit_logger(self) -> logging.Logger:
         """
         Get logger for audit operations.
-        
+
         Returns:
             logging.Logger: Audit logger
         """
         if not self.config.audit_log_enabled:
             return logging.getLogger("audit.disabled")
-        
-        logger_name = "audit"
-        if logger_name not in self._loggers:
-            logger = logging.getLogger(logger_name)
-            logger.setLevel(logging.INFO)
-            
-            # Audit-specific file handler
-            audit_log_path = Path(self.config.log_directory) / "audit.log"
-            handler = logging.handlers.RotatingFileHandler(
-                audit_log_path,
-                maxBytes=self.config.max_file_size,
-                backupCount=self.config.backup_count
-            )
-            
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-            logger.propagate = False
-            self._loggers[logger_name] = logger
-        
-        return self._loggers[logger_name]
-    
+
+        return self.get_queued_logger(
+            "audit", Path(self.config.log_directory) / "audit.log"
+        )
+
     def get_performance_logger(self) -> logging.Logger:
         """
         Get logger for performance monitoring.
-        
+
         Returns:
             logging.Logger: Performance logger
         """
-        logger_name = "performance"
-        if logger_name not in self._loggers:
-            logger = logging.getLogger(logger_name)
-            logger.setLevel(logging.INFO)
-            
-            # Performance-specific file handler
-            perf_log_path = Path(self.config.log_directory) / "performance.log"
-            handler = logging.handlers.RotatingFileHandler(
-                perf_log_path,
-                maxBytes=self.config.max_file_size,
-                backupCount=self.config.backup_count
-            )
-            
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-            logger.propagate = False
-            self._loggers[logger_name] = logger
-        
-        return self._loggers[logger_name]
-    
+        return self.get_queued_logger(
+            "performance", Path(self.config.log_directory) / "performance.log"
+        )
+
     def log_sql_query(self, query: str, params: Any, duration: float) -> None:
         """
         Log SQL query if enabled and above threshold.
-        
+
         Args:
             query: SQL query string
             params: Query parameters
@@ -283,21 +518,24 @@ class LoggingManager:
         """
         if not self.config.log_sql_queries and duration < self.config.slow_query_threshold:
             return
-        
+
         logger = self.get_performance_logger()
-        
+        statement = f"{query[:200]}{'...' if len(query) > 200 else ''}"
+
         if duration >= self.config.slow_query_threshold:
             logger.warning(
-                f"Slow query detected: {duration:.3f}s - Query: {query[:200]}{'...' if len(query) > 200 else ''}"
+                f"Slow query detected: {duration:.3f}s - Query: {statement}",
+                extra={"event": "slow_query", "duration": duration},
             )
         elif self.config.log_sql_queries:
             logger.info(
-                f"SQL Query ({duration:.3f}s): {query[:200]}{'...' if len(query) > 200 else ''}"
+                f"SQL Query ({duration:.3f}s): {statement}",
+                extra={"event": "sql_query", "duration": duration},
             )
 
 
 # Global logging manager instance
-logging_manager = LoggingManager()
+logging_manager = LoggingManager(LoggingConfig.from_settings())
 
 # Convenience functions for getting loggers
 def get_logger(name: str) -> logging.Logger:
@@ -322,4 +560,8 @@ def get_performance_logger() -> logging.Logger:
 
 def log_sql_query(query: str, params: Any, duration: float) -> None:
     """Log SQL query."""
-    logging_manager.log_sql_query(query, params, duration)
\ No newline at end of file
+    logging_manager.log_sql_query(query, params, duration)
+
+def shutdown_logging() -> None:
+    """Flush and stop all logging listeners."""
+    logging_manager.shutdown()
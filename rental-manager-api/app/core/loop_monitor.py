@@ -0,0 +1,218 @@
+"""
+Event loop lag monitoring and slow-callback detection.
+
+A heartbeat task sleeps for the sampling interval and measures how late it
+wakes up. The overshoot is the time other callbacks held the loop, i.e. how
+long any request would have waited to be scheduled.
+
+When a block threshold is configured, a watchdog thread also posts a probe
+callback to the loop every half threshold. A probe that has not run within
+the threshold means a callback is holding the loop, and the watchdog
+captures the loop thread's stack while it is still running, so blocking work
+(bcrypt, pickling, synchronous file I/O, CPU-heavy loops) is reported with
+the code responsible. Without a threshold no thread is started.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import AsyncIterator, Deque, List, Optional
+
+from app.core.metrics import (
+    event_loop_block_duration,
+    event_loop_blocks,
+    event_loop_lag,
+    event_loop_lag_histogram,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopBlockedError(RuntimeError):
+    """Raised in strict mode when a request blocked the event loop over budget."""
+
+
+@dataclass
+class LoopStall:
+    """One period during which the event loop did not run the heartbeat."""
+
+    started_at: float  # perf_counter when the probe that found the stall was posted
+    stack: str
+    duration: Optional[float] = None
+
+
+class EventLoopLagMonitor:
+    """Samples event loop lag and reports callbacks that block the loop."""
+
+    def __init__(self, interval: float = 0.5, block_threshold: Optional[float] = None, history: int = 100):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.last_lag: float = 0.0
+        self.stalls: Deque[LoopStall] = deque(maxlen=history)
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        # Probe and stall state shared by the loop and the watchdog thread
+        self._lock = threading.Lock()
+        self._probe_posted: Optional[float] = None
+        self._pending: Optional[LoopStall] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the heartbeat on the running loop, and the watchdog if a threshold is set."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._probe_posted = None
+        self._pending = None
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(), name="event-loop-lag-monitor")
+        if self.block_threshold:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="event-loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+        logger.info("Event loop lag monitor started")
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and watchdog."""
+        if not self._task:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+        logger.info("Event loop lag monitor stopped")
+
+    def record(self, lag: float) -> None:
+        """Publish one lag sample."""
+        self.last_lag = lag
+        event_loop_lag.set(lag)
+        event_loop_lag_histogram.observe(lag)
+
+    def current_block(self) -> float:
+        """How long the watchdog's probe has been waiting to run (0 if none is)."""
+        posted = self._probe_posted
+        if posted is None:
+            return 0.0
+        return max(0.0, perf_counter() - posted)
+
+    def stalls_since(self, since: float) -> List[LoopStall]:
+        """Stalls (finished or still pending) that ended after ``since``."""
+        stalls = [
+            stall for stall in self.stalls
+            if stall.started_at + (stall.duration or 0.0) >= since
+        ]
+        if self._pending is not None:
+            stalls.append(self._pending)
+        return stalls
+
+    async def _run(self) -> None:
+        while True:
+            expected = perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, perf_counter() - expected))
+
+    def _probe(self) -> None:
+        """Runs on the loop: the watchdog's probe got its turn."""
+        now = perf_counter()
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._probe_posted = None
+        if pending is not None:
+            self._report(pending, now)
+
+    def _watch(self) -> None:
+        """Watchdog thread: probe the loop and capture its stack while it is blocked."""
+        check_period = self.block_threshold / 2
+        while not self._stop.wait(check_period):
+            with self._lock:
+                posted = self._probe_posted
+                if posted is None:
+                    self._probe_posted = perf_counter()
+                elif self._pending is not None or perf_counter() - posted < self.block_threshold:
+                    continue
+            if posted is None:
+                try:
+                    self._loop.call_soon_threadsafe(self._probe)
+                except RuntimeError:  # loop closed
+                    return
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            with self._lock:
+                if self._probe_posted == posted:
+                    self._pending = LoopStall(started_at=posted, stack=stack)
+
+    def _report(self, stall: LoopStall, resumed_at: float) -> None:
+        stall.duration = max(0.0, resumed_at - stall.started_at)
+        self.stalls.append(stall)
+        event_loop_blocks.inc()
+        event_loop_block_duration.observe(stall.duration)
+        logger.warning(
+            f"Event loop blocked for {stall.duration * 1000:.0f}ms",
+            extra={
+                "event": "event_loop_blocked",
+                "duration_ms": round(stall.duration * 1000, 1),
+                "stack": stall.stack,
+            },
+        )
+
+
+# Global monitor instance
+loop_monitor = EventLoopLagMonitor()
+
+
+@asynccontextmanager
+async def assert_loop_not_blocked(
+    budget: float = 0.05,
+    monitor: Optional[EventLoopLagMonitor] = None,
+) -> AsyncIterator[EventLoopLagMonitor]:
+    """
+    Fail if the block stalls the event loop for longer than ``budget`` seconds.
+
+    Intended for tests guarding async code paths against blocking calls.
+    """
+    monitor = monitor or EventLoopLagMonitor(interval=budget / 2, block_threshold=budget)
+    owns_monitor = not monitor.running
+    if owns_monitor:
+        await monitor.start()
+
+    started = perf_counter()
+    try:
+        yield monitor
+        # Let the watchdog's probe run so a stall right at the end is finalized
+        await asyncio.sleep(monitor.block_threshold or budget)
+    finally:
+        over_budget = [
+            stall for stall in monitor.stalls_since(started)
+            if stall.duration is None or stall.duration > budget
+        ]
+        if owns_monitor:
+            await monitor.stop()
+
+    if over_budget:
+        worst = max(over_budget, key=lambda stall: stall.duration or 0.0)
+        raise AssertionError(
+            f"Event loop blocked for {(worst.duration or 0.0) * 1000:.0f}ms "
+            f"(budget {budget * 1000:.0f}ms) at:\n{worst.stack}"
+        )
@@ -0,0 +1,371 @@
+"""
+Lightweight Prometheus-style runtime metrics.
+
+A minimal in-process registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format by the ``/metrics`` endpoint. Recording
+a sample is a dictionary lookup plus a bisect, cheap enough to leave enabled
+in production; collection-time gauges (e.g. pool state) cost nothing until
+the endpoint is scraped.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """Base class holding name, help text and label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down.
+
+    Either set explicitly, or computed at scrape time by a ``collect``
+    callback returning ``{label_values_tuple: value}``.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        if self._collect:
+            values.update(self._collect())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the ``with`` block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+
+        lines = []
+        for key, series in items:
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _collect_db_pool() -> Dict[LabelValues, float]:
+    """Read connection pool state from the database manager's engines."""
+    from app.core.database import db_manager
+
+    values: Dict[LabelValues, float] = {}
+    for name, pool in db_manager.pools().items():
+        if not hasattr(pool, "checkedout"):
+            continue
+        values.update({
+            (name, "size"): pool.size(),
+            (name, "checked_out"): pool.checkedout(),
+            (name, "checked_in"): pool.checkedin(),
+            (name, "overflow"): max(pool.overflow(), 0),
+        })
+    return values
+
+
+def _collect_replica_lag() -> Dict[LabelValues, float]:
+    """Read the last lag sample of each configured replica."""
+    from app.core.database import db_manager
+
+    router = db_manager.replica_router
+    return {(replica.name,): replica.lag for replica in router.replicas} if router else {}
+
+
+def _collect_password_hashing() -> Dict[LabelValues, float]:
+    """Read the password hashing pool's queue depth."""
+    from app.core.security import password_hasher
+
+    return {(): password_hasher.pending}
+
+
+# Global registry and application metrics
+registry = MetricsRegistry()
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+)
+db_pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Database connection pool state",
+    ("pool", "state"),
+    collect=_collect_db_pool,
+)
+db_pool_checkout_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+db_pool_checkout_timeouts = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Pool checkouts that timed out waiting for a connection",
+    ("pool",),
+)
+db_pool_stale_connections = registry.counter(
+    "db_pool_stale_connections_total",
+    "Idle pooled connections found dead at checkout and replaced",
+    ("pool",),
+)
+db_admission_shed = registry.counter(
+    "db_admission_shed_total",
+    "Low-priority requests rejected with 503 while the interactive pool was busy",
+    ("path",),
+)
+db_read_routing = registry.counter(
+    "db_read_routing_total",
+    "Read-only sessions by where they were routed and why",
+    ("target", "reason"),
+)
+db_replica_lag = registry.gauge(
+    "db_replica_lag_seconds",
+    "Last sampled replication lag per read replica",
+    ("replica",),
+    collect=_collect_replica_lag,
+)
+redis_command_duration = registry.histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency",
+    ("command",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0),
+)
+cache_requests = registry.counter(
+    "cache_requests_total",
+    "Cache lookups by result",
+    ("cache", "result"),
+)
+response_not_modified = registry.counter(
+    "response_not_modified_total",
+    "Conditional GETs answered 304 Not Modified from the response cache",
+    ("route",),
+)
+scheduler_job_duration = registry.histogram(
+    "scheduler_job_duration_seconds",
+    "Scheduled job run time",
+    ("job_id", "outcome"),
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0),
+)
+event_loop_lag = registry.gauge(
+    "event_loop_lag_seconds",
+    "Most recent event loop scheduling delay",
+)
+event_loop_lag_histogram = registry.histogram(
+    "event_loop_lag_distribution_seconds",
+    "Distribution of event loop scheduling delay",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+event_loop_blocks = registry.counter(
+    "event_loop_blocks_total",
+    "Callbacks that blocked the event loop beyond the threshold",
+)
+event_loop_block_duration = registry.histogram(
+    "event_loop_block_duration_seconds",
+    "How long blocking callbacks held the event loop",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+password_hash_pending = registry.gauge(
+    "password_hash_pending",
+    "Password hash/verify operations queued or running",
+    collect=_collect_password_hashing,
+)
+password_hash_rejections = registry.counter(
+    "password_hash_rejections_total",
+    "Password hash/verify operations rejected because the queue was full",
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss."""
+    cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def render_metrics() -> str:
+    """Render all registered metrics in Prometheus text format."""
+    return registry.render()
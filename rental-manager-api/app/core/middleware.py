@@ -3,13 +3,21 @@ Custom middleware for whitelist enforcement and security.
 """
 
 import logging
+import math
 import time
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, List
 from fastapi import Request, Response, HTTPException, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.database import db_manager
+from app.core.loop_monitor import EventLoopBlockedError, EventLoopLagMonitor, loop_monitor
+from app.core.metrics import db_admission_shed, http_request_duration, http_requests_in_progress
+
+from app.core.query_profiler import query_profiler, report_request
+from app.core.read_replicas import CONSISTENCY_COOKIE, CONSISTENCY_HEADER, WRITE_METHODS, consistency_key
 from app.core.whitelist import whitelist_manager
 
 logger = logging.getLogger(__name__)
@@ -234,6 +242,196 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class QueryProfilingMiddleware(BaseHTTPMiddleware):
+    """Middleware that profiles the SQL statements issued by each request."""
+    
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 5):
+        super().__init__(app)
+        self.repeat_threshold = repeat_threshold
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Collect query stats, expose them as Server-Timing and flag N+1 patterns."""
+        with query_profiler.collect() as stats:
+            response = await call_next(request)
+        
+        response.headers.append("Server-Timing", stats.server_timing())
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        report_request(request.method, route_path, stats, self.repeat_threshold)
+        
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency per route template.
+    
+    Implemented without BaseHTTPMiddleware to keep per-request overhead low
+    enough to leave enabled in production. Requests that match no route are
+    grouped under a single label to bound metric cardinality.
+    """
+    
+    def __init__(self, app: ASGIApp, exclude_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+        self._in_progress = 0
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        started = time.perf_counter()
+        self._in_progress += 1
+        http_requests_in_progress.set(self._in_progress)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._in_progress -= 1
+            http_requests_in_progress.set(self._in_progress)
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=getattr(route, "path", "<unmatched>"),
+                status=str(status_code),
+            )
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pure ASGI middleware keeping a client's reads on the primary after it writes.
+    
+    Write responses carry a signed consistency token (header and cookie),
+    which any worker honours while the client sends it back. The worker
+    also marks the client both when a write request starts and when it
+    ends, so a read the client sends the moment the response arrives is
+    covered even without the token. Does nothing unless read replicas are
+    configured.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router = db_manager.replica_router
+        if scope["type"] != "http" or router is None or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+        
+        client = scope.get("client")
+        key = consistency_key(Headers(scope=scope), client[0] if client else None)
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                token = router.issue_token()
+                cookie = (
+                    f"{CONSISTENCY_COOKIE}={token}; Max-Age={math.ceil(router.sticky_seconds)}; "
+                    f"Path=/; HttpOnly; SameSite=lax"
+                )
+                if scope.get("scheme") == "https":
+                    cookie += "; Secure"
+                headers = MutableHeaders(scope=message)
+                headers.append(CONSISTENCY_HEADER, token)
+                headers.append("set-cookie", cookie)
+            await send(message)
+        
+        router.record_write(key)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            router.record_write(key)
+
+
+class AdmissionControlMiddleware:
+    """
+    Pure ASGI middleware shedding low-priority requests while the interactive pool is busy.
+    
+    Requests whose path contains one of ``low_priority_paths`` (exports,
+    analytics, statistics) get 503 with ``Retry-After`` once more than
+    ``max_utilization`` of the interactive pool's connections are checked
+    out, so the connections left go to interactive traffic.
+    """
+    
+    def __init__(self, app: ASGIApp, low_priority_paths: List[str], max_utilization: float = 0.8, retry_after: int = 5):
+        self.app = app
+        self.low_priority_paths = low_priority_paths
+        self.max_utilization = max_utilization
+        self.retry_after = retry_after
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            matched = next((path for path in self.low_priority_paths if path in scope["path"]), None)
+            if matched and db_manager.interactive_utilization() > self.max_utilization:
+                db_admission_shed.inc(path=matched)
+                response = JSONResponse(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    content={"detail": "Server busy, retry later"},
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+                await response(scope, receive, send)
+                return
+        
+        await self.app(scope, receive, send)
+
+
+class LoopBlockingGuardMiddleware:
+    """
+    Dev/test guard failing requests that block the event loop over budget.
+    
+    Relies on the event loop monitor's watchdog, so it only sees stalls while
+    the monitor is running. Stalls are loop-wide: with concurrent requests a
+    block may be attributed to a request that merely overlapped it, which is
+    why this is meant for development and test runs, not production.
+    """
+    
+    def __init__(self, app: ASGIApp, budget: float = 0.1, monitor: EventLoopLagMonitor = None):
+        self.app = app
+        self.budget = budget
+        self.monitor = monitor or loop_monitor
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.monitor.running:
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+
+        async def send_unless_blocked(message: Message) -> None:
+            # Checked before the status line goes out, so the failure reaches
+            # the caller as a 500 instead of following a 200
+            if message["type"] == "http.response.start":
+                self._check(scope, started)
+            await send(message)
+
+        await self.app(scope, receive, send_unless_blocked)
+
+    def _check(self, scope: Scope, started: float) -> None:
+        # A block at the very end of the handler has not let the watchdog's
+        # probe run yet, so also check how long the probe has been waiting.
+        worst, stack = self.monitor.current_block(), ""
+        for stall in self.monitor.stalls_since(started):
+            duration = stall.duration if stall.duration is not None else worst
+            if duration >= worst:
+                worst, stack = duration, stall.stack
+
+        if worst > self.budget:
+            raise EventLoopBlockedError(
+                f"{scope['method']} {scope['path']} blocked the event loop for "
+                f"{worst * 1000:.0f}ms (budget {self.budget * 1000:.0f}ms)\n{stack}"
+            )
+
+
 # Utility functions for adding middleware
 def add_whitelist_middleware(app, enabled: bool = True):
     """Add whitelist middleware to FastAPI app."""
@@ -250,4 +448,24 @@ def add_cors_middleware(app):
 
 def add_request_logging_middleware(app, log_body: bool = False):
     """Add request logging middleware to FastAPI app."""
-    app.add_middleware(RequestLoggingMiddleware, log_body=log_body)
\ No newline at end of file
+    app.add_middleware(RequestLoggingMiddleware, log_body=log_body)
+
+def add_query_profiling_middleware(app, repeat_threshold: int = 5):
+    """Add per-request SQL profiling middleware to FastAPI app."""
+    app.add_middleware(QueryProfilingMiddleware, repeat_threshold=repeat_threshold)
+
+def add_metrics_middleware(app):
+    """Add request latency metrics middleware to FastAPI app."""
+    app.add_middleware(MetricsMiddleware)
+
+def add_read_your_writes_middleware(app):
+    """Add replica read-your-writes tracking middleware to FastAPI app."""
+    app.add_middleware(ReadYourWritesMiddleware)
+
+def add_admission_control_middleware(app, low_priority_paths: List[str], max_utilization: float = 0.8):
+    """Add low-priority request shedding middleware to FastAPI app."""
+    app.add_middleware(AdmissionControlMiddleware, low_priority_paths=low_priority_paths, max_utilization=max_utilization)
+
+def add_loop_blocking_guard_middleware(app, budget: float = 0.1):
+    """Add the strict event loop blocking guard to FastAPI app."""
+    app.add_middleware(LoopBlockingGuardMiddleware, budget=budget)
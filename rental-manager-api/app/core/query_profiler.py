@@ -0,0 +1,202 @@
+"""
+Per-request SQL query profiling and N+1 detection.
+
+Hooks SQLAlchemy cursor events on the async engine and accumulates, for the
+current request (tracked in a context variable), the number of statements,
+total database time and how often each statement fingerprint was executed.
+A fingerprint that repeats many times within one request is the signature of
+a per-element query loop (N+1), whose query count grows with input size.
+
+Instrumentation is opt-in via ``SQL_PROFILING_ENABLED``. Tests can use
+:func:`count_queries` / :func:`assert_max_queries` to enforce query budgets.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.logging_config import log_sql_query
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_BIND_PARAM = re.compile(r"(\$\d+|%\(\w+\)s|:\w+|\?)")
+_NUMBER = re.compile(r"\b\d+(\.\d+)?\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_IN_LIST = re.compile(r"\(\s*\?(\s*,\s*\?)+\s*\)")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in
+    parameters, literal values or IN-list length share one fingerprint.
+    """
+    normalized = _STRING.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one request or measured block."""
+
+    count: int = 0
+    total_time: float = 0.0  # seconds
+    fingerprints: Counter = field(default_factory=Counter)
+    statements: List[str] = field(default_factory=list)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.fingerprints[fingerprint(statement)] += 1
+        self.statements.append(statement)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Fingerprints executed at least ``threshold`` times, most frequent first."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
+    @property
+    def total_time_ms(self) -> float:
+        return self.total_time * 1000
+
+    def server_timing(self) -> str:
+        """Value for a ``Server-Timing`` response header."""
+        return f'db;dur={self.total_time_ms:.2f};desc="{self.count} queries"'
+
+
+# Stack of active collectors: the request's stats plus any nested measurements
+_active_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar("query_profiler_stats", default=())
+
+
+class QueryProfiler:
+    """Attaches cursor-event listeners to engines and feeds active collectors."""
+
+    def __init__(self):
+        self._instrumented: Dict[int, Engine] = {}
+
+    def instrument(self, engine: Any) -> None:
+        """Start recording statements executed through ``engine``."""
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if id(sync_engine) in self._instrumented:
+            return
+
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        self._instrumented[id(sync_engine)] = sync_engine
+        logger.info("SQL query profiling enabled")
+
+    def uninstrument(self, engine: Any) -> None:
+        """Stop recording statements executed through ``engine``."""
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if self._instrumented.pop(id(sync_engine), None) is None:
+            return
+
+        event.remove(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start_time"].pop()
+        duration = time.perf_counter() - started
+
+        for stats in _active_stats.get():
+            stats.record(statement, duration)
+
+        log_sql_query(statement, parameters, duration)
+
+    @contextmanager
+    def collect(self) -> Iterator[QueryStats]:
+        """Record every statement executed in the current context."""
+        stats = QueryStats()
+        token = _active_stats.set(_active_stats.get() + (stats,))
+        try:
+            yield stats
+        finally:
+            _active_stats.reset(token)
+
+
+# Global profiler instance
+query_profiler = QueryProfiler()
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the outermost collector in this context (the request), if any."""
+    active = _active_stats.get()
+    return active[0] if active else None
+
+
+@contextmanager
+def count_queries(engine: Optional[Any] = None) -> Iterator[QueryStats]:
+    """
+    Count statements executed inside the block.
+
+    Usage:
+        with count_queries(engine) as stats:
+            await repo.get_by_id(item_id)
+        assert stats.count == 1
+    """
+    if engine is not None:
+        query_profiler.instrument(engine)
+    with query_profiler.collect() as stats:
+        yield stats
+
+
+@asynccontextmanager
+async def assert_max_queries(max_queries: int, engine: Optional[Any] = None) -> AsyncIterator[QueryStats]:
+    """
+    Fail if the block executes more than ``max_queries`` statements.
+
+    Intended for tests that guard the query budget of critical code paths.
+    """
+    with count_queries(engine) as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        repeated = "\n".join(f"  {n}x {fp}" for fp, n in stats.repeated(2))
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}"
+            + (f"\nRepeated statements:\n{repeated}" if repeated else "")
+        )
+
+
+def report_request(method: str, route: str, stats: QueryStats, repeat_threshold: int) -> None:
+    """Log a request's query profile and flag suspected N+1 patterns."""
+    repeated = stats.repeated(repeat_threshold)
+    if repeated:
+        fp, n = repeated[0]
+        logger.warning(
+            f"Possible N+1 on {method} {route}: statement executed {n} times "
+            f"({stats.count} queries, {stats.total_time_ms:.1f}ms) - {fp[:200]}",
+            extra={
+                "event": "n_plus_one",
+                "route": route,
+                "query_count": stats.count,
+                "db_time_ms": round(stats.total_time_ms, 2),
+                "repeated_statements": [{"count": c, "statement": f} for f, c in repeated],
+            },
+        )
+    else:
+        logger.debug(
+            f"{method} {route}: {stats.count} queries in {stats.total_time_ms:.1f}ms",
+            extra={
+                "event": "request_queries",
+                "route": route,
+                "query_count": stats.count,
+                "db_time_ms": round(stats.total_time_ms, 2),
+            },
+        )
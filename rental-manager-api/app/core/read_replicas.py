@@ -0,0 +1,199 @@
+"""
+Read-replica routing for read-only endpoints.
+
+Endpoints that only read depend on ``get_read_db`` (lists and details) or
+``get_report_db`` (reports, statistics, exports). ``ReplicaRouter``
+decides whether such a session goes to a replica or to the primary:
+
+- Read-your-writes: after a client makes a write request, its reads stay
+  on the primary for ``READ_YOUR_WRITES_SECONDS``, so it never reads a
+  state older than the one it just wrote.
+- Lag fallback: each replica's replay lag is sampled at most every
+  ``READ_REPLICA_LAG_CHECK_SECONDS``. A replica whose lag exceeds
+  ``READ_REPLICA_MAX_LAG_SECONDS``, or that cannot be reached, is skipped
+  until a later sample is healthy. With no usable replica, reads go to the
+  primary.
+
+Every write response carries a consistency token: the time of the write,
+signed with ``SECRET_KEY``, in the ``X-Consistency-Token`` header and the
+``consistency_token`` cookie. A client sending it back (the cookie does so
+by itself in a browser, API clients echo the header) is kept on the
+primary by any worker that shares the key. The worker that served the
+write also remembers the client, identified by its bearer token or by
+address when it has none, which covers clients that drop the token.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import math
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.core.metrics import db_read_routing
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica's replayed state trails the primary; zero when it
+# has replayed everything it received (an idle primary is not lag)
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+MAX_STICKY_CLIENTS = 10000
+
+CONSISTENCY_HEADER = "X-Consistency-Token"
+CONSISTENCY_COOKIE = "consistency_token"
+
+# Seconds a token's write time may lie ahead of this worker's clock
+MAX_CLOCK_SKEW = 1.0
+
+
+def consistency_key(headers, client_host: Optional[str]) -> str:
+    """Stable key for the client making a request."""
+    authorization = headers.get("authorization")
+    if authorization:
+        return "token:" + hashlib.sha256(authorization.encode()).hexdigest()[:32]
+    return f"host:{client_host or 'unknown'}"
+
+
+def consistency_token(headers, cookies) -> Optional[str]:
+    """Consistency token sent with a request, from the header or the cookie."""
+    return headers.get(CONSISTENCY_HEADER) or cookies.get(CONSISTENCY_COOKIE)
+
+
+@dataclass
+class Replica:
+    """One read replica and its last lag sample."""
+
+    name: str
+    engine: AsyncEngine
+    session_maker: async_sessionmaker
+    lean_session_maker: Optional[async_sessionmaker] = None
+    lag: float = 0.0
+    checked_at: float = -math.inf
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: AsyncEngine,
+        session_maker: async_sessionmaker,
+        lean_session_maker: Optional[async_sessionmaker] = None,
+    ) -> "Replica":
+        name = engine.url.host or engine.url.database or "replica"
+        return cls(name=name, engine=engine, session_maker=session_maker, lean_session_maker=lean_session_maker)
+
+
+async def probe_replication_lag(replica: Replica) -> float:
+    """Replica lag in seconds, from the replica itself."""
+    async with replica.engine.connect() as conn:
+        return float((await conn.execute(REPLICA_LAG_QUERY)).scalar_one())
+
+
+class ReplicaRouter:
+    """Chooses a replica for read sessions, or None for the primary."""
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        max_lag: float = 5.0,
+        sticky_seconds: float = 10.0,
+        check_interval: float = 2.0,
+        probe: Callable[[Replica], Awaitable[float]] = probe_replication_lag,
+        clock: Callable[[], float] = time.monotonic,
+        secret: Optional[str] = None,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.sticky_seconds = sticky_seconds
+        self.check_interval = check_interval
+        self.probe = probe
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self._secret = (secret or secrets.token_urlsafe(32)).encode()
+        self._next = 0
+        self._written_at: Dict[str, float] = {}
+
+    def record_write(self, key: str) -> None:
+        """Keep ``key``'s reads on the primary for the stickiness window."""
+        now = self.clock()
+        if len(self._written_at) >= MAX_STICKY_CLIENTS:
+            cutoff = now - self.sticky_seconds
+            self._written_at = {k: t for k, t in self._written_at.items() if t > cutoff}
+        self._written_at[key] = now
+
+    def _sign(self, value: str) -> str:
+        return hmac.new(self._secret, value.encode(), hashlib.sha256).hexdigest()[:32]
+
+    def issue_token(self) -> str:
+        """Consistency token for a write made now."""
+        value = f"{self.wall_clock():.3f}"
+        return f"{value}.{self._sign(value)}"
+
+    def token_written_at(self, token: Optional[str]) -> Optional[float]:
+        """Write time carried by ``token``, or None if it is not one this key signed."""
+        value, _, signature = (token or "").rpartition(".")
+        if not value or not hmac.compare_digest(signature, self._sign(value)):
+            return None
+        try:
+            written_at = float(value)
+        except ValueError:
+            return None
+        return written_at if written_at <= self.wall_clock() + MAX_CLOCK_SKEW else None
+
+    def is_sticky(self, key: Optional[str], token: Optional[str] = None) -> bool:
+        written_at = self._written_at.get(key) if key else None
+        if written_at is not None and self.clock() - written_at < self.sticky_seconds:
+            return True
+        written_at = self.token_written_at(token) if token else None
+        return written_at is not None and self.wall_clock() - written_at < self.sticky_seconds
+
+    async def replication_lag(self, replica: Replica) -> float:
+        """Cached lag of ``replica``; unreachable replicas count as infinitely behind."""
+        if self.clock() - replica.checked_at < self.check_interval:
+            return replica.lag
+        async with replica._lock:
+            if self.clock() - replica.checked_at >= self.check_interval:
+                try:
+                    replica.lag = await self.probe(replica)
+                except Exception as e:
+                    logger.warning(f"Replica {replica.name} lag check failed: {e}")
+                    replica.lag = math.inf
+                replica.checked_at = self.clock()
+        return replica.lag
+
+    async def choose(self, key: Optional[str] = None, token: Optional[str] = None) -> Optional[Replica]:
+        """A replica that is close enough to the primary, round-robin."""
+        if not self.replicas:
+            return None
+        if self.is_sticky(key, token):
+            db_read_routing.inc(target="primary", reason="read_your_writes")
+            return None
+
+        start = self._next
+        self._next = (self._next + 1) % len(self.replicas)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if await self.replication_lag(replica) <= self.max_lag:
+                db_read_routing.inc(target="replica", reason="healthy")
+                return replica
+
+        db_read_routing.inc(target="primary", reason="replica_lag")
+        return None
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
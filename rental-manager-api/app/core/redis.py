@@ -5,6 +5,7 @@ from redis import asyncio as aioredis
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 
 from app.core.config import settings
+from app.core.metrics import record_cache_lookup, redis_command_duration
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +59,8 @@ class RedisManager:
             return None
 
         try:
-            value = await self.redis_client.get(key)
+            with redis_command_duration.time(command="get"):
+                value = await self.redis_client.get(key)
             if value:
                 try:
                     # Try to deserialize JSON
@@ -89,7 +91,8 @@ class RedisManager:
             # Use default TTL if not specified
             ttl = ttl or settings.REDIS_CACHE_TTL
 
-            result = await self.redis_client.set(key, value, ex=ttl)
+            with redis_command_duration.time(command="set"):
+                result = await self.redis_client.set(key, value, ex=ttl)
             return bool(result)
         except RedisError as e:
             logger.error(f"Redis SET error for key {key}: {e}")
@@ -101,9 +104,10 @@ class RedisManager:
             return 0
 
         try:
-            if isinstance(key, list):
-                return await self.redis_client.delete(*key)
-            return await self.redis_client.delete(key)
+            with redis_command_duration.time(command="delete"):
+                if isinstance(key, list):
+                    return await self.redis_client.delete(*key)
+                return await self.redis_client.delete(key)
         except RedisError as e:
             logger.error(f"Redis DELETE error for key(s) {key}: {e}")
             return 0
@@ -114,7 +118,8 @@ class RedisManager:
             return False
 
         try:
-            return bool(await self.redis_client.exists(key))
+            with redis_command_duration.time(command="exists"):
+                return bool(await self.redis_client.exists(key))
         except RedisError as e:
             logger.error(f"Redis EXISTS error for key {key}: {e}")
             return False
@@ -125,7 +130,8 @@ class RedisManager:
             return False
 
         try:
-            return bool(await self.redis_client.expire(key, ttl))
+            with redis_command_duration.time(command="expire"):
+                return bool(await self.redis_client.expire(key, ttl))
         except RedisError as e:
             logger.error(f"Redis EXPIRE error for key {key}: {e}")
             return False
@@ -136,7 +142,8 @@ class RedisManager:
             return None
 
         try:
-            return await self.redis_client.incr(key, amount)
+            with redis_command_duration.time(command="incr"):
+                return await self.redis_client.incr(key, amount)
         except RedisError as e:
             logger.error(f"Redis INCR error for key {key}: {e}")
             return None
@@ -147,7 +154,8 @@ class RedisManager:
             return None
 
         try:
-            return await self.redis_client.decr(key, amount)
+            with redis_command_duration.time(command="decr"):
+                return await self.redis_client.decr(key, amount)
         except RedisError as e:
             logger.error(f"Redis DECR error for key {key}: {e}")
             return None
@@ -170,7 +178,8 @@ class RedisManager:
             return False
 
         try:
-            response = await self.redis_client.ping()
+            with redis_command_duration.time(command="ping"):
+                response = await self.redis_client.ping()
             return response is True
         except Exception:
             return False
@@ -178,7 +187,9 @@ class RedisManager:
     # Cache-specific methods
     async def cache_get(self, cache_key: str) -> Optional[Any]:
         """Get cached value with cache prefix"""
-        return await self.get(f"cache:{cache_key}")
+        value = await self.get(f"cache:{cache_key}")
+        record_cache_lookup("redis", value is not None)
+        return value
 
     async def cache_set(
         self,
@@ -228,10 +239,11 @@ class RedisManager:
         key = f"rate_limit:{identifier}"
         try:
             # Use pipeline for atomic operations
-            async with self.redis_client.pipeline() as pipe:
-                pipe.incr(key)
-                pipe.expire(key, window)
-                results = await pipe.execute()
+            with redis_command_duration.time(command="pipeline"):
+                async with self.redis_client.pipeline() as pipe:
+                    pipe.incr(key)
+                    pipe.expire(key, window)
+                    results = await pipe.execute()
 
             count = results[0]
             remaining = max(0, limit - count)
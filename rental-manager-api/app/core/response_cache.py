@@ -0,0 +1,268 @@
+"""
+Response cache for catalog reads, with strong ETags and conditional GETs.
+
+A cached route serializes its response model to JSON once per version of
+the tables it reads. Each worker keeps the bytes and their ETag (the
+SHA-256 of the bytes), keyed by path, query string and those versions, so
+a repeat request is answered from memory without a query or pydantic: 304
+when ``If-None-Match`` carries the ETag, the stored bytes otherwise.
+
+Versions are the ``catalog:<table>`` cache versions. Repositories that
+write a catalog table track their session (``track_catalog_writes``): a
+flush that inserts, changes or deletes a catalog row, or bulk DML run
+through the session, defers a bump of its table's version to the commit
+(see ``defer_cache_version_bumps``), so a version moves with every
+committed write that could change a response. A worker re-reads the versions at most every
+``RESPONSE_CACHE_VERSION_CHECK_SECONDS``, or straight away after one of its
+own commits; a write made by another worker is seen within that interval.
+Entries are re-rendered after ``RESPONSE_CACHE_MAX_AGE_SECONDS`` as some
+fields are computed from the clock (maintenance due, warranty expired).
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from fastapi import Depends, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+
+from app.core.config import settings
+from app.core.database import db_manager, get_read_db
+from app.core.metrics import record_cache_lookup, response_not_modified
+from app.crud.cache_version import CacheVersionRepository, defer_cache_version_bumps, track_cache_versions
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.item import Item
+from app.models.location import Location
+from app.models.unit_of_measurement import UnitOfMeasurement
+
+# Models whose writes invalidate cached responses
+CATALOG_MODELS = (Item, Category, Brand, UnitOfMeasurement, Location)
+CATALOG_TABLES = frozenset(model.__tablename__ for model in CATALOG_MODELS)
+
+# session.info key of the bumped namespaces to re-check locally once the
+# commit succeeded
+COMMITTED_KEY = "response_cache_committed"
+
+
+def catalog_namespace(table: str) -> str:
+    """Cache version namespace of a catalog table."""
+    return f"catalog:{table}"
+
+
+def strong_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def serialize(response_model: Any, content: Any) -> bytes:
+    """JSON bytes of ``content`` as FastAPI would render it for ``response_model``."""
+    adapter = _adapter(response_model)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True), by_alias=True)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized response body and its ETag."""
+
+    body: bytes
+    etag: str
+    stored_at: float
+
+
+class ResponseCache:
+    """Per-worker store of serialized catalog responses."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_age: Optional[float] = None,
+        check_interval: Optional[float] = None,
+        session_factory: Optional[async_sessionmaker] = None,
+    ):
+        self.max_entries = settings.RESPONSE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.max_age = settings.RESPONSE_CACHE_MAX_AGE_SECONDS if max_age is None else max_age
+        self.check_interval = (
+            settings.RESPONSE_CACHE_VERSION_CHECK_SECONDS if check_interval is None else check_interval
+        )
+        self.session_factory = session_factory
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._invalidations = 0
+        self._lock = asyncio.Lock()
+
+    def _stale(self, namespaces: Iterable[str]) -> List[str]:
+        now = time.monotonic()
+        return [
+            namespace for namespace in namespaces
+            if now - self._checked_at.get(namespace, -math.inf) >= self.check_interval
+        ]
+
+    async def versions(self, namespaces: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Versions of ``namespaces``, re-read from the primary only when due."""
+        if self._stale(namespaces):
+            async with self._lock:
+                stale = self._stale(namespaces)
+                if stale:
+                    invalidations = self._invalidations
+                    session_factory = self.session_factory or db_manager.lean_session_maker
+                    async with session_factory() as session:
+                        found = await CacheVersionRepository(session).get_many(stale)
+                    self._versions.update(found)
+                    # A commit that invalidated meanwhile may not be in what was read
+                    if invalidations == self._invalidations:
+                        checked_at = time.monotonic()
+                        self._checked_at.update((namespace, checked_at) for namespace in stale)
+        return tuple(self._versions[namespace] for namespace in namespaces)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at >= self.max_age:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, body: bytes) -> CachedResponse:
+        entry = CachedResponse(body=body, etag=strong_etag(body), stored_at=time.monotonic())
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, namespaces: Iterable[str]) -> None:
+        """Re-check these namespaces' versions on the next lookup."""
+        for namespace in namespaces:
+            self._checked_at.pop(namespace, None)
+        self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all responses and versions."""
+        self._entries.clear()
+        self._versions.clear()
+        self._checked_at.clear()
+        self._invalidations += 1
+
+
+response_cache = ResponseCache()
+
+
+class CachedRoute:
+    """One request to a cached route, answered from the cache or rendered into it."""
+
+    def __init__(self, cache: ResponseCache, request: Request, namespaces: Tuple[str, ...], session: AsyncSession):
+        self.cache = cache
+        self.request = request
+        self.namespaces = namespaces
+        self.session = session
+
+    async def respond(self, response_model: Any, render: Callable[[], Awaitable[Any]]) -> Response:
+        """
+        Cached response, or 304 if the client holds it already.
+
+        ``render`` is only awaited on a miss; whatever it raises propagates.
+        """
+        request = self.request
+        path = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+        entry = self.cache.get((path, await self.cache.versions(self.namespaces)))
+        record_cache_lookup("response", entry is not None)
+        if entry is None:
+            # Versions are read before rendering, in the rendering session
+            # (which may be on a replica), so the body is at least as new
+            # as the versions it is stored under
+            found = await CacheVersionRepository(self.session).get_many(self.namespaces)
+            body = serialize(response_model, await render())
+            entry = self.cache.put((path, tuple(found[namespace] for namespace in self.namespaces)), body)
+
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            route = request.scope.get("route")
+            response_not_modified.inc(route=getattr(route, "path", request.url.path))
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def cached_route(*models: Any) -> Callable[..., Awaitable[CachedRoute]]:
+    """
+    Dependency for a read endpoint whose response depends only on the
+    tables of ``models``. It shares the request's ``get_read_db`` session.
+    """
+    namespaces = tuple(catalog_namespace(model.__tablename__) for model in models)
+
+    async def dependency(request: Request, db: AsyncSession = Depends(get_read_db)) -> CachedRoute:
+        return CachedRoute(response_cache, request, namespaces, db)
+
+    return dependency
+
+
+def track_catalog_writes(session: Session) -> None:
+    """Invalidate cached responses when the session commits catalog writes."""
+    session = getattr(session, "sync_session", session)
+    if not isinstance(session, Session) or event.contains(session, "after_flush", _bump_flushed_catalog_versions):
+        return
+    event.listen(session, "after_flush", _bump_flushed_catalog_versions)
+    event.listen(session, "do_orm_execute", _bump_bulk_catalog_versions)
+    event.listen(session, "after_commit", _invalidate_committed_catalog)
+    event.listen(session, "after_transaction_end", _discard_catalog_bumps)
+    track_cache_versions(session)
+
+
+def _catalog_namespaces(targets: Iterable[Any]) -> Set[str]:
+    return {catalog_namespace(target.__tablename__) for target in targets if isinstance(target, CATALOG_MODELS)}
+
+
+def _bump_on_commit(session: Session, namespaces: Set[str]) -> None:
+    defer_cache_version_bumps(session, namespaces)
+    session.info.setdefault(COMMITTED_KEY, set()).update(namespaces)
+
+
+def _bump_flushed_catalog_versions(session: Session, flush_context) -> None:
+    namespaces = _catalog_namespaces(session.new) | _catalog_namespaces(session.deleted)
+    namespaces |= _catalog_namespaces(target for target in session.dirty if session.is_modified(target))
+    if namespaces:
+        _bump_on_commit(session, namespaces)
+
+
+def _bump_bulk_catalog_versions(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and table.name in CATALOG_TABLES:
+        _bump_on_commit(orm_execute_state.session, {catalog_namespace(table.name)})
+
+
+def _invalidate_committed_catalog(session: Session) -> None:
+    namespaces = session.info.pop(COMMITTED_KEY, None)
+    if namespaces:
+        response_cache.invalidate(namespaces)
+
+
+def _discard_catalog_bumps(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(COMMITTED_KEY, None)
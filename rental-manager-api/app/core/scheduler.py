@@ -6,10 +6,17 @@ for rental status updates and other maintenance tasks.
 """
 
 import asyncio
+import functools
 import logging
-from datetime import datetime, time
+from datetime import datetime, time, timezone
 from typing import Optional, Dict, Any, Callable, List
 from contextlib import asynccontextmanager
+from time import perf_counter
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.metrics import scheduler_job_duration
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,7 @@ try:
     from apscheduler.jobstores.memory import MemoryJobStore
     from apscheduler.executors.asyncio import AsyncIOExecutor
     from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
     from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
     SCHEDULER_AVAILABLE = True
 except ImportError:
@@ -26,6 +34,87 @@ except ImportError:
     SCHEDULER_AVAILABLE = False
 
 
+class MaintenanceLeader:
+    """
+    Elects the one process that runs maintenance jobs.
+
+    Every API worker starts the scheduler, but partition maintenance,
+    compaction and the reconcile and sweep jobs must run once per
+    deployment. Before each run a process tries to take a session-level
+    PostgreSQL advisory lock on a connection it then keeps open; the holder
+    runs the job and everyone else skips it. A leader that exits or loses
+    its connection releases the lock, and another process takes over at its
+    next run. Databases without advisory locks (SQLite in development) have
+    a single process, which always leads.
+    """
+    
+    LOCK_KEY = 7_346_221_905  # app-wide advisory lock key for the maintenance leader
+    
+    def __init__(self):
+        self._connection = None
+        self._lock = asyncio.Lock()
+    
+    async def is_leader(self) -> bool:
+        """Whether this process holds (or just took) the leader lock."""
+        from app.core.database import db_manager
+        
+        engine = db_manager.background_engine or db_manager.engine
+        if engine is None:
+            return False
+        if engine.dialect.name != "postgresql":
+            return True
+        
+        async with self._lock:
+            if self._connection is not None:
+                try:
+                    await self._connection.execute(text("SELECT 1"))
+                    return True
+                except Exception as e:
+                    logger.warning(f"Lost the maintenance leader connection: {e}")
+                    await self._discard()
+            
+            connection = await engine.connect()
+            try:
+                # Autocommit: the lock outlives transactions and the
+                # connection must not sit idle in one
+                await connection.execution_options(isolation_level="AUTOCOMMIT")
+                acquired = (await connection.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": self.LOCK_KEY}
+                )).scalar()
+            except Exception:
+                await connection.invalidate()
+                raise
+            if not acquired:
+                await connection.close()
+                return False
+            self._connection = connection
+            logger.info("This process is now the maintenance job leader")
+            return True
+    
+    async def release(self) -> None:
+        """Give up leadership, if held."""
+        async with self._lock:
+            if self._connection is None:
+                return
+            try:
+                await self._connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": self.LOCK_KEY}
+                )
+                await self._connection.close()
+                self._connection = None
+            except Exception as e:
+                logger.warning(f"Failed to release the maintenance leader lock: {e}")
+                await self._discard()
+    
+    async def _discard(self) -> None:
+        # Never return a connection that may still hold the lock to the pool
+        connection, self._connection = self._connection, None
+        try:
+            await connection.invalidate()
+        except Exception:
+            pass
+
+
 class TaskScheduler:
     """
     Application task scheduler using APScheduler.
@@ -41,6 +130,7 @@ class TaskScheduler:
         self.scheduler: Optional[AsyncIOScheduler] = None
         self._running = False
         self._enabled = SCHEDULER_AVAILABLE
+        self.leader = MaintenanceLeader()
     
     async def initialize(self):
         """Initialize the scheduler with configuration."""
@@ -107,6 +197,7 @@ class TaskScheduler:
         if self.scheduler and self._running:
             self.scheduler.shutdown(wait=True)
             self._running = False
+            await self.leader.release()
             logger.info("Task scheduler stopped")
     
     async def _register_default_jobs(self):
@@ -134,6 +225,78 @@ class TaskScheduler:
             #     replace_existing=True
             # )
             
+            # Create upcoming monthly partitions and retire expired ones.
+            # Also runs at startup so a long outage cannot leave inserts
+            # without a partition.
+            self.add_job(
+                self._partition_maintenance_job,
+                trigger=CronTrigger(hour=1, minute=30),  # Daily at 01:30 UTC
+                job_id='partition_maintenance',
+                name='Partition Maintenance',
+                next_run_time=datetime.now(timezone.utc),
+                leader_only=True,
+            )
+            
+            # Roll closed stock movement months into balance snapshots
+            self.add_job(
+                self._stock_ledger_compaction_job,
+                trigger=CronTrigger(hour=2, minute=0),  # Daily at 02:00 UTC
+                job_id='stock_ledger_compaction',
+                name='Stock Ledger Compaction',
+                leader_only=True,
+            )
+            
+            # Recompute customer credit exposure rows from their sales and
+            # correct any drift; also refreshes the date-driven overdue counts
+            self.add_job(
+                self._credit_exposure_reconcile_job,
+                trigger=CronTrigger(hour=0, minute=15),  # Daily at 00:15 UTC
+                job_id='credit_exposure_reconcile',
+                name='Credit Exposure Reconcile',
+                leader_only=True,
+            )
+            
+            # Re-evaluate date-based inventory alerts (maintenance due,
+            # warranty expiring); stock changes are evaluated as they flush
+            self.add_job(
+                self._inventory_alert_sweep_job,
+                trigger=IntervalTrigger(minutes=settings.INVENTORY_ALERT_SWEEP_INTERVAL_MINUTES),
+                job_id='inventory_alert_sweep',
+                name='Inventory Alert Sweep',
+                next_run_time=datetime.now(timezone.utc),
+                leader_only=True,
+            )
+            
+            # Correct drift in the master-data statistics counters; the
+            # first run at startup also fills them on a fresh database
+            self.add_job(
+                self._entity_stats_reconcile_job,
+                trigger=IntervalTrigger(minutes=settings.ENTITY_STATS_RECONCILE_INTERVAL_MINUTES),
+                job_id='entity_stats_reconcile',
+                name='Statistics Counter Reconcile',
+                next_run_time=datetime.now(timezone.utc),
+                leader_only=True,
+            )
+            
+            # Recount entities whose counters a bulk change left unmaintained
+            self.add_job(
+                self._entity_stats_recount_job,
+                trigger=IntervalTrigger(seconds=settings.ENTITY_STATS_RECOUNT_INTERVAL_SECONDS),
+                job_id='entity_stats_recount',
+                name='Statistics Counter Recount',
+                leader_only=True,
+            )
+            
+            # Claim queued background jobs (bulk operations, imports)
+            # submitted by any process, and fail jobs whose worker died.
+            # Every process polls: each runs jobs in its own slots.
+            self.add_job(
+                self._background_job_worker,
+                trigger=IntervalTrigger(seconds=settings.JOB_POLL_INTERVAL_SECONDS),
+                job_id='background_job_worker',
+                name='Background Job Worker',
+            )
+            
             logger.info("Default scheduled jobs registered")
             
         except Exception as e:
@@ -177,22 +340,174 @@ class TaskScheduler:
         except Exception as e:
             logger.error(f"Weekly cleanup failed: {e}")
     
+    async def _partition_maintenance_job(self):
+        """Daily partition creation and retention."""
+        from app.core.database import db_manager
+        from app.db.partitioning import maintain_partitions
+        
+        if not db_manager.async_session_maker:
+            logger.warning("Skipping partition maintenance: database not connected")
+            return
+        
+        async with db_manager.background_session_maker() as session:
+            results = await maintain_partitions(session)
+            await session.commit()
+        logger.info(f"Partition maintenance completed: {results}")
+    
+    async def _stock_ledger_compaction_job(self):
+        """Daily stock movement compaction into monthly balance snapshots."""
+        from app.core.database import db_manager
+        from app.crud.inventory import stock_balance_snapshot
+        
+        if not db_manager.async_session_maker:
+            logger.warning("Skipping stock ledger compaction: database not connected")
+            return
+        
+        async with db_manager.background_session_maker() as session:
+            results = await stock_balance_snapshot.compact_closed_periods(session)
+            await session.commit()
+        logger.info(f"Stock ledger compaction completed: {results}")
+    
+    async def _credit_exposure_reconcile_job(self):
+        """Nightly rebuild of customer credit exposure rows."""
+        from app.core.database import db_manager
+        from app.crud.customer_credit_exposure import CustomerCreditExposureRepository
+        
+        if not db_manager.async_session_maker:
+            logger.warning("Skipping credit exposure reconcile: database not connected")
+            return
+        
+        async with db_manager.background_session_maker() as session:
+            results = await CustomerCreditExposureRepository(session).reconcile()
+            await session.commit()
+        if results["corrected"] or results["cleared"] or results["created"]:
+            logger.warning(f"Credit exposure reconcile corrected drift: {results}")
+        else:
+            logger.info("Credit exposure reconcile found no drift")
+    
+    async def _inventory_alert_sweep_job(self):
+        """Periodic evaluation of every inventory alert rule."""
+        from app.core.database import db_manager
+        from app.crud.inventory import inventory_alert
+        
+        if not db_manager.async_session_maker:
+            logger.warning("Skipping inventory alert sweep: database not connected")
+            return
+        
+        async with db_manager.background_session_maker() as session:
+            results = await inventory_alert.sweep(session)
+            await session.commit()
+        logger.info(f"Inventory alert sweep completed: {results}")
+    
+    async def _entity_stats_reconcile_job(self):
+        """Recount every statistics counter from its source table."""
+        from app.core.database import db_manager
+        from app.crud.entity_stats import EntityStatsRepository
+        
+        if not db_manager.async_session_maker:
+            logger.warning("Skipping statistics counter reconcile: database not connected")
+            return
+        
+        async with db_manager.background_session_maker() as session:
+            results = await EntityStatsRepository(session).reconcile()
+        drifted = {entity: corrected for entity, corrected in results.items() if corrected}
+        if drifted:
+            logger.warning(f"Statistics counter reconcile corrected drift (-1: retried next run): {drifted}")
+        else:
+            logger.info("Statistics counter reconcile found no drift")
+    
+    async def _entity_stats_recount_job(self):
+        """Recount the statistics counters of entities marked for recount."""
+        from app.core.database import db_manager
+        from app.crud.entity_stats import EntityStatsRepository
+        
+        if not db_manager.async_session_maker:
+            logger.warning("Skipping statistics counter recount: database not connected")
+            return
+        
+        async with db_manager.background_session_maker() as session:
+            repository = EntityStatsRepository(session)
+            marked = await repository.marked()
+            if not marked:
+                return
+            results = await repository.reconcile(marked)
+        logger.info(f"Recounted marked statistics counters (-1: retried next run): {results}")
+    
+    async def _background_job_worker(self):
+        """Start queued background jobs while this process has free slots."""
+        from app.core.database import db_manager
+        from app.services.background_job import background_job_runner
+        
+        if not db_manager.async_session_maker:
+            return
+        
+        started = await background_job_runner.poll()
+        if started:
+            logger.info(f"Background job worker started {started} jobs")
+    
+    @staticmethod
+    def _timed(job_id: str, func: Callable) -> Callable:
+        """Wrap a job so its run time is recorded in the metrics registry."""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = perf_counter()
+                outcome = "error"
+                try:
+                    result = await func(*args, **kwargs)
+                    outcome = "success"
+                    return result
+                finally:
+                    scheduler_job_duration.observe(
+                        perf_counter() - started, job_id=job_id, outcome=outcome
+                    )
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                scheduler_job_duration.observe(
+                    perf_counter() - started, job_id=job_id, outcome=outcome
+                )
+        return wrapper
+    
+    def _leader_only(self, job_id: str, func: Callable) -> Callable:
+        """Wrap a job so it only runs in the elected maintenance leader."""
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not await self.leader.is_leader():
+                logger.debug(f"Skipping {job_id}: another process is the maintenance leader")
+                return None
+            return await func(*args, **kwargs)
+        return wrapper
+    
     def add_job(
         self,
         func: Callable,
         trigger,
         job_id: str,
         name: str = None,
+        leader_only: bool = False,
         **kwargs
     ):
-        """Add a custom job to the scheduler."""
+        """Add a custom job to the scheduler; ``leader_only`` jobs run in one process only."""
         if not self._enabled or not self.scheduler:
             logger.warning(f"Cannot add job {job_id}: scheduler not available")
             return
         
+        job = self._timed(job_id, func)
+        if leader_only:
+            # Skipped runs are not timed
+            job = self._leader_only(job_id, job)
         try:
             self.scheduler.add_job(
-                func=func,
+                func=job,
                 trigger=trigger,
                 id=job_id,
                 name=name or job_id,
@@ -1,19 +1,121 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union, Any
+from typing import Callable, Optional, Tuple, TypeVar, Union, Any
 import logging
 from passlib.context import CryptContext
 from joserfc import jwt
 from joserfc.errors import JoseError
 
 from app.core.config import settings
+from app.core.metrics import password_hash_rejections
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context
+T = TypeVar("T")
+
+# Password hashing context. Pinning min/max rounds to the configured cost makes
+# hashes created under a different BCRYPT_ROUNDS report needs_update, so they
+# are transparently rehashed on the next successful login.
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=settings.BCRYPT_ROUNDS
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when too many password hashing operations are already queued."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, bounded thread pool.
+    
+    bcrypt costs tens to hundreds of milliseconds per call and releases the
+    GIL, so running it off the event loop keeps a burst of logins from
+    stalling every other request. At most ``max_pending`` operations may be
+    queued or running; beyond that callers get PasswordHashingBusyError
+    instead of an ever-growing queue.
+    """
+
+    def __init__(self, context: CryptContext, max_workers: int = 2, max_pending: int = 64):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Operations currently queued or running."""
+        return self._pending
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                password_hash_rejections.inc()
+                raise PasswordHashingBusyError(
+                    f"Password hashing queue is full ({self.max_pending} pending)"
+                )
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop."""
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password off the event loop."""
+        verified, _ = await self.verify_and_update(plain_password, hashed_password)
+        return verified
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and return a replacement hash if the stored one is outdated.
+        
+        Returns:
+            (verified, new_hash) where new_hash is None unless the password
+            matched and the stored hash uses a different cost or scheme.
+        """
+        try:
+            return await self._run(self.context.verify_and_update, plain_password, hashed_password)
+        except PasswordHashingBusyError:
+            raise
+        except Exception as e:
+            logger.error(f"Password verification error: {e}")
+            return False, None
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    pwd_context,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
 )
 
 
@@ -34,6 +136,32 @@ class SecurityManager:
         """Hash a password using bcrypt"""
         return pwd_context.hash(password)
 
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the password hashing pool (for async handlers)"""
+        return await password_hasher.verify(plain_password, hashed_password)
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """Hash a password on the password hashing pool (for async handlers)"""
+        return await password_hasher.hash(password)
+
+    @staticmethod
+    async def verify_and_update_password(
+        plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and get a rehashed value if the bcrypt cost changed
+        
+        Args:
+            plain_password: The password supplied by the user
+            hashed_password: The stored hash
+        
+        Returns:
+            (verified, new_hash); persist new_hash when it is not None
+        """
+        return await password_hasher.verify_and_update(plain_password, hashed_password)
+
     @staticmethod
     def create_access_token(
         subject: Union[str, int],
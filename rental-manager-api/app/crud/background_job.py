@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+from typing import Any, Collection, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.background_job import BackgroundJob, JobStatus
+
+
+class BackgroundJobRepository:
+    """Repository for background job records."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def create(self, job_data: dict) -> BackgroundJob:
+        """Create a pending job."""
+        job = BackgroundJob(id=uuid4(), **job_data)
+        self.session.add(job)
+        await self.session.flush()
+        return job
+
+    async def get_by_id(self, job_id: UUID) -> Optional[BackgroundJob]:
+        """Get job by ID."""
+        query = select(BackgroundJob).where(BackgroundJob.id == job_id)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_by_idempotency_key(self, idempotency_key: str) -> Optional[BackgroundJob]:
+        """Get the job submitted with an idempotency key."""
+        query = select(BackgroundJob).where(BackgroundJob.idempotency_key == idempotency_key)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_all(
+        self,
+        job_type: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        created_by: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[BackgroundJob]:
+        """List jobs, newest first."""
+        query = select(BackgroundJob)
+        if job_type:
+            query = query.where(BackgroundJob.job_type == job_type)
+        if status:
+            query = query.where(BackgroundJob.status == status.value)
+        if created_by:
+            query = query.where(BackgroundJob.created_by == created_by)
+        query = query.order_by(BackgroundJob.created_at.desc()).offset(skip).limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def update_fields(self, job_id: UUID, **values: Any) -> None:
+        """Write progress or status fields without loading the job."""
+        await self.session.execute(
+            update(BackgroundJob).where(BackgroundJob.id == job_id).values(**values)
+        )
+
+    async def claim(self, host: str, job_id: Optional[UUID] = None) -> Optional[Row]:
+        """
+        Move the oldest pending job (or ``job_id``) claimable on ``host`` to RUNNING.
+
+        Returns ``(id, job_type, payload)`` of the claimed job, or None when
+        there is nothing to claim. ``FOR UPDATE SKIP LOCKED`` lets several
+        workers poll the queue without taking the same job.
+        """
+        candidate = select(BackgroundJob.id).where(
+            BackgroundJob.status == JobStatus.PENDING.value,
+            or_(BackgroundJob.claimable_by.is_(None), BackgroundJob.claimable_by == host)
+        )
+        if job_id:
+            candidate = candidate.where(BackgroundJob.id == job_id)
+        candidate = (
+            candidate.order_by(BackgroundJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(BackgroundJob)
+            .where(and_(BackgroundJob.id == candidate, BackgroundJob.status == JobStatus.PENDING.value))
+            .values(status=JobStatus.RUNNING.value, started_at=datetime.now(timezone.utc))
+            .returning(BackgroundJob.id, BackgroundJob.job_type, BackgroundJob.payload)
+        )
+        return result.first()
+
+    async def is_cancel_requested(self, job_id: UUID) -> bool:
+        """Whether a cancel has been requested for the job."""
+        query = select(BackgroundJob.cancel_requested).where(BackgroundJob.id == job_id)
+        result = await self.session.execute(query)
+        return bool(result.scalar_one_or_none())
+
+    async def request_cancel(self, job_id: UUID) -> None:
+        """Cancel a pending job outright; flag a running one for its handler."""
+        now = datetime.now(timezone.utc)
+        await self.session.execute(
+            update(BackgroundJob)
+            .where(and_(BackgroundJob.id == job_id, BackgroundJob.status == JobStatus.PENDING.value))
+            .values(status=JobStatus.CANCELLED.value, cancel_requested=True, finished_at=now)
+        )
+        await self.session.execute(
+            update(BackgroundJob)
+            .where(and_(BackgroundJob.id == job_id, BackgroundJob.status == JobStatus.RUNNING.value))
+            .values(cancel_requested=True)
+        )
+
+    async def fail_stale(self, heartbeat_before: datetime, exclude: Collection[UUID] = ()) -> int:
+        """Fail running jobs whose worker stopped reporting progress (except ``exclude``)."""
+        conditions = [
+            BackgroundJob.status == JobStatus.RUNNING.value,
+            BackgroundJob.updated_at < heartbeat_before
+        ]
+        if exclude:
+            conditions.append(BackgroundJob.id.notin_(list(exclude)))
+        result = await self.session.execute(
+            update(BackgroundJob)
+            .where(and_(*conditions))
+            .values(
+                status=JobStatus.FAILED.value,
+                error_message="Worker stopped before the job finished",
+                finished_at=datetime.now(timezone.utc)
+            )
+        )
+        return result.rowcount
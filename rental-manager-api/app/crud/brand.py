@@ -1,9 +1,11 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import Select, select, func, or_, and_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.response_cache import track_catalog_writes
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.brand import Brand
 
 
@@ -13,6 +15,8 @@ class BrandRepository:
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session."""
         self.session = session
+        track_counted_writes(session)
+        track_catalog_writes(session)
     
     async def create(self, brand_data: dict) -> Brand:
         """Create a new brand."""
@@ -114,6 +118,31 @@ class BrandRepository:
         
         return brands, total
     
+    def export_query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        include_inactive: bool = False
+    ) -> Select:
+        """Column query for streaming exports."""
+        query = select(
+            Brand.id,
+            Brand.name,
+            Brand.code,
+            Brand.description,
+            Brand.is_active,
+            Brand.created_at,
+            Brand.updated_at,
+            Brand.created_by,
+            Brand.updated_by
+        )
+        
+        if not include_inactive:
+            query = query.where(Brand.is_active == True)
+        if filters:
+            query = self._apply_filters(query, filters)
+        
+        return query.order_by(Brand.name)
+    
     async def update(self, brand_id: UUID, update_data: dict) -> Optional[Brand]:
         """Update existing brand."""
         brand = await self.get_by_id(brand_id)
@@ -283,16 +312,11 @@ class BrandRepository:
         return count
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get brand statistics."""
-        # Count all brands
-        total_query = select(func.count()).select_from(Brand)
-        total_result = await self.session.execute(total_query)
-        total_brands = total_result.scalar_one()
-        
-        # Count active brands
-        active_query = select(func.count()).select_from(Brand).where(Brand.is_active == True)
-        active_result = await self.session.execute(active_query)
-        active_brands = active_result.scalar_one()
+        """Get brand statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, Brand.__tablename__)
+        
+        total_brands = stats.total_count("is_active")
+        active_brands = stats.count("is_active")
         
         # Count brands with items (placeholder until items relationship is available)
         brands_with_items = 0
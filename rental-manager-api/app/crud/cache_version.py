@@ -0,0 +1,114 @@
+"""
+Cache version counters.
+
+Writers defer their bumps to the commit with ``defer_cache_version_bumps``.
+Just before a session tracked with ``track_cache_versions`` commits, after
+any counter writes that register themselves to run first (see
+``app.crud.entity_stats``), every deferred namespace is bumped in one upsert
+in sorted order: concurrent transactions take the version row locks in one
+global order, and hold them only for the commit. Sessions that defer
+nothing carry no commit hook.
+"""
+
+from typing import Any, Dict, Iterable, Set
+from uuid import uuid4
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.models.cache_version import CacheVersion
+
+# session.info key holding the namespaces to bump when the transaction commits
+DEFERRED_VERSIONS_KEY = "cache_versions_deferred"
+
+
+class CacheVersionRepository:
+    """Repository for cache version counters."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def get(self, namespace: str) -> int:
+        """Current version of a namespace (0 if it was never bumped)."""
+        query = select(CacheVersion.version).where(CacheVersion.namespace == namespace)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() or 0
+
+    async def get_many(self, namespaces: Iterable[str]) -> Dict[str, int]:
+        """Current versions of several namespaces in one query."""
+        namespaces = list(namespaces)
+        query = select(CacheVersion.namespace, CacheVersion.version).where(
+            CacheVersion.namespace.in_(namespaces)
+        )
+        found = dict((await self.session.execute(query)).all())
+        return {namespace: found.get(namespace) or 0 for namespace in namespaces}
+
+
+def bump_cache_versions(executor: Any, namespaces: Iterable[str]) -> None:
+    """
+    Increment several namespaces' versions in one upsert.
+
+    Synchronous on a ``Connection`` or ``Session`` so it can run inside a
+    flush. Namespaces are written in sorted order so concurrent writers
+    take the version row locks in the same order.
+    """
+    namespaces = sorted(set(namespaces))
+    if not namespaces:
+        return
+
+    dialect = executor.dialect if hasattr(executor, "dialect") else executor.get_bind().dialect
+    insert = pg_insert if dialect.name == "postgresql" else sqlite_insert
+
+    versions = CacheVersion.__table__
+    statement = insert(versions)
+    executor.execute(
+        statement.on_conflict_do_update(
+            index_elements=["namespace"],
+            set_={"version": versions.c.version + 1, "updated_at": func.now()},
+        ),
+        [
+            {"id": uuid4(), "namespace": namespace, "version": 1, "is_active": True}
+            for namespace in namespaces
+        ]
+    )
+
+
+def track_cache_versions(session: Session) -> None:
+    """
+    Write the session's deferred version bumps when it commits.
+
+    Code that defers bumps from its own flush hooks tracks the session up
+    front, as the commit's last flush runs after the commit hook was due.
+    """
+    session = getattr(session, "sync_session", session)
+    if not isinstance(session, Session):
+        # A stand-in such as a mock has no session events
+        return
+    if not event.contains(session, "before_commit", _write_deferred_versions):
+        event.listen(session, "before_commit", _write_deferred_versions)
+        event.listen(session, "after_transaction_end", _discard_deferred_versions)
+
+
+def defer_cache_version_bumps(session: Session, namespaces: Iterable[str]) -> None:
+    """Bump namespaces when the session commits."""
+    track_cache_versions(session)
+    session = getattr(session, "sync_session", session)
+    session.info.setdefault(DEFERRED_VERSIONS_KEY, set()).update(namespaces)
+
+
+def _write_deferred_versions(session: Session) -> None:
+    # The commit's own flush runs after this hook; flush first so bumps its
+    # writes defer are written here
+    session.flush()
+    namespaces: Set[str] = session.info.pop(DEFERRED_VERSIONS_KEY, set())
+    if namespaces:
+        bump_cache_versions(session.connection(), namespaces)
+
+
+def _discard_deferred_versions(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(DEFERRED_VERSIONS_KEY, None)
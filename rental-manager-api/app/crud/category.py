@@ -1,13 +1,16 @@
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, or_, and_, desc, asc, text
+from sqlalchemy import select, func, or_, and_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 from pydantic import BaseModel, ConfigDict
 
+from app.crud import statements
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.category import Category
 from app.schemas.category import CategoryFilter, CategorySort
 from app.core.errors import NotFoundError, ValidationError
+from app.core.response_cache import track_catalog_writes
 
 
 class CategoryRepository:
@@ -16,6 +19,8 @@ class CategoryRepository:
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session."""
         self.session = session
+        track_counted_writes(session)
+        track_catalog_writes(session)
 
     async def create(self, obj_data: Dict[str, Any]) -> Category:
         """Create a new category with proper handling of category_code."""
@@ -198,22 +203,7 @@ class CategoryRepository:
     async def get_ancestors(self, category_id: UUID) -> List[Category]:
         """Get all ancestors of a category (parent, grandparent, etc.)."""
         # Use recursive CTE
-        cte_query = text("""
-            WITH RECURSIVE ancestors AS (
-                SELECT c.* 
-                FROM categories c 
-                WHERE c.id = :category_id
-                
-                UNION ALL
-                
-                SELECT c.* 
-                FROM categories c 
-                INNER JOIN ancestors a ON c.id = a.parent_category_id
-            )
-            SELECT * FROM ancestors WHERE id != :category_id ORDER BY category_level DESC;
-        """)
-        
-        result = await self.session.execute(cte_query, {"category_id": str(category_id)})
+        result = await self.session.execute(statements.CATEGORY_ANCESTORS, {"category_id": str(category_id)})
         rows = result.fetchall()
         
         # Convert rows to Category objects
@@ -229,22 +219,7 @@ class CategoryRepository:
     async def get_descendants(self, category_id: UUID) -> List[Category]:
         """Get all descendants of a category (children, grandchildren, etc.)."""
         # Use recursive CTE
-        cte_query = text("""
-            WITH RECURSIVE descendants AS (
-                SELECT c.* 
-                FROM categories c 
-                WHERE c.id = :category_id
-                
-                UNION ALL
-                
-                SELECT c.* 
-                FROM categories c 
-                INNER JOIN descendants d ON c.parent_category_id = d.id
-            )
-            SELECT * FROM descendants WHERE id != :category_id ORDER BY category_level ASC;
-        """)
-        
-        result = await self.session.execute(cte_query, {"category_id": str(category_id)})
+        result = await self.session.execute(statements.CATEGORY_DESCENDANTS, {"category_id": str(category_id)})
         rows = result.fetchall()
         
         # Convert rows to Category objects
@@ -507,40 +482,17 @@ class CategoryRepository:
         return categories, total
 
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get category statistics."""
-        # Total categories
-        total_query = select(func.count()).select_from(Category)
-        total_result = await self.session.execute(total_query)
-        total_categories = total_result.scalar_one()
-        
-        # Active categories
-        active_query = select(func.count()).select_from(Category).where(Category.is_active == True)
-        active_result = await self.session.execute(active_query)
-        active_categories = active_result.scalar_one()
-        
-        # Inactive categories
-        inactive_categories = total_categories - active_categories
-        
-        # Root categories
-        root_query = select(func.count()).select_from(Category).where(
-            and_(Category.parent_category_id == None, Category.is_active == True)
-        )
-        root_result = await self.session.execute(root_query)
-        root_categories = root_result.scalar_one()
+        """Get category statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, Category.__tablename__)
         
-        # Leaf categories
-        leaf_query = select(func.count()).select_from(Category).where(
-            and_(Category.is_leaf == True, Category.is_active == True)
-        )
-        leaf_result = await self.session.execute(leaf_query)
-        leaf_categories = leaf_result.scalar_one()
+        total_categories = stats.total_count("is_active")
+        active_categories = stats.count("is_active")
+        inactive_categories = total_categories - active_categories
+        root_categories = stats.count("is_root")
+        leaf_categories = stats.count("is_leaf")
         
-        # Max depth
-        max_depth_query = select(func.max(Category.category_level)).select_from(Category).where(
-            Category.is_active == True
-        )
-        max_depth_result = await self.session.execute(max_depth_query)
-        max_depth = max_depth_result.scalar_one() or 0
+        # Deepest level with an active category
+        max_depth = max((int(level) for level in stats.buckets("category_level")), default=0)
         
         # Average children per category (simplified calculation)
         avg_children = 0.0
@@ -3,6 +3,7 @@ from uuid import UUID
 from sqlalchemy import and_, or_, func, select, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.contact_person import ContactPerson
 from app.schemas.contact_person import ContactPersonSearch
 
@@ -12,6 +13,7 @@ class ContactPersonRepository:
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        track_counted_writes(session)
     
     async def get_by_id(self, contact_id: UUID) -> Optional[ContactPerson]:
         """Get contact person by ID."""
@@ -261,53 +263,21 @@ class ContactPersonRepository:
         return result.scalar_one_or_none() is not None
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get contact person statistics."""
-        # Total counts
-        total_contacts = await self.count_all(active_only=False)
-        active_contacts = await self.count_all(active_only=True)
-        primary_contacts = await self.count_all(is_primary=True, active_only=True)
-        
-        # Count unique companies
-        companies_query = select(func.count(func.distinct(ContactPerson.company))).where(
-            and_(
-                ContactPerson.company.isnot(None),
-                ContactPerson.is_active == True
-            )
-        )
-        companies_result = await self.session.execute(companies_query)
-        companies_count = companies_result.scalar()
+        """Get contact person statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, ContactPerson.__tablename__)
         
-        # Count contacts with email
-        email_query = select(func.count(ContactPerson.id)).where(
-            and_(
-                ContactPerson.email.isnot(None),
-                ContactPerson.is_active == True
-            )
-        )
-        email_result = await self.session.execute(email_query)
-        with_email = email_result.scalar()
-        
-        # Count contacts with phone
-        phone_query = select(func.count(ContactPerson.id)).where(
-            and_(
-                or_(
-                    ContactPerson.phone.isnot(None),
-                    ContactPerson.mobile.isnot(None)
-                ),
-                ContactPerson.is_active == True
-            )
-        )
-        phone_result = await self.session.execute(phone_query)
-        with_phone = phone_result.scalar()
+        total_contacts = stats.total_count("is_active")
+        active_contacts = stats.count("is_active")
         
         return {
             "total_contacts": total_contacts,
             "active_contacts": active_contacts,
             "inactive_contacts": total_contacts - active_contacts,
-            "primary_contacts": primary_contacts,
-            "companies_count": companies_count,
-            "with_email": with_email,
-            "with_phone": with_phone,
+            "primary_contacts": stats.count("is_primary"),
+            # One counter per company that has active contacts
+            "companies_count": len(stats.buckets("company")),
+            "with_email": stats.count("has_email"),
+            "with_phone": stats.count("has_phone"),
         }
     
     async def get_recent_contacts(self, limit: int = 10) -> List[ContactPerson]:
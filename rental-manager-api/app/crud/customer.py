@@ -2,10 +2,11 @@ from typing import Optional, List, Dict, Any
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime, date
-from sqlalchemy import and_, or_, func, select, update, delete, desc, asc
+from sqlalchemy import Select, and_, or_, func, select, update, delete, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.customer import Customer, CustomerType, CustomerTier, BlacklistStatus, CustomerStatus
 
 
@@ -14,6 +15,7 @@ class CustomerRepository:
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        track_counted_writes(session)
     
     async def get_by_id(self, customer_id: UUID) -> Optional[Customer]:
         """Get customer by ID."""
@@ -47,6 +49,45 @@ class CustomerRepository:
         query = select(Customer)
         
         # Apply filters
+        conditions = self._filter_conditions(
+            customer_type, customer_status, customer_tier, blacklist_status, active_only
+        )
+        if conditions:
+            query = query.where(and_(*conditions))
+        
+        query = query.order_by(asc(Customer.customer_code)).offset(skip).limit(limit)
+        
+        result = await self.session.execute(query)
+        return result.scalars().all()
+    
+    def export_query(
+        self,
+        customer_type: Optional[CustomerType] = None,
+        customer_status: Optional[CustomerStatus] = None,
+        customer_tier: Optional[CustomerTier] = None,
+        blacklist_status: Optional[BlacklistStatus] = None,
+        active_only: bool = True
+    ) -> Select:
+        """Column query over every customer column for streaming exports."""
+        query = select(*Customer.__table__.columns)
+        
+        conditions = self._filter_conditions(
+            customer_type, customer_status, customer_tier, blacklist_status, active_only
+        )
+        if conditions:
+            query = query.where(and_(*conditions))
+        
+        return query.order_by(asc(Customer.customer_code))
+    
+    def _filter_conditions(
+        self,
+        customer_type: Optional[CustomerType],
+        customer_status: Optional[CustomerStatus],
+        customer_tier: Optional[CustomerTier],
+        blacklist_status: Optional[BlacklistStatus],
+        active_only: bool
+    ) -> list:
+        """Build the WHERE conditions shared by listing and export."""
         conditions = []
         if active_only:
             conditions.append(Customer.is_active == True)
@@ -58,14 +99,7 @@ class CustomerRepository:
             conditions.append(Customer.customer_tier == customer_tier.value)
         if blacklist_status:
             conditions.append(Customer.blacklist_status == blacklist_status.value)
-        
-        if conditions:
-            query = query.where(and_(*conditions))
-        
-        query = query.order_by(asc(Customer.customer_code)).offset(skip).limit(limit)
-        
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        return conditions
     
     async def search(
         self, 
@@ -205,25 +239,19 @@ class CustomerRepository:
         return result.scalars().all()
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get customer statistics."""
-        # Count by status
-        total_customers = await self.count_all(active_only=False)
-        active_customers = await self.count_all(active_only=True)
-        
-        # Count by type
-        individual_customers = await self.count_all(customer_type=CustomerType.INDIVIDUAL, active_only=True)
-        business_customers = await self.count_all(customer_type=CustomerType.BUSINESS, active_only=True)
+        """Get customer statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, Customer.__tablename__)
         
-        # Count by blacklist status
-        blacklisted_customers = await self.count_all(blacklist_status=BlacklistStatus.BLACKLISTED, active_only=True)
+        total_customers = stats.total_count("is_active")
+        active_customers = stats.count("is_active")
         
         return {
             "total_customers": total_customers,
             "active_customers": active_customers,
             "inactive_customers": total_customers - active_customers,
-            "individual_customers": individual_customers,
-            "business_customers": business_customers,
-            "blacklisted_customers": blacklisted_customers,
+            "individual_customers": stats.count("customer_type", CustomerType.INDIVIDUAL.value),
+            "business_customers": stats.count("customer_type", CustomerType.BUSINESS.value),
+            "blacklisted_customers": stats.count("blacklist_status", BlacklistStatus.BLACKLISTED.value),
         }
     
     async def check_customer_code_exists(self, customer_code: str, exclude_id: Optional[UUID] = None) -> bool:
@@ -0,0 +1,190 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, and_, case, exists, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.customer import Customer
+from app.models.customer_credit_exposure import CustomerCreditExposure
+from app.models.transaction import PaymentStatus, TransactionHeader, TransactionStatus, TransactionType
+
+
+def open_sales_filter():
+    """Sales that still count towards a customer's credit exposure."""
+    return and_(
+        TransactionHeader.transaction_type == TransactionType.SALE,
+        TransactionHeader.status != TransactionStatus.CANCELLED,
+        TransactionHeader.payment_status != PaymentStatus.PAID,
+        TransactionHeader.customer_id.isnot(None)
+    )
+
+
+class CustomerCreditExposureRepository:
+    """Repository for per-customer credit exposure rows."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def get(self, customer_id: UUID) -> Optional[CustomerCreditExposure]:
+        """Get a customer's exposure row (None if they never had an open sale)."""
+        query = select(CustomerCreditExposure).where(CustomerCreditExposure.customer_id == customer_id)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_with_customer(
+        self,
+        customer_id: UUID
+    ) -> Tuple[Optional[Customer], Optional[CustomerCreditExposure]]:
+        """Load a customer and their exposure row in one keyed read."""
+        query = (
+            select(Customer, CustomerCreditExposure)
+            .outerjoin(CustomerCreditExposure, CustomerCreditExposure.customer_id == Customer.id)
+            .where(Customer.id == customer_id)
+        )
+        row = (await self.session.execute(query)).first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    async def apply(
+        self,
+        customer_id: UUID,
+        balance_delta: Decimal,
+        open_sales_delta: int = 0,
+        overdue_delta: int = 0,
+        due_date: Optional[date] = None
+    ) -> None:
+        """
+        Add deltas to a customer's exposure, creating the row on first use.
+
+        A single ``INSERT ... ON CONFLICT DO UPDATE`` so concurrent sales for
+        the same customer serialize on the row instead of losing updates.
+        ``due_date`` is the due date of a sale being opened and can only move
+        ``oldest_due_date`` earlier; closing a sale is followed by
+        ``refresh_due_dates``.
+        """
+        table = CustomerCreditExposure.__table__
+        insert = pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        statement = insert(table).values(
+            id=uuid4(),
+            customer_id=customer_id,
+            outstanding_balance=balance_delta,
+            open_sales_count=max(open_sales_delta, 0),
+            oldest_due_date=due_date if open_sales_delta > 0 else None,
+            overdue_count=max(overdue_delta, 0),
+            is_active=True
+        )
+        values = {
+            "outstanding_balance": table.c.outstanding_balance + balance_delta,
+            "open_sales_count": _at_least_zero(table.c.open_sales_count + open_sales_delta),
+            "overdue_count": _at_least_zero(table.c.overdue_count + overdue_delta),
+            "updated_at": func.now()
+        }
+        if due_date is not None and open_sales_delta > 0:
+            due = literal(due_date, Date)
+            values["oldest_due_date"] = case(
+                (table.c.oldest_due_date.is_(None), due),
+                (table.c.oldest_due_date > due, due),
+                else_=table.c.oldest_due_date
+            )
+        await self.session.execute(
+            statement.on_conflict_do_update(index_elements=[table.c.customer_id], set_=values)
+        )
+
+    async def refresh_due_dates(self, customer_id: UUID, today: Optional[date] = None) -> None:
+        """Recompute ``oldest_due_date`` and ``overdue_count`` from the customer's open sales."""
+        today = today or date.today()
+        open_sales = and_(open_sales_filter(), TransactionHeader.customer_id == customer_id)
+        await self.session.execute(
+            update(CustomerCreditExposure)
+            .where(CustomerCreditExposure.customer_id == customer_id)
+            .values(
+                oldest_due_date=select(func.min(TransactionHeader.due_date)).where(open_sales).scalar_subquery(),
+                overdue_count=(
+                    select(func.count())
+                    .select_from(TransactionHeader)
+                    .where(open_sales, TransactionHeader.due_date < today)
+                    .scalar_subquery()
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def reconcile(self, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Recompute every exposure row from ``transaction_headers``.
+
+        Three set-based statements: correct rows that drifted, zero rows of
+        customers without open sales, and create rows that are missing.
+        Returns how many rows each step touched.
+        """
+        today = today or date.today()
+        exposure = CustomerCreditExposure
+        header = TransactionHeader
+        totals = (
+            select(
+                header.customer_id.label("customer_id"),
+                func.sum(header.total_amount - header.paid_amount).label("outstanding_balance"),
+                func.count().label("open_sales_count"),
+                func.min(header.due_date).label("oldest_due_date"),
+                func.sum(case((header.due_date < today, 1), else_=0)).label("overdue_count")
+            )
+            .where(open_sales_filter())
+            .group_by(header.customer_id)
+            .subquery()
+        )
+
+        corrected = await self.session.execute(
+            update(exposure)
+            .where(
+                exposure.customer_id == totals.c.customer_id,
+                or_(
+                    exposure.outstanding_balance != totals.c.outstanding_balance,
+                    exposure.open_sales_count != totals.c.open_sales_count,
+                    exposure.oldest_due_date.is_distinct_from(totals.c.oldest_due_date),
+                    exposure.overdue_count != totals.c.overdue_count
+                )
+            )
+            .values(
+                outstanding_balance=totals.c.outstanding_balance,
+                open_sales_count=totals.c.open_sales_count,
+                oldest_due_date=totals.c.oldest_due_date,
+                overdue_count=totals.c.overdue_count
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        cleared = await self.session.execute(
+            update(exposure)
+            .where(
+                ~exists().where(header.customer_id == exposure.customer_id, open_sales_filter()),
+                or_(
+                    exposure.outstanding_balance != 0,
+                    exposure.open_sales_count != 0,
+                    exposure.oldest_due_date.isnot(None),
+                    exposure.overdue_count != 0
+                )
+            )
+            .values(outstanding_balance=0, open_sales_count=0, oldest_due_date=None, overdue_count=0)
+            .execution_options(synchronize_session=False)
+        )
+
+        missing = (await self.session.execute(
+            select(totals).where(~exists().where(exposure.customer_id == totals.c.customer_id))
+        )).mappings().all()
+        if missing:
+            await self.session.execute(
+                CustomerCreditExposure.__table__.insert(),
+                [{"id": uuid4(), "is_active": True, **row} for row in missing]
+            )
+
+        return {"corrected": corrected.rowcount, "cleared": cleared.rowcount, "created": len(missing)}
+
+
+def _at_least_zero(expression):
+    return case((expression < 0, 0), else_=expression)
@@ -0,0 +1,706 @@
+"""
+Counter-table statistics for master data.
+
+``STAT_SPECS`` declares, per entity, the dimensions whose buckets are
+counted and the measures whose values are summed. The same declaration is
+used three ways: the session hooks installed by ``track_counted_writes``
+turn row changes into counter deltas, ``reconcile_entity`` recounts the
+source table to correct drift, and ``EntityStats`` answers the stats
+endpoints from one read of the counter rows.
+
+Every change to an entity's counters bumps the ``stats:<entity>`` cache
+version in the same transaction, so ``entity_stats_cache`` can hold a
+snapshot per worker and drop it exactly when the counters move. Changes
+that cannot be turned into deltas bump ``stats:<entity>:recount`` instead,
+which marks the entity for the scheduler to recount.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from uuid import uuid4
+
+from sqlalchemy import and_, delete, event, func, inspect, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+from sqlalchemy.sql import ColumnElement
+
+from app.core.metrics import record_cache_lookup
+from app.crud.cache_version import (
+    CacheVersionRepository,
+    bump_cache_versions,
+    defer_cache_version_bumps,
+    track_cache_versions,
+)
+from app.models.brand import Brand
+from app.models.cache_version import CacheVersion
+from app.models.category import Category
+from app.models.contact_person import ContactPerson
+from app.models.customer import Customer
+from app.models.entity_stat import EntityStatCounter
+from app.models.item import Item
+from app.models.location import Location
+from app.models.supplier import Supplier
+from app.models.unit_of_measurement import UnitOfMeasurement
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0")
+
+# SQLSTATEs of a transaction that lost a race (serialization failure, deadlock)
+CONFLICT_SQLSTATES = {"40001", "40P01"}
+
+# (entity, dimension, bucket) -> [count delta, total delta]
+CounterDeltas = DefaultDict[Tuple[str, str, str], List]
+
+
+@dataclass(frozen=True)
+class StatDimension:
+    """
+    A counted attribute: rows are counted per bucket of ``value``.
+
+    ``value`` computes the bucket value from a mapping of attribute values
+    (an instance before or after a change); ``expression`` computes the same
+    in SQL for recounting. Active-only dimensions count rows with
+    ``is_active`` set; ``skip_null`` leaves rows with no value uncounted.
+    """
+    name: str
+    attributes: Tuple[str, ...]
+    value: Callable[[Mapping[str, Any]], Any]
+    expression: Callable[[], ColumnElement]
+    active_only: bool = True
+    skip_null: bool = False
+
+    def bucket(self, value: Any) -> Optional[str]:
+        if value is None:
+            return None if self.skip_null else ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, Enum):
+            return str(value.value)
+        return str(value)
+
+
+@dataclass(frozen=True)
+class StatMeasure:
+    """A summed attribute of active rows: non-null count and total."""
+    name: str
+    attribute: str
+
+
+@dataclass(frozen=True)
+class StatSpec:
+    """Dimensions and measures maintained for one entity."""
+    model: Any
+    dimensions: Tuple[StatDimension, ...]
+    measures: Tuple[StatMeasure, ...] = ()
+    attributes: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self):
+        names = {"is_active"}
+        for dimension in self.dimensions:
+            names.update(dimension.attributes)
+        names.update(measure.attribute for measure in self.measures)
+        object.__setattr__(self, "attributes", tuple(sorted(names)))
+
+    @property
+    def entity(self) -> str:
+        return self.model.__tablename__
+
+
+def _column(model, attribute: str, *, active_only: bool = True, skip_null: bool = False) -> StatDimension:
+    """Dimension bucketed by a column's value."""
+    return StatDimension(
+        attribute,
+        (attribute,),
+        lambda values: values[attribute],
+        lambda: getattr(model, attribute),
+        active_only=active_only,
+        skip_null=skip_null,
+    )
+
+
+def _flag(
+    name: str,
+    attributes: Tuple[str, ...],
+    value: Callable[[Mapping[str, Any]], bool],
+    expression: Callable[[], ColumnElement]
+) -> StatDimension:
+    """Dimension bucketed by a derived true/false condition over active rows."""
+    return StatDimension(name, attributes, value, expression)
+
+
+STAT_SPECS: Dict[str, StatSpec] = {
+    spec.entity: spec
+    for spec in (
+        StatSpec(
+            Item,
+            (
+                _column(Item, "is_active", active_only=False),
+                _column(Item, "is_rentable"),
+                _column(Item, "is_salable"),
+                _column(Item, "is_rental_blocked"),
+                _column(Item, "status"),
+                _column(Item, "category_id"),
+                _column(Item, "brand_id"),
+            ),
+            (
+                StatMeasure("sale_price", "sale_price"),
+                StatMeasure("rental_rate_per_day", "rental_rate_per_day"),
+                StatMeasure("cost_price", "cost_price"),
+            ),
+        ),
+        StatSpec(
+            Customer,
+            (
+                _column(Customer, "is_active", active_only=False),
+                _column(Customer, "customer_type"),
+                _column(Customer, "blacklist_status"),
+            ),
+        ),
+        StatSpec(
+            Supplier,
+            (
+                _column(Supplier, "is_active", active_only=False),
+                _column(Supplier, "supplier_type"),
+                _column(Supplier, "status"),
+                _column(Supplier, "supplier_tier"),
+                _column(Supplier, "country", skip_null=True),
+            ),
+            (
+                StatMeasure("quality_rating", "quality_rating"),
+                StatMeasure("delivery_rating", "delivery_rating"),
+            ),
+        ),
+        StatSpec(
+            Location,
+            (
+                _column(Location, "is_active", active_only=False),
+                _column(Location, "location_type"),
+                _column(Location, "country", skip_null=True),
+                _column(Location, "state", skip_null=True),
+                _column(Location, "capacity", skip_null=True),
+                _flag(
+                    "has_coordinates",
+                    ("latitude", "longitude"),
+                    lambda values: values["latitude"] is not None and values["longitude"] is not None,
+                    lambda: and_(Location.latitude.isnot(None), Location.longitude.isnot(None)),
+                ),
+            ),
+        ),
+        StatSpec(Brand, (_column(Brand, "is_active", active_only=False),)),
+        StatSpec(
+            Category,
+            (
+                _column(Category, "is_active", active_only=False),
+                _column(Category, "is_leaf"),
+                _column(Category, "category_level"),
+                _flag(
+                    "is_root",
+                    ("parent_category_id",),
+                    lambda values: values["parent_category_id"] is None,
+                    lambda: Category.parent_category_id.is_(None),
+                ),
+            ),
+        ),
+        StatSpec(
+            ContactPerson,
+            (
+                _column(ContactPerson, "is_active", active_only=False),
+                _column(ContactPerson, "is_primary"),
+                _column(ContactPerson, "company", skip_null=True),
+                _flag(
+                    "has_email",
+                    ("email",),
+                    lambda values: values["email"] is not None,
+                    lambda: ContactPerson.email.isnot(None),
+                ),
+                _flag(
+                    "has_phone",
+                    ("phone", "mobile"),
+                    lambda values: values["phone"] is not None or values["mobile"] is not None,
+                    lambda: or_(ContactPerson.phone.isnot(None), ContactPerson.mobile.isnot(None)),
+                ),
+            ),
+        ),
+        StatSpec(UnitOfMeasurement, (_column(UnitOfMeasurement, "is_active", active_only=False),)),
+    )
+}
+
+STAT_SPECS_BY_MODEL: Dict[Any, StatSpec] = {spec.model: spec for spec in STAT_SPECS.values()}
+
+
+def stats_namespace(entity: str) -> str:
+    """Cache version namespace of an entity's counters."""
+    return f"stats:{entity}"
+
+
+def recount_namespace(entity: str) -> str:
+    """
+    Cache version namespace marking an entity for recount.
+
+    It sorts after ``stats:<entity>`` so writers and the reconcile lock
+    the two version rows in the same order.
+    """
+    return f"stats:{entity}:recount"
+
+
+def new_deltas() -> CounterDeltas:
+    return defaultdict(lambda: [0, ZERO])
+
+
+def add_contributions(deltas: CounterDeltas, spec: StatSpec, values: Mapping[str, Any], sign: int) -> None:
+    """Add (``sign`` = 1) or remove (-1) one row's contribution to the counters."""
+    active = bool(values["is_active"])
+    for dimension in spec.dimensions:
+        if dimension.active_only and not active:
+            continue
+        bucket = dimension.bucket(dimension.value(values))
+        if bucket is not None:
+            deltas[(spec.entity, dimension.name, bucket)][0] += sign
+    if not active:
+        return
+    for measure in spec.measures:
+        value = values[measure.attribute]
+        if value is not None:
+            delta = deltas[(spec.entity, measure.name, "")]
+            delta[0] += sign
+            delta[1] += sign * (value if isinstance(value, Decimal) else Decimal(str(value)))
+
+
+def add_updated_rows(
+    deltas: CounterDeltas,
+    spec: StatSpec,
+    rows: Iterable[Mapping[str, Any]],
+    previous: Mapping[str, Any]
+) -> None:
+    """
+    Move the contributions of rows changed by a bulk ``UPDATE``.
+
+    ``rows`` hold the new values of ``spec.attributes`` (from ``RETURNING``);
+    ``previous`` holds the old values of the counted attributes the update
+    set, which its ``WHERE`` clause must pin.
+    """
+    for values in rows:
+        add_contributions(deltas, spec, {**values, **previous}, -1)
+        add_contributions(deltas, spec, values, 1)
+
+
+def changed_entities(deltas: CounterDeltas) -> List[str]:
+    """Entities with a non-zero delta."""
+    return sorted({key[0] for key, (count, total) in deltas.items() if count or total})
+
+
+def write_counters(executor: Any, deltas: CounterDeltas) -> int:
+    """
+    Add deltas to the counters.
+
+    Synchronous on a ``Connection`` or ``Session`` so it can run inside a
+    commit hook. Rows are written in key order so concurrent writers take
+    the counter row locks in the same order. The caller bumps the touched
+    entities' cache versions after all its counter writes.
+
+    Returns:
+        Number of counters changed
+    """
+    changes = sorted(
+        (key, count, total) for key, (count, total) in deltas.items() if count or total
+    )
+    if not changes:
+        return 0
+
+    dialect = executor.dialect if hasattr(executor, "dialect") else executor.get_bind().dialect
+    insert = pg_insert if dialect.name == "postgresql" else sqlite_insert
+
+    table = EntityStatCounter.__table__
+    statement = insert(table)
+    executor.execute(
+        statement.on_conflict_do_update(
+            index_elements=["entity", "dimension", "bucket"],
+            set_={
+                "count": table.c["count"] + statement.excluded["count"],
+                "total": table.c["total"] + statement.excluded["total"],
+                "updated_at": func.now(),
+            },
+        ),
+        [
+            {
+                "id": uuid4(),
+                "entity": entity,
+                "dimension": dimension,
+                "bucket": bucket,
+                "count": count,
+                "total": total,
+                "is_active": True,
+            }
+            for (entity, dimension, bucket), count, total in changes
+        ]
+    )
+    return len(changes)
+
+
+def count_source(executor: Any, spec: StatSpec) -> Dict[Tuple[str, str], Tuple[int, Decimal]]:
+    """Count an entity's source table: {(dimension, bucket): (count, total)}."""
+    model = spec.model
+    counters: Dict[Tuple[str, str], List] = defaultdict(lambda: [0, ZERO])
+
+    for dimension in spec.dimensions:
+        expression = dimension.expression()
+        query = select(expression, func.count()).select_from(model).group_by(expression)
+        if dimension.active_only:
+            query = query.where(model.is_active == True)
+        for value, count in executor.execute(query):
+            bucket = dimension.bucket(value)
+            if bucket is not None:
+                counters[(dimension.name, bucket)][0] += count
+
+    for measure in spec.measures:
+        column = getattr(model, measure.attribute)
+        count, total = executor.execute(
+            select(func.count(column), func.sum(column)).where(model.is_active == True)
+        ).one()
+        if count:
+            counters[(measure.name, "")] = [count, total or ZERO]
+
+    return {key: (count, total) for key, (count, total) in counters.items()}
+
+
+def reconcile_entity(executor: Any, spec: StatSpec) -> int:
+    """
+    Correct an entity's counters from its source table.
+
+    Corrections are applied as deltas against the counters read here, so
+    the source count and the counter read must see the same snapshot for
+    the result to be exact under concurrent writes (see
+    ``EntityStatsRepository.reconcile``). Emptied counters are removed and
+    the entity's recount mark is cleared. Counter rows are written before
+    version rows, in the same order as the commit hooks of tracked sessions
+    (see ``track_counted_writes``).
+
+    Returns:
+        Number of counters corrected
+    """
+    expected = count_source(executor, spec)
+    stored = {
+        (row.dimension, row.bucket): (row.count, row.total)
+        for row in executor.execute(
+            select(EntityStatCounter.dimension, EntityStatCounter.bucket, EntityStatCounter.count, EntityStatCounter.total)
+            .where(EntityStatCounter.entity == spec.entity)
+        )
+    }
+
+    corrections = new_deltas()
+    for key in expected.keys() | stored.keys():
+        expected_count, expected_total = expected.get(key, (0, ZERO))
+        stored_count, stored_total = stored.get(key, (0, ZERO))
+        if expected_count != stored_count or expected_total != stored_total:
+            corrections[(spec.entity, *key)] = [expected_count - stored_count, expected_total - stored_total]
+
+    corrected = write_counters(executor, corrections)
+    executor.execute(
+        delete(EntityStatCounter).where(
+            EntityStatCounter.entity == spec.entity,
+            EntityStatCounter.count == 0,
+            EntityStatCounter.total == 0
+        ).execution_options(synchronize_session=False)
+    )
+    if corrected:
+        bump_cache_versions(executor, [stats_namespace(spec.entity)])
+    executor.execute(
+        delete(CacheVersion)
+        .where(CacheVersion.namespace == recount_namespace(spec.entity))
+        .execution_options(synchronize_session=False)
+    )
+    return corrected
+
+
+@dataclass(frozen=True)
+class EntityStats:
+    """Snapshot of one entity's counters."""
+    entity: str
+    version: int
+    counters: Mapping[str, Mapping[str, Tuple[int, Decimal]]]
+
+    def buckets(self, dimension: str) -> Dict[str, int]:
+        """Non-empty buckets of a dimension with their counts."""
+        return {bucket: count for bucket, (count, _) in self.counters.get(dimension, {}).items() if count}
+
+    def count(self, dimension: str, bucket: str = "true") -> int:
+        return self.buckets(dimension).get(bucket, 0)
+
+    def total_count(self, dimension: str) -> int:
+        """Rows counted in any bucket of a dimension."""
+        return sum(self.buckets(dimension).values())
+
+    def top(self, dimension: str, limit: int = 10) -> Dict[str, int]:
+        """Largest buckets of a dimension, biggest first."""
+        ranked = sorted(self.buckets(dimension).items(), key=lambda entry: (-entry[1], entry[0]))
+        return dict(ranked[:limit])
+
+    def sum(self, measure: str) -> Optional[Decimal]:
+        """Total of a measure (None when no value was counted, like SQL SUM)."""
+        count, total = self.counters.get(measure, {}).get("", (0, ZERO))
+        return total if count else None
+
+    def average(self, measure: str) -> Optional[Decimal]:
+        count, total = self.counters.get(measure, {}).get("", (0, ZERO))
+        return total / count if count else None
+
+
+class EntityStatsRepository:
+    """Repository for statistics counters."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def get(self, entity: str, version: int = 0) -> EntityStats:
+        """Read an entity's counters in one query."""
+        query = (
+            select(EntityStatCounter.dimension, EntityStatCounter.bucket, EntityStatCounter.count, EntityStatCounter.total)
+            .where(EntityStatCounter.entity == entity)
+        )
+        counters: Dict[str, Dict[str, Tuple[int, Decimal]]] = defaultdict(dict)
+        for row in await self.session.execute(query):
+            counters[row.dimension][row.bucket] = (row.count, row.total)
+        return EntityStats(entity=entity, version=version, counters=dict(counters))
+
+    async def recount(self, entity: str) -> int:
+        """Correct an entity's counters within the current transaction."""
+        return await self.session.run_sync(lambda session: reconcile_entity(session, STAT_SPECS[entity]))
+
+    async def marked(self) -> List[str]:
+        """Entities marked for recount."""
+        namespaces = {recount_namespace(entity): entity for entity in STAT_SPECS}
+        result = await self.session.execute(
+            select(CacheVersion.namespace).where(CacheVersion.namespace.in_(namespaces))
+        )
+        marked = [namespaces[namespace] for namespace in result.scalars()]
+        # End the read so each reconcile can open its own transaction
+        await self.session.commit()
+        return sorted(marked)
+
+    async def reconcile(self, entities: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Correct the counters of ``entities`` (default: all), each in its own transaction.
+
+        On PostgreSQL each entity is reconciled under REPEATABLE READ so the
+        source count and the counter read share a snapshot; a writer that
+        commits a change to the same counters or recount mark meanwhile
+        makes the correction fail with a serialization error instead of
+        being overwritten, and the entity is left for the next run.
+
+        Returns:
+            Counters corrected per entity (-1 for an entity that conflicted)
+        """
+        is_postgresql = self.session.get_bind().dialect.name == "postgresql"
+        results: Dict[str, int] = {}
+        for entity in STAT_SPECS if entities is None else entities:
+            try:
+                if is_postgresql:
+                    await self.session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                results[entity] = await self.recount(entity)
+                await self.session.commit()
+            except DBAPIError as e:
+                await self.session.rollback()
+                if getattr(e.orig, "pgcode", None) not in CONFLICT_SQLSTATES:
+                    raise
+                results[entity] = -1
+        return results
+
+
+class EntityStatsCache:
+    """
+    Per-worker snapshots of entity counters.
+
+    A lookup reads the entity's cache version and only re-reads the counters
+    when it moved, so a cached snapshot is never older than the last
+    committed counter change.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, EntityStats] = {}
+
+    async def get(self, session: AsyncSession, entity: str) -> EntityStats:
+        version = await CacheVersionRepository(session).get(stats_namespace(entity))
+        snapshot = self._snapshots.get(entity)
+        hit = snapshot is not None and snapshot.version == version
+        if not hit:
+            snapshot = await EntityStatsRepository(session).get(entity, version)
+            self._snapshots[entity] = snapshot
+        record_cache_lookup("entity_stats", hit)
+        return snapshot
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        self._snapshots.clear()
+
+
+entity_stats_cache = EntityStatsCache()
+
+
+# Write tracking ----------------------------------------------------------
+#
+# Repositories that write a counted entity track their session. At the end
+# of each flush its inserted, updated and deleted rows are turned into
+# counter deltas (old contribution out, new contribution in) and kept on the
+# session. Just before commit the counters are written in sorted key order,
+# and the ``stats:`` versions of the changed entities deferred to the
+# version upsert that follows: concurrent transactions take the counter and
+# version row locks in one global order, and hold them only for the commit.
+#
+# A row whose old values were never loaded cannot be turned into a delta,
+# and bulk DML run through the session (``update(Item)...``, ``insert`` from
+# a staging table) changes rows the flush never sees. Their entity is marked
+# for recount instead, and recounted by the scheduler under REPEATABLE READ;
+# nothing is recounted inside a request or job transaction. A bulk statement
+# whose counter changes the caller adds itself (from its ``RETURNING`` rows,
+# see ``add_deltas``) is run with the ``COUNTED`` execution option. Writes
+# through untracked sessions are corrected by the periodic reconcile.
+
+# session.info keys holding the counter deltas and the entities to mark
+# for recount when the transaction commits
+DELTAS_KEY = "entity_stats_deltas"
+RECOUNT_KEY = "entity_stats_recount"
+
+# Execution option of bulk statements whose counter changes are accounted for
+COUNTED = "entity_stats_counted"
+
+
+def track_counted_writes(session: Session) -> None:
+    """Keep the statistics counters in step with the session's writes."""
+    session = getattr(session, "sync_session", session)
+    if not isinstance(session, Session) or event.contains(session, "after_flush", _count_flushed_rows):
+        return
+    event.listen(session, "after_flush", _count_flushed_rows)
+    event.listen(session, "do_orm_execute", _track_bulk_statements)
+    # Ahead of the version upsert's own before_commit hook
+    event.listen(session, "before_commit", _write_counters, insert=True)
+    event.listen(session, "after_soft_rollback", _discard_rolled_back_counts)
+    event.listen(session, "after_transaction_end", _discard_pending_counts)
+    track_cache_versions(session)
+
+
+def add_deltas(session: Session, deltas: CounterDeltas) -> None:
+    """Add counter deltas to be written when the session commits."""
+    track_counted_writes(session)
+    session = getattr(session, "sync_session", session)
+    pending = session.info.setdefault(DELTAS_KEY, new_deltas())
+    for key, (count, total) in deltas.items():
+        pending[key][0] += count
+        pending[key][1] += total
+
+
+def _mark_for_recount(session: Session, entities: Set[str]) -> None:
+    session.info.setdefault(RECOUNT_KEY, set()).update(entities)
+
+
+def _current_values(target: Any, spec: StatSpec) -> Dict[str, Any]:
+    return {name: getattr(target, name) for name in spec.attributes}
+
+
+def _previous_values(target: Any, spec: StatSpec, row_exists: bool) -> Optional[Dict[str, Any]]:
+    """Attribute values before the flush, or None if one was never loaded."""
+    state = inspect(target)
+    values = {}
+    for name in spec.attributes:
+        history = state.attrs[name].history
+        if history.deleted:
+            values[name] = history.deleted[0]
+        elif history.unchanged:
+            values[name] = history.unchanged[0]
+        elif history.added or not row_exists:
+            # Overwritten without being loaded, or gone with the row
+            return None
+        else:
+            # Unloaded and unchanged: the stored value is still the old one
+            values[name] = getattr(target, name)
+    return values
+
+
+def _count_flushed_rows(session: Session, flush_context) -> None:
+    deltas = new_deltas()
+    recount: Set[str] = set()
+
+    for target in session.new:
+        spec = STAT_SPECS_BY_MODEL.get(type(target))
+        if spec is not None:
+            add_contributions(deltas, spec, _current_values(target, spec), 1)
+
+    for target in session.dirty:
+        spec = STAT_SPECS_BY_MODEL.get(type(target))
+        if spec is None:
+            continue
+        state = inspect(target)
+        if not any(state.attrs[name].history.has_changes() for name in spec.attributes):
+            continue
+        previous = _previous_values(target, spec, row_exists=True)
+        if previous is None:
+            recount.add(spec.entity)
+            continue
+        add_contributions(deltas, spec, previous, -1)
+        add_contributions(deltas, spec, _current_values(target, spec), 1)
+
+    for target in session.deleted:
+        spec = STAT_SPECS_BY_MODEL.get(type(target))
+        if spec is None:
+            continue
+        previous = _previous_values(target, spec, row_exists=False)
+        if previous is None:
+            recount.add(spec.entity)
+            continue
+        add_contributions(deltas, spec, previous, -1)
+
+    if deltas:
+        add_deltas(session, deltas)
+    if recount:
+        _mark_for_recount(session, recount)
+
+
+def _track_bulk_statements(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.execution_options.get(COUNTED):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and table.name in STAT_SPECS:
+        _mark_for_recount(orm_execute_state.session, {table.name})
+
+
+def _write_counters(session: Session) -> None:
+    # The commit's own flush runs after this hook; flush first so its rows
+    # are counted here
+    session.flush()
+    deltas: CounterDeltas = session.info.pop(DELTAS_KEY, new_deltas())
+    recount: Set[str] = session.info.pop(RECOUNT_KEY, set())
+    if not (deltas or recount):
+        return
+
+    write_counters(session.connection(), deltas)
+    namespaces = [stats_namespace(entity) for entity in changed_entities(deltas)]
+    namespaces += [recount_namespace(entity) for entity in recount]
+    defer_cache_version_bumps(session, namespaces)
+    if recount:
+        logger.debug(f"Marked {sorted(recount)} statistics for recount after changes without deltas")
+
+
+def _discard_rolled_back_counts(session: Session, previous_transaction: SessionTransaction) -> None:
+    if not previous_transaction.nested:
+        return
+    # Which of the pending deltas the savepoint undid is unknown: recount
+    # their entities instead
+    deltas = session.info.pop(DELTAS_KEY, None)
+    if deltas:
+        _mark_for_recount(session, {entity for entity, _, _ in deltas})
+
+
+def _discard_pending_counts(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(DELTAS_KEY, None)
+        session.info.pop(RECOUNT_KEY, None)
@@ -6,18 +6,24 @@ This package contains all CRUD operations for the inventory module.
 
 from app.crud.inventory.base import CRUDBase
 from app.crud.inventory.stock_movement import CRUDStockMovement, stock_movement
+from app.crud.inventory.stock_balance_snapshot import CRUDStockBalanceSnapshot, stock_balance_snapshot
 from app.crud.inventory.stock_level import CRUDStockLevel, stock_level
 from app.crud.inventory.inventory_unit import CRUDInventoryUnit, inventory_unit
 from app.crud.inventory.sku_sequence import CRUDSKUSequence, sku_sequence
+from app.crud.inventory.inventory_alert import CRUDInventoryAlert, inventory_alert
 
 __all__ = [
     "CRUDBase",
     "CRUDStockMovement",
     "stock_movement",
+    "CRUDStockBalanceSnapshot",
+    "stock_balance_snapshot",
     "CRUDStockLevel", 
     "stock_level",
     "CRUDInventoryUnit",
     "inventory_unit",
     "CRUDSKUSequence",
     "sku_sequence",
+    "CRUDInventoryAlert",
+    "inventory_alert",
 ]
\ No newline at end of file
@@ -0,0 +1,363 @@
+"""
+CRUD operations for Inventory Alerts.
+
+Holds the alert rules and the set-based evaluation that keeps the
+``inventory_alerts`` table in step with them. An evaluation runs three
+statements per rule whatever the number of subjects: refresh live alerts
+whose figures moved, raise alerts for subjects that newly match, and
+resolve live alerts whose subject no longer matches.
+
+Evaluation is synchronous on a ``Connection`` or sync ``Session`` so the
+flush hooks in ``app.services.inventory.alert_engine`` can run it inside
+the flush that changed the stock; async callers go through ``run_sync``.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+from sqlalchemy import (
+    String, and_, case, exists, literal, null, or_, select, update
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+from app.core.config import settings
+from app.crud.inventory.base import CRUDBase
+from app.models.inventory.enums import (
+    InventoryAlertSeverity,
+    InventoryAlertStatus,
+    InventoryAlertType
+)
+from app.models.inventory.inventory_alert import InventoryAlert
+from app.models.inventory.inventory_unit import InventoryUnit
+from app.models.inventory.stock_level import StockLevel
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """
+    One alert condition over a source table.
+
+    ``condition`` selects the source rows that should have a live alert at
+    ``now``; ``values`` gives the alert columns computed from a source row.
+    ``watched`` lists the source attributes whose change re-evaluates a row.
+    """
+    alert_type: InventoryAlertType
+    source: Any
+    watched: Tuple[str, ...]
+    condition: Callable[[datetime], ColumnElement]
+    values: Callable[[], Dict[str, ColumnElement]]
+
+
+def _low_stock_condition(now: datetime) -> ColumnElement:
+    return and_(
+        StockLevel.reorder_point.isnot(None),
+        StockLevel.quantity_available <= StockLevel.reorder_point
+    )
+
+
+def _low_stock_values() -> Dict[str, ColumnElement]:
+    return {
+        "severity": case(
+            (StockLevel.quantity_available == 0, InventoryAlertSeverity.HIGH.value),
+            else_=InventoryAlertSeverity.MEDIUM.value
+        ),
+        "message": literal("Low stock for item at location", String),
+        "quantity": StockLevel.quantity_available,
+        "threshold": StockLevel.reorder_point,
+        "due_date": null(),
+    }
+
+
+def _maintenance_due_condition(now: datetime) -> ColumnElement:
+    return and_(
+        InventoryUnit.next_maintenance_date.isnot(None),
+        InventoryUnit.next_maintenance_date <= now + timedelta(days=settings.INVENTORY_ALERT_MAINTENANCE_DAYS_AHEAD),
+        InventoryUnit.is_active == True
+    )
+
+
+def _maintenance_due_values() -> Dict[str, ColumnElement]:
+    return {
+        "severity": literal(InventoryAlertSeverity.MEDIUM.value, String),
+        "message": literal("Maintenance due for unit ", String) + InventoryUnit.sku,
+        "quantity": null(),
+        "threshold": null(),
+        "due_date": InventoryUnit.next_maintenance_date,
+    }
+
+
+def _warranty_expiring_condition(now: datetime) -> ColumnElement:
+    return and_(
+        InventoryUnit.warranty_expiry.isnot(None),
+        InventoryUnit.warranty_expiry > now,
+        InventoryUnit.warranty_expiry <= now + timedelta(days=settings.INVENTORY_ALERT_WARRANTY_DAYS_AHEAD)
+    )
+
+
+def _warranty_expiring_values() -> Dict[str, ColumnElement]:
+    return {
+        "severity": literal(InventoryAlertSeverity.LOW.value, String),
+        "message": literal("Warranty expiring for unit ", String) + InventoryUnit.sku,
+        "quantity": null(),
+        "threshold": null(),
+        "due_date": InventoryUnit.warranty_expiry,
+    }
+
+
+ALERT_RULES: Tuple[AlertRule, ...] = (
+    AlertRule(
+        InventoryAlertType.LOW_STOCK,
+        StockLevel,
+        ("quantity_available", "reorder_point"),
+        _low_stock_condition,
+        _low_stock_values,
+    ),
+    AlertRule(
+        InventoryAlertType.MAINTENANCE_DUE,
+        InventoryUnit,
+        ("next_maintenance_date", "is_active", "location_id"),
+        _maintenance_due_condition,
+        _maintenance_due_values,
+    ),
+    AlertRule(
+        InventoryAlertType.WARRANTY_EXPIRING,
+        InventoryUnit,
+        ("warranty_expiry", "location_id"),
+        _warranty_expiring_condition,
+        _warranty_expiring_values,
+    ),
+)
+
+LIVE_STATUSES = (InventoryAlertStatus.OPEN.value, InventoryAlertStatus.ACKNOWLEDGED.value)
+
+
+class CRUDInventoryAlert(CRUDBase[InventoryAlert, BaseModel, BaseModel]):
+    """CRUD operations for inventory alerts."""
+
+    def evaluate(
+        self,
+        executor: Any,
+        rule: AlertRule,
+        *,
+        now: Optional[datetime] = None,
+        subject_ids: Optional[Collection[UUID]] = None
+    ) -> Dict[str, int]:
+        """
+        Bring the live alerts of one rule in line with its source rows.
+
+        Args:
+            executor: Sync ``Connection`` or ``Session``
+            rule: Rule to evaluate
+            now: Evaluation time (defaults to the current UTC time)
+            subject_ids: Only evaluate these source rows; None evaluates all
+
+        Returns:
+            Number of alerts raised, refreshed and resolved
+        """
+        now = now or datetime.now(timezone.utc)
+        source = rule.source
+        alert_type = rule.alert_type.value
+
+        candidates = select(
+            source.id.label("subject_id"),
+            source.item_id.label("item_id"),
+            source.location_id.label("location_id"),
+            *[expression.label(name) for name, expression in rule.values().items()]
+        ).where(rule.condition(now))
+        if subject_ids is not None:
+            candidates = candidates.where(source.id.in_(list(subject_ids)))
+        candidates = candidates.subquery()
+
+        live = and_(
+            InventoryAlert.alert_type == alert_type,
+            InventoryAlert.status != InventoryAlertStatus.RESOLVED.value
+        )
+
+        # Refresh live alerts whose figures moved; an acknowledged alert
+        # that escalates to high severity is opened again
+        refreshed = executor.execute(
+            update(InventoryAlert)
+            .where(
+                live,
+                InventoryAlert.subject_id == candidates.c.subject_id,
+                or_(
+                    InventoryAlert.severity != candidates.c.severity,
+                    InventoryAlert.message != candidates.c.message,
+                    InventoryAlert.quantity.is_distinct_from(candidates.c.quantity),
+                    InventoryAlert.threshold.is_distinct_from(candidates.c.threshold),
+                    InventoryAlert.due_date.is_distinct_from(candidates.c.due_date),
+                    InventoryAlert.location_id.is_distinct_from(candidates.c.location_id)
+                )
+            )
+            .values(
+                status=case(
+                    (
+                        and_(
+                            InventoryAlert.status == InventoryAlertStatus.ACKNOWLEDGED.value,
+                            InventoryAlert.severity != InventoryAlertSeverity.HIGH.value,
+                            candidates.c.severity == InventoryAlertSeverity.HIGH.value
+                        ),
+                        InventoryAlertStatus.OPEN.value
+                    ),
+                    else_=InventoryAlert.status
+                ),
+                severity=candidates.c.severity,
+                message=candidates.c.message,
+                quantity=candidates.c.quantity,
+                threshold=candidates.c.threshold,
+                due_date=candidates.c.due_date,
+                location_id=candidates.c.location_id
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        # Raise alerts for subjects without a live one
+        new_rows = executor.execute(
+            select(candidates).where(
+                ~exists().where(live, InventoryAlert.subject_id == candidates.c.subject_id)
+            )
+        ).mappings().all()
+        if new_rows:
+            dialect = executor.dialect if hasattr(executor, "dialect") else executor.get_bind().dialect
+            insert = pg_insert if dialect.name == "postgresql" else sqlite_insert
+            # A concurrent flush may have raised the same alert; the partial
+            # unique index keeps one
+            executor.execute(
+                insert(InventoryAlert.__table__).on_conflict_do_nothing(),
+                [
+                    {
+                        **row,
+                        "id": uuid4(),
+                        "alert_type": alert_type,
+                        "status": InventoryAlertStatus.OPEN.value,
+                        "raised_at": now,
+                        "is_active": True,
+                    }
+                    for row in new_rows
+                ]
+            )
+
+        # Resolve live alerts whose subject no longer matches (or is gone)
+        resolve = (
+            update(InventoryAlert)
+            .where(
+                live,
+                ~exists().where(source.id == InventoryAlert.subject_id, rule.condition(now))
+            )
+            .values(status=InventoryAlertStatus.RESOLVED.value, resolved_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if subject_ids is not None:
+            resolve = resolve.where(InventoryAlert.subject_id.in_(list(subject_ids)))
+        resolved = executor.execute(resolve).rowcount
+
+        return {"raised": len(new_rows), "refreshed": refreshed, "resolved": resolved}
+
+    async def sweep(self, db: AsyncSession, *, now: Optional[datetime] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Evaluate every rule over every source row.
+
+        Date-based alerts (maintenance due, warranty expiring) enter and
+        leave their window without any write to the unit, so they depend on
+        this sweep; for low stock it catches changes made by bulk UPDATEs
+        that bypass the flush hooks.
+        """
+        now = now or datetime.now(timezone.utc)
+
+        def run(session) -> Dict[str, Dict[str, int]]:
+            return {rule.alert_type.value: self.evaluate(session, rule, now=now) for rule in ALERT_RULES}
+
+        return await db.run_sync(run)
+
+    async def get_live(
+        self,
+        db: AsyncSession,
+        *,
+        location_id: Optional[UUID] = None,
+        alert_type: Optional[InventoryAlertType] = None,
+        severity: Optional[InventoryAlertSeverity] = None,
+        include_acknowledged: bool = True,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[InventoryAlert]:
+        """
+        Get live alerts, newest first.
+
+        Args:
+            db: Database session
+            location_id: Optional location filter
+            alert_type: Optional alert type filter
+            severity: Optional severity filter
+            include_acknowledged: Include acknowledged alerts
+            skip: Number of records to skip
+            limit: Maximum number of records
+
+        Returns:
+            List of alerts
+        """
+        statuses = LIVE_STATUSES if include_acknowledged else (InventoryAlertStatus.OPEN.value,)
+        query = select(InventoryAlert).where(InventoryAlert.status.in_(statuses))
+
+        if location_id:
+            query = query.where(InventoryAlert.location_id == location_id)
+        if alert_type:
+            query = query.where(InventoryAlert.alert_type == alert_type.value)
+        if severity:
+            query = query.where(InventoryAlert.severity == severity.value)
+
+        query = query.order_by(InventoryAlert.raised_at.desc()).offset(skip).limit(limit)
+        # Evaluation writes alerts with Core statements, so alerts already in
+        # the identity map may be stale
+        query = query.execution_options(populate_existing=True)
+
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def acknowledge(
+        self,
+        db: AsyncSession,
+        *,
+        alert_id: UUID,
+        acknowledged_by: UUID
+    ) -> Optional[InventoryAlert]:
+        """
+        Acknowledge a live alert.
+
+        Args:
+            db: Database session
+            alert_id: Alert ID
+            acknowledged_by: User acknowledging the alert
+
+        Returns:
+            Updated alert, or None if it does not exist
+
+        Raises:
+            ValueError: If the alert is already resolved
+        """
+        result = await db.execute(
+            select(InventoryAlert)
+            .where(InventoryAlert.id == alert_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        alert = result.scalar_one_or_none()
+        if not alert:
+            return None
+        if not alert.is_live:
+            raise ValueError("Alert is already resolved")
+
+        if alert.status == InventoryAlertStatus.OPEN.value:
+            alert.status = InventoryAlertStatus.ACKNOWLEDGED.value
+            alert.acknowledged_at = datetime.now(timezone.utc)
+            alert.acknowledged_by = acknowledged_by
+            await db.flush()
+        return alert
+
+
+inventory_alert = CRUDInventoryAlert(InventoryAlert)
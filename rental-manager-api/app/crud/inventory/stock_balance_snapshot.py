@@ -0,0 +1,340 @@
+"""
+CRUD operations for Stock Balance Snapshots.
+
+Handles compaction of closed stock movement months into per-(item, location,
+month) snapshots and the snapshot side of ledger summaries.
+"""
+
+import logging
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+from sqlalchemy import select, and_, or_, func, case, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.inventory.base import CRUDBase
+from app.db.partitioning import add_months, month_start, stock_movement_partitions
+from app.models.inventory.stock_balance_snapshot import StockBalanceSnapshot
+from app.models.inventory.stock_movement import StockMovement
+
+logger = logging.getLogger(__name__)
+
+
+def month_bounds(month: date) -> Tuple[datetime, datetime]:
+    """UTC ``[start, end)`` of the month containing ``month``, matching partition bounds."""
+    start = month_start(month)
+    return (
+        datetime.combine(start, time.min, tzinfo=timezone.utc),
+        datetime.combine(add_months(start, 1), time.min, tzinfo=timezone.utc),
+    )
+
+
+def utc_date(value: datetime) -> date:
+    """Calendar date of ``value`` in UTC (naive values are taken as UTC)."""
+    return value.astimezone(timezone.utc).date() if value.tzinfo else value.date()
+
+
+class CRUDStockBalanceSnapshot(CRUDBase[StockBalanceSnapshot, BaseModel, BaseModel]):
+    """CRUD operations for stock balance snapshots."""
+
+    async def get_watermark(self, db: AsyncSession) -> Optional[date]:
+        """
+        First month that is not covered by snapshots.
+
+        Movements before this month are fully represented by snapshot rows;
+        movements from it onwards must be read from the ledger. None when
+        nothing has been compacted yet.
+        """
+        latest = await db.scalar(select(func.max(StockBalanceSnapshot.period_start)))
+        return add_months(latest, 1) if latest else None
+
+    async def compact_month(self, db: AsyncSession, *, month: date) -> int:
+        """
+        Rebuild the snapshots of one month from the movement ledger.
+
+        Args:
+            db: Database session
+            month: Any date within the month to compact
+
+        Returns:
+            Number of snapshot rows written
+        """
+        period = month_start(month)
+        start, end = month_bounds(period)
+        in_month = and_(
+            StockMovement.movement_date >= start,
+            StockMovement.movement_date < end
+        )
+        position = (StockMovement.item_id, StockMovement.location_id)
+
+        totals = await db.execute(
+            select(
+                StockMovement.item_id,
+                StockMovement.location_id,
+                StockMovement.movement_type,
+                func.count(StockMovement.id).label('count'),
+                func.sum(
+                    case((StockMovement.quantity_change > 0, StockMovement.quantity_change), else_=0)
+                ).label('increase'),
+                func.sum(
+                    case((StockMovement.quantity_change < 0, -StockMovement.quantity_change), else_=0)
+                ).label('decrease')
+            )
+            .where(in_month)
+            .group_by(*position, StockMovement.movement_type)
+        )
+
+        snapshots: Dict[Tuple[UUID, UUID], Dict[str, Any]] = {}
+        for row in totals:
+            snapshot = snapshots.setdefault(
+                (row.item_id, row.location_id),
+                {
+                    'movement_count': 0,
+                    'total_increase': Decimal('0'),
+                    'total_decrease': Decimal('0'),
+                    'movements_by_type': {},
+                    'quantity_by_type': {},
+                }
+            )
+            increase = Decimal(row.increase or 0)
+            decrease = Decimal(row.decrease or 0)
+            snapshot['movement_count'] += row.count
+            snapshot['total_increase'] += increase
+            snapshot['total_decrease'] += decrease
+            snapshot['movements_by_type'][row.movement_type.value] = row.count
+            snapshot['quantity_by_type'][row.movement_type.value] = float(increase + decrease)
+
+        # Opening and closing balances come from the first and last movement
+        # of each position, picked in one pass with window functions.
+        ranked = (
+            select(
+                StockMovement.item_id,
+                StockMovement.location_id,
+                StockMovement.quantity_before,
+                StockMovement.quantity_after,
+                func.row_number().over(
+                    partition_by=position,
+                    order_by=(StockMovement.movement_date.asc(), StockMovement.created_at.asc())
+                ).label('first_rank'),
+                func.row_number().over(
+                    partition_by=position,
+                    order_by=(StockMovement.movement_date.desc(), StockMovement.created_at.desc())
+                ).label('last_rank')
+            )
+            .where(in_month)
+            .subquery()
+        )
+        balances = await db.execute(
+            select(
+                ranked.c.item_id,
+                ranked.c.location_id,
+                func.max(case((ranked.c.first_rank == 1, ranked.c.quantity_before))).label('opening'),
+                func.max(case((ranked.c.last_rank == 1, ranked.c.quantity_after))).label('closing')
+            )
+            .where(or_(ranked.c.first_rank == 1, ranked.c.last_rank == 1))
+            .group_by(ranked.c.item_id, ranked.c.location_id)
+        )
+        for row in balances:
+            snapshot = snapshots[(row.item_id, row.location_id)]
+            snapshot['opening_quantity'] = row.opening
+            snapshot['closing_quantity'] = row.closing
+
+        await db.execute(
+            delete(StockBalanceSnapshot)
+            .where(StockBalanceSnapshot.period_start == period)
+            .execution_options(synchronize_session=False)
+        )
+        if snapshots:
+            compacted_at = datetime.now(timezone.utc)
+            await db.execute(
+                insert(StockBalanceSnapshot),
+                [
+                    {
+                        'id': uuid4(),
+                        'item_id': item_id,
+                        'location_id': location_id,
+                        'period_start': period,
+                        'compacted_at': compacted_at,
+                        **values,
+                    }
+                    for (item_id, location_id), values in snapshots.items()
+                ]
+            )
+        await db.flush()
+        return len(snapshots)
+
+    async def compact_closed_periods(
+        self,
+        db: AsyncSession,
+        *,
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Compact every closed month that is not yet (or only recently) compacted.
+
+        The latest STOCK_SNAPSHOT_RECOMPACT_MONTHS compacted months are rebuilt
+        on each run so movements recorded late for a just-closed month are
+        still picked up. When STOCK_MOVEMENT_RETENTION_MONTHS is set, ledger
+        partitions that are both past retention and compacted are retired.
+
+        Args:
+            db: Database session
+            today: Reference date (defaults to the current UTC date)
+
+        Returns:
+            Compacted months, snapshot rows written, new watermark and
+            number of ledger rows retired
+        """
+        today = today or datetime.now(timezone.utc).date()
+        current = month_start(today)
+
+        watermark = await self.get_watermark(db)
+        if watermark is not None:
+            month = add_months(watermark, -settings.STOCK_SNAPSHOT_RECOMPACT_MONTHS)
+        else:
+            oldest = await db.scalar(select(func.min(StockMovement.movement_date)))
+            month = month_start(utc_date(oldest)) if oldest else current
+
+        compacted: List[str] = []
+        rows = 0
+        while month < current:
+            rows += await self.compact_month(db, month=month)
+            compacted.append(month.isoformat())
+            month = add_months(month, 1)
+
+        watermark = await self.get_watermark(db)
+        detached_rows = 0
+        retention_cutoff = (
+            add_months(today, -settings.STOCK_MOVEMENT_RETENTION_MONTHS)
+            if settings.STOCK_MOVEMENT_RETENTION_MONTHS else None
+        )
+        if (
+            retention_cutoff and watermark
+            and await stock_movement_partitions.is_partitioned(db)
+        ):
+            detached_rows = await stock_movement_partitions.detach_before(
+                db, min(retention_cutoff, watermark)
+            )
+
+        if compacted:
+            logger.info(
+                f"Compacted stock movements for {len(compacted)} month(s) into {rows} snapshots",
+                extra={"event": "stock_ledger_compacted", "months": compacted, "snapshots": rows}
+            )
+        return {
+            'compacted_months': compacted,
+            'snapshots': rows,
+            'watermark': watermark.isoformat() if watermark else None,
+            'detached_rows': detached_rows,
+        }
+
+    async def get_totals(
+        self,
+        db: AsyncSession,
+        *,
+        item_id: Optional[UUID] = None,
+        location_id: Optional[UUID] = None,
+        period_from: Optional[date] = None,
+        period_to: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregate snapshot totals for months in ``[period_from, period_to)``.
+
+        Args:
+            db: Database session
+            item_id: Optional item filter
+            location_id: Optional location filter
+            period_from: First month included (None: from the beginning)
+            period_to: First month excluded (None: through the latest snapshot)
+
+        Returns:
+            Totals in the same shape as a ledger aggregate
+        """
+        query = select(
+            StockBalanceSnapshot.movement_count,
+            StockBalanceSnapshot.total_increase,
+            StockBalanceSnapshot.total_decrease,
+            StockBalanceSnapshot.movements_by_type,
+            StockBalanceSnapshot.quantity_by_type
+        )
+        if item_id:
+            query = query.where(StockBalanceSnapshot.item_id == item_id)
+        if location_id:
+            query = query.where(StockBalanceSnapshot.location_id == location_id)
+        if period_from:
+            query = query.where(StockBalanceSnapshot.period_start >= period_from)
+        if period_to:
+            query = query.where(StockBalanceSnapshot.period_start < period_to)
+
+        totals = {
+            'total_movements': 0,
+            'total_increase': Decimal('0'),
+            'total_decrease': Decimal('0'),
+            'movements_by_type': {},
+            'quantity_by_type': {},
+        }
+        result = await db.stream(query)
+        async for row in result:
+            totals['total_movements'] += row.movement_count
+            totals['total_increase'] += Decimal(row.total_increase)
+            totals['total_decrease'] += Decimal(row.total_decrease)
+            for movement_type, count in (row.movements_by_type or {}).items():
+                totals['movements_by_type'][movement_type] = (
+                    totals['movements_by_type'].get(movement_type, 0) + count
+                )
+            for movement_type, quantity in (row.quantity_by_type or {}).items():
+                totals['quantity_by_type'][movement_type] = (
+                    totals['quantity_by_type'].get(movement_type, 0.0) + quantity
+                )
+        return totals
+
+    async def get_latest_balances(
+        self,
+        db: AsyncSession,
+        *,
+        item_id: UUID,
+        location_id: Optional[UUID] = None
+    ) -> List[StockBalanceSnapshot]:
+        """
+        Latest snapshot of each location holding the item.
+
+        Args:
+            db: Database session
+            item_id: Item ID
+            location_id: Optional location filter
+
+        Returns:
+            One snapshot per location, the most recent compacted month
+        """
+        latest = (
+            select(
+                StockBalanceSnapshot.location_id,
+                func.max(StockBalanceSnapshot.period_start).label('period_start')
+            )
+            .where(StockBalanceSnapshot.item_id == item_id)
+            .group_by(StockBalanceSnapshot.location_id)
+        )
+        if location_id:
+            latest = latest.where(StockBalanceSnapshot.location_id == location_id)
+        latest = latest.subquery()
+
+        query = (
+            select(StockBalanceSnapshot)
+            .join(
+                latest,
+                and_(
+                    StockBalanceSnapshot.location_id == latest.c.location_id,
+                    StockBalanceSnapshot.period_start == latest.c.period_start
+                )
+            )
+            .where(StockBalanceSnapshot.item_id == item_id)
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+
+stock_balance_snapshot = CRUDStockBalanceSnapshot(StockBalanceSnapshot)
@@ -9,15 +9,18 @@ from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
 
-from sqlalchemy import select, and_, or_, func, update, desc
+from sqlalchemy import Select, select, and_, or_, func, update, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
+from app.crud import statements
 from app.crud.inventory.base import CRUDBase
 from app.models.inventory.stock_level import StockLevel
 from app.models.inventory.stock_movement import StockMovement
 from app.models.inventory.enums import StockStatus, StockMovementType
+from app.models.item import Item
+from app.models.location import Location
 from app.schemas.inventory.stock_level import (
     StockLevelCreate,
     StockLevelUpdate,
@@ -370,14 +373,7 @@ class CRUDStockLevel(CRUDBase[StockLevel, StockLevelCreate, StockLevelUpdate]):
         Returns:
             Stock level or None
         """
-        query = select(StockLevel).where(
-            and_(
-                StockLevel.item_id == item_id,
-                StockLevel.location_id == location_id
-            )
-        )
-        
-        result = await db.execute(query)
+        result = await db.execute(statements.stock_level_by_item_location(item_id, location_id))
         return result.scalar_one_or_none()
     
     async def get_by_item(
@@ -456,9 +452,59 @@ class CRUDStockLevel(CRUDBase[StockLevel, StockLevelCreate, StockLevelUpdate]):
         Returns:
             List of filtered stock levels
         """
-        query = select(StockLevel)
+        query = self._apply_filters(select(StockLevel), filter_params)
+        
+        # Apply ordering and pagination
+        query = query.offset(skip).limit(limit)
+        
+        result = await db.execute(query)
+        return result.scalars().all()
+    
+    def export_query(self, *, filter_params: StockLevelFilter) -> Select:
+        """
+        Column query for streaming exports of stock levels.
         
-        # Apply filters
+        Args:
+            filter_params: Filter parameters
+            
+        Returns:
+            Select over flat stock level columns with item and location names
+        """
+        query = (
+            select(
+                StockLevel.id,
+                StockLevel.item_id,
+                Item.sku,
+                Item.item_name,
+                StockLevel.location_id,
+                Location.location_code,
+                Location.location_name,
+                StockLevel.quantity_on_hand,
+                StockLevel.quantity_available,
+                StockLevel.quantity_reserved,
+                StockLevel.quantity_on_rent,
+                StockLevel.quantity_damaged,
+                StockLevel.quantity_under_repair,
+                StockLevel.quantity_beyond_repair,
+                StockLevel.reorder_point,
+                StockLevel.reorder_quantity,
+                StockLevel.maximum_stock,
+                StockLevel.average_cost,
+                StockLevel.total_value,
+                StockLevel.stock_status,
+                StockLevel.last_counted_date,
+                StockLevel.last_movement_date,
+                StockLevel.updated_at,
+            )
+            .outerjoin(Item, Item.id == StockLevel.item_id)
+            .outerjoin(Location, Location.id == StockLevel.location_id)
+        )
+        
+        query = self._apply_filters(query, filter_params)
+        return query.order_by(StockLevel.id)
+    
+    def _apply_filters(self, query: Select, filter_params: StockLevelFilter) -> Select:
+        """Apply stock level filters to a query."""
         if filter_params.item_id:
             query = query.where(StockLevel.item_id == filter_params.item_id)
         
@@ -504,11 +550,7 @@ class CRUDStockLevel(CRUDBase[StockLevel, StockLevelCreate, StockLevelUpdate]):
         if filter_params.max_quantity is not None:
             query = query.where(StockLevel.quantity_on_hand <= filter_params.max_quantity)
         
-        # Apply ordering and pagination
-        query = query.offset(skip).limit(limit)
-        
-        result = await db.execute(query)
-        return result.scalars().all()
+        return query
     
     async def get_low_stock_items(
         self,
@@ -6,15 +6,18 @@ Handles database operations for stock movement tracking.
 
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import select, and_, or_, func, desc
+from sqlalchemy import Select, select, and_, or_, func, desc, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.crud.inventory.base import CRUDBase
+from app.crud.inventory.stock_balance_snapshot import month_bounds, stock_balance_snapshot
+from app.db.partitioning import add_months, month_start
 from app.models.inventory.stock_movement import StockMovement
+from app.models.item import Item
 from app.models.inventory.enums import StockMovementType, get_movement_category
 from app.schemas.inventory.stock_movement import (
     StockMovementCreate,
@@ -23,6 +26,11 @@ from app.schemas.inventory.stock_movement import (
 )
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, matching the ledger's partition bounds."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
 class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMovementUpdate]):
     """CRUD operations for stock movements."""
     
@@ -106,6 +114,7 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         *,
         item_id: UUID,
         location_id: Optional[UUID] = None,
+        date_from: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100
     ) -> List[StockMovement]:
@@ -116,6 +125,8 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
             db: Database session
             item_id: Item ID
             location_id: Optional location filter
+            date_from: Only movements on or after this time; bounds the
+                scan to the partitions covering the window
             skip: Number to skip
             limit: Maximum to return
             
@@ -127,6 +138,9 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         if location_id:
             query = query.where(StockMovement.location_id == location_id)
         
+        if date_from:
+            query = query.where(StockMovement.movement_date >= date_from)
+        
         query = (
             query.order_by(desc(StockMovement.movement_date))
             .offset(skip)
@@ -181,9 +195,55 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         Returns:
             List of filtered stock movements
         """
-        query = select(StockMovement)
+        query = self._apply_filters(select(StockMovement), filter_params)
+        
+        # Apply ordering and pagination
+        query = (
+            query.order_by(desc(StockMovement.movement_date))
+            .offset(skip)
+            .limit(limit)
+        )
+        
+        result = await db.execute(query)
+        return result.scalars().all()
+    
+    def export_query(self, *, filter_params: StockMovementFilter) -> Select:
+        """
+        Column query for streaming exports of the movement ledger.
         
-        # Apply filters
+        Args:
+            filter_params: Filter parameters
+            
+        Returns:
+            Select over flat movement columns, oldest first
+        """
+        query = select(
+            StockMovement.id,
+            StockMovement.movement_date,
+            StockMovement.movement_type,
+            StockMovement.item_id,
+            Item.sku,
+            Item.item_name,
+            StockMovement.location_id,
+            StockMovement.quantity_change,
+            StockMovement.quantity_before,
+            StockMovement.quantity_after,
+            StockMovement.unit_cost,
+            StockMovement.total_cost,
+            StockMovement.reference_number,
+            StockMovement.reason,
+            StockMovement.notes,
+            StockMovement.transaction_header_id,
+            StockMovement.transaction_line_id,
+            StockMovement.performed_by_id,
+            StockMovement.approved_by_id,
+        ).outerjoin(Item, Item.id == StockMovement.item_id)
+        
+        query = self._apply_filters(query, filter_params)
+        return query.order_by(StockMovement.movement_date, StockMovement.id)
+    
+    def _apply_filters(self, query: Select, filter_params: StockMovementFilter) -> Select:
+        """Apply movement filters to a query."""
         if filter_params.item_id:
             query = query.where(StockMovement.item_id == filter_params.item_id)
         
@@ -227,15 +287,7 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
                 func.abs(StockMovement.quantity_change) <= filter_params.max_quantity
             )
         
-        # Apply ordering and pagination
-        query = (
-            query.order_by(desc(StockMovement.movement_date))
-            .offset(skip)
-            .limit(limit)
-        )
-        
-        result = await db.execute(query)
-        return result.scalars().all()
+        return query
     
     async def get_summary(
         self,
@@ -249,6 +301,11 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         """
         Get summary statistics for stock movements.
         
+        Whole months that have been compacted are read from balance
+        snapshots; only the partial months at the edges of the range and
+        the months after the compaction watermark are aggregated from the
+        ledger, so the cost follows the recent window, not total history.
+        
         Args:
             db: Database session
             item_id: Optional item filter
@@ -259,79 +316,85 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         Returns:
             Summary statistics dictionary
         """
-        # Base query
-        query = select(
-            func.count(StockMovement.id).label('total_movements'),
-            func.sum(
-                func.case(
-                    (StockMovement.quantity_change > 0, StockMovement.quantity_change),
-                    else_=0
-                )
-            ).label('total_increase'),
-            func.sum(
-                func.case(
-                    (StockMovement.quantity_change < 0, func.abs(StockMovement.quantity_change)),
-                    else_=0
+        start = _as_utc(date_from) if date_from else None
+        end = _as_utc(date_to) if date_to else None
+        
+        # Ledger segments as (from, to_exclusive, to_inclusive)
+        segments = [(start, None, end)]
+        totals = None
+        watermark = await stock_balance_snapshot.get_watermark(db)
+        if watermark:
+            first_month = None
+            if start:
+                first_month = month_start(start.date())
+                if start > month_bounds(first_month)[0]:
+                    first_month = add_months(first_month, 1)
+            last_month = min(watermark, month_start(end.date())) if end else watermark
+            
+            if first_month is None or first_month < last_month:
+                totals = await stock_balance_snapshot.get_totals(
+                    db,
+                    item_id=item_id,
+                    location_id=location_id,
+                    period_from=first_month,
+                    period_to=last_month
                 )
-            ).label('total_decrease')
-        )
-        
-        # Apply filters
-        if item_id:
-            query = query.where(StockMovement.item_id == item_id)
-        
-        if location_id:
-            query = query.where(StockMovement.location_id == location_id)
-        
-        if date_from:
-            query = query.where(StockMovement.movement_date >= date_from)
-        
-        if date_to:
-            query = query.where(StockMovement.movement_date <= date_to)
-        
-        result = await db.execute(query)
-        row = result.first()
-        
-        # Get movements by type
-        type_query = (
-            select(
+                segments = [(month_bounds(last_month)[0], None, end)]
+                if first_month and start < month_bounds(first_month)[0]:
+                    segments.append((start, month_bounds(first_month)[0], None))
+        
+        totals = totals or {
+            'total_movements': 0,
+            'total_increase': Decimal('0'),
+            'total_decrease': Decimal('0'),
+            'movements_by_type': {},
+            'quantity_by_type': {},
+        }
+        for segment_from, segment_before, segment_to in segments:
+            query = select(
                 StockMovement.movement_type,
                 func.count(StockMovement.id).label('count'),
-                func.sum(func.abs(StockMovement.quantity_change)).label('quantity')
-            )
-            .group_by(StockMovement.movement_type)
-        )
-        
-        # Apply same filters
-        if item_id:
-            type_query = type_query.where(StockMovement.item_id == item_id)
-        
-        if location_id:
-            type_query = type_query.where(StockMovement.location_id == location_id)
-        
-        if date_from:
-            type_query = type_query.where(StockMovement.movement_date >= date_from)
-        
-        if date_to:
-            type_query = type_query.where(StockMovement.movement_date <= date_to)
-        
-        type_result = await db.execute(type_query)
-        type_rows = type_result.all()
-        
-        movements_by_type = {}
-        quantity_by_type = {}
-        
-        for type_row in type_rows:
-            movements_by_type[type_row.movement_type.value] = type_row.count
-            quantity_by_type[type_row.movement_type.value] = float(type_row.quantity or 0)
+                func.sum(
+                    case((StockMovement.quantity_change > 0, StockMovement.quantity_change), else_=0)
+                ).label('increase'),
+                func.sum(
+                    case((StockMovement.quantity_change < 0, -StockMovement.quantity_change), else_=0)
+                ).label('decrease')
+            ).group_by(StockMovement.movement_type)
+            
+            if item_id:
+                query = query.where(StockMovement.item_id == item_id)
+            if location_id:
+                query = query.where(StockMovement.location_id == location_id)
+            if segment_from:
+                query = query.where(StockMovement.movement_date >= segment_from)
+            if segment_before:
+                query = query.where(StockMovement.movement_date < segment_before)
+            if segment_to:
+                query = query.where(StockMovement.movement_date <= segment_to)
+            
+            result = await db.execute(query)
+            for row in result:
+                increase = Decimal(row.increase or 0)
+                decrease = Decimal(row.decrease or 0)
+                movement_type = row.movement_type.value
+                totals['total_movements'] += row.count
+                totals['total_increase'] += increase
+                totals['total_decrease'] += decrease
+                totals['movements_by_type'][movement_type] = (
+                    totals['movements_by_type'].get(movement_type, 0) + row.count
+                )
+                totals['quantity_by_type'][movement_type] = (
+                    totals['quantity_by_type'].get(movement_type, 0.0) + float(increase + decrease)
+                )
         
         return {
-            'total_movements': row.total_movements or 0,
-            'total_increase': float(row.total_increase or 0),
-            'total_decrease': float(row.total_decrease or 0),
-            'net_change': float((row.total_increase or 0) - (row.total_decrease or 0)),
-            'movements_by_type': movements_by_type,
-            'quantity_by_type': quantity_by_type,
+            'total_movements': totals['total_movements'],
+            'total_increase': float(totals['total_increase']),
+            'total_decrease': float(totals['total_decrease']),
+            'net_change': float(totals['total_increase'] - totals['total_decrease']),
+            'movements_by_type': totals['movements_by_type'],
+            'quantity_by_type': totals['quantity_by_type'],
             'period_start': date_from,
             'period_end': date_to
         }
@@ -341,6 +404,8 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         db: AsyncSession,
         *,
         hours: int = 24,
+        location_id: Optional[UUID] = None,
+        movement_type: Optional[StockMovementType] = None,
         limit: int = 100
     ) -> List[StockMovement]:
         """
@@ -349,23 +414,71 @@ class CRUDStockMovement(CRUDBase[StockMovement, StockMovementCreate, StockMoveme
         Args:
             db: Database session
             hours: Number of hours to look back
+            location_id: Optional location filter
+            movement_type: Optional movement type filter
             limit: Maximum number of movements
             
         Returns:
             List of recent movements
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         
-        query = (
-            select(StockMovement)
-            .where(StockMovement.movement_date >= cutoff_time)
-            .order_by(desc(StockMovement.movement_date))
-            .limit(limit)
-        )
+        query = select(StockMovement).where(StockMovement.movement_date >= cutoff_time)
+        
+        if location_id:
+            query = query.where(StockMovement.location_id == location_id)
+        
+        if movement_type:
+            query = query.where(StockMovement.movement_type == movement_type)
+        
+        query = query.order_by(desc(StockMovement.movement_date)).limit(limit)
         
         result = await db.execute(query)
         return result.scalars().all()
     
+    async def get_item_ledger(
+        self,
+        db: AsyncSession,
+        *,
+        item_id: UUID,
+        location_id: Optional[UUID] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Get the compacted balance and the recent movements of an item.
+        
+        Combines the latest balance snapshot of each location with the
+        movements recorded after the compaction watermark, so only the
+        open partitions are read.
+        
+        Args:
+            db: Database session
+            item_id: Item ID
+            location_id: Optional location filter
+            limit: Maximum number of recent movements
+            
+        Returns:
+            Watermark, snapshot balances and recent movements
+        """
+        watermark = await stock_balance_snapshot.get_watermark(db)
+        balances = await stock_balance_snapshot.get_latest_balances(
+            db, item_id=item_id, location_id=location_id
+        )
+        movements = await self.get_by_item(
+            db,
+            item_id=item_id,
+            location_id=location_id,
+            date_from=month_bounds(watermark)[0] if watermark else None,
+            limit=limit
+        )
+        
+        return {
+            'item_id': item_id,
+            'compacted_through': add_months(watermark, -1) if watermark else None,
+            'balances': balances,
+            'movements': movements
+        }
+    
     async def get_adjustments_pending_approval(
         self,
         db: AsyncSession
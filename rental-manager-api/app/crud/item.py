@@ -2,10 +2,13 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import select, func, or_, and_, desc, asc, text
+from sqlalchemy import Select, select, func, or_, and_, desc, asc, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
+from app.core.response_cache import track_catalog_writes
+from app.crud import statements
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.item import Item
 from app.models.brand import Brand
 from app.models.category import Category
@@ -18,6 +21,8 @@ class ItemRepository:
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session."""
         self.session = session
+        track_counted_writes(session)
+        track_catalog_writes(session)
     
     async def create(self, item_data: dict) -> Item:
         """Create a new item."""
@@ -33,34 +38,121 @@ class ItemRepository:
         include_relations: bool = False
     ) -> Optional[Item]:
         """Get item by ID with optional related data."""
-        query = select(Item).where(Item.id == item_id)
-        
+        result = await self.session.execute(statements.item_by_id(item_id, include_relations))
+        return result.scalar_one_or_none()
+
+    async def get_by_ids(
+        self,
+        item_ids: List[UUID],
+        include_relations: bool = False
+    ) -> Dict[UUID, Item]:
+        """Get several items in one query, keyed by ID."""
+        if not item_ids:
+            return {}
+
+        query = select(Item).where(Item.id.in_(set(item_ids)))
+
         if include_relations:
             query = query.options(
-                joinedload(Item.brand),
-                joinedload(Item.category),
-                joinedload(Item.unit_of_measurement)
+                selectinload(Item.brand),
+                selectinload(Item.category),
+                selectinload(Item.unit_of_measurement)
             )
-        
+
         result = await self.session.execute(query)
-        return result.scalar_one_or_none()
-    
+        return {item.id: item for item in result.scalars()}
+
+    async def get_pricing_rows(self, item_ids: List[UUID]) -> List[Any]:
+        """
+        Get the columns needed to price rentals for several items in one query.
+
+        Returns lightweight rows instead of Item instances so quoting large
+        orders does not pay for identity-map bookkeeping.
+        """
+        if not item_ids:
+            return []
+
+        query = select(
+            Item.id,
+            Item.item_name,
+            Item.sku,
+            Item.rental_rate_per_day,
+            Item.security_deposit,
+            Item.is_rentable,
+            Item.is_rental_blocked,
+            Item.is_active
+        ).where(Item.id.in_(set(item_ids)))
+
+        result = await self.session.execute(query)
+        return result.all()
+
+    def export_query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        include_inactive: bool = False
+    ) -> Select:
+        """
+        Column query for streaming exports.
+
+        Selects flat columns (related names joined in) rather than Item
+        instances so rows can be streamed from a server-side cursor.
+        """
+        query = (
+            select(
+                Item.id,
+                Item.item_name,
+                Item.sku,
+                Item.description,
+                Item.short_description,
+                Brand.name.label("brand_name"),
+                Category.name.label("category_name"),
+                Category.category_path,
+                UnitOfMeasurement.name.label("unit_name"),
+                Item.weight,
+                Item.dimensions_length,
+                Item.dimensions_width,
+                Item.dimensions_height,
+                Item.color,
+                Item.material,
+                Item.is_rentable,
+                Item.is_salable,
+                Item.requires_serial_number,
+                Item.cost_price,
+                Item.sale_price,
+                Item.rental_rate_per_day,
+                Item.security_deposit,
+                Item.reorder_level,
+                Item.maximum_stock_level,
+                Item.status,
+                Item.notes,
+                Item.tags,
+                Item.is_rental_blocked,
+                Item.rental_block_reason,
+                Item.is_active,
+                Item.created_at,
+                Item.updated_at,
+                Item.created_by,
+                Item.updated_by
+            )
+            .outerjoin(Brand, Brand.id == Item.brand_id)
+            .outerjoin(Category, Category.id == Item.category_id)
+            .outerjoin(UnitOfMeasurement, UnitOfMeasurement.id == Item.unit_of_measurement_id)
+        )
+
+        if not include_inactive:
+            query = query.where(Item.is_active == True)
+        if filters:
+            query = self._apply_filters(query, filters)
+
+        return query.order_by(Item.item_name)
+
     async def get_by_sku(
         self, 
         sku: str, 
         include_relations: bool = False
     ) -> Optional[Item]:
         """Get item by SKU."""
-        query = select(Item).where(Item.sku == sku.upper())
-        
-        if include_relations:
-            query = query.options(
-                joinedload(Item.brand),
-                joinedload(Item.category),
-                joinedload(Item.unit_of_measurement)
-            )
-        
-        result = await self.session.execute(query)
+        result = await self.session.execute(statements.item_by_sku(sku.upper(), include_relations))
         return result.scalar_one_or_none()
     
     async def get_by_name(self, item_name: str) -> Optional[Item]:
@@ -519,105 +611,59 @@ class ItemRepository:
         return count
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get item statistics."""
-        # Base counts
-        stats_queries = {
-            "total_items": select(func.count()).select_from(Item),
-            "active_items": select(func.count()).select_from(Item).where(Item.is_active == True),
-            "rentable_items": select(func.count()).select_from(Item).where(
-                and_(Item.is_active == True, Item.is_rentable == True)
-            ),
-            "salable_items": select(func.count()).select_from(Item).where(
-                and_(Item.is_active == True, Item.is_salable == True)
-            ),
-            "rental_blocked_items": select(func.count()).select_from(Item).where(
-                and_(Item.is_active == True, Item.is_rental_blocked == True)
-            ),
+        """Get item statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, Item.__tablename__)
+        
+        total_items = stats.total_count("is_active")
+        active_items = stats.count("is_active")
+        
+        return {
+            "total_items": total_items,
+            "active_items": active_items,
+            "inactive_items": total_items - active_items,
+            "rentable_items": stats.count("is_rentable"),
+            "salable_items": stats.count("is_salable"),
+            "rental_blocked_items": stats.count("is_rental_blocked"),
+            "avg_sale_price": stats.average("sale_price"),
+            "avg_rental_rate": stats.average("rental_rate_per_day"),
+            "avg_cost_price": stats.average("cost_price"),
+            "total_inventory_value": stats.sum("cost_price"),  # Would multiply by quantity when inventory is implemented
         }
-        
-        stats = {}
-        for key, query in stats_queries.items():
-            result = await self.session.execute(query)
-            stats[key] = result.scalar_one()
-        
-        stats["inactive_items"] = stats["total_items"] - stats["active_items"]
-        
-        # Price statistics
-        price_stats_query = select(
-            func.avg(Item.sale_price).label("avg_sale_price"),
-            func.avg(Item.rental_rate_per_day).label("avg_rental_rate"),
-            func.avg(Item.cost_price).label("avg_cost_price"),
-            func.sum(Item.cost_price * 1).label("total_inventory_value")  # Would multiply by quantity when inventory is implemented
-        ).where(Item.is_active == True)
-        
-        price_result = await self.session.execute(price_stats_query)
-        price_stats = price_result.first()
-        
-        if price_stats:
-            stats.update({
-                "avg_sale_price": price_stats.avg_sale_price,
-                "avg_rental_rate": price_stats.avg_rental_rate,
-                "avg_cost_price": price_stats.avg_cost_price,
-                "total_inventory_value": price_stats.total_inventory_value
-            })
-        
-        return stats
     
     async def get_items_by_status(self) -> Dict[str, int]:
         """Get count of items by status."""
-        query = select(
-            Item.status,
-            func.count().label("count")
-        ).where(Item.is_active == True).group_by(Item.status)
-        
-        result = await self.session.execute(query)
-        rows = result.fetchall()
-        
-        return {row.status: row.count for row in rows}
+        stats = await entity_stats_cache.get(self.session, Item.__tablename__)
+        return stats.buckets("status")
     
     async def get_items_by_category(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get count of items by category."""
-        query = select(
-            Category.name.label("category_name"),
-            func.count(Item.id).label("item_count")
-        ).select_from(
-            Item
-        ).join(
-            Category, Item.category_id == Category.id, isouter=True
-        ).where(
-            Item.is_active == True
-        ).group_by(
-            Category.name
-        ).order_by(
-            func.count(Item.id).desc()
-        ).limit(limit)
-        
-        result = await self.session.execute(query)
-        rows = result.fetchall()
+        stats = await entity_stats_cache.get(self.session, Item.__tablename__)
+        top = stats.top("category_id", limit)
+        names = await self._names(Category, top)
         
-        return [{"category_name": row.category_name or "Uncategorized", "item_count": row.item_count} for row in rows]
+        return [
+            {"category_name": names.get(bucket) or "Uncategorized", "item_count": count}
+            for bucket, count in top.items()
+        ]
     
     async def get_items_by_brand(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get count of items by brand."""
-        query = select(
-            Brand.name.label("brand_name"),
-            func.count(Item.id).label("item_count")
-        ).select_from(
-            Item
-        ).join(
-            Brand, Item.brand_id == Brand.id, isouter=True
-        ).where(
-            Item.is_active == True
-        ).group_by(
-            Brand.name
-        ).order_by(
-            func.count(Item.id).desc()
-        ).limit(limit)
-        
-        result = await self.session.execute(query)
-        rows = result.fetchall()
-        
-        return [{"brand_name": row.brand_name or "No Brand", "item_count": row.item_count} for row in rows]
+        stats = await entity_stats_cache.get(self.session, Item.__tablename__)
+        top = stats.top("brand_id", limit)
+        names = await self._names(Brand, top)
+        
+        return [
+            {"brand_name": names.get(bucket) or "No Brand", "item_count": count}
+            for bucket, count in top.items()
+        ]
+    
+    async def _names(self, model, buckets: Dict[str, int]) -> Dict[str, str]:
+        """Names of the categories or brands whose ids are the given counter buckets."""
+        ids = [UUID(bucket) for bucket in buckets if bucket]
+        if not ids:
+            return {}
+        result = await self.session.execute(select(model.id, model.name).where(model.id.in_(ids)))
+        return {str(row.id): row.name for row in result}
     
     def _apply_filters(self, query, filters: Dict[str, Any]):
         """Apply filters to query."""
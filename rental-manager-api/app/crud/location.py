@@ -16,9 +16,11 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, update, delete
 from sqlalchemy.orm import selectinload, joinedload
-from sqlalchemy.sql import text
 import math
 
+from app.core.response_cache import track_catalog_writes
+from app.crud import statements
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.location import Location, LocationType
 from app.schemas.location import (
     LocationCreate, LocationUpdate, LocationSearch,
@@ -32,6 +34,8 @@ class LocationCRUD:
     def __init__(self, db: AsyncSession):
         """Initialize with database session."""
         self.db = db
+        track_counted_writes(db)
+        track_catalog_writes(db)
     
     # ==================== Basic CRUD Operations ====================
     
@@ -290,32 +294,7 @@ class LocationCRUD:
     ) -> List[Location]:
         """Get all descendants of a location recursively."""
         # Use recursive CTE for efficient hierarchical query
-        cte_query = text("""
-            WITH RECURSIVE location_tree AS (
-                SELECT * FROM locations 
-                WHERE id = :parent_id
-                UNION ALL
-                SELECT l.* FROM locations l
-                INNER JOIN location_tree lt ON l.parent_location_id = lt.id
-            )
-            SELECT * FROM location_tree
-            WHERE id != :parent_id
-        """)
-        
-        if not include_inactive:
-            cte_query = text("""
-                WITH RECURSIVE location_tree AS (
-                    SELECT * FROM locations 
-                    WHERE id = :parent_id AND is_active = true
-                    UNION ALL
-                    SELECT l.* FROM locations l
-                    INNER JOIN location_tree lt ON l.parent_location_id = lt.id
-                    WHERE l.is_active = true
-                )
-                SELECT * FROM location_tree
-                WHERE id != :parent_id
-            """)
-        
+        cte_query = statements.LOCATION_DESCENDANTS if include_inactive else statements.ACTIVE_LOCATION_DESCENDANTS
         result = await self.db.execute(cte_query, {"parent_id": parent_id})
         return result.fetchall()
     
@@ -349,87 +328,19 @@ class LocationCRUD:
     async def find_nearby(self, params: LocationNearby) -> List[Tuple[Location, float]]:
         """Find locations within a radius using Haversine formula."""
         # Haversine formula in SQL
-        distance_query = text("""
-            SELECT *, 
-            (6371 * acos(
-                cos(radians(:lat)) * cos(radians(latitude)) * 
-                cos(radians(longitude) - radians(:lng)) + 
-                sin(radians(:lat)) * sin(radians(latitude))
-            )) AS distance
-            FROM locations
-            WHERE latitude IS NOT NULL 
-            AND longitude IS NOT NULL
-            AND is_active = true
-            AND (6371 * acos(
-                cos(radians(:lat)) * cos(radians(latitude)) * 
-                cos(radians(longitude) - radians(:lng)) + 
-                sin(radians(:lat)) * sin(radians(latitude))
-            )) <= :radius
-        """)
+        parameters = {
+            "lat": float(params.latitude),
+            "lng": float(params.longitude),
+            "radius": params.radius_km,
+            "limit": params.limit
+        }
         
         # Add type filter if specified
         if params.location_type:
-            distance_query = text("""
-                SELECT *, 
-                (6371 * acos(
-                    cos(radians(:lat)) * cos(radians(latitude)) * 
-                    cos(radians(longitude) - radians(:lng)) + 
-                    sin(radians(:lat)) * sin(radians(latitude))
-                )) AS distance
-                FROM locations
-                WHERE latitude IS NOT NULL 
-                AND longitude IS NOT NULL
-                AND is_active = true
-                AND location_type = :location_type
-                AND (6371 * acos(
-                    cos(radians(:lat)) * cos(radians(latitude)) * 
-                    cos(radians(longitude) - radians(:lng)) + 
-                    sin(radians(:lat)) * sin(radians(latitude))
-                )) <= :radius
-                ORDER BY distance
-                LIMIT :limit
-            """)
-            
-            result = await self.db.execute(
-                distance_query,
-                {
-                    "lat": float(params.latitude),
-                    "lng": float(params.longitude),
-                    "radius": params.radius_km,
-                    "location_type": params.location_type,
-                    "limit": params.limit
-                }
-            )
+            parameters["location_type"] = params.location_type
+            result = await self.db.execute(statements.NEARBY_LOCATIONS_OF_TYPE, parameters)
         else:
-            distance_query = text("""
-                SELECT *, 
-                (6371 * acos(
-                    cos(radians(:lat)) * cos(radians(latitude)) * 
-                    cos(radians(longitude) - radians(:lng)) + 
-                    sin(radians(:lat)) * sin(radians(latitude))
-                )) AS distance
-                FROM locations
-                WHERE latitude IS NOT NULL 
-                AND longitude IS NOT NULL
-                AND is_active = true
-                AND (6371 * acos(
-                    cos(radians(:lat)) * cos(radians(latitude)) * 
-                    cos(radians(longitude) - radians(:lng)) + 
-                    sin(radians(:lat)) * sin(radians(latitude))
-                )) <= :radius
-                ORDER BY distance
-                LIMIT :limit
-            """)
-            
-            result = await self.db.execute(
-                distance_query,
-                {
-                    "lat": float(params.latitude),
-                    "lng": float(params.longitude),
-                    "radius": params.radius_km,
-                    "limit": params.limit
-                }
-            )
+            result = await self.db.execute(statements.NEARBY_LOCATIONS, parameters)
         
         return result.fetchall()
     
@@ -582,93 +493,35 @@ class LocationCRUD:
     # ==================== Statistics Operations ====================
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get location statistics."""
-        # Total and active counts
-        total_query = select(func.count(Location.id))
-        total_result = await self.db.execute(total_query)
-        total_count = total_result.scalar()
-        
-        active_query = select(func.count(Location.id)).where(Location.is_active == True)
-        active_result = await self.db.execute(active_query)
-        active_count = active_result.scalar()
-        
-        # Count by type
-        type_query = (
-            select(Location.location_type, func.count(Location.id))
-            .where(Location.is_active == True)
-            .group_by(Location.location_type)
-        )
-        type_result = await self.db.execute(type_query)
-        type_counts = dict(type_result.fetchall())
+        """Get location statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.db, Location.__tablename__)
         
-        # Count by country
-        country_query = (
-            select(Location.country, func.count(Location.id))
-            .where(
-                Location.is_active == True,
-                Location.country.isnot(None)
-            )
-            .group_by(Location.country)
-            .order_by(func.count(Location.id).desc())
-            .limit(10)
-        )
-        country_result = await self.db.execute(country_query)
-        country_counts = dict(country_result.fetchall())
+        total_count = stats.total_count("is_active")
+        active_count = stats.count("is_active")
         
-        # Count by state
-        state_query = (
-            select(Location.state, func.count(Location.id))
-            .where(
-                Location.is_active == True,
-                Location.state.isnot(None)
-            )
-            .group_by(Location.state)
-            .order_by(func.count(Location.id).desc())
-            .limit(10)
-        )
-        state_result = await self.db.execute(state_query)
-        state_counts = dict(state_result.fetchall())
+        # Capacity is counted per distinct value
+        capacities = {int(capacity): count for capacity, count in stats.buckets("capacity").items()}
+        located = sum(capacities.values())
+        total_capacity = sum(capacity * count for capacity, count in capacities.items())
         
         # Default location
         default_location = await self.get_default()
         
-        # Capacity statistics
-        capacity_query = select(
-            func.sum(Location.capacity),
-            func.avg(Location.capacity),
-            func.min(Location.capacity),
-            func.max(Location.capacity)
-        ).where(
-            Location.is_active == True,
-            Location.capacity.isnot(None)
-        )
-        capacity_result = await self.db.execute(capacity_query)
-        capacity_stats = capacity_result.first()
-        
-        # Locations with coordinates
-        coords_query = select(func.count(Location.id)).where(
-            Location.is_active == True,
-            Location.latitude.isnot(None),
-            Location.longitude.isnot(None)
-        )
-        coords_result = await self.db.execute(coords_query)
-        coords_count = coords_result.scalar()
-        
         return {
             "total_locations": total_count,
             "active_locations": active_count,
             "inactive_locations": total_count - active_count,
-            "locations_by_type": type_counts,
-            "locations_by_country": country_counts,
-            "locations_by_state": state_counts,
+            "locations_by_type": stats.buckets("location_type"),
+            "locations_by_country": stats.top("country", 10),
+            "locations_by_state": stats.top("state", 10),
             "default_location_id": default_location.id if default_location else None,
             "capacity_stats": {
-                "total": capacity_stats[0] if capacity_stats else 0,
-                "average": float(capacity_stats[1]) if capacity_stats and capacity_stats[1] else 0,
-                "min": capacity_stats[2] if capacity_stats else 0,
-                "max": capacity_stats[3] if capacity_stats else 0
+                "total": total_capacity if located else None,
+                "average": total_capacity / located if located else 0,
+                "min": min(capacities) if located else None,
+                "max": max(capacities) if located else None
             },
-            "locations_with_coordinates": coords_count
+            "locations_with_coordinates": stats.count("has_coordinates")
         }
     
     # ==================== Private Helper Methods ====================
@@ -0,0 +1,148 @@
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.price_book import PriceBook, PriceBookEntry
+
+
+class PriceBookRepository:
+    """Repository for price books and their entries.
+
+    Writes are flushed, not committed, so the service can bump the cache
+    version in the same transaction as the edit.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def create(self, book_data: dict) -> PriceBook:
+        """Create a new price book."""
+        book = PriceBook(id=uuid4(), **book_data)
+        self.session.add(book)
+        await self.session.flush()
+        return book
+
+    async def get_by_id(self, book_id: UUID) -> Optional[PriceBook]:
+        """Get price book by ID."""
+        query = select(PriceBook).where(PriceBook.id == book_id)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_by_code(self, code: str) -> Optional[PriceBook]:
+        """Get price book by code."""
+        query = select(PriceBook).where(PriceBook.code == code.strip().upper())
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        filters: Optional[Dict[str, Any]] = None,
+        include_inactive: bool = False
+    ) -> tuple[List[PriceBook], int]:
+        """Get paginated price books with total count."""
+        conditions = []
+        if not include_inactive:
+            conditions.append(PriceBook.is_active == True)
+        for field in ("location_id", "customer_segment"):
+            if filters and filters.get(field) is not None:
+                conditions.append(getattr(PriceBook, field) == filters[field])
+        if filters and filters.get("effective_on") is not None:
+            on = filters["effective_on"]
+            conditions.append(PriceBook.effective_from <= on)
+            conditions.append((PriceBook.effective_to.is_(None)) | (PriceBook.effective_to > on))
+
+        count_query = select(func.count()).select_from(PriceBook).where(and_(*conditions))
+        total = (await self.session.execute(count_query)).scalar_one()
+
+        query = (
+            select(PriceBook)
+            .where(and_(*conditions))
+            .order_by(PriceBook.effective_from.desc(), PriceBook.code)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all(), total
+
+    async def update(self, book: PriceBook, update_data: dict) -> PriceBook:
+        """Apply field updates to a price book and re-validate it."""
+        for field, value in update_data.items():
+            setattr(book, field, value)
+        book._validate()
+        await self.session.flush()
+        return book
+
+    async def get_entries(self, book_id: UUID) -> List[PriceBookEntry]:
+        """All active entries of a price book."""
+        query = select(PriceBookEntry).where(
+            PriceBookEntry.price_book_id == book_id,
+            PriceBookEntry.is_active == True
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def upsert_entries(self, book_id: UUID, entries: Sequence[dict]) -> List[PriceBookEntry]:
+        """Insert or replace the entries of a price book, keyed by item."""
+        item_ids = [entry["item_id"] for entry in entries]
+        result = await self.session.execute(
+            select(PriceBookEntry).where(
+                PriceBookEntry.price_book_id == book_id,
+                PriceBookEntry.item_id.in_(item_ids)
+            )
+        )
+        existing = {entry.item_id: entry for entry in result.scalars()}
+
+        saved = []
+        for data in entries:
+            entry = existing.get(data["item_id"])
+            if entry is None:
+                entry = PriceBookEntry(id=uuid4(), price_book_id=book_id, **data)
+                self.session.add(entry)
+            else:
+                for field, value in data.items():
+                    setattr(entry, field, value)
+                entry.is_active = True
+                entry._validate()
+            saved.append(entry)
+        await self.session.flush()
+        return saved
+
+    async def delete_entry(self, book_id: UUID, item_id: UUID) -> bool:
+        """Remove one item from a price book."""
+        result = await self.session.execute(
+            delete(PriceBookEntry).where(
+                PriceBookEntry.price_book_id == book_id,
+                PriceBookEntry.item_id == item_id
+            )
+        )
+        return result.rowcount > 0
+
+    async def get_active_rates(self) -> List[Row]:
+        """Every active entry of every active book, flattened for compilation."""
+        query = (
+            select(
+                PriceBookEntry.item_id,
+                PriceBook.id.label("price_book_id"),
+                PriceBook.location_id,
+                PriceBook.customer_segment,
+                PriceBook.effective_from,
+                PriceBook.effective_to,
+                PriceBook.priority,
+                PriceBookEntry.rental_rate_per_day,
+                PriceBookEntry.weekly_rate,
+                PriceBookEntry.monthly_rate,
+                PriceBookEntry.sale_price,
+                PriceBookEntry.security_deposit,
+            )
+            .join(PriceBook, PriceBook.id == PriceBookEntry.price_book_id)
+            .where(PriceBook.is_active == True, PriceBookEntry.is_active == True)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
@@ -0,0 +1,184 @@
+"""
+Cached statements for hot lookups.
+
+Building a ``select()`` and computing its cache key costs Python time on
+every call, even when the compiled SQL comes from the engine's compiled
+cache. The builders here return lambda statements instead. SQLAlchemy
+analyses each lambda once per code location, keys the compiled-cache entry
+on that location, and on later calls only reads the closure variables as
+bound parameters. Keep closure variables to plain values (ids, dates,
+strings): the SQL itself must not depend on them.
+
+Raw SQL that ``text()`` would otherwise re-parse on every call is prebuilt
+once at import time.
+
+Compiled SQL is kept per engine (``DB_COMPILED_CACHE_SIZE``). With
+asyncpg, each connection additionally keeps the server-side prepared
+statement (``DB_PREPARED_STATEMENT_CACHE_SIZE``), so a cached statement is
+neither recompiled nor re-planned.
+"""
+
+from datetime import date
+from typing import Union
+from uuid import UUID
+
+from sqlalchemy import StatementLambdaElement, and_, lambda_stmt, or_, select, text
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.models.inventory.stock_level import StockLevel
+from app.models.item import Item
+from app.models.transaction.transaction_header import RentalStatus
+from app.models.transaction.transaction_line import TransactionLine
+from app.models.user import User
+
+ACTIVE_RENTAL_STATUSES = (RentalStatus.RENTAL_INPROGRESS, RentalStatus.RENTAL_EXTENDED)
+
+
+def item_by_id(item_id: UUID, include_relations: bool = False) -> StatementLambdaElement:
+    """Item by id, optionally with brand, category and unit joined in."""
+    statement = lambda_stmt(lambda: select(Item).where(Item.id == item_id))
+    if include_relations:
+        statement += lambda s: s.options(
+            joinedload(Item.brand),
+            joinedload(Item.category),
+            joinedload(Item.unit_of_measurement),
+        )
+    return statement
+
+
+def item_by_sku(sku: str, include_relations: bool = False) -> StatementLambdaElement:
+    """Item by (upper-cased) SKU, optionally with its relations."""
+    statement = lambda_stmt(lambda: select(Item).where(Item.sku == sku))
+    if include_relations:
+        statement += lambda s: s.options(
+            joinedload(Item.brand),
+            joinedload(Item.category),
+            joinedload(Item.unit_of_measurement),
+        )
+    return statement
+
+
+def stock_level_by_item_location(item_id: UUID, location_id: UUID) -> StatementLambdaElement:
+    """Stock level row of an item at a location."""
+    return lambda_stmt(
+        lambda: select(StockLevel).where(
+            StockLevel.item_id == item_id,
+            StockLevel.location_id == location_id,
+        )
+    )
+
+
+def rental_conflicts(item_id: UUID, start_date: date, end_date: date) -> StatementLambdaElement:
+    """Active rental lines of an item whose period overlaps the given one."""
+    return lambda_stmt(
+        lambda: select(TransactionLine)
+        .where(
+            TransactionLine.item_id == item_id,
+            TransactionLine.current_rental_status.in_(ACTIVE_RENTAL_STATUSES),
+            or_(
+                and_(
+                    TransactionLine.rental_start_date <= start_date,
+                    TransactionLine.rental_end_date >= start_date,
+                ),
+                and_(
+                    TransactionLine.rental_start_date <= end_date,
+                    TransactionLine.rental_end_date >= end_date,
+                ),
+                and_(
+                    TransactionLine.rental_start_date >= start_date,
+                    TransactionLine.rental_end_date <= end_date,
+                ),
+            ),
+        )
+        .options(selectinload(TransactionLine.transaction))
+    )
+
+
+def user_by_id(user_id: Union[UUID, str]) -> StatementLambdaElement:
+    """User by id, as resolved on every authenticated request."""
+    return lambda_stmt(lambda: select(User).where(User.id == user_id))
+
+
+CATEGORY_ANCESTORS = text("""
+    WITH RECURSIVE ancestors AS (
+        SELECT c.*
+        FROM categories c
+        WHERE c.id = :category_id
+
+        UNION ALL
+
+        SELECT c.*
+        FROM categories c
+        INNER JOIN ancestors a ON c.id = a.parent_category_id
+    )
+    SELECT * FROM ancestors WHERE id != :category_id ORDER BY category_level DESC;
+""")
+
+CATEGORY_DESCENDANTS = text("""
+    WITH RECURSIVE descendants AS (
+        SELECT c.*
+        FROM categories c
+        WHERE c.id = :category_id
+
+        UNION ALL
+
+        SELECT c.*
+        FROM categories c
+        INNER JOIN descendants d ON c.parent_category_id = d.id
+    )
+    SELECT * FROM descendants WHERE id != :category_id ORDER BY category_level ASC;
+""")
+
+LOCATION_DESCENDANTS = text("""
+    WITH RECURSIVE location_tree AS (
+        SELECT * FROM locations
+        WHERE id = :parent_id
+        UNION ALL
+        SELECT l.* FROM locations l
+        INNER JOIN location_tree lt ON l.parent_location_id = lt.id
+    )
+    SELECT * FROM location_tree
+    WHERE id != :parent_id
+""")
+
+ACTIVE_LOCATION_DESCENDANTS = text("""
+    WITH RECURSIVE location_tree AS (
+        SELECT * FROM locations
+        WHERE id = :parent_id AND is_active = true
+        UNION ALL
+        SELECT l.* FROM locations l
+        INNER JOIN location_tree lt ON l.parent_location_id = lt.id
+        WHERE l.is_active = true
+    )
+    SELECT * FROM location_tree
+    WHERE id != :parent_id
+""")
+
+_HAVERSINE_KM = """(6371 * acos(
+        cos(radians(:lat)) * cos(radians(latitude)) *
+        cos(radians(longitude) - radians(:lng)) +
+        sin(radians(:lat)) * sin(radians(latitude))
+    ))"""
+
+NEARBY_LOCATIONS = text(f"""
+    SELECT *, {_HAVERSINE_KM} AS distance
+    FROM locations
+    WHERE latitude IS NOT NULL
+    AND longitude IS NOT NULL
+    AND is_active = true
+    AND {_HAVERSINE_KM} <= :radius
+    ORDER BY distance
+    LIMIT :limit
+""")
+
+NEARBY_LOCATIONS_OF_TYPE = text(f"""
+    SELECT *, {_HAVERSINE_KM} AS distance
+    FROM locations
+    WHERE latitude IS NOT NULL
+    AND longitude IS NOT NULL
+    AND is_active = true
+    AND location_type = :location_type
+    AND {_HAVERSINE_KM} <= :radius
+    ORDER BY distance
+    LIMIT :limit
+""")
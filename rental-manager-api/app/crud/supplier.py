@@ -1,10 +1,11 @@
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import Select, select, func, or_, and_, desc, asc
 from sqlalchemy.orm import selectinload
 from datetime import datetime, timedelta
 
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.supplier import Supplier, SupplierType, SupplierTier, SupplierStatus, PaymentTerms
 
 
@@ -13,6 +14,7 @@ class SupplierRepository:
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        track_counted_writes(session)
     
     async def get_by_id(self, supplier_id: UUID) -> Optional[Supplier]:
         """Get supplier by ID."""
@@ -85,9 +87,53 @@ class SupplierRepository:
         sort_order: str = "asc"
     ) -> List[Supplier]:
         """Get all suppliers with filtering and sorting."""
-        query = select(Supplier)
+        query = self._apply_filters(
+            select(Supplier), supplier_type, status, supplier_tier, payment_terms, country, active_only
+        )
         
-        # Apply filters
+        # Apply sorting
+        if hasattr(Supplier, sort_by):
+            sort_column = getattr(Supplier, sort_by)
+            if sort_order.lower() == "desc":
+                query = query.order_by(desc(sort_column))
+            else:
+                query = query.order_by(asc(sort_column))
+        else:
+            query = query.order_by(asc(Supplier.company_name))
+        
+        # Apply pagination
+        query = query.offset(skip).limit(limit)
+        
+        result = await self.session.execute(query)
+        return result.scalars().all()
+    
+    def export_query(
+        self,
+        supplier_type: Optional[SupplierType] = None,
+        status: Optional[SupplierStatus] = None,
+        supplier_tier: Optional[SupplierTier] = None,
+        payment_terms: Optional[PaymentTerms] = None,
+        country: Optional[str] = None,
+        active_only: bool = True
+    ) -> Select:
+        """Column query over every supplier column for streaming exports."""
+        query = self._apply_filters(
+            select(*Supplier.__table__.columns),
+            supplier_type, status, supplier_tier, payment_terms, country, active_only
+        )
+        return query.order_by(asc(Supplier.supplier_code))
+    
+    def _apply_filters(
+        self,
+        query: Select,
+        supplier_type: Optional[SupplierType],
+        status: Optional[SupplierStatus],
+        supplier_tier: Optional[SupplierTier],
+        payment_terms: Optional[PaymentTerms],
+        country: Optional[str],
+        active_only: bool
+    ) -> Select:
+        """Apply the filters shared by listing and export."""
         if active_only:
             query = query.where(Supplier.is_active == True)
         
@@ -106,21 +152,7 @@ class SupplierRepository:
         if country:
             query = query.where(Supplier.country.ilike(f"%{country}%"))
         
-        # Apply sorting
-        if hasattr(Supplier, sort_by):
-            sort_column = getattr(Supplier, sort_by)
-            if sort_order.lower() == "desc":
-                query = query.order_by(desc(sort_column))
-            else:
-                query = query.order_by(asc(sort_column))
-        else:
-            query = query.order_by(asc(Supplier.company_name))
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        return query
     
     async def search(
         self,
@@ -346,60 +378,17 @@ class SupplierRepository:
         return result.scalars().all()
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get supplier statistics."""
-        # Basic counts
-        total_count = await self.session.execute(select(func.count(Supplier.id)))
-        active_count = await self.session.execute(
-            select(func.count(Supplier.id)).where(Supplier.is_active == True)
-        )
-        
-        # Count by type
-        type_counts = await self.session.execute(
-            select(Supplier.supplier_type, func.count(Supplier.id))
-            .where(Supplier.is_active == True)
-            .group_by(Supplier.supplier_type)
-        )
-        
-        # Count by status
-        status_counts = await self.session.execute(
-            select(Supplier.status, func.count(Supplier.id))
-            .where(Supplier.is_active == True)
-            .group_by(Supplier.status)
-        )
-        
-        # Count by tier
-        tier_counts = await self.session.execute(
-            select(Supplier.supplier_tier, func.count(Supplier.id))
-            .where(Supplier.is_active == True)
-            .group_by(Supplier.supplier_tier)
-        )
-        
-        # Count by country
-        country_counts = await self.session.execute(
-            select(Supplier.country, func.count(Supplier.id))
-            .where(and_(Supplier.is_active == True, Supplier.country.isnot(None)))
-            .group_by(Supplier.country)
-            .order_by(desc(func.count(Supplier.id)))
-            .limit(10)
-        )
-        
-        # Average ratings
-        avg_ratings = await self.session.execute(
-            select(
-                func.avg(Supplier.quality_rating),
-                func.avg(Supplier.delivery_rating)
-            )
-            .where(Supplier.is_active == True)
-        )
+        """Get supplier statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, Supplier.__tablename__)
         
         return {
-            "total_suppliers": total_count.scalar(),
-            "active_suppliers": active_count.scalar(),
-            "suppliers_by_type": dict(type_counts.fetchall()),
-            "suppliers_by_status": dict(status_counts.fetchall()),
-            "suppliers_by_tier": dict(tier_counts.fetchall()),
-            "suppliers_by_country": dict(country_counts.fetchall()),
-            "average_ratings": avg_ratings.fetchone()
+            "total_suppliers": stats.total_count("is_active"),
+            "active_suppliers": stats.count("is_active"),
+            "suppliers_by_type": stats.buckets("supplier_type"),
+            "suppliers_by_status": stats.buckets("status"),
+            "suppliers_by_tier": stats.buckets("supplier_tier"),
+            "suppliers_by_country": stats.top("country", 10),
+            "average_ratings": (stats.average("quality_rating"), stats.average("delivery_rating"))
         }
     
     async def get_recent_suppliers(
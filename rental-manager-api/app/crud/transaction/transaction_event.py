@@ -4,10 +4,12 @@ Transaction Event CRUD operations.
 
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import datetime, date
-from sqlalchemy import select, and_, func, delete
+from datetime import datetime, date, timedelta, timezone
+from sqlalchemy import select, and_, func, delete, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.db.partitioning import transaction_event_partitions, month_start
 from app.models.transaction import TransactionEvent
 
 
@@ -168,7 +170,12 @@ class TransactionEventRepository:
         event_category: Optional[str] = None,
         status: Optional[str] = None
     ) -> List[TransactionEvent]:
-        """Get events within a date range."""
+        """
+        Get events within a date range.
+        
+        The bounds are on the partition key, so only the monthly partitions
+        overlapping the range are scanned.
+        """
         query = select(TransactionEvent).where(
             and_(
                 TransactionEvent.event_timestamp >= start_date,
@@ -189,15 +196,29 @@ class TransactionEventRepository:
     async def get_error_events(
         self,
         transaction_id: Optional[UUID] = None,
-        limit: int = 100
+        limit: int = 100,
+        since: Optional[datetime] = None
     ) -> List[TransactionEvent]:
-        """Get error events."""
+        """
+        Get error events.
+        
+        Without a transaction_id the search is bounded to events since
+        ``since`` (default: TRANSACTION_EVENT_ERROR_LOOKBACK_DAYS ago) so that
+        only recent partitions are scanned.
+        """
         query = select(TransactionEvent).where(
             TransactionEvent.event_category == "ERROR"
         )
         
         if transaction_id:
             query = query.where(TransactionEvent.transaction_id == transaction_id)
+        elif since is None:
+            since = datetime.now(timezone.utc) - timedelta(
+                days=settings.TRANSACTION_EVENT_ERROR_LOOKBACK_DAYS
+            )
+        
+        if since is not None:
+            query = query.where(TransactionEvent.event_timestamp >= since)
         
         query = query.order_by(TransactionEvent.event_timestamp.desc()).limit(limit)
         
@@ -222,16 +243,46 @@ class TransactionEventRepository:
     async def delete_old_events(
         self,
         older_than: datetime,
-        event_category: Optional[str] = None
+        event_category: Optional[str] = None,
+        chunk_size: int = 5000
     ) -> int:
-        """Delete events older than specified date."""
-        query = delete(TransactionEvent).where(
-            TransactionEvent.event_timestamp < older_than
-        )
+        """
+        Delete events older than specified date.
         
-        if event_category:
-            query = query.where(TransactionEvent.event_category == event_category)
+        On the partitioned table whole months before the cutoff are detached
+        instead of deleted row by row. Remaining rows (the part of the cutoff
+        month before ``older_than``, or everything when filtering by
+        category) are deleted in chunks of ``chunk_size`` so no single
+        statement touches an unbounded number of rows. Rows are matched by
+        their full ``(event_timestamp, id)`` key and the DELETE itself is
+        bounded by ``older_than``, so each chunk only visits the partitions
+        before the cutoff.
+        """
+        deleted = 0
+        if event_category is None and await transaction_event_partitions.is_partitioned(self.session):
+            # Partition bounds are UTC month starts
+            cutoff = older_than.astimezone(timezone.utc) if older_than.tzinfo else older_than
+            deleted += await transaction_event_partitions.detach_before(
+                self.session, month_start(cutoff)
+            )
         
-        result = await self.session.execute(query)
-        await self.session.flush()
-        return result.rowcount
\ No newline at end of file
+        key = tuple_(TransactionEvent.event_timestamp, TransactionEvent.id)
+        while True:
+            expired = select(TransactionEvent.event_timestamp, TransactionEvent.id).where(
+                TransactionEvent.event_timestamp < older_than
+            )
+            if event_category:
+                expired = expired.where(TransactionEvent.event_category == event_category)
+            
+            result = await self.session.execute(
+                delete(TransactionEvent)
+                .where(
+                    TransactionEvent.event_timestamp < older_than,
+                    key.in_(expired.limit(chunk_size)),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.flush()
+            deleted += result.rowcount
+            if result.rowcount < chunk_size:
+                return deleted
\ No newline at end of file
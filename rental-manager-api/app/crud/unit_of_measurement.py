@@ -6,6 +6,8 @@ from sqlalchemy import select, func, or_, and_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.response_cache import track_catalog_writes
+from app.crud.entity_stats import entity_stats_cache, track_counted_writes
 from app.models.unit_of_measurement import UnitOfMeasurement
 from app.schemas.unit_of_measurement import UnitOfMeasurementCreate, UnitOfMeasurementUpdate
 
@@ -15,6 +17,8 @@ class UnitOfMeasurementRepository:
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        track_counted_writes(session)
+        track_catalog_writes(session)
     
     async def create(self, *, obj_in: UnitOfMeasurementCreate) -> UnitOfMeasurement:
         """Create a new unit of measurement."""
@@ -216,18 +220,11 @@ class UnitOfMeasurementRepository:
         return count
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get unit statistics."""
-        # Count all units
-        total_query = select(func.count()).select_from(UnitOfMeasurement)
-        total_result = await self.session.execute(total_query)
-        total_units = total_result.scalar_one()
+        """Get unit statistics from the statistics counters."""
+        stats = await entity_stats_cache.get(self.session, UnitOfMeasurement.__tablename__)
         
-        # Count active units
-        active_query = select(func.count()).select_from(UnitOfMeasurement).where(
-            UnitOfMeasurement.is_active == True
-        )
-        active_result = await self.session.execute(active_query)
-        active_units = active_result.scalar_one()
+        total_units = stats.total_count("is_active")
+        active_units = stats.count("is_active")
         
         # Count units with items (when items relationship is available)
         units_with_items = 0  # Temporary until items relationship is available
@@ -0,0 +1,202 @@
+"""
+Monthly range partition maintenance for append-mostly PostgreSQL tables.
+
+Tables are declaratively partitioned ``PARTITION BY RANGE (<timestamp>)`` with
+one child table per calendar month named ``<parent>_pYYYY_MM`` plus a
+``<parent>_default`` catch-all. The maintenance job creates partitions a few
+months ahead and enforces retention by detaching (and dropping) whole months,
+which is a catalog operation instead of a long, lock-holding ``DELETE``.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(value: date) -> date:
+    """First day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """First day of the month ``months`` after the month containing ``value``."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    """One monthly child table covering ``[start, end)``."""
+
+    name: str
+    start: date
+    end: date
+
+
+class MonthlyPartitionManager:
+    """Creates, lists and retires the monthly partitions of one parent table."""
+
+    def __init__(
+        self,
+        parent: str,
+        premake_months: int = 3,
+        retention_months: Optional[int] = None,
+        archive_detached: bool = False,
+    ):
+        self.parent = parent
+        self.premake_months = premake_months
+        self.retention_months = retention_months
+        self.archive_detached = archive_detached
+        self._name_pattern = re.compile(rf"^{re.escape(parent)}_p(\d{{4}})_(\d{{2}})$")
+        self._partitioned: Optional[bool] = None
+
+    def partition_for(self, month: date) -> MonthlyPartition:
+        start = month_start(month)
+        return MonthlyPartition(
+            name=f"{self.parent}_p{start:%Y_%m}",
+            start=start,
+            end=add_months(start, 1),
+        )
+
+    def create_partition_sql(self, month: date) -> str:
+        partition = self.partition_for(month)
+        return (
+            f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {self.parent} "
+            f"FOR VALUES FROM ('{partition.start.isoformat()} 00:00:00+00') "
+            f"TO ('{partition.end.isoformat()} 00:00:00+00')"
+        )
+
+    def retention_cutoff(self, today: Optional[date] = None) -> Optional[date]:
+        """Months starting before this date are past retention."""
+        if not self.retention_months:
+            return None
+        today = today or datetime.now(timezone.utc).date()
+        return add_months(today, -self.retention_months)
+
+    def expired(self, partitions: List[MonthlyPartition], cutoff: date) -> List[MonthlyPartition]:
+        """Partitions whose whole range lies before ``cutoff``."""
+        return [partition for partition in partitions if partition.end <= cutoff]
+
+    async def is_partitioned(self, session: AsyncSession) -> bool:
+        """Whether the parent exists as a partitioned table (always False off PostgreSQL)."""
+        if self._partitioned is None:
+            if session.get_bind().dialect.name != "postgresql":
+                self._partitioned = False
+            else:
+                result = await session.execute(
+                    text(
+                        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+                        "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :parent)"
+                    ),
+                    {"parent": self.parent},
+                )
+                self._partitioned = bool(result.scalar())
+        return self._partitioned
+
+    async def list_partitions(self, session: AsyncSession) -> List[MonthlyPartition]:
+        """Attached monthly partitions, oldest first (the default partition is excluded)."""
+        result = await session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :parent"
+            ),
+            {"parent": self.parent},
+        )
+        partitions = []
+        for (name,) in result:
+            match = self._name_pattern.match(name)
+            if match:
+                partitions.append(self.partition_for(date(int(match[1]), int(match[2]), 1)))
+        return sorted(partitions, key=lambda partition: partition.start)
+
+    async def ensure_partitions(self, session: AsyncSession, today: Optional[date] = None) -> List[str]:
+        """Create partitions from the current month through ``premake_months`` ahead."""
+        today = today or datetime.now(timezone.utc).date()
+        existing = {partition.name for partition in await self.list_partitions(session)}
+        created = []
+        for offset in range(self.premake_months + 1):
+            partition = self.partition_for(add_months(today, offset))
+            if partition.name not in existing:
+                await session.execute(text(self.create_partition_sql(partition.start)))
+                created.append(partition.name)
+        if created:
+            logger.info(f"Created partitions for {self.parent}: {', '.join(created)}")
+        return created
+
+    async def detach_before(self, session: AsyncSession, cutoff: date) -> int:
+        """
+        Detach every partition that ends on or before ``cutoff``.
+
+        Detached tables are dropped unless ``archive_detached`` is set, in
+        which case they are left in place as standalone tables for archival.
+
+        Returns:
+            Estimated number of rows that were in the detached partitions,
+            from planner statistics (counting them would scan each one)
+        """
+        expired = self.expired(await self.list_partitions(session), cutoff)
+        if not expired:
+            return 0
+        estimates = await session.execute(
+            text("SELECT relname, reltuples FROM pg_class WHERE relname = ANY(:names)"),
+            {"names": [partition.name for partition in expired]},
+        )
+        # reltuples is -1 for a table never vacuumed or analyzed
+        rows = sum(max(int(reltuples), 0) for _, reltuples in estimates)
+        for partition in expired:
+            await session.execute(text(f"ALTER TABLE {self.parent} DETACH PARTITION {partition.name}"))
+            if not self.archive_detached:
+                await session.execute(text(f"DROP TABLE {partition.name}"))
+            logger.info(
+                f"Detached partition {partition.name}",
+                extra={"event": "partition_detached", "table": self.parent, "partition": partition.name},
+            )
+        return rows
+
+    async def maintain(self, session: AsyncSession, today: Optional[date] = None) -> Dict[str, object]:
+        """Create upcoming partitions and retire expired ones."""
+        if not await self.is_partitioned(session):
+            return {"partitioned": False}
+
+        created = await self.ensure_partitions(session, today)
+        cutoff = self.retention_cutoff(today)
+        detached_rows = await self.detach_before(session, cutoff) if cutoff else 0
+        return {"partitioned": True, "created": created, "detached_rows": detached_rows}
+
+
+# Partitioned tables kept up to date by the scheduler
+transaction_event_partitions = MonthlyPartitionManager(
+    "transaction_events",
+    premake_months=settings.PARTITION_PREMAKE_MONTHS,
+    retention_months=settings.TRANSACTION_EVENT_RETENTION_MONTHS,
+    archive_detached=settings.PARTITION_ARCHIVE_DETACHED,
+)
+
+# Stock movement retention is enforced by the ledger compaction job, which
+# never retires a month before it has been rolled into balance snapshots.
+stock_movement_partitions = MonthlyPartitionManager(
+    "stock_movements",
+    premake_months=settings.PARTITION_PREMAKE_MONTHS,
+    archive_detached=settings.PARTITION_ARCHIVE_DETACHED,
+)
+
+partitioned_tables: List[MonthlyPartitionManager] = [
+    transaction_event_partitions,
+    stock_movement_partitions,
+]
+
+
+async def maintain_partitions(session: AsyncSession, today: Optional[date] = None) -> Dict[str, Dict[str, object]]:
+    """Run maintenance for every partitioned table."""
+    return {manager.parent: await manager.maintain(session, today) for manager in partitioned_tables}
@@ -5,20 +5,29 @@ from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import uvicorn
 
 from app.core.config import settings
 from app.core.database import db_manager
+from app.core.logging_config import logging_manager
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import render_metrics
+from app.core.middleware import (
+    add_admission_control_middleware,
+    add_loop_blocking_guard_middleware,
+    add_metrics_middleware,
+    add_query_profiling_middleware,
+    add_read_your_writes_middleware,
+)
 from app.core.redis import redis_manager
+from app.core.scheduler import start_scheduler, stop_scheduler
+from app.core.security import PasswordHashingBusyError, password_hasher
+from app.services.background_job import background_job_runner
 from app.api.v1.api import api_router
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s' if settings.LOG_FORMAT == "text"
-    else '{"time": "%(asctime)s", "name": "%(name)s", "level": "%(levelname)s", "message": "%(message)s"}',
-)
+# Logging is configured on import of app.core.logging_config: records are
+# queued on the request path and written by a background listener thread.
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +56,14 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to connect to Redis: {e}")
         # Allow app to run without Redis
     
+    if settings.METRICS_ENABLED or settings.EVENT_LOOP_BLOCK_STRICT:
+        loop_monitor.interval = settings.EVENT_LOOP_LAG_INTERVAL
+        loop_monitor.block_threshold = settings.event_loop_block_threshold
+        await loop_monitor.start()
+    
+    if settings.SCHEDULER_ENABLED and not settings.is_testing:
+        await start_scheduler()
+    
     logger.info(f"{settings.PROJECT_NAME} API started successfully")
     
     yield
@@ -54,6 +71,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info(f"Shutting down {settings.PROJECT_NAME} API...")
     
+    await stop_scheduler()
+    await background_job_runner.wait()
+    await loop_monitor.stop()
+    password_hasher.shutdown()
+    
     # Disconnect from database
     await db_manager.disconnect()
     
@@ -61,6 +83,9 @@ async def lifespan(app: FastAPI):
     await redis_manager.disconnect()
     
     logger.info(f"{settings.PROJECT_NAME} API shut down successfully")
+    
+    # Write out buffered log batches; listeners are stopped at interpreter exit
+    logging_manager.flush()
 
 
 # Create FastAPI application
@@ -90,6 +115,34 @@ if cors_origins:
 else:
     logger.warning("No CORS origins configured - CORS middleware not enabled")
 
+# Per-request SQL profiling (Server-Timing header and N+1 warnings)
+if settings.SQL_PROFILING_ENABLED:
+    add_query_profiling_middleware(
+        app, repeat_threshold=settings.SQL_PROFILING_REPEAT_THRESHOLD
+    )
+
+
+# Shed exports and reports before the interactive pool runs out
+if settings.low_priority_paths:
+    add_admission_control_middleware(
+        app, settings.low_priority_paths, max_utilization=settings.DB_ADMISSION_SHED_UTILIZATION
+    )
+
+
+# Request latency metrics per route template
+if settings.METRICS_ENABLED:
+    add_metrics_middleware(app)
+
+
+# Keep a client's reads on the primary right after its writes
+if settings.read_replica_urls:
+    add_read_your_writes_middleware(app)
+
+
+# Fail requests that block the event loop (development and test runs only)
+if settings.EVENT_LOOP_BLOCK_STRICT and not settings.is_production:
+    add_loop_blocking_guard_middleware(app, budget=settings.event_loop_block_threshold)
+
 
 # Add CORS debugging middleware
 @app.middleware("http")
@@ -210,6 +263,27 @@ async def readiness_check() -> dict[str, Any]:
     return response_data
 
 
+# Metrics endpoint
+@app.get(
+    "/metrics",
+    tags=["Health"],
+    summary="Runtime Metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=settings.METRICS_ENABLED,
+)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus-style metrics endpoint.
+    Exposes request latency, DB pool, Redis, cache, scheduler and event loop metrics.
+    """
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("Metrics disabled", status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        render_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 # Root endpoint
 @app.get("/", tags=["Root"])
 async def root() -> dict[str, str]:
@@ -229,6 +303,17 @@ async def root() -> dict[str, str]:
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+# Password hashing pool saturated: shed load instead of queueing indefinitely
+@app.exception_handler(PasswordHashingBusyError)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError):
+    logger.warning(f"Rejected {request.method} {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
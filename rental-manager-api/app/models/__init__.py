@@ -9,6 +9,13 @@ from app.models.contact_person import ContactPerson
 from app.models.unit_of_measurement import UnitOfMeasurement
 from app.models.item import Item
 from app.models.location import Location
+from app.models.price_book import PriceBook, PriceBookEntry
+from app.models.cache_version import CacheVersion
+from app.models.background_job import BackgroundJob, JobStatus
+from app.models.item_rental_block_history import ItemRentalBlockHistory
+from app.models.customer_credit_exposure import CustomerCreditExposure
+from app.models.entity_stat import EntityStatCounter
+from app.models.sku_counter import SkuCounter
 
 # Import transaction models
 from app.models.transaction import (
@@ -43,7 +50,9 @@ from app.models.inventory import (
     InventoryUnit,
     StockLevel,
     StockMovement,
+    StockBalanceSnapshot,
     SKUSequence,
+    InventoryAlert,
     # Inventory enums
     ItemStatus,
     InventoryUnitStatus,
@@ -67,6 +76,15 @@ __all__ = [
     "UnitOfMeasurement",
     "Item",
     "Location",
+    "PriceBook",
+    "PriceBookEntry",
+    "CacheVersion",
+    "BackgroundJob",
+    "JobStatus",
+    "ItemRentalBlockHistory",
+    "CustomerCreditExposure",
+    "EntityStatCounter",
+    "SkuCounter",
     
     # Transaction models
     "TransactionHeader",
@@ -99,7 +117,9 @@ __all__ = [
     "InventoryUnit",
     "StockLevel",
     "StockMovement",
+    "StockBalanceSnapshot",
     "SKUSequence",
+    "InventoryAlert",
     
     # Inventory enums
     "ItemStatus",
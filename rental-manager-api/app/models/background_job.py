@@ -0,0 +1,104 @@
+"""
+Background Job Model - Persistent record of long-running operations.
+
+Bulk operations (imports and the like) run outside the HTTP request. The
+request creates a job row and returns its id; the worker updates progress
+counters and the per-row error report as it goes, and clients poll the row.
+The table doubles as the work queue: workers claim PENDING rows, and
+``payload`` carries everything the handler needs to run. A job whose input
+lives on one host's disk names that host in ``claimable_by``.
+"""
+
+from __future__ import annotations
+from enum import Enum
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, JSON, String, Text
+
+from app.db.base import RentalManagerBaseModel
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a background job."""
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+FINISHED_STATUSES = (JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value)
+
+
+class BackgroundJob(RentalManagerBaseModel):
+    """
+    Background job with progress counters and a per-row error report.
+
+    Progress:
+        total_rows is set once the input size is known; processed_rows grows
+        as the worker goes. succeeded/failed/skipped/updated break down the
+        outcome per input row.
+
+    Cancellation:
+        A pending job is cancelled straight away. A running job gets
+        cancel_requested and stops at its next checkpoint; chunks committed
+        before that point stay applied.
+    """
+    __tablename__ = "background_jobs"
+
+    job_type = Column(String(50), nullable=False, index=True, comment="Kind of operation, e.g. item_import")
+    status = Column(
+        String(20),
+        nullable=False,
+        default=JobStatus.PENDING.value,
+        comment="PENDING, RUNNING, COMPLETED, FAILED or CANCELLED"
+    )
+    payload = Column(JSON, nullable=True, comment="Handler input, e.g. item ids and the operation")
+    idempotency_key = Column(
+        String(255),
+        nullable=True,
+        unique=True,
+        comment="Client-supplied key; resubmitting it returns the existing job"
+    )
+    claimable_by = Column(
+        String(255),
+        nullable=True,
+        comment="Host whose workers may claim the job; any worker when empty"
+    )
+    cancel_requested = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Set by a cancel request; the handler stops at its next checkpoint"
+    )
+
+    total_rows = Column(Integer, nullable=True, comment="Input size, once known")
+    processed_rows = Column(Integer, nullable=False, default=0, comment="Rows handled so far")
+    succeeded_rows = Column(Integer, nullable=False, default=0, comment="Rows inserted")
+    updated_rows = Column(Integer, nullable=False, default=0, comment="Rows that updated an existing record")
+    skipped_rows = Column(Integer, nullable=False, default=0, comment="Rows left unchanged")
+    failed_rows = Column(Integer, nullable=False, default=0, comment="Rows rejected")
+
+    errors = Column(JSON, nullable=True, comment="Per-row errors: [{row, field, message}]")
+    result = Column(JSON, nullable=True, comment="Job-specific summary")
+    error_message = Column(Text, nullable=True, comment="Reason the job failed")
+
+    started_at = Column(DateTime(timezone=True), nullable=True, comment="When the worker picked the job up")
+    finished_at = Column(DateTime(timezone=True), nullable=True, comment="When the job completed, failed or was cancelled")
+
+    __table_args__ = (
+        Index("idx_background_job_status_created", "status", "created_at"),
+    )
+
+    @property
+    def progress(self) -> float:
+        """Fraction of rows processed (0 until the total is known)."""
+        if not self.total_rows:
+            return 1.0 if self.is_finished else 0.0
+        return min(self.processed_rows / self.total_rows, 1.0)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(id={self.id}, type={self.job_type}, status={self.status})>"
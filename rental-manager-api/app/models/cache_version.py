@@ -0,0 +1,30 @@
+"""
+Cache Version Models - Version counters of data cached per worker.
+
+Each row counts the committed edits of one cached data set (its namespace):
+``price_books`` for the compiled price books, ``catalog:<table>`` for cached
+catalog responses, ``stats:<entity>`` for statistics snapshots. Readers key
+what they cache by the version and rebuild it once the version moves.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, String
+
+from app.db.base import RentalManagerBaseModel
+
+
+class CacheVersion(RentalManagerBaseModel):
+    """
+    Version counter for data compiled into per-worker caches.
+
+    Writers bump ``version`` in the same transaction as their edit; readers
+    compare it with the version their cache was built from.
+    """
+    __tablename__ = "cache_versions"
+
+    namespace = Column(String(100), nullable=False, unique=True, comment="Cached data set")
+    version = Column(BigInteger, nullable=False, default=1, comment="Incremented on every edit")
+
+    def __repr__(self) -> str:
+        return f"<CacheVersion(namespace='{self.namespace}', version={self.version})>"
@@ -0,0 +1,58 @@
+"""
+Customer Credit Exposure Model - Running totals behind the sales credit check.
+
+One row per customer with open (unpaid, not cancelled) sales. Sale creation,
+payment and cancellation adjust the row in the same transaction as the sale
+itself, so the credit check reads one row instead of aggregating the
+customer's sales. A nightly reconcile recomputes every row from
+``transaction_headers`` and corrects any drift.
+"""
+
+from __future__ import annotations
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.db.base import RentalManagerBaseModel
+
+
+class CustomerCreditExposure(RentalManagerBaseModel):
+    """Outstanding sales balance and due dates for a customer."""
+    __tablename__ = "customer_credit_exposures"
+
+    customer_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("customers.id", name="fk_customer_credit_exposure_customer", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="Customer the exposure belongs to"
+    )
+    outstanding_balance = Column(
+        Numeric(15, 2), nullable=False, default=0,
+        comment="Sum of balance due over open sales"
+    )
+    open_sales_count = Column(Integer, nullable=False, default=0, comment="Number of open sales")
+    oldest_due_date = Column(Date, nullable=True, comment="Earliest due date among open sales")
+    overdue_count = Column(
+        Integer, nullable=False, default=0,
+        comment="Open sales past their due date (exact as of the last reconcile)"
+    )
+
+    @property
+    def oldest_overdue_date(self) -> Optional[date]:
+        """Earliest due date that has already passed, if any."""
+        if self.oldest_due_date and self.oldest_due_date < date.today():
+            return self.oldest_due_date
+        return None
+
+    @property
+    def has_overdue(self) -> bool:
+        return self.oldest_overdue_date is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"<CustomerCreditExposure(customer_id={self.customer_id}, "
+            f"outstanding_balance={self.outstanding_balance})>"
+        )
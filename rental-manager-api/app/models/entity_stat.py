@@ -0,0 +1,37 @@
+"""
+Entity Statistics Models - Counter table behind the master-data stats.
+
+Each row is one counter: how many rows of ``entity`` fall in ``bucket`` of
+``dimension`` (e.g. items / is_rentable / true), or for a measure the
+number of non-null values and their ``total``. Counters are kept up to
+date by the session hooks of ``app.crud.entity_stats.track_counted_writes``
+and checked against the source tables by a periodic reconcile.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, Numeric, String, UniqueConstraint
+
+from app.db.base import RentalManagerBaseModel
+
+
+class EntityStatCounter(RentalManagerBaseModel):
+    """One statistics counter for one entity, dimension and bucket."""
+    __tablename__ = "entity_stat_counters"
+
+    entity = Column(String(50), nullable=False, comment="Counted table, e.g. 'items'")
+    dimension = Column(String(50), nullable=False, comment="Counted attribute or measure")
+    bucket = Column(String(255), nullable=False, default="", comment="Attribute value ('' for measures)")
+    count = Column(BigInteger, nullable=False, default=0, comment="Rows in the bucket (non-null values for a measure)")
+    total = Column(Numeric(18, 2), nullable=False, default=0, comment="Sum of a measure's values")
+
+    __table_args__ = (
+        # Also serves the per-entity read, which filters on the leading column
+        UniqueConstraint("entity", "dimension", "bucket", name="uq_entity_stat_counter"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntityStatCounter(entity='{self.entity}', dimension='{self.dimension}', "
+            f"bucket='{self.bucket}', count={self.count})>"
+        )
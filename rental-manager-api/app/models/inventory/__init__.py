@@ -16,6 +16,9 @@ from app.models.inventory.enums import (
     StockStatus,
     ReservationStatus,
     TransferStatus,
+    InventoryAlertType,
+    InventoryAlertSeverity,
+    InventoryAlertStatus,
     get_movement_category,
     is_positive_movement,
     is_negative_movement,
@@ -25,9 +28,11 @@ from app.models.inventory.enums import (
 )
 
 from app.models.inventory.stock_movement import StockMovement
+from app.models.inventory.stock_balance_snapshot import StockBalanceSnapshot
 from app.models.inventory.stock_level import StockLevel
 from app.models.inventory.inventory_unit import InventoryUnit
 from app.models.inventory.sku_sequence import SKUSequence
+from app.models.inventory.inventory_alert import InventoryAlert
 
 __all__ = [
     # Enums
@@ -42,6 +47,9 @@ __all__ = [
     "StockStatus",
     "ReservationStatus",
     "TransferStatus",
+    "InventoryAlertType",
+    "InventoryAlertSeverity",
+    "InventoryAlertStatus",
     
     # Enum helpers
     "get_movement_category",
@@ -53,7 +61,9 @@ __all__ = [
     
     # Models
     "StockMovement",
+    "StockBalanceSnapshot",
     "StockLevel",
     "InventoryUnit",
     "SKUSequence",
+    "InventoryAlert",
 ]
\ No newline at end of file
@@ -156,6 +156,30 @@ class TransferStatus(str, Enum):
     REJECTED = "REJECTED"
 
 
+class InventoryAlertType(str, Enum):
+    """Conditions the inventory alert engine raises alerts for."""
+    LOW_STOCK = "LOW_STOCK"
+    MAINTENANCE_DUE = "MAINTENANCE_DUE"
+    WARRANTY_EXPIRING = "WARRANTY_EXPIRING"
+
+
+class InventoryAlertSeverity(str, Enum):
+    """Severity of an inventory alert."""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+class InventoryAlertStatus(str, Enum):
+    """
+    Lifecycle of an inventory alert.
+    Open and acknowledged alerts are live; resolved ones are history.
+    """
+    OPEN = "OPEN"
+    ACKNOWLEDGED = "ACKNOWLEDGED"
+    RESOLVED = "RESOLVED"
+
+
 # Helper functions for enum operations
 
 def get_movement_category(movement_type: StockMovementType) -> str:
@@ -0,0 +1,94 @@
+"""
+Inventory Alert Model - Materialized alert state.
+
+Alerts are raised, refreshed and resolved by the alert engine when stock
+levels or unit dates change, and by a scheduled sweep for conditions that
+only depend on the passage of time. Reads serve straight from this table,
+so listing alerts costs the same however large the inventory is.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Numeric, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.db.base import RentalManagerBaseModel
+from app.models.inventory.enums import InventoryAlertStatus
+
+
+OPEN_ALERT_CLAUSE = text("status <> 'RESOLVED'")
+
+
+class InventoryAlert(RentalManagerBaseModel):
+    """
+    One alert about one stock level or inventory unit.
+
+    At most one alert per (alert_type, subject) is live (open or
+    acknowledged) at a time; re-evaluating a subject refreshes that alert
+    instead of raising a duplicate. Resolved alerts are kept as history.
+    """
+    __tablename__ = "inventory_alerts"
+
+    alert_type = Column(String(30), nullable=False, comment="InventoryAlertType")
+    severity = Column(String(20), nullable=False, comment="InventoryAlertSeverity")
+    status = Column(
+        String(20),
+        nullable=False,
+        default=InventoryAlertStatus.OPEN.value,
+        comment="InventoryAlertStatus"
+    )
+
+    subject_id = Column(
+        PostgresUUID(as_uuid=True),
+        nullable=False,
+        comment="Stock level (LOW_STOCK) or inventory unit the alert is about"
+    )
+    item_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("items.id", name="fk_inventory_alert_item", ondelete="CASCADE"),
+        nullable=False,
+        comment="Item the alert is about"
+    )
+    location_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("locations.id", name="fk_inventory_alert_location", ondelete="CASCADE"),
+        nullable=True,
+        comment="Location of the stock level or unit"
+    )
+
+    message = Column(Text, nullable=False, comment="Human-readable alert text")
+    quantity = Column(Numeric(10, 2), nullable=True, comment="Available quantity (LOW_STOCK)")
+    threshold = Column(Numeric(10, 2), nullable=True, comment="Reorder point that was crossed (LOW_STOCK)")
+    due_date = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Maintenance date or warranty expiry the alert is about"
+    )
+
+    raised_at = Column(DateTime(timezone=True), nullable=False, comment="When the alert was raised")
+    acknowledged_at = Column(DateTime(timezone=True), nullable=True)
+    acknowledged_by = Column(PostgresUUID(as_uuid=True), nullable=True, comment="User who acknowledged the alert")
+    resolved_at = Column(DateTime(timezone=True), nullable=True, comment="When the condition cleared")
+
+    __table_args__ = (
+        # Deduplication: one live alert per condition and subject
+        Index(
+            "uq_inventory_alert_live_subject",
+            "alert_type", "subject_id",
+            unique=True,
+            postgresql_where=OPEN_ALERT_CLAUSE,
+            sqlite_where=OPEN_ALERT_CLAUSE,
+        ),
+        Index("idx_inventory_alert_status_raised", "status", "raised_at"),
+        Index("idx_inventory_alert_location_status_raised", "location_id", "status", "raised_at"),
+    )
+
+    @property
+    def is_live(self) -> bool:
+        return self.status != InventoryAlertStatus.RESOLVED.value
+
+    def __repr__(self) -> str:
+        return (
+            f"<InventoryAlert(alert_type={self.alert_type}, subject_id={self.subject_id}, "
+            f"status={self.status})>"
+        )
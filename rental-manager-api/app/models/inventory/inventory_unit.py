@@ -357,6 +357,8 @@ class InventoryUnit(RentalManagerBaseModel):
         Index("idx_inventory_unit_batch", "batch_code"),
         Index("idx_inventory_unit_available", "item_id", "location_id", "status"),
         Index("idx_inventory_unit_rental_blocked", "is_rental_blocked"),
+        Index("idx_inventory_unit_next_maintenance", "next_maintenance_date"),
+        Index("idx_inventory_unit_warranty_expiry", "warranty_expiry"),
         
         # Constraints
         CheckConstraint(
@@ -0,0 +1,132 @@
+"""
+Stock Balance Snapshot Model - Monthly roll-up of the stock movement ledger.
+
+Closed months of ``stock_movements`` are compacted into one row per
+(item, location, month) so summaries and balances read a handful of
+snapshot rows plus the recent, still-open partitions instead of the whole
+movement history.
+"""
+
+from __future__ import annotations
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import (
+    Column, Date, DateTime, ForeignKey, Index, Integer, JSON, Numeric, UniqueConstraint
+)
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.db.base import RentalManagerBaseModel
+
+
+class StockBalanceSnapshot(RentalManagerBaseModel):
+    """
+    Per-month movement totals and closing balance for one stock position.
+
+    This model provides:
+    - Opening and closing quantity for the month
+    - Movement count and increase/decrease totals
+    - Count and quantity breakdown by movement type
+
+    Rows are derived data: the compaction job rebuilds a month from the
+    ledger, so they are never edited by hand.
+    """
+    __tablename__ = "stock_balance_snapshots"
+
+    item_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("items.id", name="fk_stock_balance_snapshot_item"),
+        nullable=False,
+        comment="Item the snapshot covers"
+    )
+
+    location_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("locations.id", name="fk_stock_balance_snapshot_location"),
+        nullable=False,
+        comment="Location the snapshot covers"
+    )
+
+    period_start = Column(
+        Date,
+        nullable=False,
+        comment="First day of the (UTC) month the snapshot covers"
+    )
+
+    # Balances
+    opening_quantity = Column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0"),
+        comment="Quantity before the first movement of the month"
+    )
+
+    closing_quantity = Column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0"),
+        comment="Quantity after the last movement of the month"
+    )
+
+    # Totals
+    movement_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of movements in the month"
+    )
+
+    total_increase = Column(
+        Numeric(14, 2),
+        nullable=False,
+        default=Decimal("0"),
+        comment="Sum of positive quantity changes"
+    )
+
+    total_decrease = Column(
+        Numeric(14, 2),
+        nullable=False,
+        default=Decimal("0"),
+        comment="Sum of negative quantity changes (as a positive number)"
+    )
+
+    movements_by_type = Column(
+        JSON,
+        nullable=False,
+        default=dict,
+        comment="Movement count per movement type"
+    )
+
+    quantity_by_type = Column(
+        JSON,
+        nullable=False,
+        default=dict,
+        comment="Absolute quantity moved per movement type"
+    )
+
+    compacted_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        comment="When the month was last compacted"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "item_id", "location_id", "period_start",
+            name="uq_stock_balance_snapshot_period"
+        ),
+        Index("idx_stock_balance_snapshot_period", "period_start"),
+        Index("idx_stock_balance_snapshot_location_period", "location_id", "period_start"),
+    )
+
+    @property
+    def net_change(self) -> Decimal:
+        """Net quantity change over the month."""
+        return (self.total_increase or Decimal("0")) - (self.total_decrease or Decimal("0"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<StockBalanceSnapshot(item={self.item_id}, location={self.location_id}, "
+            f"period={self.period_start}, closing={self.closing_quantity})>"
+        )
@@ -15,7 +15,7 @@ from sqlalchemy import (
     Boolean, Column, DateTime, Enum, ForeignKey, Index, 
     Numeric, String, Text, UniqueConstraint, CheckConstraint
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import declared_attr, relationship
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 
 from app.db.base import RentalManagerBaseModel
@@ -151,9 +151,10 @@ class StockMovement(RentalManagerBaseModel):
         comment="User who approved this movement (for adjustments)"
     )
     
-    # Timestamps
+    # Timestamps (partition key, so part of the table's primary key)
     movement_date = Column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         default=datetime.utcnow,
         comment="When the movement occurred"
@@ -203,6 +204,14 @@ class StockMovement(RentalManagerBaseModel):
         lazy="select"
     )
     
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        # The table PK is (movement_date, id) because PostgreSQL requires the
+        # partition key in it; ORM identity stays the UUID alone.
+        return {"primary_key": [cls.__table__.c.id]}
+    
+    # Range-partitioned by month (see app/db/partitioning.py); closed months
+    # are rolled into StockBalanceSnapshot rows by the compaction job.
     __table_args__ = (
         # Indexes for performance
         Index("idx_stock_movement_stock_level", "stock_level_id"),
@@ -213,6 +222,8 @@ class StockMovement(RentalManagerBaseModel):
         Index("idx_stock_movement_item_date", "item_id", "movement_date"),
         Index("idx_stock_movement_location_date", "location_id", "movement_date"),
         Index("idx_stock_movement_transaction", "transaction_header_id", "transaction_line_id"),
+        # The PK leads with movement_date; lookups by id need their own index
+        Index("idx_stock_movement_id", "id"),
         
         # Constraints
         CheckConstraint(
@@ -227,6 +238,7 @@ class StockMovement(RentalManagerBaseModel):
             "abs(quantity_before + quantity_change - quantity_after) < 0.01",
             name="check_quantity_math"
         ),
+        {"postgresql_partition_by": "RANGE (movement_date)"},
     )
     
     def __init__(
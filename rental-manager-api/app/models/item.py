@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 from sqlalchemy import (
-    Column, String, Text, Boolean, Numeric, DateTime, Integer, Index, ForeignKey, event
+    Column, String, Text, Boolean, Numeric, DateTime, Integer, Index, ForeignKey, event, text
 )
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.dialects.postgresql import UUID as SA_UUID
@@ -307,6 +307,8 @@ class Item(RentalManagerBaseModel):
         # Core search indexes
         Index('idx_item_name_active', 'item_name', 'is_active'),
         Index('idx_item_sku_active', 'sku', 'is_active'),
+        # Case-insensitive SKU uniqueness; also serves the upper(sku) lookups
+        Index('uq_item_sku_upper', text('upper(sku)'), unique=True),
         Index('idx_item_status_active', 'status', 'is_active'),
         
         # Relationship indexes
@@ -0,0 +1,38 @@
+"""
+Item Rental Block History Model - Audit trail of rental block changes.
+
+One row per change of ``Item.is_rental_blocked``, whether made by a user
+(single or bulk toggle) or by the auto-unblock sweep. Bulk paths write
+their rows with one multi-row ``INSERT`` per chunk.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.db.base import RentalManagerBaseModel
+
+
+class ItemRentalBlockHistory(RentalManagerBaseModel):
+    """Rental block status change for an item."""
+    __tablename__ = "item_rental_block_history"
+
+    item_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("items.id", name="fk_item_rental_block_history_item", ondelete="CASCADE"),
+        nullable=False,
+        comment="Item whose rental status changed"
+    )
+    is_blocked = Column(Boolean, nullable=False, comment="Rental blocked after the change")
+    previous_status = Column(Boolean, nullable=False, comment="Rental blocked before the change")
+    remarks = Column(Text, nullable=True, comment="Reason given for the change")
+    changed_by = Column(PostgresUUID(as_uuid=True), nullable=True, comment="User who made the change (null for automatic changes)")
+    changed_at = Column(DateTime(timezone=True), nullable=False, comment="When the change was made")
+
+    __table_args__ = (
+        Index("idx_item_rental_block_history_item_changed", "item_id", "changed_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ItemRentalBlockHistory(item_id={self.item_id}, is_blocked={self.is_blocked})>"
@@ -0,0 +1,212 @@
+"""
+Price Book Models - Effective-dated rate tables.
+
+A price book is a set of item rates that applies from ``effective_from`` up
+to (but excluding) ``effective_to``, optionally narrowed to one location
+and/or one customer segment (``Customer.customer_tier``). Books are compiled
+into an in-memory lookup per worker; every edit bumps the ``price_books``
+cache version so workers rebuild it.
+"""
+
+from __future__ import annotations
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint, Column, Date, ForeignKey, Index, Integer,
+    Numeric, String, Text, UniqueConstraint
+)
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy.orm import relationship
+
+from app.db.base import RentalManagerBaseModel
+from app.models.customer import CustomerTier
+
+
+class PriceBook(RentalManagerBaseModel):
+    """
+    Effective-dated rate table.
+
+    Scope:
+        location_id / customer_segment: None means the book applies to every
+        location / segment. When several books match, the most specific scope
+        wins, then the highest ``priority``, then the latest ``effective_from``.
+    """
+    __tablename__ = "price_books"
+
+    name = Column(String(100), nullable=False, comment="Price book name")
+    code = Column(String(30), nullable=False, unique=True, index=True, comment="Unique price book code")
+    description = Column(Text, nullable=True, comment="Price book description")
+
+    location_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("locations.id", name="fk_price_book_location"),
+        nullable=True,
+        comment="Location the book is limited to (all locations if null)"
+    )
+
+    customer_segment = Column(
+        String(20),
+        nullable=True,
+        comment="Customer tier the book is limited to (all customers if null)"
+    )
+
+    effective_from = Column(Date, nullable=False, comment="First day the rates apply")
+    effective_to = Column(Date, nullable=True, comment="First day the rates no longer apply (open-ended if null)")
+    priority = Column(Integer, nullable=False, default=0, comment="Higher wins between books of the same scope")
+
+    entries = relationship(
+        "PriceBookEntry",
+        back_populates="price_book",
+        cascade="all, delete-orphan",
+        lazy="select"
+    )
+
+    __table_args__ = (
+        Index("idx_price_book_scope", "location_id", "customer_segment", "effective_from"),
+        CheckConstraint(
+            "effective_to IS NULL OR effective_to > effective_from",
+            name="check_price_book_effective_range"
+        ),
+        CheckConstraint(
+            "customer_segment IS NULL OR customer_segment IN ('BRONZE', 'SILVER', 'GOLD', 'PLATINUM')",
+            name="check_price_book_customer_segment"
+        ),
+    )
+
+    def __init__(
+        self,
+        name: str,
+        code: str,
+        effective_from: date,
+        effective_to: Optional[date] = None,
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None,
+        priority: int = 0,
+        description: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Initialize a PriceBook.
+
+        Args:
+            name: Price book name
+            code: Unique price book code
+            effective_from: First day the rates apply
+            effective_to: First day the rates no longer apply
+            location_id: Optional location scope
+            customer_segment: Optional customer tier scope
+            priority: Tie-breaker between books of the same scope
+            description: Optional description
+            **kwargs: Additional BaseModel fields
+        """
+        if 'is_active' not in kwargs:
+            kwargs['is_active'] = True
+
+        super().__init__(**kwargs)
+        self.name = name
+        self.code = code
+        self.effective_from = effective_from
+        self.effective_to = effective_to
+        self.location_id = location_id
+        self.customer_segment = customer_segment
+        self.priority = priority
+        self.description = description
+        self._validate()
+
+    def _validate(self):
+        """Validate price book business rules."""
+        if not self.name or not self.name.strip():
+            raise ValueError("Price book name cannot be empty")
+
+        if not self.code or not self.code.strip():
+            raise ValueError("Price book code cannot be empty")
+        self.code = self.code.strip().upper()
+
+        if self.effective_to and self.effective_to <= self.effective_from:
+            raise ValueError("Price book effective_to must be after effective_from")
+
+        if self.customer_segment is not None:
+            self.customer_segment = CustomerTier(self.customer_segment).value
+
+    def covers(self, on: date) -> bool:
+        """Whether the book's rates apply on ``on``."""
+        return self.effective_from <= on and (self.effective_to is None or on < self.effective_to)
+
+    def __repr__(self) -> str:
+        return f"<PriceBook(id={self.id}, code='{self.code}', from={self.effective_from}, to={self.effective_to})>"
+
+
+class PriceBookEntry(RentalManagerBaseModel):
+    """
+    Rates for one item in one price book.
+
+    ``weekly_rate`` and ``monthly_rate`` replace the generic duration tier
+    multipliers for long rentals when set.
+    """
+    __tablename__ = "price_book_entries"
+
+    price_book_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("price_books.id", name="fk_price_book_entry_book", ondelete="CASCADE"),
+        nullable=False,
+        comment="Owning price book"
+    )
+
+    item_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("items.id", name="fk_price_book_entry_item"),
+        nullable=False,
+        index=True,
+        comment="Priced item"
+    )
+
+    rental_rate_per_day = Column(Numeric(10, 2), nullable=False, comment="Daily rental rate")
+    weekly_rate = Column(Numeric(10, 2), nullable=True, comment="Rate for 7 days")
+    monthly_rate = Column(Numeric(10, 2), nullable=True, comment="Rate for 30 days")
+    sale_price = Column(Numeric(10, 2), nullable=True, comment="Selling price")
+    security_deposit = Column(Numeric(10, 2), nullable=True, comment="Deposit per unit; item default if null")
+
+    price_book = relationship("PriceBook", back_populates="entries", lazy="select")
+
+    __table_args__ = (
+        UniqueConstraint("price_book_id", "item_id", name="uq_price_book_entry_item"),
+        CheckConstraint("rental_rate_per_day >= 0", name="check_price_book_entry_rate_positive"),
+    )
+
+    def __init__(
+        self,
+        price_book_id: UUID,
+        item_id: UUID,
+        rental_rate_per_day: Decimal,
+        weekly_rate: Optional[Decimal] = None,
+        monthly_rate: Optional[Decimal] = None,
+        sale_price: Optional[Decimal] = None,
+        security_deposit: Optional[Decimal] = None,
+        **kwargs
+    ):
+        if 'is_active' not in kwargs:
+            kwargs['is_active'] = True
+
+        super().__init__(**kwargs)
+        self.price_book_id = price_book_id
+        self.item_id = item_id
+        self.rental_rate_per_day = rental_rate_per_day
+        self.weekly_rate = weekly_rate
+        self.monthly_rate = monthly_rate
+        self.sale_price = sale_price
+        self.security_deposit = security_deposit
+        self._validate()
+
+    def _validate(self):
+        """Validate entry business rules."""
+        for name in ("rental_rate_per_day", "weekly_rate", "monthly_rate", "sale_price", "security_deposit"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} cannot be negative")
+
+    def __repr__(self) -> str:
+        return f"<PriceBookEntry(book={self.price_book_id}, item={self.item_id}, rate={self.rental_rate_per_day})>"
+
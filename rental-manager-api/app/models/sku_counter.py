@@ -0,0 +1,27 @@
+"""
+SKU Counter Models - Numbering state for generated item SKUs.
+
+Each row numbers one SKU template: the pattern with everything but the
+counter (and date/time fields) filled in, e.g. ``ELEC-{counter:05d}`` for
+the default pattern of a category coded ELEC, or ``ITEM-{counter:05d}``
+for uncategorised items. ``SKUGenerator`` reserves numbers by incrementing
+``next_value`` in a single statement, so the row lock serialises writers
+and a rolled-back reservation hands its numbers back.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, String
+
+from app.db.base import RentalManagerBaseModel
+
+
+class SkuCounter(RentalManagerBaseModel):
+    """Next number to hand out for one SKU template."""
+    __tablename__ = "sku_counters"
+
+    template = Column(String(255), nullable=False, unique=True, comment="SKU template the counter numbers")
+    next_value = Column(BigInteger, nullable=False, default=1, comment="First number not yet handed out")
+
+    def __repr__(self) -> str:
+        return f"<SkuCounter(template='{self.template}', next_value={self.next_value})>"
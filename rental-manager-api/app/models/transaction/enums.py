@@ -47,6 +47,14 @@ class RentalPricingType(str, PyEnum):
     FLAT_RATE = "FLAT_RATE"
 
 
+class RentalPricingStrategy(str, PyEnum):
+    """Rental pricing calculation strategies."""
+    STANDARD = "STANDARD"  # Fixed daily/weekly/monthly rates
+    DYNAMIC = "DYNAMIC"    # Demand-based pricing
+    SEASONAL = "SEASONAL"  # Season-adjusted pricing
+    TIERED = "TIERED"     # Duration-based discounts
+
+
 class DamageSeverity(str, PyEnum):
     """Severity levels for damage assessment."""
     NONE = "NONE"
@@ -121,7 +129,8 @@ __all__ = [
     
     # Additional service enums
     "DiscountType",
-    "RentalPricingType", 
+    "RentalPricingType",
+    "RentalPricingStrategy", 
     "DamageSeverity",
     "ReturnType",
     "ReturnStatus",
@@ -10,7 +10,7 @@ from uuid import UUID
 from sqlalchemy import (
     Column, String, Text, DateTime, JSON, ForeignKey, Index, Integer
 )
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.orm import declared_attr, relationship, Mapped, mapped_column
 
 from app.db.base import RentalManagerBaseModel, UUIDType
 
@@ -98,9 +98,10 @@ class TransactionEvent(RentalManagerBaseModel):
         comment="Correlation ID for tracking across services"
     )
     
-    # Timing information
+    # Timing information (partition key, so part of the table's primary key)
     event_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         default=lambda: datetime.now(timezone.utc),
         comment="When this event occurred"
@@ -141,7 +142,14 @@ class TransactionEvent(RentalManagerBaseModel):
         "TransactionHeader", back_populates="events", lazy="select"
     )
     
-    # Table constraints and indexes
+    @declared_attr.directive
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        # The table PK is (event_timestamp, id) because PostgreSQL requires the
+        # partition key in it; ORM identity stays the UUID alone.
+        return {"primary_key": [cls.__table__.c.id]}
+    
+    # Table constraints and indexes. The table is range-partitioned by month
+    # (see app/db/partitioning.py); partitions are created by maintenance.
     __table_args__ = (
         Index('idx_transaction_events_transaction_id', 'transaction_id'),
         Index('idx_transaction_events_event_type', 'event_type'),
@@ -154,6 +162,9 @@ class TransactionEvent(RentalManagerBaseModel):
         # Composite indexes for common query patterns
         Index('idx_transaction_events_tx_type_time', 'transaction_id', 'event_type', 'event_timestamp'),
         Index('idx_transaction_events_category_status', 'event_category', 'status', 'event_timestamp'),
+        # The PK leads with event_timestamp; lookups by id need their own index
+        Index('idx_transaction_events_id', 'id'),
+        {"postgresql_partition_by": "RANGE (event_timestamp)"},
     )
     
     def __init__(
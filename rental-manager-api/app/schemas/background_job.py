@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.background_job import JobStatus
+
+
+class BackgroundJobResponse(BaseModel):
+    """Schema for background job status polling."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(..., description="Job unique identifier")
+    job_type: str = Field(..., description="Kind of operation")
+    status: JobStatus = Field(..., description="Job status")
+    progress: float = Field(..., ge=0, le=1, description="Fraction of rows processed")
+    total_rows: Optional[int] = Field(None, description="Input size, once known")
+    processed_rows: int = Field(0, description="Rows handled so far")
+    succeeded_rows: int = Field(0, description="Rows inserted")
+    updated_rows: int = Field(0, description="Rows that updated an existing record")
+    skipped_rows: int = Field(0, description="Rows left unchanged")
+    failed_rows: int = Field(0, description="Rows rejected")
+    errors: Optional[List[Dict[str, Any]]] = Field(None, description="Per-row errors")
+    result: Optional[Dict[str, Any]] = Field(None, description="Job-specific summary")
+    error_message: Optional[str] = Field(None, description="Reason the job failed")
+    cancel_requested: bool = Field(False, description="Whether a cancel has been requested")
+    idempotency_key: Optional[str] = Field(None, description="Key the job was submitted with")
+    created_by: Optional[str] = Field(None, description="User who started the job")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    started_at: Optional[datetime] = Field(None, description="When the job started running")
+    finished_at: Optional[datetime] = Field(None, description="When the job completed, failed or was cancelled")
@@ -17,7 +17,8 @@ from app.schemas.inventory.base import (
     PriceUpdate,
     LocationTransfer,
     StockSummary,
-    InventoryAlert
+    InventoryAlert,
+    InventoryAlertResponse
 )
 
 # Stock Movement schemas
@@ -31,7 +32,9 @@ from app.schemas.inventory.stock_movement import (
     StockMovementSummary,
     BulkStockMovementCreate,
     RentalMovementCreate,
-    RentalReturnMovementCreate
+    RentalReturnMovementCreate,
+    StockBalanceSnapshotResponse,
+    StockItemLedgerResponse
 )
 
 # Stock Level schemas
@@ -96,6 +99,7 @@ __all__ = [
     "LocationTransfer",
     "StockSummary",
     "InventoryAlert",
+    "InventoryAlertResponse",
     
     # Stock Movement
     "StockMovementBase",
@@ -108,6 +112,8 @@ __all__ = [
     "BulkStockMovementCreate",
     "RentalMovementCreate",
     "RentalReturnMovementCreate",
+    "StockBalanceSnapshotResponse",
+    "StockItemLedgerResponse",
     
     # Stock Level
     "StockLevelBase",
@@ -198,4 +198,18 @@ class InventoryAlert(BaseModel):
                 "quantity": 5,
                 "threshold": 10
             }
-        }
\ No newline at end of file
+        }
+
+
+class InventoryAlertResponse(InventoryAlert):
+    """Live or resolved alert as stored by the alert engine."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID = Field(..., description="Alert ID")
+    status: str = Field(..., description="OPEN, ACKNOWLEDGED or RESOLVED")
+    subject_id: UUID = Field(..., description="Stock level or inventory unit the alert is about")
+    due_date: Optional[datetime] = Field(None, description="Maintenance date or warranty expiry")
+    raised_at: datetime = Field(..., description="When the alert was raised")
+    acknowledged_at: Optional[datetime] = Field(None, description="When the alert was acknowledged")
+    acknowledged_by: Optional[UUID] = Field(None, description="User who acknowledged the alert")
+    resolved_at: Optional[datetime] = Field(None, description="When the condition cleared")
\ No newline at end of file
@@ -4,7 +4,7 @@ Stock Movement Schemas.
 Pydantic schemas for stock movement operations.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, List, Dict
 from uuid import UUID
@@ -231,4 +231,25 @@ class MovementTypeStats(BaseModel):
     transfer_count: int = Field(0, description="Number of transfer movements")
     transfer_quantity: Decimal = Field(0, description="Total transfer quantity")
     adjustment_count: int = Field(0, description="Number of adjustment movements")
-    adjustment_quantity: Decimal = Field(0, description="Total adjustment quantity")
\ No newline at end of file
+    adjustment_quantity: Decimal = Field(0, description="Total adjustment quantity")
+
+class StockBalanceSnapshotResponse(InventoryBaseSchema):
+    """Compacted monthly balance of one item at one location."""
+    item_id: UUID = Field(..., description="Item ID")
+    location_id: UUID = Field(..., description="Location ID")
+    period_start: date = Field(..., description="First day of the compacted month")
+    opening_quantity: Decimal = Field(..., description="Quantity at the start of the month")
+    closing_quantity: Decimal = Field(..., description="Quantity at the end of the month")
+    movement_count: int = Field(..., description="Movements in the month")
+    total_increase: Decimal = Field(..., description="Total quantity increased")
+    total_decrease: Decimal = Field(..., description="Total quantity decreased")
+    movements_by_type: Dict[str, int] = Field(default_factory=dict, description="Count by movement type")
+    quantity_by_type: Dict[str, float] = Field(default_factory=dict, description="Quantity by movement type")
+
+
+class StockItemLedgerResponse(BaseModel):
+    """Latest compacted balances of an item plus its uncompacted movements."""
+    item_id: UUID = Field(..., description="Item ID")
+    compacted_through: Optional[date] = Field(None, description="Last month rolled into snapshots")
+    balances: List[StockBalanceSnapshotResponse] = Field(..., description="Latest snapshot per location")
+    movements: List[StockMovementResponse] = Field(..., description="Movements after the compacted months")
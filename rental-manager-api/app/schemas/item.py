@@ -607,4 +607,33 @@ class ItemDuplicate(BaseModel):
             if not v.strip():
                 raise ValueError('New SKU cannot be empty if provided')
             return v.strip().upper()
-        return v
\ No newline at end of file
+        return v
+
+class ItemSkuRegenerate(BaseModel):
+    """Schema for regenerating the SKUs of many items."""
+    
+    item_ids: List[UUID] = Field(..., min_length=1, description="List of item IDs")
+    pattern: Optional[str] = Field(None, description="Custom SKU pattern (default: category or ITEM pattern)")
+    new_category_id: Optional[UUID] = Field(None, description="Category to generate the SKUs for")
+    dry_run: bool = Field(False, description="Only report the changes that would be made")
+
+
+class ItemSkuChange(BaseModel):
+    """One SKU rewrite."""
+    
+    item_id: UUID = Field(..., description="Item ID")
+    old_sku: str = Field(..., description="Current SKU")
+    new_sku: str = Field(..., description="Regenerated SKU")
+
+
+class ItemSkuRegenerateResult(BaseModel):
+    """Schema for batch SKU regeneration results."""
+    
+    dry_run: bool = Field(..., description="Whether the changes were only previewed")
+    total_requested: int = Field(..., description="Total number of items requested")
+    changes: List[ItemSkuChange] = Field(..., description="Old and new SKU per item")
+    missing_items: List[UUID] = Field(default_factory=list, description="Requested IDs with no item")
+    conflicts: List[str] = Field(
+        default_factory=list,
+        description="New SKUs already held by other items (the run is refused if any)"
+    )
@@ -0,0 +1,123 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.models.customer import CustomerTier
+
+
+class PriceBookBase(BaseModel):
+    """Base price book schema with common fields."""
+
+    name: str = Field(..., min_length=1, max_length=100, description="Price book name")
+    code: str = Field(..., min_length=1, max_length=30, description="Unique price book code")
+    description: Optional[str] = Field(None, max_length=1000, description="Price book description")
+    location_id: Optional[UUID] = Field(None, description="Location the book is limited to")
+    customer_segment: Optional[CustomerTier] = Field(None, description="Customer tier the book is limited to")
+    effective_from: date = Field(..., description="First day the rates apply")
+    effective_to: Optional[date] = Field(None, description="First day the rates no longer apply")
+    priority: int = Field(0, description="Higher wins between books of the same scope")
+
+    @field_validator('code')
+    @classmethod
+    def validate_code(cls, v):
+        if not v.replace('-', '').replace('_', '').isalnum():
+            raise ValueError('Price book code must contain only letters, numbers, hyphens, and underscores')
+        return v.upper().strip()
+
+    @model_validator(mode="after")
+    def validate_effective_range(self) -> "PriceBookBase":
+        if self.effective_to and self.effective_to <= self.effective_from:
+            raise ValueError("effective_to must be after effective_from")
+        return self
+
+
+class PriceBookCreate(PriceBookBase):
+    """Schema for creating a new price book."""
+    pass
+
+
+class PriceBookUpdate(BaseModel):
+    """Schema for updating an existing price book."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=100, description="Price book name")
+    description: Optional[str] = Field(None, max_length=1000, description="Price book description")
+    location_id: Optional[UUID] = Field(None, description="Location the book is limited to")
+    customer_segment: Optional[CustomerTier] = Field(None, description="Customer tier the book is limited to")
+    effective_from: Optional[date] = Field(None, description="First day the rates apply")
+    effective_to: Optional[date] = Field(None, description="First day the rates no longer apply")
+    priority: Optional[int] = Field(None, description="Higher wins between books of the same scope")
+    is_active: Optional[bool] = Field(None, description="Price book active status")
+
+
+class PriceBookResponse(PriceBookBase):
+    """Schema for price book response."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(..., description="Price book unique identifier")
+    is_active: bool = Field(True, description="Price book active status")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+
+
+class PriceBookList(BaseModel):
+    """Schema for paginated price book list response."""
+
+    items: List[PriceBookResponse] = Field(..., description="List of price books")
+    total: int = Field(..., description="Total number of price books")
+    page: int = Field(..., description="Current page number")
+    page_size: int = Field(..., description="Number of items per page")
+    total_pages: int = Field(..., description="Total number of pages")
+    has_next: bool = Field(..., description="Whether there are more pages")
+    has_previous: bool = Field(..., description="Whether there are previous pages")
+
+
+class PriceBookEntryInput(BaseModel):
+    """Rates for one item in a price book."""
+
+    item_id: UUID = Field(..., description="Priced item")
+    rental_rate_per_day: Decimal = Field(..., ge=0, decimal_places=2, description="Daily rental rate")
+    weekly_rate: Optional[Decimal] = Field(None, ge=0, decimal_places=2, description="Rate for 7 days")
+    monthly_rate: Optional[Decimal] = Field(None, ge=0, decimal_places=2, description="Rate for 30 days")
+    sale_price: Optional[Decimal] = Field(None, ge=0, decimal_places=2, description="Selling price")
+    security_deposit: Optional[Decimal] = Field(None, ge=0, decimal_places=2, description="Deposit per unit")
+
+
+class PriceBookEntriesUpsert(BaseModel):
+    """Schema for inserting or replacing price book entries."""
+
+    entries: List[PriceBookEntryInput] = Field(..., min_length=1, max_length=5000)
+
+    @field_validator('entries')
+    @classmethod
+    def validate_unique_items(cls, v):
+        if len({entry.item_id for entry in v}) != len(v):
+            raise ValueError('Each item may appear only once')
+        return v
+
+
+class PriceBookEntryResponse(PriceBookEntryInput):
+    """Schema for price book entry response."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(..., description="Entry unique identifier")
+    price_book_id: UUID = Field(..., description="Owning price book")
+
+
+class ResolvedPriceResponse(BaseModel):
+    """Rate in effect for an item in a given context."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    item_id: UUID
+    price_book_id: UUID
+    rental_rate_per_day: Decimal
+    weekly_rate: Optional[Decimal] = None
+    monthly_rate: Optional[Decimal] = None
+    sale_price: Optional[Decimal] = None
+    security_deposit: Optional[Decimal] = None
+    version: int = Field(..., description="Price book version the rate was resolved from")
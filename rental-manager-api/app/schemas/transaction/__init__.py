@@ -29,6 +29,8 @@ from .rental import (
     RentalResponse,
     RentalReturnRequest,
     RentalExtensionRequest,
+    RentalQuoteRequest,
+    RentalQuoteResponse,
 )
 from .transaction_event import (
     TransactionEventCreate,
@@ -61,6 +63,8 @@ __all__ = [
     "RentalResponse",
     "RentalReturnRequest",
     "RentalExtensionRequest",
+    "RentalQuoteRequest",
+    "RentalQuoteResponse",
     # Transaction Event schemas
     "TransactionEventCreate",
     "TransactionEventUpdate",
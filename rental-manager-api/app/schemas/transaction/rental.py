@@ -11,11 +11,13 @@ from uuid import UUID
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing_extensions import Annotated
 
+from app.models.customer import CustomerTier
 from app.models.transaction.enums import (
     RentalStatus,
     PaymentMethod,
     PaymentStatus,
     RentalPricingType,
+    RentalPricingStrategy,
     DamageType,
     DamageSeverity,
 )
@@ -83,6 +85,7 @@ class RentalCreate(BaseModel):
     pickup_location_id: Optional[UUID] = None
     return_location_id: Optional[UUID] = None
     items: List[RentalItemCreate] = Field(..., min_length=1)
+    pricing_strategy: RentalPricingStrategy = RentalPricingStrategy.STANDARD
     delivery_required: bool = False
     delivery_address: Optional[str] = Field(None, max_length=500)
     delivery_fee: Annotated[Decimal, Field(ge=0, decimal_places=2)] = Decimal("0.00")
@@ -355,6 +358,72 @@ class RentalPricingResponse(BaseModel):
         from_attributes = True
 
 
+class RentalQuoteLineRequest(BaseModel):
+    """One line of a rental quote request."""
+    
+    item_id: UUID
+    quantity: Annotated[int, Field(gt=0)]
+    daily_rate: Optional[Annotated[Decimal, Field(ge=0, decimal_places=2)]] = Field(
+        None, description="Agreed daily rate; defaults to the item's catalog rate"
+    )
+    discount_percent: Optional[Annotated[Decimal, Field(ge=0, le=100)]] = None
+
+
+class RentalQuoteRequest(BaseModel):
+    """Schema for quoting a rental order without creating it."""
+    
+    rental_start_date: datetime
+    rental_end_date: datetime
+    pricing_strategy: RentalPricingStrategy = RentalPricingStrategy.STANDARD
+    location_id: Optional[UUID] = Field(None, description="Selects location price books")
+    customer_segment: Optional[CustomerTier] = Field(None, description="Selects customer tier price books")
+    items: List[RentalQuoteLineRequest] = Field(..., min_length=1, max_length=2000)
+    
+    @model_validator(mode="after")
+    def validate_dates(self) -> "RentalQuoteRequest":
+        """Validate rental dates."""
+        if self.rental_end_date <= self.rental_start_date:
+            raise ValueError("Rental end date must be after start date")
+        return self
+
+
+class RentalQuoteLineResponse(BaseModel):
+    """Priced line of a rental quote."""
+    
+    item_id: UUID
+    item_name: str
+    sku: str
+    quantity: int
+    rental_days: int
+    base_daily_rate: Decimal
+    applied_daily_rate: Decimal
+    subtotal: Decimal
+    discount_amount: Decimal
+    line_total: Decimal
+    deposit_amount: Decimal
+    price_book_id: Optional[UUID] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class RentalQuoteResponse(BaseModel):
+    """Response schema for a rental quote."""
+    
+    pricing_strategy: RentalPricingStrategy
+    rental_days: int
+    line_count: int
+    lines: List[RentalQuoteLineResponse]
+    subtotal: Decimal
+    discount_amount: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
+    security_deposit: Decimal
+    
+    class Config:
+        from_attributes = True
+
+
 class RentalMetrics(BaseModel):
     """Schema for rental metrics and analytics."""
     
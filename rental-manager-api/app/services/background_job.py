@@ -0,0 +1,350 @@
+"""
+Background job runner.
+
+The ``background_jobs`` table is the queue. ``BackgroundJobRunner.submit``
+records a pending job with its JSON payload and commits it, so the HTTP
+request returns the job id straight away and gives its pooled connection
+back. The job is then claimed and run on an asyncio task with a session of
+its own: straight away when the process has a free slot, otherwise by the
+scheduler's ``poll`` once one frees up (which also picks up jobs submitted
+by other processes). A job submitted with ``claimable_by`` set to a host
+name, such as a file import reading an upload spooled to local disk, is
+only claimed by runners on that host.
+
+Handlers are registered per job type with ``@job_handler`` and report
+progress through ``JobProgress``. Progress is written in short separate
+transactions that pollers can see while the handler is still running, and
+``checkpoint`` doubles as the cancellation point. ``run_in_chunks`` commits
+a bulk operation chunk by chunk so a large input never holds one long
+transaction.
+"""
+
+import asyncio
+import logging
+import socket
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import db_manager
+from app.core.errors import ConflictError, NotFoundError, ValidationError
+from app.crud.background_job import BackgroundJobRepository
+from app.models.background_job import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+class JobCancelledError(Exception):
+    """Raised at a checkpoint once a cancel has been requested."""
+
+
+class JobProgress:
+    """Progress writer and payload handed to a running job."""
+
+    def __init__(self, job_id: UUID, session_factory: SessionFactory, payload: Optional[Dict[str, Any]] = None):
+        self.job_id = job_id
+        self.payload = payload or {}
+        self._session_factory = session_factory
+
+    async def update(self, **values: Any) -> None:
+        """Write counters (``processed_rows`` etc.) to the job row and commit."""
+        async with self._session_factory() as session:
+            await BackgroundJobRepository(session).update_fields(self.job_id, **values)
+            await session.commit()
+
+    async def checkpoint(self, **values: Any) -> None:
+        """Write progress, then raise ``JobCancelledError`` if the job was cancelled."""
+        async with self._session_factory() as session:
+            repository = BackgroundJobRepository(session)
+            if values:
+                await repository.update_fields(self.job_id, **values)
+            cancelled = await repository.is_cancel_requested(self.job_id)
+            await session.commit()
+        if cancelled:
+            raise JobCancelledError(f"Job {self.job_id} was cancelled")
+
+
+JobHandler = Callable[[AsyncSession, JobProgress], Awaitable[Optional[Dict[str, Any]]]]
+
+# Handlers by job type, filled in by the modules that own each operation
+job_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the handler that runs jobs of ``job_type``."""
+    def register(func: JobHandler) -> JobHandler:
+        job_handlers[job_type] = func
+        return func
+    return register
+
+
+@dataclass
+class ChunkResult:
+    """Outcome of one chunk of a bulk job."""
+    succeeded: int = 0
+    skipped: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+async def run_in_chunks(
+    session: AsyncSession,
+    progress: JobProgress,
+    rows: Sequence[Any],
+    handle_chunk: Callable[[List[Any]], Awaitable[ChunkResult]],
+    chunk_size: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Run ``handle_chunk`` over ``rows`` one committed chunk at a time.
+
+    Each entry in ``ChunkResult.errors`` is one failed row. A chunk that
+    raises is rolled back and all of its rows are reported as failed.
+    Progress is checkpointed after every chunk, so a cancel stops the job
+    between chunks and leaves the committed ones applied.
+    """
+    chunk_size = chunk_size or settings.JOB_CHUNK_SIZE
+    succeeded = skipped = failed = 0
+    errors: List[Dict[str, Any]] = []
+
+    for offset in range(0, len(rows), chunk_size):
+        chunk = list(rows[offset:offset + chunk_size])
+        try:
+            outcome = await handle_chunk(chunk)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"Job {progress.job_id} chunk at row {offset + 1} failed: {e}")
+            outcome = ChunkResult(errors=[
+                {"row": offset + position, "error": str(e)} for position in range(1, len(chunk) + 1)
+            ])
+
+        succeeded += outcome.succeeded
+        skipped += outcome.skipped
+        failed += len(outcome.errors)
+        errors.extend(outcome.errors[:max(settings.IMPORT_MAX_REPORTED_ERRORS - len(errors), 0)])
+        await progress.checkpoint(
+            processed_rows=offset + len(chunk),
+            succeeded_rows=succeeded,
+            skipped_rows=skipped,
+            failed_rows=failed,
+            errors=list(errors)
+        )
+
+    return {"total": len(rows), "succeeded": succeeded, "skipped": skipped, "failed": failed}
+
+
+class BackgroundJobRunner:
+    """Claims queued jobs and runs their handlers outside the submitting request."""
+
+    def __init__(
+        self,
+        session_factory: Optional[SessionFactory] = None,
+        max_concurrency: Optional[int] = None,
+        host: Optional[str] = None
+    ):
+        self._session_factory = session_factory
+        self._max_concurrency = max_concurrency
+        self.host = host or socket.gethostname()
+        self._tasks: Set[asyncio.Task] = set()
+        self._running: Set[UUID] = set()
+
+    @property
+    def session_factory(self) -> SessionFactory:
+        if self._session_factory:
+            return self._session_factory
+        if not db_manager.async_session_maker:
+            raise RuntimeError("Database not initialized. Call connect() first.")
+        return db_manager.background_session_maker
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency or settings.JOB_MAX_CONCURRENCY
+
+    async def submit(
+        self,
+        session: AsyncSession,
+        job_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        created_by: Optional[str] = None,
+        total_rows: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+        claimable_by: Optional[str] = None
+    ) -> BackgroundJob:
+        """
+        Queue a job, commit it and start it if this process has a free slot.
+
+        Submitting an ``idempotency_key`` that was used before returns the
+        original job instead of queueing another one. ``claimable_by``
+        restricts the job to runners on that host.
+        """
+        if job_type not in job_handlers:
+            raise ValidationError(f"Unknown job type: {job_type}")
+
+        repository = BackgroundJobRepository(session)
+        if idempotency_key:
+            existing = await repository.get_by_idempotency_key(idempotency_key)
+            if existing:
+                return self._replay(existing, job_type)
+
+        try:
+            job = await repository.create({
+                "job_type": job_type,
+                "status": JobStatus.PENDING.value,
+                "payload": payload,
+                "idempotency_key": idempotency_key,
+                "claimable_by": claimable_by,
+                "total_rows": total_rows,
+                "created_by": created_by,
+                "updated_by": created_by
+            })
+            await session.commit()
+        except IntegrityError:
+            # A concurrent request with the same key won the race
+            await session.rollback()
+            existing = await repository.get_by_idempotency_key(idempotency_key) if idempotency_key else None
+            if not existing:
+                raise
+            return self._replay(existing, job_type)
+
+        self.dispatch(job.id)
+        return job
+
+    @staticmethod
+    def _replay(job: BackgroundJob, job_type: str) -> BackgroundJob:
+        if job.job_type != job_type:
+            raise ConflictError(
+                "Idempotency key was already used for a different operation",
+                conflicting_field="idempotency_key"
+            )
+        return job
+
+    def dispatch(self, job_id: Optional[UUID] = None) -> bool:
+        """Start claiming ``job_id`` (or the oldest queued job) if a slot is free."""
+        if len(self._tasks) >= self.max_concurrency:
+            return False
+        self._start(self._claim_and_run(job_id))
+        return True
+
+    async def poll(self) -> int:
+        """
+        Fail stale jobs, then claim queued jobs up to the concurrency limit.
+
+        Runs on the scheduler; returns the number of jobs started.
+        """
+        async with self.session_factory() as session:
+            stale = await BackgroundJobRepository(session).fail_stale(
+                datetime.now(timezone.utc) - timedelta(seconds=settings.JOB_STALE_AFTER_SECONDS),
+                exclude=self._running
+            )
+            await session.commit()
+        if stale:
+            logger.warning(f"Failed {stale} background jobs that stopped reporting progress")
+
+        started = 0
+        while len(self._tasks) < self.max_concurrency:
+            claimed = await self._claim()
+            if not claimed:
+                break
+            self._start(self._execute(claimed.id, claimed.job_type, claimed.payload))
+            started += 1
+        return started
+
+    def _start(self, coroutine: Awaitable[None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _claim(self, job_id: Optional[UUID] = None):
+        async with self.session_factory() as session:
+            claimed = await BackgroundJobRepository(session).claim(self.host, job_id)
+            await session.commit()
+        return claimed
+
+    async def _claim_and_run(self, job_id: Optional[UUID]) -> None:
+        claimed = await self._claim(job_id)
+        if claimed:
+            await self._execute(claimed.id, claimed.job_type, claimed.payload)
+
+    async def _execute(self, job_id: UUID, job_type: str, payload: Optional[Dict[str, Any]]) -> None:
+        progress = JobProgress(job_id, self.session_factory, payload)
+        handler = job_handlers.get(job_type)
+        self._running.add(job_id)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job type '{job_type}'")
+            async with self.session_factory() as session:
+                result = await handler(session, progress)
+                await session.commit()
+        except JobCancelledError:
+            logger.info(f"Background job {job_id} cancelled")
+            await progress.update(status=JobStatus.CANCELLED.value, finished_at=datetime.now(timezone.utc))
+            return
+        except Exception as e:
+            logger.exception(f"Background job {job_id} failed")
+            await progress.update(
+                status=JobStatus.FAILED.value,
+                error_message=str(e),
+                finished_at=datetime.now(timezone.utc)
+            )
+            return
+        finally:
+            self._running.discard(job_id)
+        await progress.update(
+            status=JobStatus.COMPLETED.value,
+            result=result,
+            finished_at=datetime.now(timezone.utc)
+        )
+
+    async def wait(self) -> None:
+        """Wait for every job started by this runner (shutdown and tests)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+# Global runner instance
+background_job_runner = BackgroundJobRunner()
+
+
+class BackgroundJobService:
+    """Service for reading and cancelling jobs."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session."""
+        self.session = session
+        self.repository = BackgroundJobRepository(session)
+
+    async def get_job(self, job_id: UUID) -> BackgroundJob:
+        """Get a job by ID."""
+        job = await self.repository.get_by_id(job_id)
+        if not job:
+            raise NotFoundError(f"Job with ID {job_id} not found")
+        return job
+
+    async def list_jobs(
+        self,
+        job_type: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        created_by: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[BackgroundJob]:
+        """List jobs, newest first."""
+        return await self.repository.get_all(
+            job_type=job_type, status=status, created_by=created_by, skip=skip, limit=limit
+        )
+
+    async def cancel_job(self, job_id: UUID) -> BackgroundJob:
+        """Cancel a queued job, or ask a running one to stop at its next checkpoint."""
+        job = await self.get_job(job_id)
+        if job.is_finished:
+            raise ValidationError(f"Job is already {job.status.lower()}")
+        await self.repository.request_cancel(job_id)
+        await self.session.commit()
+        await self.session.refresh(job)
+        return job
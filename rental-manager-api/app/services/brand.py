@@ -1,9 +1,12 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
+from pathlib import Path
 
 from app.crud.brand import BrandRepository
+from app.models.background_job import BackgroundJob
 from app.models.brand import Brand
+from app.services.bulk_import import BulkImporter, ImportFileFormat, BRAND_IMPORT, submit_file_import
 from app.schemas.brand import (
     BrandCreate, BrandUpdate, BrandResponse, BrandSummary, 
     BrandList, BrandFilter, BrandSort, BrandStats,
@@ -380,6 +383,9 @@ class BrandService:
     ) -> BrandImportResult:
         """Import brands data.
         
+        Existing brands (matched by name) are skipped; the rest are inserted
+        with a single statement.
+        
         Args:
             import_data: List of brand import data
             created_by: User importing the data
@@ -387,46 +393,47 @@ class BrandService:
         Returns:
             Import operation result
         """
-        total_processed = len(import_data)
-        successful_imports = 0
-        failed_imports = 0
-        skipped_imports = 0
-        errors = []
-        
-        for row, brand_data in enumerate(import_data, 1):
-            try:
-                # Check if brand already exists
-                if await self.repository.exists_by_name(brand_data.name):
-                    skipped_imports += 1
-                    continue
-                
-                if brand_data.code and await self.repository.exists_by_code(brand_data.code):
-                    skipped_imports += 1
-                    continue
-                
-                # Create brand
-                create_data = brand_data.model_dump()
-                create_data.update({
-                    "created_by": created_by,
-                    "updated_by": created_by
-                })
-                
-                await self.repository.create(create_data)
-                successful_imports += 1
-                
-            except Exception as e:
-                failed_imports += 1
-                errors.append({
-                    "row": row,
-                    "error": str(e)
-                })
+        report = await BulkImporter(
+            self.repository.session, BRAND_IMPORT, created_by=created_by
+        ).run(import_data)
+        await self.repository.session.commit()
         
         return BrandImportResult(
-            total_processed=total_processed,
-            successful_imports=successful_imports,
-            failed_imports=failed_imports,
-            skipped_imports=skipped_imports,
-            errors=errors
+            total_processed=report.total_rows,
+            successful_imports=report.inserted,
+            failed_imports=report.failed,
+            skipped_imports=report.skipped,
+            errors=[
+                {"row": error["row"], "field": error["field"], "error": error["message"]}
+                for error in report.errors
+            ]
+        )
+    
+    async def start_import_job(
+        self,
+        path: Path,
+        file_format: ImportFileFormat,
+        created_by: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """Import an uploaded file in the background and return the job to poll.
+        
+        Args:
+            path: Spooled upload
+            file_format: Upload format
+            created_by: User importing the data
+            idempotency_key: Client key; a resubmission returns the first job
+            
+        Returns:
+            Pending job
+        """
+        return await submit_file_import(
+            self.repository.session,
+            "brand_import",
+            path,
+            file_format,
+            created_by=created_by,
+            idempotency_key=idempotency_key
         )
     
     async def activate_brand(self, brand_id: UUID) -> BrandResponse:
@@ -0,0 +1,556 @@
+"""
+Set-based bulk import engine.
+
+An import runs in a handful of statements however many rows it has:
+
+1. Rows are validated against the import schema in chunks; invalid rows are
+   reported and dropped, valid ones are written to a temporary staging
+   table (``COPY`` on PostgreSQL, a multi-row ``INSERT`` elsewhere).
+2. Names of related records (brand, category, unit) are resolved to ids
+   with one correlated ``UPDATE`` per lookup; rows whose names do not
+   resolve are reported.
+3. Missing natural keys (item SKUs) are allocated for all rows at once.
+4. Duplicate keys within the file and clashes on other unique columns are
+   reported.
+5. The surviving rows are applied with a single
+   ``INSERT ... SELECT ... ON CONFLICT (key) DO UPDATE`` (or ``DO NOTHING``).
+
+Errors are collected per input row as ``{"row", "field", "message"}``.
+Uploaded files are imported by the ``item_import`` / ``brand_import``
+background jobs registered at the bottom of this module.
+"""
+
+import csv
+import json
+import logging
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type
+)
+from uuid import uuid4
+
+from fastapi import UploadFile
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+from sqlalchemy import (
+    Column, DateTime, Integer, MetaData, String, Table, Text, Uuid, and_, bindparam, delete, exists,
+    func, literal, select, true, update
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+from app.core.config import settings
+from app.core.response_cache import track_catalog_writes
+from app.crud.entity_stats import track_counted_writes
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.item import Item
+from app.models.unit_of_measurement import UnitOfMeasurement
+from app.schemas.brand import BrandImport
+from app.schemas.item import ItemImport
+from app.models.background_job import BackgroundJob
+from app.services.background_job import JobProgress, background_job_runner, job_handler
+from app.services.sku_generator import SKUGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class ImportFileFormat(str, Enum):
+    """Supported upload formats."""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass(frozen=True)
+class NameLookup:
+    """Resolve a staged name column to a foreign key id."""
+    name_field: str
+    id_column: str
+    label: str
+    table: Table
+    match_columns: Tuple[str, ...] = ("name",)
+
+
+KeyAllocator = Callable[[AsyncSession, int, Set[str]], Awaitable[List[str]]]
+
+
+@dataclass(frozen=True)
+class ImportSpec:
+    """
+    What an import writes and how.
+
+    Attributes:
+        table: Target table
+        schema: Pydantic model each input row is validated against
+        key: Natural key the upsert conflicts on
+        upper_key: The key's unique index is on ``upper(key)``
+        lookups: Name columns resolved to foreign keys
+        unique_fields: Other unique columns checked before the upsert
+        update_existing: DO UPDATE on conflict (otherwise DO NOTHING)
+        allocate_keys: Fills in rows without a key
+    """
+    table: Table
+    schema: Type[BaseModel]
+    key: str
+    upper_key: bool = False
+    lookups: Tuple[NameLookup, ...] = ()
+    unique_fields: Tuple[str, ...] = ()
+    update_existing: bool = True
+    allocate_keys: Optional[KeyAllocator] = None
+
+    def key_of(self, table: Table) -> ColumnElement:
+        """The key as its unique index sees it."""
+        column = table.c[self.key]
+        return func.upper(column) if self.upper_key else column
+
+    @property
+    def name_fields(self) -> Set[str]:
+        return {lookup.name_field for lookup in self.lookups}
+
+    @property
+    def data_fields(self) -> List[str]:
+        """Schema fields written to target columns as-is."""
+        return [name for name in self.schema.model_fields if name not in self.name_fields]
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import, kept up to date while it runs."""
+    total_rows: int = 0
+    processed_rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    max_errors: int = field(default_factory=lambda: settings.IMPORT_MAX_REPORTED_ERRORS)
+
+    def add_error(self, row: int, message: str, field_name: Optional[str] = None) -> None:
+        """Reject one input row."""
+        self.add_errors(row, [(field_name, message)])
+
+    def add_errors(self, row: int, problems: Sequence[Tuple[Optional[str], str]]) -> None:
+        """Reject one input row with one or more field problems."""
+        self.failed += 1
+        for field_name, message in problems:
+            if len(self.errors) < self.max_errors:
+                self.errors.append({"row": row, "field": field_name, "message": message})
+
+    def job_fields(self) -> Dict[str, Any]:
+        """Counters as ``BackgroundJob`` column values."""
+        return {
+            "total_rows": self.total_rows or None,
+            "processed_rows": self.processed_rows,
+            "succeeded_rows": self.inserted,
+            "updated_rows": self.updated,
+            "skipped_rows": self.skipped,
+            "failed_rows": self.failed,
+            "errors": list(self.errors),
+        }
+
+
+ProgressCallback = Callable[[ImportReport], Awaitable[None]]
+
+
+class BulkImporter:
+    """Runs one import according to an ``ImportSpec``."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        spec: ImportSpec,
+        chunk_size: Optional[int] = None,
+        created_by: Optional[str] = None
+    ):
+        self.session = session
+        self.spec = spec
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        # The upsert is bulk DML: its table is marked for recount and its
+        # catalog version bumped when the caller commits
+        track_counted_writes(session)
+        track_catalog_writes(session)
+        self.created_by = created_by
+        self.report = ImportReport()
+        self.stage = self._stage_table()
+        self._dialect: Optional[str] = None
+
+    async def run(
+        self,
+        rows: Iterable[Any],
+        progress: Optional[ProgressCallback] = None,
+        total_rows: Optional[int] = None
+    ) -> ImportReport:
+        """
+        Import ``rows`` (dicts or schema instances) and return the report.
+
+        Nothing is committed; the caller owns the transaction.
+        """
+        report = self.report
+        report.total_rows = total_rows or 0
+        connection = await self.session.connection()
+        self._dialect = connection.dialect.name
+        # Rolled back with the transaction if anything below fails
+        await connection.run_sync(self.stage.create)
+
+        for chunk in _chunked(enumerate(rows, 1), self.chunk_size):
+            records = self._validate(chunk)
+            if records:
+                await self._load(records)
+            report.processed_rows += len(chunk)
+            if progress:
+                await progress(report)
+        report.total_rows = max(report.total_rows, report.processed_rows)
+
+        for lookup in self.spec.lookups:
+            await self._resolve(lookup)
+        await self._allocate_missing_keys()
+        await self._reject_duplicate_keys()
+        for name in self.spec.unique_fields:
+            await self._reject_unique_clashes(name)
+        await self._apply()
+        await connection.run_sync(self.stage.drop)
+
+        if progress:
+            await progress(report)
+        logger.info(
+            f"Imported into {self.spec.table.name}: {report.inserted} inserted, "
+            f"{report.updated} updated, {report.skipped} skipped, {report.failed} failed",
+            extra={"event": "bulk_import", "table": self.spec.table.name, "rows": report.total_rows}
+        )
+        return report
+
+    # Staging -------------------------------------------------------------
+
+    def _stage_table(self) -> Table:
+        target = self.spec.table
+        columns = [Column("row_no", Integer, primary_key=True), Column("id", Uuid)]
+        for name in self.spec.data_fields:
+            columns.append(Column(name, target.c[name].type))
+        for lookup in self.spec.lookups:
+            columns.append(Column(lookup.name_field, Text))
+            columns.append(Column(lookup.id_column, Uuid))
+        return Table(
+            f"import_stage_{uuid4().hex[:12]}",
+            MetaData(),
+            *columns,
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP"
+        )
+
+    def _validate(self, chunk: Sequence[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        records = []
+        for row_no, raw in chunk:
+            try:
+                data = raw if isinstance(raw, self.spec.schema) else self.spec.schema.model_validate(raw)
+            except PydanticValidationError as e:
+                self.report.add_errors(row_no, [
+                    (".".join(str(part) for part in error["loc"]) or None, error["msg"])
+                    for error in e.errors()
+                ])
+                continue
+            record = data.model_dump()
+            record.update({"row_no": row_no, "id": uuid4()})
+            records.append(record)
+        return records
+
+    async def _load(self, records: List[Dict[str, Any]]) -> None:
+        if self._dialect == "postgresql":
+            names = [column.name for column in self.stage.columns]
+            connection = await self.session.connection()
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                self.stage.name,
+                records=[tuple(record.get(name) for name in names) for record in records],
+                columns=names
+            )
+        else:
+            await self.session.execute(self.stage.insert(), records)
+
+    # Set-based checks ----------------------------------------------------
+
+    async def _reject(self, condition, message: Callable[[Any], str], field_name: Optional[str], value_column) -> None:
+        """Report and drop every staged row matching ``condition``."""
+        result = await self.session.execute(
+            select(self.stage.c.row_no, value_column).where(condition).order_by(self.stage.c.row_no)
+        )
+        rejected = result.all()
+        if not rejected:
+            return
+        for row_no, value in rejected:
+            self.report.add_error(row_no, message(value), field_name)
+        await self.session.execute(delete(self.stage).where(condition))
+
+    async def _allocate_missing_keys(self) -> None:
+        stage, key = self.stage, self.spec.key
+        if self.spec.allocate_keys is None:
+            return
+        missing = (await self.session.execute(
+            select(stage.c.row_no).where(stage.c[key].is_(None)).order_by(stage.c.row_no)
+        )).scalars().all()
+        if not missing:
+            return
+        staged = set((await self.session.execute(
+            select(func.upper(stage.c[key])).where(stage.c[key].isnot(None))
+        )).scalars())
+        keys = await self.spec.allocate_keys(self.session, len(missing), staged)
+        await self.session.execute(
+            update(stage).where(stage.c.row_no == bindparam("b_row_no")).values({key: bindparam("b_key")}),
+            [{"b_row_no": row_no, "b_key": value} for row_no, value in zip(missing, keys)]
+        )
+
+    async def _resolve(self, lookup: NameLookup) -> None:
+        stage = self.stage
+        name = stage.c[lookup.name_field]
+        for column in lookup.match_columns:
+            candidate = lookup.table.alias("candidate")
+            conditions = [
+                func.lower(candidate.c[column]) == func.lower(name),
+                candidate.c.is_active == True
+            ]
+            if not lookup.table.c[column].unique:
+                # Only accept names that identify exactly one record
+                twin = lookup.table.alias("twin")
+                conditions.append(
+                    select(func.count()).select_from(twin).where(
+                        func.lower(twin.c[column]) == func.lower(candidate.c[column]),
+                        twin.c.is_active == True
+                    ).scalar_subquery() == 1
+                )
+            await self.session.execute(
+                update(stage)
+                .where(name.isnot(None), stage.c[lookup.id_column].is_(None))
+                .values({lookup.id_column: select(candidate.c.id).where(*conditions).scalar_subquery()})
+            )
+
+        await self._reject(
+            and_(name.isnot(None), stage.c[lookup.id_column].is_(None)),
+            lambda value: f"{lookup.label} '{value}' not found",
+            lookup.name_field,
+            name
+        )
+
+    async def _reject_duplicate_keys(self) -> None:
+        """Keep the last row for each key; earlier ones are reported."""
+        stage, key = self.stage, self.spec.key
+        later = stage.alias("later")
+        await self._reject(
+            exists().where(
+                func.upper(later.c[key]) == func.upper(stage.c[key]),
+                later.c.row_no > stage.c.row_no
+            ),
+            lambda value: f"Duplicate {key} '{value}' in file; a later row replaces this one",
+            key,
+            stage.c[key]
+        )
+
+    async def _reject_unique_clashes(self, name: str) -> None:
+        """Rows whose unique value belongs to another record, in the table or earlier in the file."""
+        stage, key, target = self.stage, self.spec.key, self.spec.table
+        earlier = stage.alias("earlier")
+        value = stage.c[name]
+        await self._reject(
+            and_(
+                value.isnot(None),
+                exists().where(target.c[name] == value, target.c[key] != stage.c[key])
+            ),
+            lambda v: f"{name} '{v}' is already used by another record",
+            name,
+            value
+        )
+        await self._reject(
+            and_(
+                value.isnot(None),
+                exists().where(
+                    earlier.c[name] == value,
+                    earlier.c[key] != stage.c[key],
+                    earlier.c.row_no < stage.c.row_no
+                )
+            ),
+            lambda v: f"{name} '{v}' appears on an earlier row",
+            name,
+            value
+        )
+
+    # Upsert --------------------------------------------------------------
+
+    async def _apply(self) -> None:
+        stage, spec, target = self.stage, self.spec, self.spec.table
+        staged = (await self.session.execute(select(func.count()).select_from(stage))).scalar_one()
+        if not staged:
+            return
+        existing = (await self.session.execute(
+            select(func.count()).select_from(stage).join(target, spec.key_of(target) == spec.key_of(stage))
+        )).scalar_one()
+
+        now = datetime.now(timezone.utc)
+        fk_columns = [lookup.id_column for lookup in spec.lookups]
+        names = ["id", *spec.data_fields, *fk_columns, "created_at", "updated_at", "created_by", "updated_by"]
+        rows = select(
+            stage.c.id,
+            *[stage.c[name] for name in spec.data_fields],
+            *[stage.c[name] for name in fk_columns],
+            literal(now, DateTime(timezone=True)),
+            literal(now, DateTime(timezone=True)),
+            literal(self.created_by, String),
+            literal(self.created_by, String)
+        ).where(true()).order_by(stage.c.row_no)  # WHERE disambiguates ON CONFLICT on SQLite
+
+        insert = pg_insert if self._dialect == "postgresql" else sqlite_insert
+        statement = insert(target).from_select(names, rows)
+        if spec.update_existing:
+            excluded = statement.excluded
+            # A blank or missing cell, or a blank name, keeps the existing value
+            values = {
+                name: func.coalesce(excluded[name], target.c[name])
+                for name in [*spec.data_fields, *fk_columns] if name != spec.key
+            }
+            values.update({"updated_at": excluded.updated_at, "updated_by": excluded.updated_by})
+            statement = statement.on_conflict_do_update(index_elements=[spec.key_of(target)], set_=values)
+            self.report.updated += existing
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=[spec.key_of(target)])
+            self.report.skipped += existing
+
+        await self.session.execute(statement)
+        self.report.inserted += staged - existing
+
+
+def _chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk: List[Any] = []
+    for element in iterable:
+        chunk.append(element)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Import definitions ------------------------------------------------------
+
+
+async def _allocate_item_skus(session: AsyncSession, count: int, reserved: Set[str]) -> List[str]:
+    return await SKUGenerator(session).allocate_default_skus(count, reserved)
+
+
+ITEM_IMPORT = ImportSpec(
+    table=Item.__table__,
+    schema=ItemImport,
+    key="sku",
+    upper_key=True,
+    lookups=(
+        NameLookup("brand_name", "brand_id", "Brand", Brand.__table__),
+        NameLookup("category_name", "category_id", "Category", Category.__table__, ("category_path", "name")),
+        NameLookup("unit_name", "unit_of_measurement_id", "Unit of measurement", UnitOfMeasurement.__table__),
+    ),
+    allocate_keys=_allocate_item_skus
+)
+
+# Existing brands are left untouched, as the row-by-row import always did
+BRAND_IMPORT = ImportSpec(
+    table=Brand.__table__,
+    schema=BrandImport,
+    key="name",
+    unique_fields=("code",),
+    update_existing=False
+)
+
+
+# Upload parsing ----------------------------------------------------------
+
+
+def detect_format(filename: Optional[str], declared: Optional[ImportFileFormat] = None) -> ImportFileFormat:
+    """Upload format from the explicit choice or the file extension."""
+    if declared:
+        return declared
+    suffix = Path(filename or "").suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        return ImportFileFormat.NDJSON
+    return ImportFileFormat.CSV
+
+
+def iter_import_file(path: Path, file_format: ImportFileFormat) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of an uploaded file one at a time."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as handle:
+        if file_format == ImportFileFormat.NDJSON:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        for row in csv.DictReader(handle):
+            # Blank CSV cells mean "not provided"
+            yield {name: (value if value != "" else None) for name, value in row.items() if name}
+
+
+def count_import_rows(path: Path, file_format: ImportFileFormat) -> int:
+    """Approximate number of data rows in an uploaded file, for progress reporting."""
+    with open(path, "rb") as handle:
+        lines = sum(1 for line in handle if line.strip())
+    return lines if file_format == ImportFileFormat.NDJSON else max(lines - 1, 0)
+
+
+async def spool_upload(upload: UploadFile, chunk_size: int = 1024 * 1024) -> Path:
+    """Copy an upload to a temporary file the background job can read after the request ends."""
+    suffix = Path(upload.filename or "").suffix
+    with tempfile.NamedTemporaryFile(prefix="import-", suffix=suffix, delete=False) as handle:
+        while chunk := await upload.read(chunk_size):
+            handle.write(chunk)
+    return Path(handle.name)
+
+
+async def submit_file_import(
+    session: AsyncSession,
+    job_type: str,
+    path: Path,
+    file_format: ImportFileFormat,
+    created_by: Optional[str] = None,
+    idempotency_key: Optional[str] = None
+) -> BackgroundJob:
+    """
+    Queue a spooled upload for import; the job deletes the file when it is done.
+
+    The spool file is on this host's disk, so only workers here may claim the job.
+    """
+    job = await background_job_runner.submit(
+        session,
+        job_type,
+        payload={"path": str(path), "format": file_format.value, "created_by": created_by},
+        created_by=created_by,
+        idempotency_key=idempotency_key,
+        claimable_by=background_job_runner.host
+    )
+    if (job.payload or {}).get("path") != str(path):
+        # Replay of an earlier submission: this upload will never be read
+        path.unlink(missing_ok=True)
+    return job
+
+
+async def _run_file_import(session: AsyncSession, progress: JobProgress, spec: ImportSpec) -> Dict[str, Any]:
+    """Import the file named in the job payload, checkpointing after each chunk."""
+    path = Path(progress.payload["path"])
+    file_format = ImportFileFormat(progress.payload["format"])
+    try:
+        total = count_import_rows(path, file_format)
+        report = await BulkImporter(session, spec, created_by=progress.payload.get("created_by")).run(
+            iter_import_file(path, file_format),
+            progress=lambda report: progress.checkpoint(**report.job_fields()),
+            total_rows=total
+        )
+    finally:
+        path.unlink(missing_ok=True)
+    return {"inserted": report.inserted, "updated": report.updated, "skipped": report.skipped, "failed": report.failed}
+
+
+@job_handler("item_import")
+async def run_item_import_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    return await _run_file_import(session, progress, ITEM_IMPORT)
+
+
+@job_handler("brand_import")
+async def run_brand_import_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    return await _run_file_import(session, progress, BRAND_IMPORT)
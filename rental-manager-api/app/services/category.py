@@ -2,8 +2,14 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.crud.category import CategoryRepository
+from app.models.background_job import BackgroundJob
 from app.models.category import Category
+from app.services.background_job import (
+    ChunkResult, JobProgress, background_job_runner, job_handler, run_in_chunks
+)
 from app.schemas.category import (
     CategoryCreate, CategoryUpdate, CategoryMove, CategoryResponse, 
     CategorySummary, CategoryTree, CategoryList, CategoryFilter, 
@@ -529,6 +535,22 @@ class CategoryService:
             errors=result["errors"]
         )
     
+    async def start_bulk_operation_job(
+        self,
+        operation: CategoryBulkOperation,
+        updated_by: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """Queue a bulk operation on categories to run in committed chunks."""
+        return await background_job_runner.submit(
+            self.repository.session,
+            "category_bulk_operation",
+            payload={"operation": operation.model_dump(mode="json"), "updated_by": updated_by},
+            created_by=updated_by,
+            total_rows=len(operation.category_ids),
+            idempotency_key=idempotency_key
+        )
+    
     async def validate_category_operation(
         self,
         category_id: UUID,
@@ -730,4 +752,20 @@ class CategoryService:
             updated_at=category.updated_at,
             child_count=child_count,
             item_count=item_count
-        )
\ No newline at end of file
+        )
+
+
+@job_handler("category_bulk_operation")
+async def run_category_bulk_operation_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    """Apply a queued category bulk operation chunk by chunk."""
+    operation = CategoryBulkOperation.model_validate(progress.payload["operation"])
+    service = CategoryService(CategoryRepository(session))
+    
+    async def handle_chunk(category_ids: List[UUID]) -> ChunkResult:
+        result = await service.bulk_operation(
+            operation.model_copy(update={"category_ids": category_ids}),
+            updated_by=progress.payload.get("updated_by")
+        )
+        return ChunkResult(succeeded=result.success_count, errors=result.errors)
+    
+    return await run_in_chunks(session, progress, operation.category_ids, handle_chunk)
@@ -0,0 +1,7 @@
+"""
+Inventory services package.
+
+Importing the package registers the inventory alert engine's flush hooks.
+"""
+
+from app.services.inventory import alert_engine  # noqa: F401
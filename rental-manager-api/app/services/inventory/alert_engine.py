@@ -0,0 +1,80 @@
+"""
+Inventory alert engine.
+
+Mapper hooks note which stock levels and inventory units had a watched
+attribute inserted, changed or deleted; at the end of each flush the
+matching alert rules are evaluated for just those rows on the flush's
+connection. Alerts therefore move in the same transaction as the stock
+change that caused them, and a rollback discards both.
+
+Conditions that change with the clock alone (maintenance coming due,
+warranties entering or leaving their window) are picked up by the
+scheduler's periodic ``inventory_alert.sweep``.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.crud.inventory.inventory_alert import ALERT_RULES, AlertRule, inventory_alert
+from app.models.inventory.inventory_unit import InventoryUnit
+from app.models.inventory.stock_level import StockLevel
+
+logger = logging.getLogger(__name__)
+
+# session.info key holding {rule: subject ids} until the flush ends
+PENDING_SUBJECTS_KEY = "inventory_alert_subjects"
+
+
+def _rules_for(source) -> Tuple[AlertRule, ...]:
+    return tuple(rule for rule in ALERT_RULES if rule.source is source)
+
+
+def _track(target, changed_only: bool) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    state = inspect(target)
+    pending: Dict[AlertRule, Set[UUID]] = session.info.setdefault(PENDING_SUBJECTS_KEY, {})
+    for rule in _rules_for(type(target)):
+        if changed_only and not any(state.attrs[name].history.has_changes() for name in rule.watched):
+            continue
+        pending.setdefault(rule, set()).add(target.id)
+
+
+def _after_insert(mapper, connection, target) -> None:
+    _track(target, changed_only=False)
+
+
+def _after_update(mapper, connection, target) -> None:
+    _track(target, changed_only=True)
+
+
+def _after_delete(mapper, connection, target) -> None:
+    _track(target, changed_only=False)
+
+
+for _source in (StockLevel, InventoryUnit):
+    event.listen(_source, "after_insert", _after_insert)
+    event.listen(_source, "after_update", _after_update)
+    event.listen(_source, "after_delete", _after_delete)
+
+
+@event.listens_for(Session, "after_flush")
+def _evaluate_pending(session: Session, flush_context) -> None:
+    pending = session.info.pop(PENDING_SUBJECTS_KEY, None)
+    if not pending:
+        return
+    connection = session.connection()
+    now = datetime.now(timezone.utc)
+    for rule, subject_ids in pending.items():
+        inventory_alert.evaluate(connection, rule, now=now, subject_ids=subject_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_SUBJECTS_KEY, None)
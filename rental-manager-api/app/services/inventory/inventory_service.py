@@ -16,12 +16,15 @@ from app.crud.inventory import (
     stock_movement,
     stock_level,
     inventory_unit,
+    inventory_alert,
     sku_sequence
 )
 from app.models.inventory.enums import (
     StockMovementType,
     InventoryUnitStatus,
-    InventoryUnitCondition
+    InventoryUnitCondition,
+    InventoryAlertType,
+    InventoryAlertSeverity
 )
 from app.schemas.inventory.stock_level import (
     StockLevelCreate,
@@ -586,73 +589,67 @@ class InventoryService:
         self,
         db: AsyncSession,
         *,
-        location_id: Optional[UUID] = None
-    ) -> List[Dict[str, Any]]:
+        location_id: Optional[UUID] = None,
+        alert_type: Optional[InventoryAlertType] = None,
+        severity: Optional[InventoryAlertSeverity] = None,
+        include_acknowledged: bool = True,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Any]:
         """
-        Get inventory alerts (low stock, maintenance due, etc.).
+        Get live inventory alerts (low stock, maintenance due, etc.).
+        
+        Alerts are maintained by the alert engine as stock and units change,
+        so this reads the indexed alert table rather than scanning inventory.
         
         Args:
             db: Database session
             location_id: Optional location filter
+            alert_type: Optional alert type filter
+            severity: Optional severity filter
+            include_acknowledged: Include acknowledged alerts
+            skip: Number of records to skip
+            limit: Maximum number of records
             
         Returns:
             List of alerts
         """
-        alerts = []
-        
-        # Low stock alerts
-        low_stock_items = await stock_level.get_low_stock_items(
-            db,
-            location_id=location_id
-        )
-        
-        for stock in low_stock_items:
-            alerts.append({
-                'alert_type': 'LOW_STOCK',
-                'severity': 'high' if stock.quantity_available == 0 else 'medium',
-                'message': f"Low stock for item at location",
-                'item_id': stock.item_id,
-                'location_id': stock.location_id,
-                'quantity': float(stock.quantity_available),
-                'threshold': float(stock.reorder_point or 0)
-            })
-        
-        # Maintenance due alerts
-        maintenance_units = await inventory_unit.get_maintenance_due(
+        return await inventory_alert.get_live(
             db,
             location_id=location_id,
-            days_ahead=7
+            alert_type=alert_type,
+            severity=severity,
+            include_acknowledged=include_acknowledged,
+            skip=skip,
+            limit=limit
         )
+    
+    async def acknowledge_alert(
+        self,
+        db: AsyncSession,
+        *,
+        alert_id: UUID,
+        acknowledged_by: UUID
+    ) -> Optional[Any]:
+        """
+        Acknowledge an inventory alert.
         
-        for unit in maintenance_units:
-            alerts.append({
-                'alert_type': 'MAINTENANCE_DUE',
-                'severity': 'medium',
-                'message': f"Maintenance due for unit {unit.sku}",
-                'item_id': unit.item_id,
-                'location_id': unit.location_id,
-                'unit_id': unit.id,
-                'due_date': unit.next_maintenance_date
-            })
-        
-        # Warranty expiring alerts
-        warranty_units = await inventory_unit.get_expiring_warranties(
+        Args:
+            db: Database session
+            alert_id: Alert ID
+            acknowledged_by: User acknowledging the alert
+            
+        Returns:
+            Acknowledged alert, or None if it does not exist
+            
+        Raises:
+            ValueError: If the alert is already resolved
+        """
+        return await inventory_alert.acknowledge(
             db,
-            days_ahead=30
+            alert_id=alert_id,
+            acknowledged_by=acknowledged_by
         )
-        
-        for unit in warranty_units:
-            alerts.append({
-                'alert_type': 'WARRANTY_EXPIRING',
-                'severity': 'low',
-                'message': f"Warranty expiring for unit {unit.sku}",
-                'item_id': unit.item_id,
-                'location_id': unit.location_id,
-                'unit_id': unit.id,
-                'expiry_date': unit.warranty_expiry
-            })
-        
-        return alerts
 
 
 # Create service instance
@@ -2,9 +2,17 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.item import ItemRepository
+from app.models.background_job import BackgroundJob
 from app.models.item import Item
+from app.services.background_job import (
+    ChunkResult, JobProgress, background_job_runner, job_handler, run_in_chunks
+)
+from app.services.bulk_import import BulkImporter, ImportFileFormat, ITEM_IMPORT, submit_file_import
 from app.services.sku_generator import SKUGenerator
 from app.schemas.item import (
     ItemCreate, ItemUpdate, ItemResponse, ItemSummary,
@@ -12,7 +20,8 @@ from app.schemas.item import (
     ItemRentalStatusRequest, ItemRentalStatusResponse,
     ItemBulkOperation, ItemBulkResult, ItemExport,
     ItemImport, ItemImportResult, ItemAvailabilityCheck,
-    ItemAvailabilityResponse, ItemPricingUpdate, ItemDuplicate
+    ItemAvailabilityResponse, ItemPricingUpdate, ItemDuplicate,
+    ItemSkuRegenerate, ItemSkuRegenerateResult
 )
 from app.core.errors import (
     NotFoundError, ConflictError, ValidationError, 
@@ -50,6 +59,9 @@ class ItemService:
         sku = item_data.sku
         if not sku or sku == "AUTO":
             sku = await self.sku_generator.generate_sku(item_data.category_id)
+        else:
+            # Keep the generator from handing out a hand-picked SKU later
+            await self.sku_generator.claim_skus([sku])
         
         # Check if SKU already exists
         if await self.repository.exists_by_sku(sku):
@@ -150,6 +162,7 @@ class ItemService:
         if item_data.sku is not None and item_data.sku != existing_item.sku:
             if await self.repository.exists_by_sku(item_data.sku, exclude_id=item_id):
                 raise ConflictError(f"Item with SKU '{item_data.sku}' already exists")
+            await self.sku_generator.claim_skus([item_data.sku])
             update_data["sku"] = item_data.sku
         
         # Check name uniqueness if provided
@@ -469,6 +482,8 @@ class ItemService:
         new_sku = duplicate_request.new_sku
         if not new_sku:
             new_sku = await self.sku_generator.generate_sku(source_item.category_id)
+        else:
+            await self.sku_generator.claim_skus([new_sku])
         
         # Check if new SKU already exists
         if await self.repository.exists_by_sku(new_sku):
@@ -588,6 +603,31 @@ class ItemService:
             failed_items=failed_items
         )
     
+    async def start_bulk_operation_job(
+        self,
+        operation: ItemBulkOperation,
+        updated_by: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """Queue a bulk operation to run in committed chunks.
+        
+        Args:
+            operation: Bulk operation data
+            updated_by: User performing the operation
+            idempotency_key: Client key; a resubmission returns the first job
+            
+        Returns:
+            Pending job
+        """
+        return await background_job_runner.submit(
+            self.repository.session,
+            "item_bulk_operation",
+            payload={"operation": operation.model_dump(mode="json"), "updated_by": updated_by},
+            created_by=updated_by,
+            total_rows=len(operation.item_ids),
+            idempotency_key=idempotency_key
+        )
+    
     async def get_rentable_items(self, limit: Optional[int] = None) -> List[ItemSummary]:
         """Get items available for rental."""
         items = await self.repository.get_rentable_items(limit=limit)
@@ -662,59 +702,41 @@ class ItemService:
         import_data: List[ItemImport],
         created_by: Optional[str] = None
     ) -> ItemImportResult:
-        """Import items data."""
-        total_processed = len(import_data)
-        successful_imports = 0
-        failed_imports = 0
-        skipped_imports = 0
-        updated_items = 0
-        errors = []
-        warnings = []
-        
-        for row, item_data in enumerate(import_data, 1):
-            try:
-                # Generate SKU if not provided
-                sku = item_data.sku or await self.sku_generator.generate_sku(None)
-                
-                # Check if item already exists
-                existing_item = await self.repository.get_by_sku(sku)
-                if existing_item:
-                    # Update existing item
-                    update_data = item_data.model_dump(exclude={'brand_name', 'category_name', 'unit_name'})
-                    update_data['updated_by'] = created_by
-                    await self.repository.update(existing_item.id, update_data)
-                    updated_items += 1
-                    continue
-                
-                # Create new item
-                create_data = item_data.model_dump(exclude={'brand_name', 'category_name', 'unit_name'})
-                create_data.update({
-                    "sku": sku,
-                    "created_by": created_by,
-                    "updated_by": created_by
-                })
-                
-                # Resolve brand, category, and unit IDs from names
-                # This would need additional repository calls
-                
-                await self.repository.create(create_data)
-                successful_imports += 1
-                
-            except Exception as e:
-                failed_imports += 1
-                errors.append({
-                    "row": row,
-                    "message": str(e)
-                })
+        """Import items data.
+        
+        Rows are staged and applied with one upsert keyed on SKU; brand,
+        category and unit names are resolved to IDs in bulk.
+        """
+        report = await BulkImporter(
+            self.repository.session, ITEM_IMPORT, created_by=created_by
+        ).run(import_data)
+        await self.repository.session.commit()
         
         return ItemImportResult(
-            total_processed=total_processed,
-            successful_imports=successful_imports,
-            failed_imports=failed_imports,
-            skipped_imports=skipped_imports,
-            updated_items=updated_items,
-            errors=errors,
-            warnings=warnings
+            total_processed=report.total_rows,
+            successful_imports=report.inserted,
+            failed_imports=report.failed,
+            skipped_imports=report.skipped,
+            updated_items=report.updated,
+            errors=report.errors,
+            warnings=[]
+        )
+    
+    async def start_import_job(
+        self,
+        path: Path,
+        file_format: ImportFileFormat,
+        created_by: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """Import an uploaded file in the background and return the job to poll."""
+        return await submit_file_import(
+            self.repository.session,
+            "item_import",
+            path,
+            file_format,
+            created_by=created_by,
+            idempotency_key=idempotency_key
         )
     
     async def regenerate_item_sku(
@@ -742,6 +764,25 @@ class ItemService:
         # Return updated item
         return await self.get_item(item_id)
     
+    async def regenerate_skus(self, request: ItemSkuRegenerate) -> ItemSkuRegenerateResult:
+        """Regenerate the SKUs of many items, or preview the rewrite.
+        
+        Args:
+            request: Items, pattern and dry-run flag
+            
+        Returns:
+            Old and new SKU per item
+            
+        Raises:
+            ConflictError: If a regenerated SKU is already held by another item
+        """
+        return await self.sku_generator.regenerate_skus(
+            request.item_ids,
+            pattern=request.pattern,
+            new_category_id=request.new_category_id,
+            dry_run=request.dry_run
+        )
+    
     async def _to_response(self, item: Item) -> ItemResponse:
         """Convert item model to response schema."""
         # Get related data names
@@ -837,4 +878,20 @@ class ItemService:
             "category_name": category_name
         }
         
-        return ItemSummary(**item_dict)
\ No newline at end of file
+        return ItemSummary(**item_dict)
+
+
+@job_handler("item_bulk_operation")
+async def run_item_bulk_operation_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    """Apply a queued item bulk operation chunk by chunk."""
+    operation = ItemBulkOperation.model_validate(progress.payload["operation"])
+    service = ItemService(ItemRepository(session), SKUGenerator(session))
+    
+    async def handle_chunk(item_ids: List[UUID]) -> ChunkResult:
+        result = await service.bulk_operation(
+            operation.model_copy(update={"item_ids": item_ids}),
+            updated_by=progress.payload.get("updated_by")
+        )
+        return ChunkResult(succeeded=result.success_count, errors=result.failed_items)
+    
+    return await run_in_chunks(session, progress, operation.item_ids, handle_chunk)
\ No newline at end of file
@@ -1,13 +1,19 @@
 """Item Rental Blocking Service for managing rental availability and blocking history."""
 
 from typing import List, Optional, Dict, Any, Tuple
-from uuid import UUID
-from datetime import datetime
-from sqlalchemy import select, func, and_, or_, desc
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, func, and_, or_, desc, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.background_job import BackgroundJob
 from app.models.item import Item
+from app.models.item_rental_block_history import ItemRentalBlockHistory
+from app.crud.entity_stats import COUNTED, STAT_SPECS_BY_MODEL, add_deltas, add_updated_rows, new_deltas
 from app.crud.item import ItemRepository
+from app.services.background_job import (
+    ChunkResult, JobProgress, background_job_runner, job_handler, run_in_chunks
+)
 from app.schemas.item import (
     ItemRentalStatusRequest,
     ItemRentalStatusResponse,
@@ -15,19 +21,11 @@ from app.schemas.item import (
     ItemBulkOperation,
     ItemBulkResult
 )
+from app.core.config import settings
 from app.core.errors import NotFoundError, ValidationError, BusinessRuleError
 
 
-class RentalBlockHistory:
-    """Model for rental block history (placeholder for future inventory module)."""
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
-    
-    @classmethod
-    def create_item_entry(cls, **kwargs):
-        """Create a rental block history entry."""
-        return cls(**kwargs)
+AUTO_UNBLOCK_REMARKS = "Auto-unblocked after expiry"
 
 
 class ItemRentalBlockingService:
@@ -140,32 +138,54 @@ class ItemRentalBlockingService:
         if not item or not item.is_active:
             raise NotFoundError(f"Item with id {item_id} not found")
         
-        # For now, return mock history data
-        # In a full implementation, this would query a proper history table
-        history_entries = []
+        total_result = await self.session.execute(
+            select(func.count()).select_from(ItemRentalBlockHistory).where(
+                ItemRentalBlockHistory.item_id == item_id
+            )
+        )
+        total = total_result.scalar_one()
+        
+        if total:
+            result = await self.session.execute(
+                select(ItemRentalBlockHistory)
+                .where(ItemRentalBlockHistory.item_id == item_id)
+                .order_by(ItemRentalBlockHistory.changed_at.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+            entries = [
+                (entry.id, entry.is_blocked, entry.previous_status, entry.remarks, entry.changed_by, entry.changed_at)
+                for entry in result.scalars().all()
+            ]
+        elif item.rental_blocked_at:
+            # Blocked before history was recorded: describe the current block
+            total = 1
+            entries = [(
+                UUID(int=1), item.is_rental_blocked, not item.is_rental_blocked,
+                item.rental_block_reason, item.rental_blocked_by, item.rental_blocked_at
+            )][skip:skip + limit]
+        else:
+            entries = []
         
-        if item.rental_blocked_at:
-            history_entries.append({
-                "id": str(UUID(int=1)),
+        history_entries = [
+            {
+                "id": str(entry_id),
                 "entity_type": "ITEM",
                 "entity_id": str(item.id),
                 "item_id": str(item.id),
                 "inventory_unit_id": None,
-                "is_blocked": item.is_rental_blocked,
-                "previous_status": not item.is_rental_blocked,
-                "remarks": item.rental_block_reason,
-                "changed_by": item.rental_blocked_by,
-                "changed_at": item.rental_blocked_at,
-                "status_change_description": f"Item {'blocked' if item.is_rental_blocked else 'unblocked'} from rental",
+                "is_blocked": is_blocked,
+                "previous_status": previous_status,
+                "remarks": remarks,
+                "changed_by": changed_by,
+                "changed_at": changed_at,
+                "status_change_description": f"Item {'blocked' if is_blocked else 'unblocked'} from rental",
                 "entity_display_name": item.item_name
-            })
-        
-        total = len(history_entries)
-        
-        # Apply pagination
-        paginated_entries = history_entries[skip:skip + limit]
+            }
+            for entry_id, is_blocked, previous_status, remarks, changed_by, changed_at in entries
+        ]
         
-        return paginated_entries, total
+        return history_entries, total
     
     async def get_blocked_items(
         self,
@@ -275,6 +295,9 @@ class ItemRentalBlockingService:
     ) -> ItemBulkResult:
         """Toggle rental status for multiple items.
         
+        Each chunk of items is changed with one ``UPDATE ... RETURNING`` and
+        one history insert, then committed.
+        
         Args:
             item_ids: List of item UUIDs
             is_rental_blocked: Whether to block or unblock rental
@@ -287,26 +310,27 @@ class ItemRentalBlockingService:
         successful_items = []
         failed_items = []
         
-        for item_id in item_ids:
-            try:
-                request = ItemRentalStatusRequest(
-                    is_rental_blocked=is_rental_blocked,
-                    remarks=remarks
-                )
-                
-                result = await self.toggle_item_rental_status(
-                    item_id=item_id,
-                    request=request,
-                    changed_by=changed_by
+        for offset in range(0, len(item_ids), settings.JOB_CHUNK_SIZE):
+            chunk = item_ids[offset:offset + settings.JOB_CHUNK_SIZE]
+            changed = await self._set_rental_blocked(chunk, is_rental_blocked, remarks, changed_by)
+            if len(changed) < len(set(chunk)):
+                # Items already in the requested state count as successful
+                existing = await self.session.execute(
+                    select(Item.id).where(and_(Item.id.in_(chunk), Item.is_active == True))
                 )
-                
-                successful_items.append(item_id)
-                
-            except Exception as e:
-                failed_items.append({
-                    "item_id": str(item_id),
-                    "error": str(e)
-                })
+                found = set(existing.scalars().all())
+            else:
+                found = set(changed)
+            await self.session.commit()
+            
+            for item_id in chunk:
+                if item_id in found:
+                    successful_items.append(item_id)
+                else:
+                    failed_items.append({
+                        "item_id": str(item_id),
+                        "error": f"Item with id {item_id} not found"
+                    })
         
         return ItemBulkResult(
             total_requested=len(item_ids),
@@ -316,6 +340,40 @@ class ItemRentalBlockingService:
             failed_items=failed_items
         )
     
+    async def start_bulk_toggle_job(
+        self,
+        item_ids: List[UUID],
+        is_rental_blocked: bool,
+        remarks: Optional[str],
+        changed_by: UUID,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """Queue a bulk rental status change to run in committed chunks.
+        
+        Args:
+            item_ids: List of item UUIDs
+            is_rental_blocked: Whether to block or unblock rental
+            remarks: Reason for the change
+            changed_by: User making the change
+            idempotency_key: Client key; a resubmission returns the first job
+            
+        Returns:
+            Pending job
+        """
+        return await background_job_runner.submit(
+            self.session,
+            "item_bulk_rental_status",
+            payload={
+                "item_ids": [str(item_id) for item_id in item_ids],
+                "is_rental_blocked": is_rental_blocked,
+                "remarks": remarks,
+                "changed_by": str(changed_by)
+            },
+            created_by=str(changed_by),
+            total_rows=len(item_ids),
+            idempotency_key=idempotency_key
+        )
+    
     async def get_rental_blocking_statistics(self) -> Dict[str, Any]:
         """Get statistics about rental blocking.
         
@@ -403,53 +461,77 @@ class ItemRentalBlockingService:
     
     async def auto_unblock_expired_items(
         self,
-        auto_unblock_after_days: int = 90
+        auto_unblock_after_days: int = 90,
+        limit: Optional[int] = None
     ) -> List[UUID]:
         """Automatically unblock items that have been blocked for too long.
         
+        Expired items are unblocked in chunks of one ``UPDATE ... RETURNING``
+        plus one history insert, each committed on its own, so no item rows
+        are loaded into the session.
+        
         Args:
             auto_unblock_after_days: Days after which to auto-unblock
+            limit: Optional cap on items unblocked by this call
             
         Returns:
             List of unblocked item IDs
         """
-        cutoff_date = datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
-        
-        # Find items blocked for more than specified days
-        query = select(Item).where(
-            and_(
-                Item.is_active == True,
-                Item.is_rental_blocked == True,
-                Item.rental_blocked_at < cutoff_date
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=auto_unblock_after_days)
+        unblocked_items: List[UUID] = []
+        
+        while not limit or len(unblocked_items) < limit:
+            batch_size = settings.JOB_CHUNK_SIZE
+            if limit:
+                batch_size = min(batch_size, limit - len(unblocked_items))
+            expired = (
+                select(Item.id)
+                .where(and_(
+                    Item.is_active == True,
+                    Item.is_rental_blocked == True,
+                    Item.rental_blocked_at < cutoff_date
+                ))
+                .order_by(Item.rental_blocked_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
             )
-        )
-        
-        result = await self.session.execute(query)
-        items_to_unblock = result.scalars().all()
-        
-        unblocked_items = []
-        
-        for item in items_to_unblock:
-            # Unblock the item
-            item.unblock_rental()
-            
-            # Create history entry
-            await self._create_history_entry(
-                item_id=item.id,
+            unblocked = await self._change_rental_block(
+                Item.id.in_(expired),
                 is_blocked=False,
-                remarks="Auto-unblocked after expiry",
-                changed_by=None,
-                previous_status=True
+                remarks=AUTO_UNBLOCK_REMARKS,
+                changed_by=None
             )
-            
-            unblocked_items.append(item.id)
-        
-        # Save changes
-        if unblocked_items:
             await self.session.commit()
+            unblocked_items.extend(unblocked)
+            if len(unblocked) < batch_size:
+                break
         
         return unblocked_items
     
+    async def start_auto_unblock_job(
+        self,
+        auto_unblock_after_days: int = 90,
+        requested_by: Optional[str] = None,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """Queue the auto-unblock sweep to run in committed chunks.
+        
+        Args:
+            auto_unblock_after_days: Days after which to auto-unblock
+            requested_by: User starting the sweep
+            idempotency_key: Client key; a resubmission returns the first job
+            
+        Returns:
+            Pending job
+        """
+        return await background_job_runner.submit(
+            self.session,
+            "item_auto_unblock",
+            payload={"auto_unblock_after_days": auto_unblock_after_days},
+            created_by=requested_by,
+            idempotency_key=idempotency_key
+        )
+    
     async def get_items_blocked_by_user(
         self,
         user_id: UUID,
@@ -542,24 +624,130 @@ class ItemRentalBlockingService:
         remarks: Optional[str],
         changed_by: Optional[UUID],
         previous_status: bool
-    ):
-        """Create a history entry for rental status change.
-        
-        This is a placeholder implementation. In a full system, this would
-        create entries in a proper history table.
-        """
-        # Placeholder - would create actual history record
-        history_entry = RentalBlockHistory.create_item_entry(
+    ) -> ItemRentalBlockHistory:
+        """Record a rental status change for one item (committed with the change)."""
+        history_entry = ItemRentalBlockHistory(
+            id=uuid4(),
             item_id=item_id,
             is_blocked=is_blocked,
+            previous_status=previous_status,
             remarks=remarks,
             changed_by=changed_by,
-            previous_status=previous_status,
-            changed_at=datetime.utcnow()
+            changed_at=datetime.now(timezone.utc),
+            created_by=str(changed_by) if changed_by else None
         )
+        self.session.add(history_entry)
+        return history_entry
+    
+    async def _set_rental_blocked(
+        self,
+        item_ids: List[UUID],
+        is_blocked: bool,
+        remarks: Optional[str],
+        changed_by: Optional[UUID]
+    ) -> List[UUID]:
+        """Block or unblock the given items; returns the IDs that changed."""
+        return await self._change_rental_block(Item.id.in_(item_ids), is_blocked, remarks, changed_by)
+    
+    async def _change_rental_block(
+        self,
+        condition,
+        is_blocked: bool,
+        remarks: Optional[str],
+        changed_by: Optional[UUID]
+    ) -> List[UUID]:
+        """Change the rental block of active items matching ``condition``.
         
-        # In a full implementation, this would be saved to database
-        # self.session.add(history_entry)
-        # await self.session.commit()
-        
-        return history_entry
\ No newline at end of file
+        One ``UPDATE ... RETURNING`` touches only items not already in the
+        target state, then one multi-row insert records their history. Nothing
+        is loaded into the session; the caller commits. The statistics
+        counters are moved from the returned rows, whose previous block
+        state the ``WHERE`` clause pins.
+        """
+        now = datetime.now(timezone.utc)
+        if is_blocked:
+            values = {
+                "is_rental_blocked": True,
+                "rental_block_reason": remarks or "Manual block",
+                "rental_blocked_at": now,
+                "rental_blocked_by": changed_by
+            }
+        else:
+            values = {
+                "is_rental_blocked": False,
+                "rental_block_reason": None,
+                "rental_blocked_at": None,
+                "rental_blocked_by": None
+            }
+        if changed_by:
+            values["updated_by"] = str(changed_by)
+        
+        spec = STAT_SPECS_BY_MODEL[Item]
+        result = await self.session.execute(
+            update(Item)
+            .where(and_(condition, Item.is_active == True, Item.is_rental_blocked == (not is_blocked)))
+            .values(**values)
+            .returning(Item.id, *(getattr(Item, name) for name in spec.attributes))
+            .execution_options(synchronize_session=False, **{COUNTED: True})
+        )
+        rows = result.mappings().all()
+        changed = [row["id"] for row in rows]
+        
+        deltas = new_deltas()
+        add_updated_rows(deltas, spec, rows, {"is_rental_blocked": not is_blocked})
+        add_deltas(self.session, deltas)
+        
+        if changed:
+            await self.session.execute(
+                insert(ItemRentalBlockHistory.__table__),
+                [
+                    {
+                        "id": uuid4(),
+                        "item_id": item_id,
+                        "is_blocked": is_blocked,
+                        "previous_status": not is_blocked,
+                        "remarks": remarks,
+                        "changed_by": changed_by,
+                        "changed_at": now,
+                        "created_by": str(changed_by) if changed_by else None
+                    }
+                    for item_id in changed
+                ]
+            )
+        return changed
+
+
+@job_handler("item_bulk_rental_status")
+async def run_bulk_rental_status_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    """Apply a queued bulk rental status change chunk by chunk."""
+    payload = progress.payload
+    service = ItemRentalBlockingService(session, ItemRepository(session))
+    
+    async def handle_chunk(item_ids: List[str]) -> ChunkResult:
+        result = await service.bulk_toggle_rental_status(
+            item_ids=[UUID(item_id) for item_id in item_ids],
+            is_rental_blocked=payload["is_rental_blocked"],
+            remarks=payload.get("remarks"),
+            changed_by=UUID(payload["changed_by"])
+        )
+        return ChunkResult(succeeded=result.success_count, errors=result.failed_items)
+    
+    return await run_in_chunks(session, progress, payload["item_ids"], handle_chunk)
+
+
+@job_handler("item_auto_unblock")
+async def run_auto_unblock_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    """Unblock expired items one committed chunk at a time."""
+    service = ItemRentalBlockingService(session, ItemRepository(session))
+    chunk_size = settings.JOB_CHUNK_SIZE
+    unblocked = 0
+    while True:
+        item_ids = await service.auto_unblock_expired_items(
+            auto_unblock_after_days=progress.payload.get("auto_unblock_after_days", 90),
+            limit=chunk_size
+        )
+        unblocked += len(item_ids)
+        await progress.checkpoint(processed_rows=unblocked, succeeded_rows=unblocked)
+        if len(item_ids) < chunk_size:
+            break
+    return {"unblocked": unblocked}
@@ -17,6 +17,7 @@ import logging
 from datetime import datetime, timedelta
 
 from app.crud.location import LocationCRUD
+from app.models.background_job import BackgroundJob
 from app.models.location import Location, LocationType
 from app.schemas.location import (
     LocationCreate, LocationUpdate, LocationResponse, LocationSearch,
@@ -27,8 +28,11 @@ from app.core.errors import (
     NotFoundError, ConflictError, ValidationError,
     BusinessRuleError, DatabaseError
 )
-from app.core.redis import RedisManager
+from app.core.redis import RedisManager, redis_manager
 from app.core.database import AsyncSession
+from app.services.background_job import (
+    ChunkResult, JobProgress, background_job_runner, job_handler, run_in_chunks
+)
 
 logger = logging.getLogger(__name__)
 
@@ -546,20 +550,7 @@ class LocationService:
         Returns:
             List of created location responses
         """
-        # Rate limiting for bulk operations
-        if requester_id and self.redis:
-            rate_limit_key = f"bulk_ops:{requester_id}"
-            allowed, remaining = await self.redis.rate_limit_check(
-                rate_limit_key,
-                self.BULK_OPERATION_RATE_LIMIT,
-                60  # 1 minute window
-            )
-            if not allowed:
-                raise BusinessRuleError(
-                    f"Rate limit exceeded for bulk operations. Try again later.",
-                    rule_name="bulk_operation_rate_limit",
-                    context={"remaining": remaining}
-                )
+        await self._check_bulk_rate_limit(requester_id)
         
         logger.info(f"Bulk creating {len(bulk_data.locations)} locations")
         
@@ -596,6 +587,55 @@ class LocationService:
             logger.error(f"Error in bulk create: {e}")
             raise DatabaseError(f"Failed to bulk create locations: {str(e)}", operation="bulk_create", table="locations")
     
+    async def start_bulk_create_job(
+        self,
+        bulk_data: LocationBulkCreate,
+        created_by: Optional[UUID] = None,
+        requester_id: Optional[UUID] = None,
+        idempotency_key: Optional[str] = None
+    ) -> BackgroundJob:
+        """
+        Queue a bulk location creation to run in committed chunks.
+        
+        Args:
+            bulk_data: Bulk creation data
+            created_by: User creating the locations
+            requester_id: ID of the requester for rate limiting
+            idempotency_key: Client key; a resubmission returns the first job
+            
+        Returns:
+            Pending job
+        """
+        await self._check_bulk_rate_limit(requester_id)
+        return await background_job_runner.submit(
+            self.db,
+            "location_bulk_create",
+            payload={
+                "locations": [location.model_dump(mode="json") for location in bulk_data.locations],
+                "skip_duplicates": bulk_data.skip_duplicates,
+                "created_by": str(created_by) if created_by else None
+            },
+            created_by=str(created_by) if created_by else None,
+            total_rows=len(bulk_data.locations),
+            idempotency_key=idempotency_key
+        )
+    
+    async def _check_bulk_rate_limit(self, requester_id: Optional[UUID]) -> None:
+        """Raise if the requester exceeded the bulk operation rate limit."""
+        if requester_id and self.redis:
+            rate_limit_key = f"bulk_ops:{requester_id}"
+            allowed, remaining = await self.redis.rate_limit_check(
+                rate_limit_key,
+                self.BULK_OPERATION_RATE_LIMIT,
+                60  # 1 minute window
+            )
+            if not allowed:
+                raise BusinessRuleError(
+                    f"Rate limit exceeded for bulk operations. Try again later.",
+                    rule_name="bulk_operation_rate_limit",
+                    context={"remaining": remaining}
+                )
+    
     # ==================== Statistics and Analytics ====================
     
     async def get_location_statistics(self, use_cache: bool = True) -> LocationStatistics:
@@ -748,4 +788,21 @@ class LocationService:
         # Could also cache recent audit events in Redis for quick access
         if self.redis:
             audit_key = f"audit:location:{datetime.utcnow().strftime('%Y-%m-%d')}"
-            await self.redis.set(audit_key, audit_entry, ttl=86400)  # 24 hours
\ No newline at end of file
+            await self.redis.set(audit_key, audit_entry, ttl=86400)  # 24 hours
+
+
+@job_handler("location_bulk_create")
+async def run_location_bulk_create_job(session: AsyncSession, progress: JobProgress) -> Dict[str, Any]:
+    """Create queued locations chunk by chunk."""
+    payload = progress.payload
+    service = LocationService(session, redis_manager)
+    created_by = UUID(payload["created_by"]) if payload.get("created_by") else None
+    
+    async def handle_chunk(locations: List[Dict[str, Any]]) -> ChunkResult:
+        created = await service.bulk_create_locations(
+            LocationBulkCreate(locations=locations, skip_duplicates=payload["skip_duplicates"]),
+            created_by=created_by
+        )
+        return ChunkResult(succeeded=len(created), skipped=len(locations) - len(created))
+    
+    return await run_in_chunks(session, progress, payload["locations"], handle_chunk)
@@ -0,0 +1,338 @@
+"""
+Price book service and the per-worker compiled rate lookup.
+
+All active price book entries are compiled into ``CompiledPriceBooks``: a
+dict keyed by ``(item_id, location_id, customer_segment)`` whose values are
+the matching rate windows, best first. Resolving a rate is a handful of
+dict lookups and a short scan of date windows, with no database access.
+
+Each worker keeps one compiled copy in ``price_book_cache``. It is rebuilt
+when the ``price_books`` cache version (bumped by every edit) changes; the
+version itself is re-read at most every ``PRICE_BOOK_VERSION_CHECK_SECONDS``
+or straight away after an edit made by this worker.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from math import ceil
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.errors import ConflictError, NotFoundError, ValidationError
+from app.core.metrics import record_cache_lookup
+from app.crud.cache_version import CacheVersionRepository, defer_cache_version_bumps
+from app.crud.price_book import PriceBookRepository
+from app.schemas.price_book import (
+    PriceBookCreate, PriceBookUpdate, PriceBookResponse, PriceBookList,
+    PriceBookEntriesUpsert, PriceBookEntryResponse
+)
+
+logger = logging.getLogger(__name__)
+
+PRICE_BOOK_NAMESPACE = "price_books"
+
+RateKey = Tuple[UUID, Optional[UUID], Optional[str]]
+
+
+@dataclass(frozen=True)
+class PriceBookRate:
+    """One item's rates from one price book, with the book's validity window."""
+
+    item_id: UUID
+    price_book_id: UUID
+    priority: int
+    effective_from: date
+    effective_to: Optional[date]
+    rental_rate_per_day: Decimal
+    weekly_rate: Optional[Decimal] = None
+    monthly_rate: Optional[Decimal] = None
+    sale_price: Optional[Decimal] = None
+    security_deposit: Optional[Decimal] = None
+
+    def covers(self, on: date) -> bool:
+        return self.effective_from <= on and (self.effective_to is None or on < self.effective_to)
+
+
+class CompiledPriceBooks:
+    """Immutable rate lookup built from one version of the price books."""
+
+    def __init__(self, version: int, rates: Dict[RateKey, Tuple[PriceBookRate, ...]]):
+        self.version = version
+        self._rates = rates
+
+    @classmethod
+    def compile(cls, version: int, rows: Iterable) -> "CompiledPriceBooks":
+        """Group flattened entry rows by scope, best window first."""
+        grouped: Dict[RateKey, List[PriceBookRate]] = {}
+        for row in rows:
+            key = (row.item_id, row.location_id, row.customer_segment)
+            grouped.setdefault(key, []).append(PriceBookRate(
+                item_id=row.item_id,
+                price_book_id=row.price_book_id,
+                priority=row.priority or 0,
+                effective_from=row.effective_from,
+                effective_to=row.effective_to,
+                rental_rate_per_day=row.rental_rate_per_day,
+                weekly_rate=row.weekly_rate,
+                monthly_rate=row.monthly_rate,
+                sale_price=row.sale_price,
+                security_deposit=row.security_deposit,
+            ))
+        return cls(version, {
+            key: tuple(sorted(rates, key=lambda rate: (rate.priority, rate.effective_from), reverse=True))
+            for key, rates in grouped.items()
+        })
+
+    def __len__(self) -> int:
+        return sum(len(rates) for rates in self._rates.values())
+
+    def resolve(
+        self,
+        item_id: UUID,
+        on: Union[date, datetime],
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None,
+    ) -> Optional[PriceBookRate]:
+        """
+        Rate in effect for an item, or None when no book prices it.
+
+        Scopes are tried most specific first: location and segment, location
+        only, segment only, then books that apply everywhere.
+        """
+        if isinstance(on, datetime):
+            on = on.date()
+        for key in self._scopes(item_id, location_id, customer_segment):
+            for rate in self._rates.get(key, ()):
+                if rate.covers(on):
+                    return rate
+        return None
+
+    @staticmethod
+    def _scopes(item_id: UUID, location_id: Optional[UUID], segment: Optional[str]) -> List[RateKey]:
+        scopes = []
+        if location_id is not None and segment is not None:
+            scopes.append((item_id, location_id, segment))
+        if location_id is not None:
+            scopes.append((item_id, location_id, None))
+        if segment is not None:
+            scopes.append((item_id, None, segment))
+        scopes.append((item_id, None, None))
+        return scopes
+
+
+class PriceBookCache:
+    """Per-worker holder of the compiled price books."""
+
+    def __init__(self, check_interval: Optional[float] = None):
+        self.check_interval = (
+            settings.PRICE_BOOK_VERSION_CHECK_SECONDS if check_interval is None else check_interval
+        )
+        self._compiled: Optional[CompiledPriceBooks] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, session: AsyncSession) -> CompiledPriceBooks:
+        """Compiled price books, rebuilt if the stored version moved on."""
+        if self._compiled is not None and time.monotonic() - self._checked_at < self.check_interval:
+            record_cache_lookup("price_book", True)
+            return self._compiled
+
+        async with self._lock:
+            version = await CacheVersionRepository(session).get(PRICE_BOOK_NAMESPACE)
+            hit = self._compiled is not None and self._compiled.version == version
+            if not hit:
+                rows = await PriceBookRepository(session).get_active_rates()
+                self._compiled = CompiledPriceBooks.compile(version, rows)
+                logger.info(
+                    f"Compiled price books version {version}",
+                    extra={"event": "price_books_compiled", "version": version, "rates": len(self._compiled)},
+                )
+            self._checked_at = time.monotonic()
+        record_cache_lookup("price_book", hit)
+        return self._compiled
+
+    def invalidate(self) -> None:
+        """Re-check the version on the next lookup."""
+        self._checked_at = 0.0
+
+    def clear(self) -> None:
+        """Drop the compiled books entirely."""
+        self._compiled = None
+        self._checked_at = 0.0
+
+
+price_book_cache = PriceBookCache()
+
+
+class PriceBookService:
+    """Service layer for price book business logic."""
+
+    def __init__(self, session: AsyncSession, cache: PriceBookCache = price_book_cache):
+        """Initialize service with a session and the worker's price book cache."""
+        self.session = session
+        self.repository = PriceBookRepository(session)
+        self.cache = cache
+
+    async def create_price_book(
+        self,
+        book_data: PriceBookCreate,
+        created_by: Optional[str] = None
+    ) -> PriceBookResponse:
+        """Create a new price book.
+
+        Raises:
+            ConflictError: If the code is already used
+            ValidationError: If the book data is invalid
+        """
+        if await self.repository.get_by_code(book_data.code):
+            raise ConflictError(f"Price book with code '{book_data.code}' already exists")
+
+        create_data = book_data.model_dump()
+        if create_data["customer_segment"] is not None:
+            create_data["customer_segment"] = create_data["customer_segment"].value
+        create_data.update({"created_by": created_by, "updated_by": created_by})
+
+        try:
+            book = await self.repository.create(create_data)
+        except ValueError as e:
+            raise ValidationError(str(e))
+        await self._commit_edit()
+        return PriceBookResponse.model_validate(book)
+
+    async def get_price_book(self, book_id: UUID) -> PriceBookResponse:
+        """Get a price book by ID."""
+        return PriceBookResponse.model_validate(await self._get_book(book_id))
+
+    async def list_price_books(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None,
+        effective_on: Optional[date] = None,
+        include_inactive: bool = False
+    ) -> PriceBookList:
+        """List price books, optionally only those in effect on a date."""
+        books, total = await self.repository.get_paginated(
+            page=page,
+            page_size=page_size,
+            filters={
+                "location_id": location_id,
+                "customer_segment": customer_segment,
+                "effective_on": effective_on,
+            },
+            include_inactive=include_inactive
+        )
+        total_pages = ceil(total / page_size) if total else 0
+        return PriceBookList(
+            items=[PriceBookResponse.model_validate(book) for book in books],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_previous=page > 1
+        )
+
+    async def update_price_book(
+        self,
+        book_id: UUID,
+        book_data: PriceBookUpdate,
+        updated_by: Optional[str] = None
+    ) -> PriceBookResponse:
+        """Update a price book."""
+        book = await self._get_book(book_id)
+        update_data = book_data.model_dump(exclude_unset=True)
+        if update_data.get("customer_segment") is not None:
+            update_data["customer_segment"] = update_data["customer_segment"].value
+        update_data["updated_by"] = updated_by
+
+        try:
+            book = await self.repository.update(book, update_data)
+        except ValueError as e:
+            raise ValidationError(str(e))
+        await self._commit_edit()
+        return PriceBookResponse.model_validate(book)
+
+    async def delete_price_book(self, book_id: UUID, deleted_by: Optional[str] = None) -> bool:
+        """Soft delete a price book; its rates stop applying immediately."""
+        book = await self._get_book(book_id)
+        book.soft_delete(deleted_by)
+        await self._commit_edit()
+        return True
+
+    async def get_entries(self, book_id: UUID) -> List[PriceBookEntryResponse]:
+        """List the entries of a price book."""
+        await self._get_book(book_id)
+        entries = await self.repository.get_entries(book_id)
+        return [PriceBookEntryResponse.model_validate(entry) for entry in entries]
+
+    async def upsert_entries(
+        self,
+        book_id: UUID,
+        entries_data: PriceBookEntriesUpsert,
+        updated_by: Optional[str] = None
+    ) -> List[PriceBookEntryResponse]:
+        """Insert or replace item rates in a price book.
+
+        Raises:
+            NotFoundError: If the book or an item does not exist
+        """
+        await self._get_book(book_id)
+        entries = [
+            {**entry.model_dump(), "updated_by": updated_by}
+            for entry in entries_data.entries
+        ]
+        try:
+            saved = await self.repository.upsert_entries(book_id, entries)
+        except IntegrityError:
+            await self.session.rollback()
+            raise NotFoundError("One or more items do not exist", resource_type="Item")
+        await self._commit_edit()
+        return [PriceBookEntryResponse.model_validate(entry) for entry in saved]
+
+    async def delete_entry(self, book_id: UUID, item_id: UUID) -> bool:
+        """Remove one item's rates from a price book."""
+        if not await self.repository.delete_entry(book_id, item_id):
+            raise NotFoundError(
+                f"Item {item_id} is not in price book {book_id}",
+                resource_type="PriceBookEntry"
+            )
+        await self._commit_edit()
+        return True
+
+    async def resolve_price(
+        self,
+        item_id: UUID,
+        on: date,
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None
+    ) -> Tuple[PriceBookRate, int]:
+        """Rate in effect for an item, with the compiled version it came from."""
+        compiled = await self.cache.get(self.session)
+        rate = compiled.resolve(item_id, on, location_id, customer_segment)
+        if rate is None:
+            raise NotFoundError(f"No price book rate for item {item_id} on {on}", resource_type="PriceBookEntry")
+        return rate, compiled.version
+
+    async def _get_book(self, book_id: UUID):
+        book = await self.repository.get_by_id(book_id)
+        if not book:
+            raise NotFoundError(f"Price book with id {book_id} not found", resource_type="PriceBook")
+        return book
+
+    async def _commit_edit(self) -> None:
+        """Bump the price book version with the edit so every worker recompiles."""
+        # Bumped at commit, with any other versions, in the global lock order
+        defer_cache_version_bumps(self.session, [PRICE_BOOK_NAMESPACE])
+        await self.session.commit()
+        self.cache.invalidate()
+        logger.info("Price books changed", extra={"event": "price_books_changed"})
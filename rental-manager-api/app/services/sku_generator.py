@@ -1,14 +1,120 @@
-"""SKU Generator Service for automatic SKU generation based on categories."""
+"""SKU Generator Service for automatic SKU generation based on categories.
 
-from typing import Optional, Dict, Any
-from uuid import UUID
-from sqlalchemy import select, func, text
+Numbers come from ``sku_counters``: one row per SKU template (the pattern
+with the category code, prefix and other fixed fields filled in), advanced
+with a single ``UPDATE ... RETURNING`` per request. A reservation therefore
+never hands out a number twice, a rolled-back transaction gives its numbers
+back, and no candidate SKU has to be probed against the items table. A
+counter row is created on first use, starting after the highest number an
+existing SKU already took from the same template.
+"""
+
+from collections import Counter
+from functools import lru_cache
+from string import Formatter
+from typing import Collection, Iterable, Iterator, List, Optional, Dict, Any, Pattern, Sequence, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import String, Uuid, bindparam, column, exists, select, func, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import re
 
 from app.models.item import Item
 from app.models.category import Category
+from app.models.sku_counter import SkuCounter
+from app.schemas.item import ItemSkuChange, ItemSkuRegenerateResult
+from app.core.errors import ConflictError
+
+
+# Rows per anti-join / UPDATE statement in batch regeneration
+SKU_REWRITE_CHUNK_SIZE = 1000
+
+
+# Fields that change between calls; they stay as placeholders in a template
+VOLATILE_FIELDS = {
+    "counter": r"(?P<counter>\d+)",
+    "timestamp": r"\d{14}",
+    "date": r"\d{8}",
+    "time": r"\d{6}",
+    "year": r"\d{4}",
+    "month": r"\d{1,2}",
+    "day": r"\d{1,2}",
+}
+
+
+def _placeholder(field: str, format_spec: str, conversion: Optional[str]) -> str:
+    conversion_part = f"!{conversion}" if conversion else ""
+    spec_part = f":{format_spec}" if format_spec else ""
+    return f"{{{field}{conversion_part}{spec_part}}}"
+
+
+def build_template(pattern: str, fields: Dict[str, Any]) -> str:
+    """Fill a pattern's fixed fields, keeping the counter and date/time ones.
+    
+    Args:
+        pattern: SKU pattern, e.g. ``{category_code}-{counter:05d}``
+        fields: Values of the fixed fields
+        
+    Returns:
+        Upper-cased template, e.g. ``ELEC-{counter:05d}``
+        
+    Raises:
+        KeyError: If the pattern uses a field that has no value
+    """
+    parts = []
+    for literal, field, format_spec, conversion in Formatter().parse(pattern):
+        parts.append(literal.upper().replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if field in VOLATILE_FIELDS:
+            parts.append(_placeholder(field, format_spec, conversion))
+        else:
+            value = format(fields[field], format_spec or "")
+            parts.append(value.upper().replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def template_regex(template: str) -> Pattern[str]:
+    """Regex matching the SKUs a template renders, capturing the counter."""
+    parts = []
+    seen_counter = False
+    for literal, field, _format_spec, _conversion in Formatter().parse(template):
+        parts.append(re.escape(literal))
+        if field is None:
+            continue
+        if field == "counter" and seen_counter:
+            parts.append(r"\d+")
+        else:
+            parts.append(VOLATILE_FIELDS[field])
+            seen_counter = seen_counter or field == "counter"
+    return re.compile("".join(parts))
+
+
+def _chunks(values_: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values_), size):
+        yield values_[start:start + size]
+
+
+def _sku_values(rows: List[Tuple[UUID, str]]):
+    """``(VALUES ...) AS new_skus (item_id, sku)`` for a chunk of rewrites."""
+    return values(column("item_id", Uuid), column("sku", String), name="new_skus").data(rows)
+
+
+def render_sku(template: str, counter: int, now: Optional[datetime] = None) -> str:
+    """Render one SKU from a template."""
+    now = now or datetime.now()
+    return template.format(
+        counter=counter,
+        timestamp=now.strftime("%Y%m%d%H%M%S"),
+        date=now.strftime("%Y%m%d"),
+        time=now.strftime("%H%M%S"),
+        year=now.year,
+        month=now.month,
+        day=now.day
+    )
 
 
 class SKUGenerator:
@@ -18,6 +124,7 @@ class SKUGenerator:
     DEFAULT_PATTERN = "ITEM-{counter:05d}"
     CATEGORY_PATTERN = "{category_code}-{counter:05d}"
     TIMESTAMP_PATTERN = "ITEM-{timestamp}-{counter:03d}"
+    PREFIX_PATTERN = "{prefix}-{counter:05d}"
     
     def __init__(self, session: AsyncSession):
         """Initialize SKU generator with database session."""
@@ -39,12 +146,8 @@ class SKUGenerator:
         Returns:
             Generated unique SKU
         """
-        if category_id:
-            return await self._generate_category_based_sku(category_id, pattern)
-        elif pattern:
-            return await self._generate_custom_pattern_sku(pattern, prefix)
-        else:
-            return await self._generate_default_sku(prefix)
+        skus = await self.generate_bulk_skus(1, category_id, pattern, prefix)
+        return skus[0]
     
     async def generate_bulk_skus(
         self,
@@ -55,6 +158,8 @@ class SKUGenerator:
     ) -> list[str]:
         """Generate multiple unique SKUs efficiently.
         
+        The whole range is reserved with one counter update.
+        
         Args:
             count: Number of SKUs to generate
             category_id: Optional category ID for category-based generation
@@ -64,226 +169,201 @@ class SKUGenerator:
         Returns:
             List of generated unique SKUs
         """
-        skus = []
-        for i in range(count):
-            sku = await self.generate_sku(category_id, pattern, prefix)
-            skus.append(sku)
+        if count <= 0:
+            return []
         
-        return skus
+        template = await self._resolve_template(category_id, pattern, prefix)
+        first = await self._reserve(template, count)
+        now = datetime.now()
+        
+        return [render_sku(template, n, now) for n in range(first, first + count)]
     
-    async def _generate_category_based_sku(
+    async def allocate_default_skus(
         self,
-        category_id: UUID,
-        pattern: Optional[str] = None
-    ) -> str:
-        """Generate SKU based on category information.
-        
-        Args:
-            category_id: Category ID
-            pattern: Optional custom pattern
-            
-        Returns:
-            Generated SKU
-        """
-        # Get category information
-        category = await self._get_category(category_id)
-        if not category:
-            # Fall back to default generation if category not found
-            return await self._generate_default_sku()
-        
-        # Use category code or create one from name
-        category_code = category.category_code or self._create_category_code(category.name)
-        
-        # Get next counter for this category
-        next_counter = await self._get_next_category_counter(category_id)
-        
-        # Use provided pattern or default category pattern
-        sku_pattern = pattern or self.CATEGORY_PATTERN
-        
-        # Generate SKU
-        sku = sku_pattern.format(
-            category_code=category_code,
-            category_name=category.name,
-            counter=next_counter,
-            category_id=str(category_id)[:8].upper()
-        )
+        count: int,
+        reserved: Collection[str] = (),
+        prefix: Optional[str] = None
+    ) -> list[str]:
+        """Allocate ``count`` distinct default-pattern SKUs.
         
-        # Ensure uniqueness
-        return await self._ensure_unique_sku(sku)
-    
-    async def _generate_default_sku(self, prefix: Optional[str] = None) -> str:
-        """Generate default SKU with sequential numbering.
+        Numbers whose SKU is in ``reserved`` are skipped and the shortfall
+        is reserved again; the counter is then moved past any reserved SKU
+        that belongs to the template so later calls do not hand it out.
         
         Args:
+            count: Number of SKUs needed
+            reserved: SKUs already claimed outside the items table (upper-cased)
             prefix: Optional prefix
-            
+        
         Returns:
-            Generated SKU
+            List of unused SKUs
         """
-        # Get next counter
-        next_counter = await self._get_next_global_counter()
+        template = await self._resolve_template(None, None, prefix)
+        now = datetime.now()
+        skus: list[str] = []
         
-        # Use prefix or default
-        sku_prefix = prefix or "ITEM"
+        while len(skus) < count:
+            needed = count - len(skus)
+            first = await self._reserve(template, needed)
+            candidates = [render_sku(template, n, now) for n in range(first, first + needed)]
+            skus.extend(sku for sku in candidates if sku not in reserved)
         
-        # Generate SKU
-        sku = f"{sku_prefix}-{next_counter:05d}"
+        await self.claim_skus(reserved)
+        return skus
+    
+    async def claim_skus(self, skus: Iterable[str]) -> None:
+        """Move counters past SKUs that were chosen by hand.
         
-        # Ensure uniqueness
-        return await self._ensure_unique_sku(sku)
+        A manually entered SKU that matches a template (``ITEM-00420`` for
+        ``ITEM-{counter:05d}``) would otherwise be generated again once the
+        counter reaches its number.
+        
+        Args:
+            skus: SKUs about to be stored
+        """
+        skus = [sku.strip().upper() for sku in skus if sku]
+        if not skus:
+            return
+        
+        result = await self.session.execute(select(SkuCounter.template))
+        for template in result.scalars():
+            regex = template_regex(template)
+            if "counter" not in regex.groupindex:
+                continue
+            numbers = [
+                int(match.group("counter"))
+                for match in map(regex.fullmatch, skus) if match
+            ]
+            if numbers:
+                await self.session.execute(
+                    update(SkuCounter)
+                    .where(SkuCounter.template == template, SkuCounter.next_value <= max(numbers))
+                    .values(next_value=max(numbers) + 1)
+                    .execution_options(synchronize_session=False)
+                )
     
-    async def _generate_custom_pattern_sku(
+    async def _resolve_template(
         self,
-        pattern: str,
-        prefix: Optional[str] = None
+        category_id: Optional[UUID],
+        pattern: Optional[str],
+        prefix: Optional[str]
     ) -> str:
-        """Generate SKU using custom pattern.
+        """Work out the template whose counter numbers the SKUs.
         
         Args:
-            pattern: Custom pattern string
+            category_id: Optional category ID
+            pattern: Optional custom pattern
             prefix: Optional prefix
             
         Returns:
-            Generated SKU
+            SKU template
         """
-        # Get current timestamp
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        
-        # Get next counter
-        next_counter = await self._get_next_global_counter()
-        
-        # Replace pattern placeholders
-        sku = pattern.format(
-            prefix=prefix or "ITEM",
-            timestamp=timestamp,
-            counter=next_counter,
-            date=datetime.now().strftime("%Y%m%d"),
-            time=datetime.now().strftime("%H%M%S"),
-            year=datetime.now().year,
-            month=datetime.now().month,
-            day=datetime.now().day
-        )
-        
-        # Ensure uniqueness
-        return await self._ensure_unique_sku(sku)
+        category = await self._get_category(category_id) if category_id else None
+        return self._template_for(category_id, category, pattern, prefix)
     
-    async def _generate_timestamp_sku(self, prefix: Optional[str] = None) -> str:
-        """Generate timestamp-based SKU.
+    def _template_for(
+        self,
+        category_id: Optional[UUID],
+        category: Optional[Category],
+        pattern: Optional[str],
+        prefix: Optional[str]
+    ) -> str:
+        """Build the template for an already loaded category (or none)."""
+        fields: Dict[str, Any] = {"prefix": prefix or "ITEM"}
         
-        Args:
-            prefix: Optional prefix
+        if category_id:
+            if not category:
+                # Fall back to default generation if category not found
+                return build_template(self.PREFIX_PATTERN, {"prefix": "ITEM"})
             
-        Returns:
-            Generated SKU
-        """
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        sku_prefix = prefix or "ITEM"
-        
-        # Generate base SKU
-        base_sku = f"{sku_prefix}-{timestamp}"
-        
-        # Add counter if needed for uniqueness
-        counter = 1
-        sku = base_sku
-        
-        while await self._sku_exists(sku):
-            sku = f"{base_sku}-{counter:03d}"
-            counter += 1
+            fields.update(
+                # Use category code or create one from name
+                category_code=category.category_code or self._create_category_code(category.name),
+                category_name=category.name,
+                category_id=str(category_id)[:8].upper()
+            )
+            return build_template(pattern or self.CATEGORY_PATTERN, fields)
         
-        return sku
+        return build_template(pattern or self.PREFIX_PATTERN, fields)
     
-    async def _get_category(self, category_id: UUID) -> Optional[Category]:
-        """Get category by ID.
+    async def _reserve(self, template: str, count: int) -> int:
+        """Reserve ``count`` consecutive numbers of a template's counter.
         
         Args:
-            category_id: Category ID
+            template: SKU template
+            count: Numbers to reserve
             
         Returns:
-            Category model or None
+            First reserved number
         """
-        query = select(Category).where(Category.id == category_id)
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
-    
-    async def _get_next_category_counter(self, category_id: UUID) -> int:
-        """Get next counter value for a specific category.
-        
-        Args:
-            category_id: Category ID
+        while True:
+            result = await self.session.execute(
+                update(SkuCounter)
+                .where(SkuCounter.template == template)
+                .values(next_value=SkuCounter.next_value + count)
+                .returning(SkuCounter.next_value)
+                .execution_options(synchronize_session=False)
+            )
+            next_value = result.scalar_one_or_none()
+            if next_value is not None:
+                return next_value - count
             
-        Returns:
-            Next counter value
-        """
-        # Get the highest counter for items in this category
-        query = select(
-            func.count(Item.id).label("count")
-        ).where(
-            Item.category_id == category_id
-        )
-        
-        result = await self.session.execute(query)
-        current_count = result.scalar_one()
-        
-        return current_count + 1
+            # First use of the template; a concurrent creator wins the insert
+            # and both go on to reserve from the same row
+            start = await self._first_unused_number(template)
+            insert = pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+            await self.session.execute(
+                insert(SkuCounter.__table__)
+                .values(id=uuid4(), template=template, next_value=start)
+                .on_conflict_do_nothing(index_elements=["template"])
+            )
     
-    async def _get_next_global_counter(self) -> int:
-        """Get next global counter value.
-        
-        Returns:
-            Next counter value
-        """
-        # Get total count of items
-        query = select(func.count(Item.id))
-        result = await self.session.execute(query)
-        current_count = result.scalar_one()
-        
-        return current_count + 1
+    async def _peek(self, template: str) -> int:
+        """Next number of a template's counter, without reserving it."""
+        result = await self.session.execute(
+            select(SkuCounter.next_value).where(SkuCounter.template == template)
+        )
+        next_value = result.scalar_one_or_none()
+        return next_value if next_value is not None else await self._first_unused_number(template)
     
-    async def _ensure_unique_sku(self, sku: str) -> str:
-        """Ensure SKU is unique by adding counter if needed.
+    async def _first_unused_number(self, template: str) -> int:
+        """Number after the highest one existing SKUs took from a template.
         
         Args:
-            sku: Base SKU
+            template: SKU template
             
         Returns:
-            Unique SKU
+            Starting value for a new counter
         """
-        if not await self._sku_exists(sku):
-            return sku
-        
-        # Add counter to make it unique
-        counter = 1
-        base_sku = sku
-        
-        while await self._sku_exists(sku):
-            sku = f"{base_sku}-{counter:03d}"
-            counter += 1
-            
-            # Prevent infinite loops
-            if counter > 999:
-                # Use timestamp as additional uniqueness
-                timestamp = datetime.now().strftime("%H%M%S")
-                sku = f"{base_sku}-{timestamp}"
-                break
-        
-        return sku
+        regex = template_regex(template)
+        if "counter" not in regex.groupindex:
+            return 1
+        
+        literal_prefix = next(Formatter().parse(template), ('',))[0]
+        query = select(func.upper(Item.sku))
+        if literal_prefix:
+            query = query.where(func.upper(Item.sku).startswith(literal_prefix, autoescape=True))
+        
+        highest = 0
+        for sku in (await self.session.execute(query)).scalars():
+            match = regex.fullmatch(sku)
+            if match:
+                highest = max(highest, int(match.group("counter")))
+        
+        return highest + 1
     
-    async def _sku_exists(self, sku: str) -> bool:
-        """Check if SKU already exists.
+    async def _get_category(self, category_id: UUID) -> Optional[Category]:
+        """Get category by ID.
         
         Args:
-            sku: SKU to check
+            category_id: Category ID
             
         Returns:
-            True if SKU exists
+            Category model or None
         """
-        query = select(func.count()).select_from(Item).where(
-            func.upper(Item.sku) == sku.upper()
-        )
+        query = select(Category).where(Category.id == category_id)
         result = await self.session.execute(query)
-        count = result.scalar_one()
-        
-        return count > 0
+        return result.scalar_one_or_none()
     
     def _create_category_code(self, category_name: str) -> str:
         """Create a category code from category name.
@@ -418,25 +498,12 @@ class SKUGenerator:
         Returns:
             New generated SKU
         """
-        # Get existing item
-        query = select(Item).where(Item.id == item_id)
-        result = await self.session.execute(query)
-        item = result.scalar_one_or_none()
+        result = await self.regenerate_skus([item_id], pattern, new_category_id)
         
-        if not item:
+        if not result.changes:
             raise ValueError(f"Item with ID {item_id} not found")
         
-        # Use new category or existing one
-        category_id = new_category_id or item.category_id
-        
-        # Generate new SKU
-        new_sku = await self.generate_sku(category_id, pattern)
-        
-        # Update item with new SKU
-        item.sku = new_sku
-        await self.session.commit()
-        
-        return new_sku
+        return result.changes[0].new_sku
     
     async def batch_regenerate_skus(
         self,
@@ -452,17 +519,157 @@ class SKUGenerator:
         Returns:
             Dictionary mapping item_id to new_sku
         """
-        results = {}
+        result = await self.regenerate_skus(item_ids, pattern)
         
-        for item_id in item_ids:
-            try:
-                new_sku = await self.regenerate_sku(item_id, pattern=pattern)
-                results[str(item_id)] = new_sku
-            except Exception as e:
-                results[str(item_id)] = f"ERROR: {str(e)}"
+        results = {str(change.item_id): change.new_sku for change in result.changes}
+        for item_id in result.missing_items:
+            results[str(item_id)] = f"ERROR: Item with ID {item_id} not found"
         
         return results
     
+    async def regenerate_skus(
+        self,
+        item_ids: Sequence[UUID],
+        pattern: Optional[str] = None,
+        new_category_id: Optional[UUID] = None,
+        dry_run: bool = False
+    ) -> ItemSkuRegenerateResult:
+        """Regenerate the SKUs of many items in a few set-based statements.
+        
+        Items and their categories are loaded up front, one counter range
+        is reserved per template and all new SKUs are rendered in memory.
+        Clashes with SKUs held by other items are found with one anti-join
+        per chunk before anything is written; the rewrite itself is one
+        ``UPDATE ... FROM (VALUES ...)`` per chunk. With ``dry_run`` the
+        counters and items are left untouched and the result is the diff
+        that would be applied.
+        
+        Args:
+            item_ids: Items to re-SKU
+            pattern: Optional custom pattern
+            new_category_id: Optional category to generate the SKUs for
+            dry_run: Only compute the changes
+            
+        Returns:
+            Old and new SKU per item, missing items and clashing SKUs
+            
+        Raises:
+            ConflictError: If a new SKU is held by another item (not in dry runs)
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        items: Dict[UUID, Tuple[str, Optional[UUID]]] = {}
+        for chunk in _chunks(item_ids, SKU_REWRITE_CHUNK_SIZE):
+            result = await self.session.execute(
+                select(Item.id, Item.sku, Item.category_id).where(Item.id.in_(chunk))
+            )
+            items.update((row.id, (row.sku, row.category_id)) for row in result)
+        
+        category_ids = {new_category_id} if new_category_id else {
+            category_id for _sku, category_id in items.values() if category_id
+        }
+        categories: Dict[UUID, Category] = {}
+        if category_ids:
+            result = await self.session.execute(select(Category).where(Category.id.in_(category_ids)))
+            categories = {category.id: category for category in result.scalars()}
+        
+        # Group items by the template that numbers them, in request order
+        by_template: Dict[str, List[UUID]] = {}
+        for item_id in item_ids:
+            if item_id not in items:
+                continue
+            category_id = new_category_id or items[item_id][1]
+            template = self._template_for(category_id, categories.get(category_id), pattern, None)
+            by_template.setdefault(template, []).append(item_id)
+        
+        now = datetime.now()
+        new_skus: Dict[UUID, str] = {}
+        for template, template_item_ids in by_template.items():
+            if dry_run:
+                first = await self._peek(template)
+            else:
+                first = await self._reserve(template, len(template_item_ids))
+            for number, item_id in enumerate(template_item_ids, start=first):
+                new_skus[item_id] = render_sku(template, number, now)
+        
+        changes = [
+            ItemSkuChange(item_id=item_id, old_sku=items[item_id][0], new_sku=new_skus[item_id])
+            for item_id in item_ids if item_id in new_skus
+        ]
+        rows = [(change.item_id, change.new_sku) for change in changes]
+        
+        conflicts = sorted(
+            sku for sku, count in Counter(new_skus.values()).items() if count > 1
+        )
+        for chunk in _chunks(rows, SKU_REWRITE_CHUNK_SIZE):
+            conflicts.extend(await self._find_taken_skus(chunk))
+        
+        if conflicts and not dry_run:
+            raise ConflictError(
+                f"Regenerated SKUs already in use: {', '.join(sorted(set(conflicts))[:10])}"
+            )
+        
+        if not dry_run:
+            for chunk in _chunks(rows, SKU_REWRITE_CHUNK_SIZE):
+                await self._rewrite_skus(chunk)
+            await self.session.commit()
+        
+        return ItemSkuRegenerateResult(
+            dry_run=dry_run,
+            total_requested=len(item_ids),
+            changes=changes,
+            missing_items=[item_id for item_id in item_ids if item_id not in items],
+            conflicts=sorted(set(conflicts))
+        )
+    
+    async def _find_taken_skus(self, rows: List[Tuple[UUID, str]]) -> List[str]:
+        """New SKUs of ``rows`` that another item already holds.
+        
+        Args:
+            rows: (item_id, new_sku) pairs
+            
+        Returns:
+            Clashing SKUs
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            new_skus = _sku_values(rows)
+            result = await self.session.execute(
+                select(new_skus.c.sku).where(
+                    exists().where(func.upper(Item.sku) == new_skus.c.sku, Item.id != new_skus.c.item_id)
+                )
+            )
+            return list(result.scalars())
+        
+        # SQLite cannot alias the columns of a VALUES list
+        owners = dict((sku, item_id) for item_id, sku in rows)
+        result = await self.session.execute(
+            select(Item.id, func.upper(Item.sku).label("sku")).where(func.upper(Item.sku).in_(owners))
+        )
+        return [row.sku for row in result if owners[row.sku] != row.id]
+    
+    async def _rewrite_skus(self, rows: List[Tuple[UUID, str]]) -> None:
+        """Set each item's SKU in one statement.
+        
+        Args:
+            rows: (item_id, new_sku) pairs
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            new_skus = _sku_values(rows)
+            await self.session.execute(
+                update(Item)
+                .where(Item.id == new_skus.c.item_id)
+                .values(sku=new_skus.c.sku)
+                .execution_options(synchronize_session=False)
+            )
+            return
+        
+        table = Item.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("item_id"))
+            .values(sku=bindparam("new_sku"), updated_at=func.now()),
+            [{"item_id": item_id, "new_sku": sku} for item_id, sku in rows]
+        )
+    
     def get_available_patterns(self) -> Dict[str, str]:
         """Get available SKU patterns with descriptions.
         
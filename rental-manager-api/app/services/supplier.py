@@ -128,31 +128,12 @@ class SupplierService:
     
     async def get_supplier_statistics(self) -> Dict[str, Any]:
         """Get supplier statistics."""
-        # Get basic counts
-        total_suppliers = await self.repository.count_all(active_only=False)
-        active_suppliers = await self.repository.count_all(active_only=True)
-        
-        # Get suppliers by type
-        inventory_suppliers = await self.repository.count_all(
-            supplier_type=SupplierType.INVENTORY, active_only=True
-        )
-        service_suppliers = await self.repository.count_all(
-            supplier_type=SupplierType.SERVICE, active_only=True
-        )
-        
-        # Get suppliers by status
-        approved_suppliers = await self.repository.count_all(
-            status=SupplierStatus.APPROVED, active_only=True
-        )
-        pending_suppliers = await self.repository.count_all(
-            status=SupplierStatus.PENDING, active_only=True
-        )
-        suspended_suppliers = await self.repository.count_all(
-            status=SupplierStatus.SUSPENDED, active_only=True
-        )
-        blacklisted_suppliers = await self.repository.count_all(
-            status=SupplierStatus.BLACKLISTED, active_only=True
-        )
+        # Counts come from the statistics counters in one read
+        stats = await self.repository.get_statistics()
+        total_suppliers = stats["total_suppliers"]
+        active_suppliers = stats["active_suppliers"]
+        by_type = stats["suppliers_by_type"]
+        by_status = stats["suppliers_by_status"]
         
         # Get recent suppliers
         recent_suppliers = await self.repository.get_recent_suppliers(limit=10, active_only=True)
@@ -164,19 +145,16 @@ class SupplierService:
         # Get contracts expiring soon
         contract_expiring_soon = await self.repository.get_suppliers_with_expiring_contracts(days=30, active_only=True)
         
-        # Get statistics from repository
-        stats = await self.repository.get_statistics()
-        
         return {
             "total_suppliers": total_suppliers,
             "active_suppliers": active_suppliers,
             "inactive_suppliers": total_suppliers - active_suppliers,
-            "inventory_suppliers": inventory_suppliers,
-            "service_suppliers": service_suppliers,
-            "approved_suppliers": approved_suppliers,
-            "pending_suppliers": pending_suppliers,
-            "suspended_suppliers": suspended_suppliers,
-            "blacklisted_suppliers": blacklisted_suppliers,
+            "inventory_suppliers": by_type.get(SupplierType.INVENTORY.value, 0),
+            "service_suppliers": by_type.get(SupplierType.SERVICE.value, 0),
+            "approved_suppliers": by_status.get(SupplierStatus.APPROVED.value, 0),
+            "pending_suppliers": by_status.get(SupplierStatus.PENDING.value, 0),
+            "suspended_suppliers": by_status.get(SupplierStatus.SUSPENDED.value, 0),
+            "blacklisted_suppliers": by_status.get(SupplierStatus.BLACKLISTED.value, 0),
             "average_quality_rating": float(stats["average_ratings"][0] or 0) if stats["average_ratings"][0] else 0.0,
             "average_delivery_rating": float(stats["average_ratings"][1] or 0) if stats["average_ratings"][1] else 0.0,
             "suppliers_by_type": stats["suppliers_by_type"],
@@ -5,6 +5,7 @@ Exports all transaction-related service classes.
 
 from .purchase_service import PurchaseService
 from .rental_service import RentalService, RentalPricingStrategy
+from .pricing_engine import RentalPricingEngine, QuoteLine, RentalQuote
 from .sales_service import SalesService
 from .purchase_returns_service import PurchaseReturnsService, ReturnType
 from .transaction_service import TransactionService
@@ -13,6 +14,9 @@ __all__ = [
     "PurchaseService",
     "RentalService",
     "RentalPricingStrategy",
+    "RentalPricingEngine",
+    "QuoteLine",
+    "RentalQuote",
     "SalesService",
     "PurchaseReturnsService",
     "ReturnType",
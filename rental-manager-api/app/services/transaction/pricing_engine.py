@@ -0,0 +1,443 @@
+"""
+Rental pricing engine - prices a whole rental order in one pass.
+
+Items for every line are loaded with a single query into a columnar
+``PricingFrame`` (one list per field, one slot per line). Pricing rules are
+pluggable and each transforms whole columns at once, so the cost of a quote
+is one round trip plus a few list passes regardless of the number of lines.
+
+Catalog rates come from the worker's compiled price books (a dict lookup per
+line, see ``app.services.price_book``) and fall back to the item's own
+``rental_rate_per_day`` when no book prices the item.
+
+Money is carried as integer cents and rates as basis points inside the
+frame; ``Decimal`` only appears at the edges.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+from math import ceil
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import NotFoundError, ValidationError
+from app.crud.item import ItemRepository
+from app.models.transaction.enums import RentalPricingStrategy
+from app.services.price_book import CompiledPriceBooks, PriceBookCache, price_book_cache
+
+BASIS_POINTS = 10_000
+CENTS = Decimal("0.01")
+
+
+def to_cents(value: Optional[Decimal]) -> int:
+    """Convert a money amount to integer cents (None counts as zero)."""
+    if value is None:
+        return 0
+    return int((Decimal(value) / CENTS).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def from_cents(value: int) -> Decimal:
+    """Convert integer cents back to a two-place Decimal."""
+    return Decimal(value).scaleb(-2)
+
+
+def to_basis_points(fraction: Decimal) -> int:
+    """Convert a fraction (0.1 = 10%) to basis points."""
+    return int((Decimal(fraction) * BASIS_POINTS).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def apply_basis_points(amounts: List[int], rates: List[int]) -> List[int]:
+    """Element-wise ``amount * rate``, rounded half-up back to whole cents."""
+    half = BASIS_POINTS // 2
+    return [(amount * rate + half) // BASIS_POINTS for amount, rate in zip(amounts, rates)]
+
+
+def rental_days(start: Union[date, datetime], end: Union[date, datetime]) -> int:
+    """Chargeable days between two dates; part days count as a full day."""
+    if isinstance(start, datetime) and isinstance(end, datetime):
+        return max(ceil((end - start).total_seconds() / 86400), 1)
+    return max((end - start).days, 1)
+
+
+@dataclass(frozen=True)
+class QuoteLine:
+    """One requested rental line."""
+
+    item_id: UUID
+    quantity: int
+    daily_rate: Optional[Decimal] = None  # agreed rate overriding the catalog rate
+    discount_percent: Optional[Decimal] = None
+
+
+@dataclass
+class PricingFrame:
+    """Columnar view of an order that pricing rules read and write."""
+
+    strategy: RentalPricingStrategy
+    start_date: Union[date, datetime]
+    rental_days: int
+    item_ids: List[UUID]
+    item_names: List[str]
+    skus: List[str]
+    quantity: List[int]
+    base_rate: List[int]        # catalog or agreed daily rate, cents
+    unit_deposit: List[int]     # deposit per unit, cents
+    discount_rate: List[int]    # requested line discount, basis points
+    weekly_rate: List[int] = field(default_factory=list)     # price book 7-day rate, cents (0: none)
+    monthly_rate: List[int] = field(default_factory=list)    # price book 30-day rate, cents (0: none)
+    price_book_ids: List[Optional[UUID]] = field(default_factory=list)
+    rate_factor: List[int] = field(default_factory=list)     # basis points applied to base_rate
+    line_subtotal: List[int] = field(default_factory=list)   # cents
+    line_discount: List[int] = field(default_factory=list)   # cents
+    line_deposit: List[int] = field(default_factory=list)    # cents
+    tax_rate: int = 0                                         # basis points of the taxable amount
+
+    def __post_init__(self):
+        size = len(self.item_ids)
+        self.rate_factor = self.rate_factor or [BASIS_POINTS] * size
+        self.line_subtotal = self.line_subtotal or [0] * size
+        self.line_discount = self.line_discount or [0] * size
+        self.line_deposit = self.line_deposit or [0] * size
+        self.weekly_rate = self.weekly_rate or [0] * size
+        self.monthly_rate = self.monthly_rate or [0] * size
+        self.price_book_ids = self.price_book_ids or [None] * size
+
+    @property
+    def size(self) -> int:
+        return len(self.item_ids)
+
+    def scale_rates(self, factor: int) -> None:
+        """Apply one rate factor (basis points) to every line."""
+        self.rate_factor = [(rate * factor) // BASIS_POINTS for rate in self.rate_factor]
+
+
+class PricingRule:
+    """
+    One step of the pricing pipeline.
+
+    Rules mutate frame columns in place. ``strategies`` restricts a rule to
+    orders priced with one of the given strategies (empty: always applies).
+    """
+
+    name = "rule"
+    strategies: Tuple[RentalPricingStrategy, ...] = ()
+
+    def applies(self, frame: PricingFrame) -> bool:
+        return not self.strategies or frame.strategy in self.strategies
+
+    def apply(self, frame: PricingFrame) -> None:
+        raise NotImplementedError
+
+
+class DurationTierRule(PricingRule):
+    """
+    Discount the daily rate of long rentals (TIERED strategy).
+
+    Lines whose price book sets a monthly (30-day) or weekly (7-day) rate use
+    that rate's daily equivalent; other lines get the generic tier factor.
+    """
+
+    name = "duration_tier"
+    strategies = (RentalPricingStrategy.TIERED,)
+
+    def __init__(self, tiers: Sequence[Tuple[int, Decimal]] = ((30, Decimal("0.8")), (7, Decimal("0.9")))):
+        # Longest tier first so the best matching discount wins
+        self.tiers = sorted(((days, to_basis_points(factor)) for days, factor in tiers), reverse=True)
+
+    def apply(self, frame: PricingFrame) -> None:
+        factor = next((factor for min_days, factor in self.tiers if frame.rental_days >= min_days), BASIS_POINTS)
+        if frame.rental_days >= 30:
+            period, book_rates = 30, frame.monthly_rate
+        elif frame.rental_days >= 7:
+            period, book_rates = 7, frame.weekly_rate
+        else:
+            period, book_rates = 1, [0] * frame.size
+
+        factors = [
+            (book_rate * BASIS_POINTS + period * base // 2) // (period * base) if book_rate and base else factor
+            for book_rate, base in zip(book_rates, frame.base_rate)
+        ]
+        frame.rate_factor = [(rate * line_factor) // BASIS_POINTS for rate, line_factor in zip(frame.rate_factor, factors)]
+
+
+class SeasonalRule(PricingRule):
+    """Adjust the daily rate by the month the rental starts in (SEASONAL strategy)."""
+
+    name = "seasonal"
+    strategies = (RentalPricingStrategy.SEASONAL,)
+
+    DEFAULT_FACTORS = {
+        6: Decimal("1.2"), 7: Decimal("1.2"), 8: Decimal("1.2"),    # summer peak
+        12: Decimal("0.9"), 1: Decimal("0.9"), 2: Decimal("0.9"),   # winter low
+    }
+
+    def __init__(self, month_factors: Optional[Dict[int, Decimal]] = None):
+        factors = self.DEFAULT_FACTORS if month_factors is None else month_factors
+        self.month_factors = {month: to_basis_points(factor) for month, factor in factors.items()}
+
+    def apply(self, frame: PricingFrame) -> None:
+        factor = self.month_factors.get(frame.start_date.month)
+        if factor is not None:
+            frame.scale_rates(factor)
+
+
+class LineTotalRule(PricingRule):
+    """Line subtotal = adjusted daily rate x days x quantity."""
+
+    name = "line_total"
+
+    def apply(self, frame: PricingFrame) -> None:
+        days = frame.rental_days
+        frame.line_subtotal = apply_basis_points(
+            [rate * days * quantity for rate, quantity in zip(frame.base_rate, frame.quantity)],
+            frame.rate_factor,
+        )
+
+
+class LineDiscountRule(PricingRule):
+    """Per-line percentage discount requested on the order."""
+
+    name = "line_discount"
+
+    def apply(self, frame: PricingFrame) -> None:
+        frame.line_discount = apply_basis_points(frame.line_subtotal, frame.discount_rate)
+
+
+class SecurityDepositRule(PricingRule):
+    """Deposit = the item's security deposit per unit x quantity."""
+
+    name = "security_deposit"
+
+    def apply(self, frame: PricingFrame) -> None:
+        frame.line_deposit = [
+            deposit * quantity for deposit, quantity in zip(frame.unit_deposit, frame.quantity)
+        ]
+
+
+class TaxRule(PricingRule):
+    """Flat tax on the discounted order subtotal."""
+
+    name = "tax"
+
+    def __init__(self, rate: Decimal = Decimal("0.10")):
+        self.rate = to_basis_points(rate)
+
+    def apply(self, frame: PricingFrame) -> None:
+        frame.tax_rate = self.rate
+
+
+def default_rules() -> List[PricingRule]:
+    """Rate adjustments first, then line totals, discounts, deposits and tax."""
+    return [
+        DurationTierRule(),
+        SeasonalRule(),
+        LineTotalRule(),
+        LineDiscountRule(),
+        SecurityDepositRule(),
+        TaxRule(),
+    ]
+
+
+@dataclass
+class QuotedLine:
+    """Priced result for one requested line."""
+
+    item_id: UUID
+    item_name: str
+    sku: str
+    quantity: int
+    rental_days: int
+    base_daily_rate: Decimal
+    applied_daily_rate: Decimal
+    subtotal: Decimal
+    discount_amount: Decimal
+    line_total: Decimal
+    deposit_amount: Decimal
+    price_book_id: Optional[UUID] = None  # book the base rate came from
+
+
+@dataclass
+class RentalQuote:
+    """Priced rental order."""
+
+    pricing_strategy: RentalPricingStrategy
+    rental_days: int
+    lines: List[QuotedLine]
+    subtotal: Decimal
+    discount_amount: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
+    security_deposit: Decimal
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    def as_pricing(self) -> Dict[str, Decimal]:
+        """Order totals in the shape used by rental creation."""
+        return {
+            "subtotal": self.subtotal,
+            "discount_amount": self.discount_amount,
+            "tax_amount": self.tax_amount,
+            "total_amount": self.total_amount,
+            "security_deposit": self.security_deposit,
+        }
+
+
+class RentalPricingEngine:
+    """Quotes rental orders with one item query and a pipeline of pricing rules."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        rules: Optional[Sequence[PricingRule]] = None,
+        price_books: PriceBookCache = price_book_cache,
+    ):
+        self.session = session
+        self.item_repo = ItemRepository(session)
+        self.rules = list(rules) if rules is not None else default_rules()
+        self.price_books = price_books
+
+    async def quote(
+        self,
+        lines: Sequence[QuoteLine],
+        start_date: Union[date, datetime],
+        end_date: Union[date, datetime],
+        strategy: RentalPricingStrategy = RentalPricingStrategy.STANDARD,
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None,
+    ) -> RentalQuote:
+        """
+        Price an order.
+
+        ``location_id`` and ``customer_segment`` select the price books that
+        apply; books are matched on the rental start date.
+
+        Raises:
+            ValidationError: If there are no lines or an item cannot be rented
+            NotFoundError: If an item does not exist
+        """
+        if not lines:
+            raise ValidationError("A quote needs at least one line", field="items")
+        if end_date <= start_date:
+            raise ValidationError("Rental end date must be after start date", field="rental_end_date")
+
+        rows = await self.item_repo.get_pricing_rows([line.item_id for line in lines])
+        items = {row.id: row for row in rows}
+
+        missing = sorted({str(line.item_id) for line in lines if line.item_id not in items})
+        if missing:
+            raise NotFoundError(f"Items not found: {', '.join(missing)}", resource_type="Item")
+
+        unavailable = sorted({
+            str(row.id) for row in rows
+            if not row.is_active or not row.is_rentable or row.is_rental_blocked
+        })
+        if unavailable:
+            raise ValidationError(
+                "Some items cannot be rented",
+                field="items",
+                details={"unavailable_items": unavailable},
+            )
+
+        compiled = await self.price_books.get(self.session)
+        frame = self._build_frame(
+            lines, items, compiled, start_date, end_date, strategy, location_id, customer_segment
+        )
+        for rule in self.rules:
+            if rule.applies(frame):
+                rule.apply(frame)
+        return self._to_quote(frame)
+
+    @staticmethod
+    def _build_frame(
+        lines: Sequence[QuoteLine],
+        items: Dict[UUID, object],
+        compiled: CompiledPriceBooks,
+        start_date: Union[date, datetime],
+        end_date: Union[date, datetime],
+        strategy: RentalPricingStrategy,
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None,
+    ) -> PricingFrame:
+        ordered = [items[line.item_id] for line in lines]
+        book_rates = [
+            compiled.resolve(line.item_id, start_date, location_id, customer_segment) for line in lines
+        ]
+        return PricingFrame(
+            strategy=strategy,
+            start_date=start_date,
+            rental_days=rental_days(start_date, end_date),
+            item_ids=[line.item_id for line in lines],
+            item_names=[row.item_name for row in ordered],
+            skus=[row.sku for row in ordered],
+            quantity=[line.quantity for line in lines],
+            base_rate=[
+                to_cents(
+                    line.daily_rate if line.daily_rate is not None
+                    else book.rental_rate_per_day if book is not None
+                    else row.rental_rate_per_day
+                )
+                for line, row, book in zip(lines, ordered, book_rates)
+            ],
+            unit_deposit=[
+                to_cents(
+                    book.security_deposit if book is not None and book.security_deposit is not None
+                    else row.security_deposit
+                )
+                for row, book in zip(ordered, book_rates)
+            ],
+            discount_rate=[
+                to_basis_points(line.discount_percent / 100) if line.discount_percent else 0
+                for line in lines
+            ],
+            # An agreed daily rate replaces the book's weekly and monthly rates as well
+            weekly_rate=[
+                to_cents(book.weekly_rate) if book is not None and line.daily_rate is None else 0
+                for line, book in zip(lines, book_rates)
+            ],
+            monthly_rate=[
+                to_cents(book.monthly_rate) if book is not None and line.daily_rate is None else 0
+                for line, book in zip(lines, book_rates)
+            ],
+            price_book_ids=[book.price_book_id if book is not None else None for book in book_rates],
+        )
+
+    @staticmethod
+    def _to_quote(frame: PricingFrame) -> RentalQuote:
+        applied_rates = apply_basis_points(frame.base_rate, frame.rate_factor)
+        subtotal = sum(frame.line_subtotal)
+        discount = sum(frame.line_discount)
+        taxable = subtotal - discount
+        tax = (taxable * frame.tax_rate + BASIS_POINTS // 2) // BASIS_POINTS
+
+        lines = [
+            QuotedLine(
+                item_id=frame.item_ids[index],
+                item_name=frame.item_names[index],
+                sku=frame.skus[index],
+                quantity=frame.quantity[index],
+                rental_days=frame.rental_days,
+                base_daily_rate=from_cents(frame.base_rate[index]),
+                applied_daily_rate=from_cents(applied_rates[index]),
+                subtotal=from_cents(frame.line_subtotal[index]),
+                discount_amount=from_cents(frame.line_discount[index]),
+                line_total=from_cents(frame.line_subtotal[index] - frame.line_discount[index]),
+                deposit_amount=from_cents(frame.line_deposit[index]),
+                price_book_id=frame.price_book_ids[index],
+            )
+            for index in range(frame.size)
+        ]
+        return RentalQuote(
+            pricing_strategy=frame.strategy,
+            rental_days=frame.rental_days,
+            lines=lines,
+            subtotal=from_cents(subtotal),
+            discount_amount=from_cents(discount),
+            tax_amount=from_cents(tax),
+            total_amount=from_cents(taxable + tax),
+            security_deposit=from_cents(sum(frame.line_deposit)),
+        )
@@ -8,7 +8,6 @@ from uuid import UUID
 from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
 import logging
-from enum import Enum
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func, or_
@@ -21,6 +20,7 @@ from app.models.transaction import (
     LineItemType, RentalStatus, RentalPeriodUnit,
     InspectionStatus, ConditionRating, ItemDisposition
 )
+from app.models.transaction.enums import RentalPricingStrategy
 from app.models.transaction.rental_lifecycle import (
     RentalLifecycle, RentalReturnEvent, RentalItemInspection,
     ReturnEventType, InspectionCondition
@@ -29,6 +29,7 @@ from app.models.customer import Customer
 from app.models.location import Location
 from app.models.item import Item
 
+from app.crud import statements
 from app.crud.transaction import (
     TransactionHeaderRepository,
     TransactionLineRepository,
@@ -46,18 +47,11 @@ from app.schemas.transaction.rental import (
 )
 
 from app.core.errors import NotFoundError, ValidationError, ConflictError
+from app.services.transaction.pricing_engine import QuoteLine, RentalPricingEngine, RentalQuote
 
 logger = logging.getLogger(__name__)
 
 
-class RentalPricingStrategy(Enum):
-    """Rental pricing calculation strategies."""
-    STANDARD = "STANDARD"  # Fixed daily/weekly/monthly rates
-    DYNAMIC = "DYNAMIC"    # Demand-based pricing
-    SEASONAL = "SEASONAL"  # Season-adjusted pricing
-    TIERED = "TIERED"     # Duration-based discounts
-
-
 class RentalService:
     """Service for handling rental transaction operations with lifecycle management."""
     
@@ -76,6 +70,7 @@ class RentalService:
         self.customer_repo = CustomerRepository(session)
         self.location_repo = LocationCRUD(session)
         self.item_repo = ItemRepository(session)
+        self.pricing_engine = RentalPricingEngine(session)
     
     async def create_rental(
         self,
@@ -124,12 +119,17 @@ class RentalService:
             transaction_number = await self._generate_transaction_number()
             
             # Calculate rental pricing
-            pricing = await self._calculate_rental_pricing(
+            # Already loaded by validation, so this is an identity map hit
+            customer = await self.session.get(Customer, rental_data.customer_id)
+            quote = await self._calculate_rental_pricing(
                 rental_data.items,
                 rental_data.rental_start_date,
                 rental_data.rental_end_date,
-                rental_data.pricing_strategy or RentalPricingStrategy.STANDARD
+                rental_data.pricing_strategy or RentalPricingStrategy.STANDARD,
+                location_id=rental_data.location_id,
+                customer_segment=customer.customer_tier if customer else None
             )
+            pricing = quote.as_pricing()
             
             # Create transaction header
             transaction = TransactionHeader(
@@ -168,6 +168,7 @@ class RentalService:
             lines = await self._create_rental_lines(
                 transaction.id,
                 rental_data.items,
+                quote,
                 rental_data.rental_start_date,
                 rental_data.rental_end_date,
                 created_by
@@ -681,31 +682,7 @@ class RentalService:
         end_date: date
     ) -> List[Dict]:
         """Find existing rentals that conflict with the requested period."""
-        query = select(TransactionLine).where(
-            and_(
-                TransactionLine.item_id == item_id,
-                TransactionLine.current_rental_status.in_([
-                    RentalStatus.RENTAL_INPROGRESS,
-                    RentalStatus.RENTAL_EXTENDED
-                ]),
-                or_(
-                    and_(
-                        TransactionLine.rental_start_date <= start_date,
-                        TransactionLine.rental_end_date >= start_date
-                    ),
-                    and_(
-                        TransactionLine.rental_start_date <= end_date,
-                        TransactionLine.rental_end_date >= end_date
-                    ),
-                    and_(
-                        TransactionLine.rental_start_date >= start_date,
-                        TransactionLine.rental_end_date <= end_date
-                    )
-                )
-            )
-        ).options(selectinload(TransactionLine.transaction))
-        
-        result = await self.session.execute(query)
+        result = await self.session.execute(statements.rental_conflicts(item_id, start_date, end_date))
         conflicts = result.scalars().all()
         
         return [
@@ -723,94 +700,45 @@ class RentalService:
         items: List[RentalItemCreate],
         start_date: date,
         end_date: date,
-        strategy: RentalPricingStrategy
-    ) -> Dict[str, Decimal]:
-        """Calculate rental pricing based on items and period."""
-        subtotal = Decimal("0.00")
-        security_deposit = Decimal("0.00")
-        discount_amount = Decimal("0.00")
-        
-        duration_days = (end_date - start_date).days
-        
-        for item_data in items:
-            item = await self.item_repo.get_by_id(item_data.item_id)
-            if not item:
-                continue
-            
-            # Get base rate
-            if item_data.custom_daily_rate:
-                daily_rate = item_data.custom_daily_rate
-            else:
-                daily_rate = item.rental_rates.get("daily", Decimal("0.00"))
-            
-            # Apply pricing strategy
-            if strategy == RentalPricingStrategy.TIERED:
-                # Apply duration discounts
-                if duration_days >= 30:
-                    daily_rate *= Decimal("0.8")  # 20% discount for monthly
-                elif duration_days >= 7:
-                    daily_rate *= Decimal("0.9")  # 10% discount for weekly
-            elif strategy == RentalPricingStrategy.SEASONAL:
-                # Apply seasonal adjustments (simplified)
-                current_month = datetime.now().month
-                if current_month in [6, 7, 8]:  # Summer peak
-                    daily_rate *= Decimal("1.2")  # 20% increase
-                elif current_month in [12, 1, 2]:  # Winter low
-                    daily_rate *= Decimal("0.9")  # 10% discount
-            
-            # Calculate line totals
-            line_total = daily_rate * duration_days * item_data.quantity
-            subtotal += line_total
-            
-            # Calculate security deposit
-            item_deposit = item.replacement_value * self.SECURITY_DEPOSIT_PERCENTAGE * item_data.quantity
-            security_deposit += item_deposit
-            
-            # Apply item-specific discount if provided
-            if item_data.discount_percent:
-                item_discount = line_total * item_data.discount_percent / 100
-                discount_amount += item_discount
-        
-        # Calculate tax (simplified - would be more complex in production)
-        tax_rate = Decimal("0.10")  # 10% tax
-        taxable_amount = subtotal - discount_amount
-        tax_amount = taxable_amount * tax_rate
-        
-        total_amount = taxable_amount + tax_amount
-        
-        return {
-            "subtotal": subtotal,
-            "discount_amount": discount_amount,
-            "tax_amount": tax_amount,
-            "total_amount": total_amount,
-            "security_deposit": security_deposit
-        }
+        strategy: RentalPricingStrategy,
+        location_id: Optional[UUID] = None,
+        customer_segment: Optional[str] = None
+    ) -> RentalQuote:
+        """Price all rental lines in one pass with the pricing engine."""
+        return await self.pricing_engine.quote(
+            [
+                # A zero agreed rate means "use the catalog rate"
+                QuoteLine(
+                    item_id=item_data.item_id,
+                    quantity=item_data.quantity,
+                    daily_rate=item_data.daily_rate or None
+                )
+                for item_data in items
+            ],
+            start_date,
+            end_date,
+            strategy,
+            location_id=location_id,
+            customer_segment=customer_segment
+        )
     
     async def _create_rental_lines(
         self,
         transaction_id: UUID,
         items: List[RentalItemCreate],
+        quote: RentalQuote,
         start_date: date,
         end_date: date,
         created_by: Optional[str] = None
     ) -> List[TransactionLine]:
-        """Create transaction lines for rental."""
+        """Create transaction lines for rental from the priced quote."""
         lines = []
-        duration_days = (end_date - start_date).days
+        catalog = await self.item_repo.get_by_ids(
+            [item_data.item_id for item_data in items], include_relations=True
+        )
         
-        for idx, item_data in enumerate(items, 1):
-            item = await self.item_repo.get_by_id(item_data.item_id)
-            if not item:
-                continue
-            
-            # Get rental rate
-            if item_data.custom_daily_rate:
-                daily_rate = item_data.custom_daily_rate
-            else:
-                daily_rate = item.rental_rates.get("daily", Decimal("0.00"))
-            
-            # Calculate line totals
-            line_total = daily_rate * duration_days * item_data.quantity
+        for idx, (item_data, quoted) in enumerate(zip(items, quote.lines), 1):
+            item = catalog[item_data.item_id]
             
             # Create line
             line = TransactionLine(
@@ -823,15 +751,16 @@ class RentalService:
                 category=item.category.category_name if item.category else None,
                 quantity=item_data.quantity,
                 unit_of_measure=item.unit_of_measurement.abbreviation if item.unit_of_measurement else None,
-                unit_price=daily_rate,
-                total_price=line_total,
-                line_total=line_total,
+                unit_price=quoted.applied_daily_rate,
+                total_price=quoted.subtotal,
+                discount_amount=quoted.discount_amount,
+                line_total=quoted.line_total,
                 rental_start_date=start_date,
                 rental_end_date=end_date,
-                rental_period=duration_days,
+                rental_period=quoted.rental_days,
                 rental_period_unit=RentalPeriodUnit.DAY,
                 current_rental_status=RentalStatus.RENTAL_INPROGRESS,
-                daily_rate=daily_rate,
+                daily_rate=quoted.applied_daily_rate,
                 location_id=item_data.pickup_location_id,
                 status="PENDING",
                 fulfillment_status="PENDING",
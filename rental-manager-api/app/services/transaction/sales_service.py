@@ -29,6 +29,7 @@ from app.crud.transaction import (
     TransactionEventRepository,
 )
 from app.crud.customer import CustomerRepository
+from app.crud.customer_credit_exposure import CustomerCreditExposureRepository
 from app.crud.location import LocationCRUD  
 from app.crud.item import ItemRepository
 
@@ -58,6 +59,7 @@ class SalesService:
         self.line_repo = TransactionLineRepository(session)
         self.event_repo = TransactionEventRepository(session)
         self.customer_repo = CustomerRepository(session)
+        self.credit_exposure_repo = CustomerCreditExposureRepository(session)
         self.location_repo = LocationCRUD(session)
         self.item_repo = ItemRepository(session)
     
@@ -204,6 +206,8 @@ class SalesService:
                 if transaction.is_paid:
                     transaction.status = TransactionStatus.COMPLETED
             
+            await self._update_credit_exposure(transaction, was_open=False, old_balance=Decimal("0.00"))
+            
             await self.session.commit()
             
             # Reload with relationships
@@ -302,6 +306,7 @@ class SalesService:
             )
         
         old_status = transaction.status
+        was_open = self._counts_towards_credit(transaction)
         transaction.status = status_update.status
         transaction.updated_by = updated_by
         
@@ -325,6 +330,8 @@ class SalesService:
             for line in transaction.transaction_lines:
                 line.status = "CANCELLED"
                 line.fulfillment_status = "CANCELLED"
+            
+            await self._update_credit_exposure(transaction, was_open, transaction.balance_due)
         
         await self.session.flush()
         
@@ -366,7 +373,10 @@ class SalesService:
             raise ValidationError("Cannot process payment for cancelled sale")
         
         # Add payment
+        was_open = self._counts_towards_credit(transaction)
+        old_balance = transaction.balance_due
         transaction.add_payment(amount, processed_by)
+        await self._update_credit_exposure(transaction, was_open, old_balance)
         
         # Update payment method if different
         if payment_method != transaction.payment_method:
@@ -612,53 +622,6 @@ class SalesService:
         
         return stock_issues
     
-    async def _check_customer_credit(
-        self,
-        customer_id: UUID,
-        items: List[SalesItemCreate]
-    ) -> Dict[str, Any]:
-        """Check customer credit for credit sales."""
-        customer = await self.customer_repo.get_by_id(customer_id)
-        if not customer:
-            return {"approved": False, "reason": "Customer not found"}
-        
-        # Calculate order total
-        totals = self._calculate_sales_pricing(items, Decimal("0"), Decimal("0"))
-        order_amount = totals["total_amount"]
-        
-        # Get customer's current credit usage
-        current_credit = await self._get_customer_credit_usage(customer_id)
-        
-        # Check credit limit
-        if customer.credit_limit:
-            available_credit = customer.credit_limit - current_credit
-            if order_amount > available_credit:
-                return {
-                    "approved": False,
-                    "reason": "Exceeds credit limit",
-                    "credit_limit": customer.credit_limit,
-                    "current_usage": current_credit,
-                    "available": available_credit,
-                    "order_amount": order_amount
-                }
-        
-        # Check for overdue payments
-        overdue = await self._check_overdue_payments(customer_id)
-        if overdue:
-            return {
-                "approved": False,
-                "reason": "Has overdue payments",
-                "overdue_count": len(overdue),
-                "overdue_amount": sum(o["amount"] for o in overdue)
-            }
-        
-        return {
-            "approved": True,
-            "credit_limit": customer.credit_limit,
-            "current_usage": current_credit,
-            "available": customer.credit_limit - current_credit if customer.credit_limit else None
-        }
-    
     def _calculate_sales_pricing(
         self,
         items: List[SalesItemCreate],
@@ -847,45 +810,42 @@ class SalesService:
         # Simplified for now
         return Decimal("100.00")
     
-    async def _get_customer_credit_usage(self, customer_id: UUID) -> Decimal:
-        """Get current credit usage for a customer."""
-        # Sum unpaid sales on credit
-        query = select(func.sum(TransactionHeader.balance_due)).where(
-            and_(
-                TransactionHeader.customer_id == customer_id,
-                TransactionHeader.transaction_type == TransactionType.SALE,
-                TransactionHeader.payment_status != PaymentStatus.PAID,
-                TransactionHeader.status != TransactionStatus.CANCELLED
-            )
+    @staticmethod
+    def _counts_towards_credit(transaction: TransactionHeader) -> bool:
+        """Whether a sale is open, i.e. part of its customer's credit exposure."""
+        return bool(
+            transaction.customer_id
+            and transaction.transaction_type == TransactionType.SALE
+            and transaction.status != TransactionStatus.CANCELLED
+            and transaction.payment_status != PaymentStatus.PAID
         )
-        result = await self.session.execute(query)
-        return result.scalar() or Decimal("0.00")
     
-    async def _check_overdue_payments(self, customer_id: UUID) -> List[Dict]:
-        """Check for overdue payments for a customer."""
-        # Get unpaid sales past due date
-        query = select(TransactionHeader).where(
-            and_(
-                TransactionHeader.customer_id == customer_id,
-                TransactionHeader.transaction_type == TransactionType.SALE,
-                TransactionHeader.payment_status != PaymentStatus.PAID,
-                TransactionHeader.due_date < date.today(),
-                TransactionHeader.status != TransactionStatus.CANCELLED
-            )
+    async def _update_credit_exposure(
+        self,
+        transaction: TransactionHeader,
+        was_open: bool,
+        old_balance: Decimal
+    ) -> None:
+        """Apply a sale's change in balance due to its customer's credit exposure row."""
+        is_open = self._counts_towards_credit(transaction)
+        balance_delta = (transaction.balance_due if is_open else Decimal("0.00")) - (
+            old_balance if was_open else Decimal("0.00")
         )
-        result = await self.session.execute(query)
-        overdue = result.scalars().all()
-        
-        return [
-            {
-                "transaction_id": str(tx.id),
-                "transaction_number": tx.transaction_number,
-                "due_date": tx.due_date,
-                "amount": tx.balance_due,
-                "days_overdue": (date.today() - tx.due_date).days
-            }
-            for tx in overdue
-        ]
+        open_delta = int(is_open) - int(was_open)
+        if not balance_delta and not open_delta:
+            return
+        
+        past_due = transaction.due_date is not None and transaction.due_date < date.today()
+        await self.credit_exposure_repo.apply(
+            transaction.customer_id,
+            balance_delta,
+            open_sales_delta=open_delta,
+            overdue_delta=open_delta if past_due else 0,
+            due_date=transaction.due_date if open_delta > 0 else None
+        )
+        # A closed sale may have been the one holding the oldest due date
+        if open_delta < 0 and transaction.due_date is not None:
+            await self.credit_exposure_repo.refresh_due_dates(transaction.customer_id)
     
     # Missing methods for test compatibility
     def _calculate_totals(self, items: List[Dict], discounts: List[Dict] = None) -> Dict[str, Decimal]:
@@ -917,8 +877,8 @@ class SalesService:
         }
     
     async def _check_customer_credit(self, customer_id: UUID, items: List) -> Dict[str, Any]:
-        """Check customer credit for order."""
-        customer = await self.customer_repo.get_by_id(customer_id)
+        """Check customer credit for order against the customer's credit exposure row."""
+        customer, exposure = await self.credit_exposure_repo.get_with_customer(customer_id)
         if not customer:
             return {"approved": False, "reason": "Customer not found"}
         
@@ -928,8 +888,8 @@ class SalesService:
             order_amount += Decimal(str(item.quantity)) * Decimal(str(item.unit_price))
         
         # Get current balance
-        current_balance = await self._get_customer_credit_usage(customer_id)
-        credit_limit = getattr(customer, 'credit_limit', Decimal("0.00"))
+        current_balance = exposure.outstanding_balance if exposure else Decimal("0.00")
+        credit_limit = getattr(customer, 'credit_limit', None) or Decimal("0.00")
         available_credit = credit_limit - current_balance
         
         if order_amount > available_credit:
@@ -942,6 +902,15 @@ class SalesService:
                 "suggested_payment": suggested_payment
             }
         
+        if exposure and exposure.has_overdue:
+            return {
+                "approved": False,
+                "reason": "Has overdue payments",
+                # The count is refreshed nightly; a due date passed since then is still overdue
+                "overdue_count": max(exposure.overdue_count, 1),
+                "oldest_overdue_date": exposure.oldest_overdue_date
+            }
+        
         return {
             "approved": True,
             "available_credit": available_credit,
@@ -972,15 +941,17 @@ class SalesService:
         if payment_data.amount > transaction.balance_due:
             raise ValueError(f"Payment amount {payment_data.amount} exceeds balance {transaction.balance_due}")
         
-        # Update payment status
+        # Update payment status (balance_due is derived from paid_amount)
+        was_open = self._counts_towards_credit(transaction)
+        old_balance = transaction.balance_due
         transaction.paid_amount += payment_data.amount
-        transaction.balance_due -= payment_data.amount
         
         if transaction.balance_due <= 0:
             transaction.payment_status = PaymentStatus.PAID
         elif transaction.paid_amount > 0:
             transaction.payment_status = PaymentStatus.PARTIAL
         
+        await self._update_credit_exposure(transaction, was_open, old_balance)
         await self.session.commit()
         
         # Create response from transaction data
@@ -1007,7 +978,9 @@ class SalesService:
         if not transaction:
             raise NotFoundError(f"Sales transaction {sales_id} not found")
         
+        was_open = self._counts_towards_credit(transaction)
         transaction.status = status
+        await self._update_credit_exposure(transaction, was_open, transaction.balance_due)
         await self.session.commit()
         
         # Publish event
@@ -1044,7 +1017,9 @@ class SalesService:
         if transaction.payment_status == PaymentStatus.PAID:
             raise ValueError("Cannot cancel paid order")
         
+        was_open = self._counts_towards_credit(transaction)
         transaction.status = TransactionStatus.CANCELLED
+        await self._update_credit_exposure(transaction, was_open, transaction.balance_due)
         await self.session.commit()
         
         # Reverse inventory allocation
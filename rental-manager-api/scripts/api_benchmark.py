@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+End-to-end API benchmark.
+
+Runs the workloads in scripts.api_workloads.WORKLOADS and writes one JSON
+report with p50/p95/p99 latency, throughput, errors and SQL statements
+per request for each workload.
+
+Without --base-url the app runs in process (httpx ASGITransport) against
+settings.DATABASE_URL, with its normal lifespan. With --base-url the
+requests go to a running stack; statement counts then need
+SQL_PROFILING_ENABLED on the server.
+
+    python scripts/api_benchmark.py --username admin --password ... --output bench.json
+    python scripts/api_benchmark.py --base-url http://localhost:8000 --workload catalog_browse \\
+        --username admin --password ... --compare bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+
+from scripts.api_workloads import WORKLOADS, BenchmarkSetupError, compare_reports, login, run_workload
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark API workloads')
+    parser.add_argument('--workload', nargs='*', choices=sorted(WORKLOADS), help='Workloads to run (default: all)')
+    parser.add_argument('--base-url', help='Benchmark a running stack instead of the in-process app')
+    parser.add_argument('--username', help='User to log in as')
+    parser.add_argument('--password', help='Password for --username')
+    parser.add_argument('--token', help='Bearer token to use instead of logging in')
+    parser.add_argument('--iterations', type=int, default=200, help='Measured steps per workload (default: 200)')
+    parser.add_argument('--concurrency', type=int, help="Virtual users (default: each workload's own)")
+    parser.add_argument('--warmup', type=int, default=10, help='Unmeasured steps first (default: 10)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the request mix (default: 0)')
+    parser.add_argument('--output', type=Path, help='Write the JSON report here')
+    parser.add_argument('--compare', type=Path, help='Earlier JSON report to compare with')
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace, http: httpx.AsyncClient, in_process: bool) -> dict:
+    if args.token:
+        http.headers["Authorization"] = f"Bearer {args.token}"
+    elif args.username:
+        await login(http, args.username, args.password or "")
+
+    reports = {}
+    for name in args.workload or sorted(WORKLOADS):
+        print(f"🏃 {name}...")
+        reports[name] = await run_workload(
+            http, WORKLOADS[name],
+            iterations=args.iterations,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            seed=args.seed,
+            count_in_process=in_process,
+        )
+    return reports
+
+
+async def main() -> int:
+    args = parse_args()
+    timeout = httpx.Timeout(60.0)
+
+    try:
+        if args.base_url:
+            async with httpx.AsyncClient(base_url=args.base_url, timeout=timeout) as http:
+                reports = await run(args, http, in_process=False)
+        else:
+            from app.core.database import db_manager
+            from app.core.query_profiler import query_profiler
+            from app.main import app
+
+            async with app.router.lifespan_context(app):
+                query_profiler.instrument(db_manager.engine)
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=timeout) as http:
+                    reports = await run(args, http, in_process=True)
+    except (BenchmarkSetupError, httpx.HTTPStatusError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    previous = json.loads(args.compare.read_text()) if args.compare else {}
+    for name, report in reports.items():
+        overall = report["overall"]
+        latency = overall["latency_ms"]
+        queries = overall["queries_per_request"]
+        print(f"{name:<24} {overall['requests']:>6} req  {overall['throughput_rps']:>8.1f} req/s  "
+              f"p50 {latency['p50']:>8.2f}  p95 {latency['p95']:>8.2f}  p99 {latency['p99']:>8.2f} ms  "
+              f"errors {overall['errors']}  queries {queries['mean'] if queries else '-'}")
+        if name in previous:
+            changes = compare_reports(report, previous[name])
+            print("   vs previous: " + "  ".join(
+                f"{key} {value:+.1%}" for key, value in changes.items() if value is not None
+            ))
+
+    if args.output:
+        args.output.write_text(json.dumps(reports, indent=2) + "\n")
+        print(f"💾 Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
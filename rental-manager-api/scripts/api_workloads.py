@@ -0,0 +1,389 @@
+"""
+End-to-end API benchmark workloads with percentile reporting.
+
+A workload is a named, seeded sequence of API calls that mimics one kind
+of traffic (see ``WORKLOADS``). ``run_workload`` drives it with a number
+of concurrent virtual users through any ``httpx.AsyncClient``. That can be
+the in-process app behind ``ASGITransport`` or a running stack reached
+over HTTP. The run reports the following as a JSON-ready dict, overall
+and per request label:
+
+- latency percentiles (p50/p95/p99);
+- throughput;
+- error counts;
+- SQL statements per request.
+
+Statement counts come from the ``X-DB-Query-Count`` header set by the
+query-profiling middleware. In process, the benchmark also collects them
+directly from the instrumented engine, so profiling need not be on.
+
+Workloads look up the ids they use (items, stock levels, customers)
+through the API during setup, which is not measured. They therefore work
+against any populated database, for example one seeded with
+:func:`scripts.plan_datasets.seed_datasets` plus some opening stock.
+``scripts/api_benchmark.py`` is the command-line front end.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.query_profiler import query_profiler
+
+API = "/api/v1"
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+PERCENTILES = (50, 95, 99)
+
+
+class BenchmarkSetupError(RuntimeError):
+    """The target has no data a workload needs."""
+
+
+@dataclass
+class Sample:
+    """One measured request."""
+
+    label: str
+    status: int
+    latency: float  # seconds
+    queries: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+
+class BenchmarkClient:
+    """
+    Wraps an ``httpx.AsyncClient`` and records every request made through it.
+
+    Requests made while ``recording`` is off (setup, warm-up, teardown) are
+    sent but not measured.
+    """
+
+    def __init__(self, http: httpx.AsyncClient, count_in_process: bool = False):
+        self.http = http
+        self.count_in_process = count_in_process
+        self.recording = False
+        self.samples: List[Sample] = []
+
+    async def request(self, label: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        with query_profiler.collect() as stats:
+            started = time.perf_counter()
+            response = await self.http.request(method, url, **kwargs)
+            latency = time.perf_counter() - started
+
+        if self.recording:
+            header = response.headers.get(QUERY_COUNT_HEADER)
+            queries = int(header) if header is not None else (stats.count if self.count_in_process else None)
+            self.samples.append(Sample(label, response.status_code, latency, queries))
+        return response
+
+    async def get(self, label: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request(label, "GET", url, **kwargs)
+
+    async def post(self, label: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request(label, "POST", url, **kwargs)
+
+
+WorkloadState = Dict[str, Any]
+SetupHook = Callable[[BenchmarkClient], Awaitable[WorkloadState]]
+StepHook = Callable[[BenchmarkClient, WorkloadState, random.Random], Awaitable[None]]
+TeardownHook = Callable[[BenchmarkClient, WorkloadState], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A named traffic profile."""
+
+    name: str
+    description: str
+    setup: SetupHook
+    step: StepHook
+    teardown: Optional[TeardownHook] = None
+    concurrency: int = 10
+
+
+WORKLOADS: Dict[str, Workload] = {}
+
+
+def register_workload(workload: Workload) -> Workload:
+    WORKLOADS[workload.name] = workload
+    return workload
+
+
+# Statistics -----------------------------------------------------------------
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linearly interpolated percentile of ``values`` (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """Latency, throughput, error and query figures for a set of samples."""
+    latencies = [sample.latency * 1000 for sample in samples]
+    queries = [sample.queries for sample in samples if sample.queries is not None]
+    summary: Dict[str, Any] = {
+        "requests": len(samples),
+        "errors": sum(1 for sample in samples if not sample.ok),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            **{f"p{pct}": round(percentile(latencies, pct), 3) for pct in PERCENTILES},
+            "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+            "max": round(max(latencies), 3) if latencies else 0.0,
+        },
+        "queries_per_request": None,
+    }
+    if queries:
+        summary["queries_per_request"] = {
+            "mean": round(statistics.fmean(queries), 2),
+            "p95": round(percentile(queries, 95), 2),
+            "max": max(queries),
+        }
+    return summary
+
+
+def build_report(workload: Workload, samples: List[Sample], elapsed: float, **settings: Any) -> Dict[str, Any]:
+    """JSON-ready report of one workload run."""
+    labels: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        labels.setdefault(sample.label, []).append(sample)
+    return {
+        "workload": workload.name,
+        "settings": settings,
+        "elapsed_s": round(elapsed, 3),
+        "overall": summarize(samples, elapsed),
+        "requests": {label: summarize(group, elapsed) for label, group in sorted(labels.items())},
+    }
+
+
+def compare_reports(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Relative change (0.1 = +10%) of the headline figures between two runs."""
+    def change(now: float, before: float) -> Optional[float]:
+        return round((now - before) / before, 4) if before else None
+
+    now, before = current["overall"], previous["overall"]
+    changes = {
+        f"latency_p{pct}": change(now["latency_ms"][f"p{pct}"], before["latency_ms"][f"p{pct}"])
+        for pct in PERCENTILES
+    }
+    changes["throughput_rps"] = change(now["throughput_rps"], before["throughput_rps"])
+    if now["queries_per_request"] and before["queries_per_request"]:
+        changes["queries_mean"] = change(now["queries_per_request"]["mean"], before["queries_per_request"]["mean"])
+    return changes
+
+
+# Runner ---------------------------------------------------------------------
+
+
+async def run_workload(
+    http: httpx.AsyncClient,
+    workload: Workload,
+    iterations: int = 200,
+    concurrency: Optional[int] = None,
+    warmup: int = 10,
+    seed: int = 0,
+    count_in_process: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run ``iterations`` workload steps spread over ``concurrency`` virtual users.
+
+    Each virtual user draws from its own ``random.Random`` derived from
+    ``seed``, so the same seed replays the same request mix. ``warmup``
+    steps run first and are not measured.
+    """
+    concurrency = concurrency or workload.concurrency
+    client = BenchmarkClient(http, count_in_process=count_in_process)
+    state = await workload.setup(client)
+
+    try:
+        warmup_rng = random.Random(f"{seed}:warmup")
+        for _ in range(warmup):
+            await workload.step(client, state, warmup_rng)
+
+        async def virtual_user(index: int, steps: int) -> None:
+            rng = random.Random(f"{seed}:{index}")
+            for _ in range(steps):
+                await workload.step(client, state, rng)
+
+        per_user, extra = divmod(iterations, concurrency)
+        client.recording = True
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            virtual_user(index, per_user + (1 if index < extra else 0)) for index in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+        client.recording = False
+    finally:
+        if workload.teardown is not None:
+            await workload.teardown(client, state)
+
+    return build_report(
+        workload, client.samples, elapsed,
+        iterations=iterations, concurrency=concurrency, warmup=warmup, seed=seed,
+    )
+
+
+async def login(http: httpx.AsyncClient, username: str, password: str) -> None:
+    """Log in and send the access token with every later request."""
+    response = await http.post(f"{API}/auth/login", json={"username": username, "password": password})
+    response.raise_for_status()
+    http.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+# Workloads ------------------------------------------------------------------
+
+
+SEARCH_TERMS = ("drill", "tent", "speaker", "generator", "chair", "camera", "pro", "mini")
+
+
+async def _catalog_setup(client: BenchmarkClient) -> WorkloadState:
+    response = await client.get("setup", f"{API}/items/", params={"page_size": 100, "is_active": True})
+    response.raise_for_status()
+    item_ids = [item["id"] for item in response.json()["items"]]
+    if not item_ids:
+        raise BenchmarkSetupError("catalog_browse needs at least one active item")
+    return {"item_ids": item_ids}
+
+
+async def _catalog_step(client: BenchmarkClient, state: WorkloadState, rng: random.Random) -> None:
+    roll = rng.random()
+    if roll < 0.35:
+        await client.get("items.list", f"{API}/items/", params={"page": rng.randint(1, 5), "page_size": 20})
+    elif roll < 0.60:
+        await client.get("items.detail", f"{API}/items/{rng.choice(state['item_ids'])}")
+    elif roll < 0.75:
+        await client.get("items.search", f"{API}/items/", params={"search": rng.choice(SEARCH_TERMS)})
+    elif roll < 0.90:
+        await client.get("categories.tree", f"{API}/categories/tree/")
+    else:
+        await client.get("brands.list", f"{API}/brands/", params={"page": rng.randint(1, 3), "page_size": 20})
+
+
+register_workload(Workload(
+    name="catalog_browse",
+    description="Item lists, detail pages, search, category tree and brand lists",
+    setup=_catalog_setup,
+    step=_catalog_step,
+    concurrency=20,
+))
+
+
+async def _rental_setup(client: BenchmarkClient) -> WorkloadState:
+    stock = await client.get(
+        "setup", f"{API}/inventory/stock-levels/", params={"include_zero": False, "limit": 500}
+    )
+    stock.raise_for_status()
+    locations = [
+        (level["item_id"], level["location_id"])
+        for level in stock.json()["items"]
+        if float(level["quantity_available"]) >= 1
+    ]
+    customers = await client.get("setup", f"{API}/customers/", params={"limit": 50})
+    customers.raise_for_status()
+    customer_ids = [customer["id"] for customer in customers.json()]
+    if not locations or not customer_ids:
+        raise BenchmarkSetupError("rental workloads need available stock and at least one customer")
+    return {"stock": locations, "customer_ids": customer_ids, "on_rent": []}
+
+
+async def _checkout(client: BenchmarkClient, state: WorkloadState, rng: random.Random) -> Optional[Dict[str, Any]]:
+    item_id, location_id = rng.choice(state["stock"])
+    response = await client.post(
+        "rental.checkout",
+        f"{API}/inventory/stock-levels/rental/checkout",
+        params={
+            "item_id": item_id,
+            "location_id": location_id,
+            "quantity": 1,
+            "customer_id": rng.choice(state["customer_ids"]),
+        },
+    )
+    if response.status_code != 200:
+        return None
+    return {"location_id": location_id, "unit_ids": response.json()["unit_ids"]}
+
+
+async def _return(client: BenchmarkClient, rental: Dict[str, Any], label: str = "rental.return") -> None:
+    await client.post(
+        label,
+        f"{API}/inventory/stock-levels/rental/return",
+        params={"unit_ids": rental["unit_ids"], "location_id": rental["location_id"]},
+    )
+
+
+async def _checkout_step(client: BenchmarkClient, state: WorkloadState, rng: random.Random) -> None:
+    rental = await _checkout(client, state, rng)
+    if rental is not None:
+        state["on_rent"].append(rental)
+
+
+async def _return_all(client: BenchmarkClient, state: WorkloadState) -> None:
+    # Put the stock back so the next run starts from the same levels
+    while state["on_rent"]:
+        await _return(client, state["on_rent"].pop(), label="teardown")
+
+
+register_workload(Workload(
+    name="rental_checkout_burst",
+    description="Many concurrent single-unit checkouts; units are returned after the run",
+    setup=_rental_setup,
+    step=_checkout_step,
+    teardown=_return_all,
+    concurrency=50,
+))
+
+
+async def _return_step(client: BenchmarkClient, state: WorkloadState, rng: random.Random) -> None:
+    rental = await _checkout(client, state, rng)
+    if rental is not None:
+        await _return(client, rental)
+
+
+register_workload(Workload(
+    name="return_processing",
+    description="Checkout followed by return of the same units",
+    setup=_rental_setup,
+    step=_return_step,
+    concurrency=10,
+))
+
+
+DASHBOARD_PANELS = (
+    ("dashboard.overview", f"{API}/analytics/dashboard/overview"),
+    ("dashboard.kpis", f"{API}/analytics/dashboard/kpis"),
+    ("dashboard.inventory", f"{API}/analytics/dashboard/inventory"),
+    ("dashboard.recent_activity", f"{API}/analytics/dashboard/recent-activity"),
+    ("stock.summary", f"{API}/inventory/stock-levels/summary"),
+    ("stock.alerts", f"{API}/inventory/stock-levels/alerts"),
+)
+
+
+async def _dashboard_setup(client: BenchmarkClient) -> WorkloadState:
+    return {}
+
+
+async def _dashboard_step(client: BenchmarkClient, state: WorkloadState, rng: random.Random) -> None:
+    # A browser tab refreshes every panel at once
+    await asyncio.gather(*(client.get(label, url) for label, url in DASHBOARD_PANELS))
+
+
+register_workload(Workload(
+    name="dashboard_polling",
+    description="Open dashboards refreshing all panels concurrently",
+    setup=_dashboard_setup,
+    step=_dashboard_step,
+    concurrency=5,
+))
@@ -0,0 +1,234 @@
+"""
+Deterministic master-data datasets for query-plan checks.
+
+``seed_datasets(conn, scale)`` fills brands, categories, units, items,
+customers and suppliers with rows that depend only on ``scale`` and
+``seed``: ids are UUIDv5 values of ``"<table>:<n>"`` and every other
+value comes from a seeded ``random.Random``. Two runs at the same scale
+therefore produce identical tables and identical planner statistics, and
+the query registry in :mod:`scripts.query_plans` can refer to known rows
+(``dataset_id("items", 42)``, ``item_sku(42)``) without reading them back.
+
+``scale`` is the number of items; the other tables are sized from it
+(see :func:`table_sizes`). Rows are written with multi-row ``INSERT``\\ s
+in chunks, and the seeded tables are emptied first, so only point this at
+a database reserved for performance runs.
+"""
+
+import logging
+import random
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List
+from uuid import UUID, uuid5
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.customer import Customer, CustomerType, CustomerTier, BlacklistStatus
+from app.models.item import Item
+from app.models.supplier import Supplier, SupplierStatus, SupplierTier, SupplierType
+from app.models.unit_of_measurement import UnitOfMeasurement
+
+logger = logging.getLogger(__name__)
+
+# Namespace for the UUIDv5 ids of seeded rows
+DATASET_NAMESPACE = UUID("6f1c2a4e-3b7d-5e8f-9a0b-1c2d3e4f5a6b")
+DEFAULT_SEED = 20251023
+INSERT_CHUNK_SIZE = 5000
+
+ITEM_STATUSES = ("ACTIVE", "ACTIVE", "ACTIVE", "ACTIVE", "MAINTENANCE", "INACTIVE")
+CITIES = ("Aizawl", "Lunglei", "Shillong", "Guwahati", "Kolkata", "Delhi", "Mumbai", "Chennai")
+COUNTRIES = ("India", "India", "India", "Bangladesh", "Myanmar", "Nepal")
+NOUNS = ("Drill", "Ladder", "Tent", "Projector", "Speaker", "Generator", "Table", "Chair", "Camera", "Mixer")
+ADJECTIVES = ("Heavy", "Compact", "Portable", "Pro", "Mini", "Industrial", "Folding", "Wireless")
+
+
+def dataset_id(table: str, n: int) -> UUID:
+    """Id of the ``n``-th seeded row of ``table``."""
+    return uuid5(DATASET_NAMESPACE, f"{table}:{n}")
+
+
+def item_sku(n: int) -> str:
+    """SKU of the ``n``-th seeded item."""
+    return f"PLN-{n:07d}"
+
+
+def customer_code(n: int) -> str:
+    """Code of the ``n``-th seeded customer."""
+    return f"CUS-{n:07d}"
+
+
+def table_sizes(scale: int) -> Dict[str, int]:
+    """Rows per seeded table for a dataset of ``scale`` items."""
+    return {
+        Brand.__tablename__: max(scale // 100, 10),
+        Category.__tablename__: max(scale // 500, 10),
+        UnitOfMeasurement.__tablename__: 20,
+        Item.__tablename__: scale,
+        Customer.__tablename__: scale,
+        Supplier.__tablename__: max(scale // 10, 10),
+    }
+
+
+def _brand_rows(count: int, rng: random.Random, sizes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    for n in range(count):
+        yield {
+            "id": dataset_id("brands", n),
+            "name": f"Brand {n:06d}",
+            "code": f"BR{n:06d}",
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def _category_rows(count: int, rng: random.Random, sizes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    for n in range(count):
+        name = f"Category {n:05d}"
+        yield {
+            "id": dataset_id("categories", n),
+            "name": name,
+            "category_code": f"C{n:05d}",
+            "category_path": name,
+            "category_level": 1,
+            "is_leaf": True,
+            "is_active": True,
+        }
+
+
+def _unit_rows(count: int, rng: random.Random, sizes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    for n in range(count):
+        yield {
+            "id": dataset_id("unit_of_measurements", n),
+            "name": f"Unit {n:02d}",
+            "code": f"U{n:02d}",
+            "is_active": True,
+        }
+
+
+def _item_rows(count: int, rng: random.Random, sizes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    for n in range(count):
+        cost = Decimal(rng.randint(500, 500000)) / 100
+        yield {
+            "id": dataset_id("items", n),
+            "item_name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {n:07d}",
+            "sku": item_sku(n),
+            "short_description": f"Seeded item {n}",
+            "brand_id": dataset_id("brands", rng.randrange(sizes["brands"])) if rng.random() < 0.9 else None,
+            "category_id": dataset_id("categories", rng.randrange(sizes["categories"])),
+            "unit_of_measurement_id": dataset_id("unit_of_measurements", rng.randrange(20)),
+            "is_rentable": rng.random() < 0.8,
+            "is_salable": rng.random() < 0.5,
+            "is_rental_blocked": rng.random() < 0.02,
+            "cost_price": cost,
+            "sale_price": cost * 2,
+            "rental_rate_per_day": (cost / 20).quantize(Decimal("0.01")),
+            "status": rng.choice(ITEM_STATUSES),
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def _customer_rows(count: int, rng: random.Random, sizes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    for n in range(count):
+        business = rng.random() < 0.3
+        yield {
+            "id": dataset_id("customers", n),
+            "customer_code": customer_code(n),
+            "customer_type": (CustomerType.BUSINESS if business else CustomerType.INDIVIDUAL).value,
+            "business_name": f"Business {n:07d}" if business else None,
+            "first_name": f"First{n % 997}",
+            "last_name": f"Last{n:07d}",
+            "email": f"customer{n:07d}@example.test",
+            "phone": f"+91{n:010d}",
+            "address_line1": f"{n % 500} Main Road",
+            "city": rng.choice(CITIES),
+            "state": "Mizoram",
+            "postal_code": f"{796000 + n % 1000}",
+            "customer_tier": rng.choice(list(CustomerTier)).value,
+            "blacklist_status": (
+                BlacklistStatus.BLACKLISTED if rng.random() < 0.01 else BlacklistStatus.CLEAR
+            ).value,
+            "is_active": rng.random() < 0.95,
+        }
+
+
+def _supplier_rows(count: int, rng: random.Random, sizes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    for n in range(count):
+        yield {
+            "id": dataset_id("suppliers", n),
+            "supplier_code": f"SUP-{n:06d}",
+            "company_name": f"Supplier {n:06d}",
+            "supplier_type": rng.choice(list(SupplierType)).value,
+            "supplier_tier": rng.choice(list(SupplierTier)).value,
+            "status": rng.choice(list(SupplierStatus)).value,
+            "country": rng.choice(COUNTRIES),
+            "quality_rating": Decimal(rng.randint(0, 500)) / 100,
+            "delivery_rating": Decimal(rng.randint(0, 500)) / 100,
+            "is_active": rng.random() < 0.95,
+        }
+
+
+RowFactory = Callable[[int, random.Random, Dict[str, int]], Iterator[Dict[str, Any]]]
+
+# In foreign-key order
+DATASETS: List[tuple] = [
+    (Brand.__table__, _brand_rows),
+    (Category.__table__, _category_rows),
+    (UnitOfMeasurement.__table__, _unit_rows),
+    (Item.__table__, _item_rows),
+    (Customer.__table__, _customer_rows),
+    (Supplier.__table__, _supplier_rows),
+]
+
+
+def dataset_rows(table: Table, factory: RowFactory, scale: int, seed: int = DEFAULT_SEED) -> Iterator[Dict[str, Any]]:
+    """Rows of one seeded table; each table has its own random stream."""
+    sizes = table_sizes(scale)
+    rng = random.Random(f"{seed}:{table.name}")
+    return factory(sizes[table.name], rng, sizes)
+
+
+def _chunked(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def seed_datasets(conn: AsyncConnection, scale: int, seed: int = DEFAULT_SEED) -> Dict[str, int]:
+    """
+    Replace the seeded tables' contents with the dataset for ``scale``.
+
+    On PostgreSQL the tables are truncated (cascading to rows that refer
+    to them) and analyzed afterwards so plans reflect the new data.
+
+    Returns:
+        Rows written per table
+    """
+    is_postgresql = conn.dialect.name == "postgresql"
+    tables = [table for table, _factory in DATASETS]
+
+    if is_postgresql:
+        names = ", ".join(table.name for table in tables)
+        await conn.execute(text(f"TRUNCATE {names} CASCADE"))
+    else:
+        for table in reversed(tables):
+            await conn.execute(table.delete())
+
+    written: Dict[str, int] = {}
+    for table, factory in DATASETS:
+        written[table.name] = 0
+        for chunk in _chunked(dataset_rows(table, factory, scale, seed), INSERT_CHUNK_SIZE):
+            await conn.execute(insert(table), chunk)
+            written[table.name] += len(chunk)
+        logger.info(f"Seeded {written[table.name]} rows into {table.name}")
+
+    if is_postgresql:
+        for table in tables:
+            await conn.execute(text(f"ANALYZE {table.name}"))
+
+    return written
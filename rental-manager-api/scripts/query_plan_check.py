@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""
+Query-plan regression check for critical repository queries.
+
+Seeds a deterministic dataset (optional), EXPLAINs every query in
+scripts.query_plans.PLAN_QUERIES and compares plan shapes and timings
+with the stored baseline for the same scale. Exits non-zero when a
+query starts using an unexpected sequential scan or gets much slower.
+
+Needs PostgreSQL, and --seed empties the seeded tables first, so point it
+at a database reserved for performance runs:
+
+    python scripts/query_plan_check.py --database-url postgresql+asyncpg://... \\
+        --scale 100000 --seed --update-baseline
+    python scripts/query_plan_check.py --database-url postgresql+asyncpg://... --scale 100000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from scripts.plan_datasets import DEFAULT_SEED, seed_datasets
+from scripts.query_plans import (
+    PLAN_QUERIES,
+    compare_with_baseline,
+    load_baselines,
+    run_plan_checks,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent.parent / "tests" / "performance" / "query_plan_baselines.json"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Check query plans against stored baselines')
+    parser.add_argument('--database-url', required=True, help='PostgreSQL URL (postgresql+asyncpg://...)')
+    parser.add_argument('--scale', type=int, default=10000, help='Dataset size in items (default: 10000)')
+    parser.add_argument('--seed', action='store_true', help='Reseed the dataset before checking')
+    parser.add_argument('--seed-value', type=int, default=DEFAULT_SEED, help='Random seed for the dataset')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline JSON file')
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='Allowed relative slowdown (default: 0.5)')
+    parser.add_argument('--min-delta-ms', type=float, default=2.0, help='Ignore slowdowns below this (default: 2.0)')
+    parser.add_argument('--repeat', type=int, default=3, help='EXPLAIN runs per statement (default: 3)')
+    parser.add_argument('--only', nargs='*', choices=sorted(PLAN_QUERIES), help='Check only these queries')
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = parse_args()
+    engine = create_async_engine(args.database_url)
+    if engine.dialect.name != "postgresql":
+        print("❌ Query plans can only be checked on PostgreSQL")
+        return 2
+
+    try:
+        if args.seed:
+            print(f"🌱 Seeding dataset at scale {args.scale:,}...")
+            async with engine.begin() as conn:
+                written = await seed_datasets(conn, args.scale, args.seed_value)
+            for table, count in written.items():
+                print(f"   {table}: {count:,}")
+
+        async with AsyncSession(engine) as session:
+            results = await run_plan_checks(session, args.scale, args.only, args.repeat)
+    finally:
+        await engine.dispose()
+
+    for result in results:
+        scans = f"  seq: {', '.join(result.seq_scans)}" if result.seq_scans else ""
+        print(f"{result.name:<40} {result.execution_ms:>9.2f} ms  "
+              f"hit {result.shared_hit_blocks:>6}  read {result.shared_read_blocks:>6}{scans}")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, args.scale, results)
+        print(f"💾 Baseline for scale {args.scale} written to {args.baseline}")
+        return 0
+
+    baseline = load_baselines(args.baseline).get(str(args.scale), {})
+    findings = compare_with_baseline(results, baseline, args.tolerance, args.min_delta_ms)
+    for finding in findings:
+        marker = "❌" if finding.level == "error" else "⚠️ "
+        print(f"{marker} {finding.name}: {finding.message}")
+
+    errors = sum(1 for finding in findings if finding.level == "error")
+    print(f"{'❌' if errors else '✅'} {len(results)} statements checked, {errors} errors")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,318 @@
+"""
+Query-plan regression checks for critical repository queries.
+
+Each entry of ``PLAN_QUERIES`` calls a real repository method against a
+dataset seeded by :mod:`scripts.plan_datasets`. The harness records the
+SQL the call emits, runs every statement under
+``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` (PostgreSQL only) and reduces
+the plan to:
+
+- a shape: the node tree with relations and indexes, no costs or rows;
+- the median execution time over a few runs;
+- shared buffer hits and reads;
+- the relations read with a sequential scan.
+
+Results are compared with a JSON baseline kept per dataset scale. A
+sequential scan the entry does not allow, or an execution time more than
+``tolerance`` above the baseline (and at least ``min_delta_ms`` slower),
+is an error. A changed shape or a query without a baseline is a warning.
+``scripts/query_plan_check.py`` is the command-line front end.
+"""
+
+import json
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from scripts.plan_datasets import customer_code, dataset_id, item_sku, table_sizes
+from app.crud.brand import BrandRepository
+from app.crud.customer import CustomerRepository
+from app.crud.entity_stats import EntityStatsRepository
+from app.crud.item import ItemRepository
+from app.crud.supplier import SupplierRepository
+
+QueryRunner = Callable[[AsyncSession, int], Awaitable[Any]]
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+SEQ_SCAN = "Seq Scan"
+
+
+@dataclass(frozen=True)
+class PlanQuery:
+    """A repository call whose statements are plan-checked."""
+
+    name: str
+    run: QueryRunner
+    # Relations a sequential scan is expected on (e.g. leading-wildcard search)
+    allow_seq_scans: FrozenSet[str] = frozenset()
+
+
+PLAN_QUERIES: Dict[str, PlanQuery] = {}
+
+
+def plan_query(name: str, allow_seq_scans: Tuple[str, ...] = ()) -> Callable[[QueryRunner], QueryRunner]:
+    """Register a repository call under ``name``."""
+    def register(run: QueryRunner) -> QueryRunner:
+        PLAN_QUERIES[name] = PlanQuery(name, run, frozenset(allow_seq_scans))
+        return run
+    return register
+
+
+# Registry ------------------------------------------------------------------
+
+
+@plan_query("items.get_by_sku")
+async def _item_by_sku(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).get_by_sku(item_sku(scale // 2))
+
+
+@plan_query("items.get_by_id_with_relations")
+async def _item_by_id(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).get_by_id(dataset_id("items", scale // 3), include_relations=True)
+
+
+@plan_query("items.exists_by_sku")
+async def _item_sku_exists(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).exists_by_sku(item_sku(scale - 1))
+
+
+@plan_query("items.get_paginated", allow_seq_scans=("items",))
+async def _items_page(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).get_paginated(page=5, page_size=20)
+
+
+@plan_query("items.get_paginated_by_category")
+async def _items_page_by_category(session: AsyncSession, scale: int) -> Any:
+    filters = {"category_id": dataset_id("categories", 1), "is_rentable": True}
+    return await ItemRepository(session).get_paginated(page=1, page_size=20, filters=filters)
+
+
+@plan_query("items.get_by_brand")
+async def _items_by_brand(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).get_by_brand(dataset_id("brands", 3), limit=50)
+
+
+@plan_query("items.get_rental_blocked")
+async def _blocked_items(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).get_rental_blocked_items(limit=50)
+
+
+@plan_query("items.search", allow_seq_scans=("items",))
+async def _item_search(session: AsyncSession, scale: int) -> Any:
+    return await ItemRepository(session).search("Generator", limit=20)
+
+
+@plan_query("customers.get_by_code")
+async def _customer_by_code(session: AsyncSession, scale: int) -> Any:
+    return await CustomerRepository(session).get_by_code(customer_code(scale // 2))
+
+
+@plan_query("customers.get_all")
+async def _customers_page(session: AsyncSession, scale: int) -> Any:
+    return await CustomerRepository(session).get_all(skip=100, limit=50)
+
+
+@plan_query("suppliers.get_all")
+async def _suppliers_page(session: AsyncSession, scale: int) -> Any:
+    return await SupplierRepository(session).get_all(limit=50)
+
+
+@plan_query("brands.get_by_name")
+async def _brand_by_name(session: AsyncSession, scale: int) -> Any:
+    return await BrandRepository(session).get_by_name(f"Brand {table_sizes(scale)['brands'] // 2:06d}")
+
+
+@plan_query("entity_stats.get")
+async def _item_stats(session: AsyncSession, scale: int) -> Any:
+    return await EntityStatsRepository(session).get("items")
+
+
+# Capture and EXPLAIN -------------------------------------------------------
+
+
+async def capture_statements(session: AsyncSession, query: PlanQuery, scale: int) -> List[Tuple[str, Any]]:
+    """Run a registry entry and return the SELECTs it sent, with parameters."""
+    connection = await session.connection()
+    captured: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", record)
+    try:
+        await query.run(session, scale)
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", record)
+    return captured
+
+
+async def explain(session: AsyncSession, statement: str, parameters: Any) -> Dict[str, Any]:
+    """``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` output of one statement."""
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(EXPLAIN_PREFIX + statement, parameters)
+    document = result.scalar_one()
+    if isinstance(document, str):
+        document = json.loads(document)
+    return document[0]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Every node of a plan tree, depth first."""
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def plan_shape(plan: Dict[str, Any]) -> str:
+    """Plan tree with node types, relations and indexes only."""
+    label = plan["Node Type"]
+    if "Relation Name" in plan:
+        label += f" on {plan['Relation Name']}"
+    if "Index Name" in plan:
+        label += f" using {plan['Index Name']}"
+    children = [plan_shape(child) for child in plan.get("Plans", ())]
+    return f"{label}({', '.join(children)})" if children else label
+
+
+def seq_scans(plan: Dict[str, Any]) -> List[str]:
+    """Relations read with a (possibly parallel) sequential scan."""
+    return sorted({
+        node["Relation Name"] for node in plan_nodes(plan) if node["Node Type"] == SEQ_SCAN
+    })
+
+
+@dataclass
+class PlanResult:
+    """Reduced EXPLAIN output for one statement of a registry entry."""
+
+    name: str
+    shape: str
+    execution_ms: float
+    planning_ms: float
+    shared_hit_blocks: int
+    shared_read_blocks: int
+    seq_scans: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_explain(cls, name: str, documents: List[Dict[str, Any]]) -> "PlanResult":
+        """Summarise repeated EXPLAIN runs of the same statement."""
+        plan = documents[-1]["Plan"]
+        return cls(
+            name=name,
+            shape=plan_shape(plan),
+            execution_ms=round(statistics.median(d["Execution Time"] for d in documents), 3),
+            planning_ms=round(statistics.median(d["Planning Time"] for d in documents), 3),
+            shared_hit_blocks=plan.get("Shared Hit Blocks", 0),
+            shared_read_blocks=plan.get("Shared Read Blocks", 0),
+            seq_scans=seq_scans(plan),
+        )
+
+
+async def run_plan_checks(
+    session: AsyncSession,
+    scale: int,
+    names: Optional[List[str]] = None,
+    repeat: int = 3,
+) -> List[PlanResult]:
+    """
+    EXPLAIN every statement of the selected registry entries.
+
+    A registry entry that sends several statements (a count and a page)
+    yields one result per statement, named ``<entry>#<n>``. Everything
+    runs in one transaction that is rolled back.
+    """
+    results: List[PlanResult] = []
+    try:
+        for query in PLAN_QUERIES.values():
+            if names and query.name not in names:
+                continue
+            statements = await capture_statements(session, query, scale)
+            for index, (statement, parameters) in enumerate(statements):
+                name = query.name if len(statements) == 1 else f"{query.name}#{index + 1}"
+                documents = [await explain(session, statement, parameters) for _ in range(repeat)]
+                results.append(PlanResult.from_explain(name, documents))
+    finally:
+        await session.rollback()
+    return results
+
+
+# Baselines -----------------------------------------------------------------
+
+
+@dataclass
+class PlanFinding:
+    """A difference from the baseline."""
+
+    level: str  # "error" or "warning"
+    name: str
+    message: str
+
+
+def _registry_entry(result_name: str) -> Optional[PlanQuery]:
+    return PLAN_QUERIES.get(result_name.split("#", 1)[0])
+
+
+def compare_with_baseline(
+    results: List[PlanResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.5,
+    min_delta_ms: float = 2.0,
+) -> List[PlanFinding]:
+    """
+    Check results against a baseline for the same scale.
+
+    Args:
+        results: Current plan results
+        baseline: Baseline results by name
+        tolerance: Allowed relative slowdown (0.5 = 50%)
+        min_delta_ms: Slowdowns smaller than this are noise
+
+    Returns:
+        Errors and warnings, in result order
+    """
+    findings: List[PlanFinding] = []
+    for result in results:
+        entry = _registry_entry(result.name)
+        allowed = entry.allow_seq_scans if entry else frozenset()
+        unexpected = [relation for relation in result.seq_scans if relation not in allowed]
+        if unexpected:
+            findings.append(PlanFinding("error", result.name, f"sequential scan on {', '.join(unexpected)}"))
+
+        previous = baseline.get(result.name)
+        if previous is None:
+            findings.append(PlanFinding("warning", result.name, "no baseline"))
+            continue
+
+        slower = result.execution_ms - previous["execution_ms"]
+        if slower > min_delta_ms and result.execution_ms > previous["execution_ms"] * (1 + tolerance):
+            findings.append(PlanFinding(
+                "error", result.name,
+                f"execution {result.execution_ms:.2f} ms vs baseline {previous['execution_ms']:.2f} ms"
+            ))
+        if result.shape != previous["shape"]:
+            findings.append(PlanFinding(
+                "warning", result.name, f"plan changed: {previous['shape']} -> {result.shape}"
+            ))
+    return findings
+
+
+def load_baselines(path: Path) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Baselines by scale (as a string) and result name; empty if missing."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, scale: int, results: List[PlanResult]) -> None:
+    """Replace the baseline for ``scale``, keeping other scales."""
+    baselines = load_baselines(path)
+    baselines[str(scale)] = {
+        result.name: {key: value for key, value in asdict(result).items() if key != "name"}
+        for result in results
+    }
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
@@ -89,6 +89,20 @@ async def db_session(async_session_maker) -> AsyncGenerator[AsyncSession, None]:
         # Rollback transaction after test
         await transaction.rollback()
 
+@pytest.fixture
+def query_counter(async_engine):
+    """
+    Count SQL statements executed against the test engine.
+    Usage:
+        with query_counter() as stats:
+            await repo.get_by_id(item_id)
+        assert stats.count <= 2
+    """
+    from app.core.query_profiler import count_queries, query_profiler
+
+    yield lambda: count_queries(async_engine)
+    query_profiler.uninstrument(async_engine)
+
 # Model Fixtures
 
 @pytest.fixture
@@ -0,0 +1,119 @@
+"""
+Benchmark: database round trips and latency per GET, ``get_db`` versus the
+lean ``get_read_db`` session.
+
+A list endpoint runs a count and a page query through each dependency.
+Round trips are counted as a Postgres server would receive them:
+every statement, plus BEGIN / COMMIT / ROLLBACK on connections that are
+not in autocommit (asyncpg sends those, SQLite elides them for reads).
+Each round trip also sleeps ``ROUND_TRIP_SECONDS`` to stand in for network
+latency, so the saved round trips show up in the timings.
+"""
+
+import time
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import db_manager, get_db, get_read_db
+from app.models.unit_of_measurement import UnitOfMeasurement
+
+REQUESTS = 200
+ROUND_TRIP_SECONDS = 0.0005
+
+
+class RoundTrips:
+    """Counts statements and transaction control sent to the server."""
+
+    def __init__(self, engine):
+        self.count = 0
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._statement)
+        for name in ("begin", "commit", "rollback"):
+            event.listen(sync_engine, name, self._transaction_control)
+
+    def _round_trip(self):
+        self.count += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+
+    def _statement(self, conn, cursor, statement, parameters, context, executemany):
+        self._round_trip()
+
+    def _transaction_control(self, conn):
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            self._round_trip()
+
+
+@pytest_asyncio.fixture
+async def engine(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            UnitOfMeasurement.metadata.create_all,
+            tables=[UnitOfMeasurement.__table__],
+        )
+    async with AsyncSession(engine) as session:
+        session.add_all(UnitOfMeasurement(id=uuid4(), name=f"Unit {n}") for n in range(50))
+        await session.commit()
+
+    monkeypatch.setattr(db_manager, "engine", engine)
+    monkeypatch.setattr(db_manager, "async_session_maker", db_manager._create_session_maker(engine))
+    monkeypatch.setattr(db_manager, "_lean_session_maker", db_manager._create_session_maker(engine, lean=True))
+    monkeypatch.setattr(db_manager, "replica_router", None)
+    yield engine
+    await engine.dispose()
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    async def page(db: AsyncSession):
+        total = (await db.execute(select(func.count()).select_from(UnitOfMeasurement))).scalar_one()
+        rows = (await db.execute(select(UnitOfMeasurement).order_by(UnitOfMeasurement.name).limit(20))).scalars()
+        return {"total": total, "items": [unit.name for unit in rows]}
+
+    @app.get("/standard")
+    async def standard(db: AsyncSession = Depends(get_db)):
+        return await page(db)
+
+    @app.get("/lean")
+    async def lean(db: AsyncSession = Depends(get_read_db)):
+        return await page(db)
+
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+class TestReadSessionBenchmark:
+    """Round trips and latency of read-only GETs."""
+
+    async def test_lean_session_saves_transaction_round_trips(self, engine):
+        trips = RoundTrips(engine)
+
+        async def measure(client, path):
+            await client.get(path)
+            trips.count = 0
+            started = time.perf_counter()
+            for _ in range(REQUESTS):
+                response = await client.get(path)
+                assert response.status_code == 200
+            elapsed_ms = (time.perf_counter() - started) / REQUESTS * 1000
+            return trips.count / REQUESTS, elapsed_ms
+
+        async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as client:
+            standard_trips, standard_ms = await measure(client, "/standard")
+            lean_trips, lean_ms = await measure(client, "/lean")
+
+        print(f"\nget_db:      {standard_trips:.1f} round trips, {standard_ms:.2f} ms per GET")
+        print(f"get_read_db: {lean_trips:.1f} round trips, {lean_ms:.2f} ms per GET")
+        print(f"saved:       {standard_trips - lean_trips:.1f} round trips per GET")
+
+        assert standard_trips == 4  # BEGIN, count, page, COMMIT
+        assert lean_trips == 2
+        assert lean_ms < standard_ms
@@ -0,0 +1,135 @@
+"""
+Benchmark: /rentals/quote with 1, 100 and 1,000 lines.
+
+Runs in-process against the rentals router backed by in-memory SQLite, so it
+needs no database server. Each quote must cost a single item query no matter
+how many lines it has, and a 1,000-line quote must stay well inside one
+request budget.
+"""
+
+import statistics
+import time
+from decimal import Decimal
+from typing import Dict, List
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.v1.endpoints import rentals
+from app.core.dependencies import get_rental_pricing_engine
+from app.models.cache_version import CacheVersion
+from app.models.item import Item
+from app.models.price_book import PriceBook, PriceBookEntry
+from app.services.price_book import PriceBookCache
+from app.services.transaction.pricing_engine import RentalPricingEngine
+
+
+LINE_COUNTS = (1, 100, 1000)
+ROUNDS = 20
+MAX_1000_LINE_MEDIAN = 1.0  # seconds
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[Item.__table__, PriceBook.__table__, PriceBookEntry.__table__, CacheVersion.__table__],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def item_ids(engine) -> List[str]:
+    async with AsyncSession(engine) as session:
+        items = [
+            Item(
+                id=uuid4(),
+                item_name=f"Benchmark item {index}",
+                sku=f"BENCH-{index:05d}",
+                rental_rate_per_day=Decimal(index % 50 + 5),
+                security_deposit=Decimal("25.00"),
+            )
+            for index in range(max(LINE_COUNTS))
+        ]
+        ids = [str(item.id) for item in items]
+        session.add_all(items)
+        await session.commit()
+    return ids
+
+
+def build_app(engine, price_books: PriceBookCache) -> FastAPI:
+    app = FastAPI()
+    app.include_router(rentals.router, prefix="/rentals")
+
+    async def pricing_engine():
+        async with AsyncSession(engine) as session:
+            yield RentalPricingEngine(session, price_books=price_books)
+
+    app.dependency_overrides[get_rental_pricing_engine] = pricing_engine
+    return app
+
+
+def quote_payload(item_ids: List[str], lines: int) -> Dict:
+    return {
+        "rental_start_date": "2025-03-01T09:00:00Z",
+        "rental_end_date": "2025-03-11T09:00:00Z",
+        "pricing_strategy": "TIERED",
+        "items": [
+            {"item_id": item_id, "quantity": 2, "discount_percent": "5"}
+            for item_id in item_ids[:lines]
+        ],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+class TestRentalQuoteBenchmark:
+    """Quote latency and query count by order size."""
+
+    async def test_quote_scales_with_one_query(self, engine, item_ids):
+        selects: List[str] = []
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        # Compiled price books are reused between quotes; keep the version
+        # re-check out of the measured window
+        price_books = PriceBookCache(check_interval=3600)
+        async with AsyncSession(engine) as session:
+            await price_books.get(session)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+        medians = {}
+        try:
+            async with AsyncClient(transport=ASGITransport(app=build_app(engine, price_books)), base_url="http://test") as client:
+                for lines in LINE_COUNTS:
+                    payload = quote_payload(item_ids, lines)
+                    timings = []
+                    for _ in range(ROUNDS):
+                        selects.clear()
+                        started = time.perf_counter()
+                        response = await client.post("/rentals/quote", json=payload)
+                        timings.append(time.perf_counter() - started)
+                        assert response.status_code == 200, response.text
+                        assert response.json()["line_count"] == lines
+                        assert len(selects) == 1
+                    medians[lines] = statistics.median(timings)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+        print("\nlines  median_ms  per_line_us")
+        for lines, median in medians.items():
+            print(f"{lines:>5}  {median * 1000:>9.2f}  {median / lines * 1e6:>11.1f}")
+
+        assert medians[1000] < MAX_1000_LINE_MEDIAN
+        # Fixed per-request cost dominates small orders: per-line cost must fall
+        assert medians[1000] / 1000 < medians[1]
@@ -0,0 +1,135 @@
+"""
+Benchmark: per-call Python overhead of hot lookups, inline select() versus
+the cached statements in app.crud.statements.
+
+Measures what happens before the driver is reached: building the statement
+and deriving its compiled-cache key, plus a full execute against in-memory
+SQLite where the database work is negligible. The cached statements must
+cost markedly less per call.
+"""
+
+import time
+from datetime import date
+from typing import Callable
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.crud import statements
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.inventory.stock_level import StockLevel
+from app.models.item import Item
+from app.models.transaction.transaction_line import TransactionLine
+from app.models.unit_of_measurement import UnitOfMeasurement
+
+ROUNDS = 2000
+EXECUTE_ROUNDS = 500
+
+
+def inline_item_by_id(item_id):
+    return select(Item).where(Item.id == item_id).options(
+        joinedload(Item.brand),
+        joinedload(Item.category),
+        joinedload(Item.unit_of_measurement),
+    )
+
+
+def inline_stock_level(item_id, location_id):
+    return select(StockLevel).where(
+        and_(StockLevel.item_id == item_id, StockLevel.location_id == location_id)
+    )
+
+
+def inline_rental_conflicts(item_id, start_date, end_date):
+    return select(TransactionLine).where(
+        and_(
+            TransactionLine.item_id == item_id,
+            TransactionLine.current_rental_status.in_(statements.ACTIVE_RENTAL_STATUSES),
+            or_(
+                and_(TransactionLine.rental_start_date <= start_date, TransactionLine.rental_end_date >= start_date),
+                and_(TransactionLine.rental_start_date <= end_date, TransactionLine.rental_end_date >= end_date),
+                and_(TransactionLine.rental_start_date >= start_date, TransactionLine.rental_end_date <= end_date),
+            ),
+        )
+    ).options(selectinload(TransactionLine.transaction))
+
+
+CASES = {
+    "item_by_id": (
+        lambda: inline_item_by_id(uuid4()),
+        lambda: statements.item_by_id(uuid4(), include_relations=True),
+    ),
+    "stock_level_by_item_location": (
+        lambda: inline_stock_level(uuid4(), uuid4()),
+        lambda: statements.stock_level_by_item_location(uuid4(), uuid4()),
+    ),
+    "rental_conflicts": (
+        lambda: inline_rental_conflicts(uuid4(), date(2025, 3, 1), date(2025, 3, 9)),
+        lambda: statements.rental_conflicts(uuid4(), date(2025, 3, 1), date(2025, 3, 9)),
+    ),
+}
+
+
+def per_call_us(build: Callable, rounds: int = ROUNDS) -> float:
+    for _ in range(50):
+        build()._generate_cache_key()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        build()._generate_cache_key()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[Brand.__table__, Category.__table__, UnitOfMeasurement.__table__, Item.__table__],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.performance
+class TestStatementBuildBenchmark:
+    """Statement construction and cache-key cost per call."""
+
+    def test_cached_statements_cost_less_to_prepare(self):
+        print("\nstatement                        inline_us  cached_us  speedup")
+        for name, (inline, cached) in CASES.items():
+            before, after = per_call_us(inline), per_call_us(cached)
+            print(f"{name:<32} {before:>9.1f}  {after:>9.1f}  {before / after:>6.1f}x")
+            assert after < before / 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.performance
+class TestStatementExecuteBenchmark:
+    """Full execute of the item lookup against in-memory SQLite."""
+
+    async def test_cached_lookup_executes_faster(self, engine):
+        item_id = uuid4()
+        async with AsyncSession(engine) as session:
+            session.add(Item(id=item_id, item_name="Drill", sku="DRL-001"))
+            await session.commit()
+
+        async def timed(build: Callable) -> float:
+            async with AsyncSession(engine) as session:
+                for _ in range(50):
+                    await session.execute(build(item_id))
+                started = time.perf_counter()
+                for _ in range(EXECUTE_ROUNDS):
+                    (await session.execute(build(item_id))).scalar_one()
+                return (time.perf_counter() - started) / EXECUTE_ROUNDS * 1e6
+
+        before = await timed(inline_item_by_id)
+        after = await timed(lambda item_id: statements.item_by_id(item_id, include_relations=True))
+        print(f"\nitem_by_id execute: inline {before:.1f} us, cached {after:.1f} us")
+
+        assert after < before
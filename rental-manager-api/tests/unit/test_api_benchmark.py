@@ -0,0 +1,161 @@
+"""
+Unit tests for the API benchmark runner: percentiles, seeded request
+mixes, warm-up exclusion, query counting and run-over-run comparison.
+"""
+
+from collections import Counter
+from typing import List
+from uuid import uuid4
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Query, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from scripts.api_workloads import (
+    API,
+    WORKLOADS,
+    Workload,
+    compare_reports,
+    percentile,
+    run_workload,
+)
+from app.core.query_profiler import query_profiler
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    query_profiler.instrument(engine)
+    yield engine
+    query_profiler.uninstrument(engine)
+    await engine.dispose()
+
+
+def build_app(engine) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/one")
+    async def one():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return {}
+
+    @app.get("/headed")
+    async def headed(response: Response):
+        response.headers["X-DB-Query-Count"] = "7"
+        return {}
+
+    @app.get("/fail")
+    async def fail(response: Response):
+        response.status_code = 500
+        return {}
+
+    return app
+
+
+async def mixed_setup(client):
+    return {}
+
+
+async def labelled_step(client, state, rng):
+    label = rng.choice(["one", "headed", "fail"])
+    await client.get(label, f"/{label}")
+
+
+MIXED = Workload("mixed", "test", mixed_setup, labelled_step, concurrency=4)
+
+
+def client_for(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.unit
+class TestStatistics:
+    """Test percentile and comparison helpers."""
+
+    def test_percentile_interpolates(self):
+        values = [float(n) for n in range(1, 101)]
+
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([], 95) == 0.0
+
+    def test_compare_reports(self):
+        def report(p50, throughput, queries):
+            return {"overall": {
+                "latency_ms": {"p50": p50, "p95": p50 * 2, "p99": p50 * 3},
+                "throughput_rps": throughput,
+                "queries_per_request": {"mean": queries},
+            }}
+
+        changes = compare_reports(report(12.0, 90.0, 3.0), report(10.0, 100.0, 2.0))
+
+        assert changes == {
+            "latency_p50": 0.2, "latency_p95": 0.2, "latency_p99": 0.2,
+            "throughput_rps": -0.1, "queries_mean": 0.5,
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRunner:
+    """Test workload execution and reporting."""
+
+    async def test_report_per_label(self, engine):
+        async with client_for(build_app(engine)) as http:
+            report = await run_workload(http, MIXED, iterations=60, warmup=5, count_in_process=True)
+
+        requests = report["requests"]
+        assert report["overall"]["requests"] == 60  # warm-up not counted
+        assert report["settings"]["concurrency"] == 4
+        assert set(requests) == {"one", "headed", "fail"}
+        assert requests["one"]["queries_per_request"]["max"] == 1
+        assert requests["headed"]["queries_per_request"]["mean"] == 7  # header wins
+        assert requests["fail"]["errors"] == requests["fail"]["requests"]
+        latency = report["overall"]["latency_ms"]
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+    async def test_seed_replays_the_request_mix(self, engine):
+        async def mix(seed):
+            async with client_for(build_app(engine)) as http:
+                report = await run_workload(http, MIXED, iterations=40, warmup=0, seed=seed)
+            return Counter({label: figures["requests"] for label, figures in report["requests"].items()})
+
+        assert await mix(1) == await mix(1)
+        assert await mix(1) != await mix(2)
+
+    async def test_checkout_burst_returns_units_afterwards(self):
+        item_id, location_id, customer_id = uuid4(), uuid4(), uuid4()
+        stock = {"available": 100}
+        app = FastAPI()
+
+        @app.get(f"{API}/inventory/stock-levels/")
+        async def stock_levels():
+            return {"items": [{
+                "item_id": str(item_id), "location_id": str(location_id),
+                "quantity_available": str(stock["available"]),
+            }]}
+
+        @app.get(f"{API}/customers/")
+        async def customers():
+            return [{"id": str(customer_id)}]
+
+        @app.post(f"{API}/inventory/stock-levels/rental/checkout")
+        async def checkout(quantity: int = Query(...)):
+            stock["available"] -= quantity
+            return {"unit_ids": [str(uuid4())]}
+
+        @app.post(f"{API}/inventory/stock-levels/rental/return")
+        async def rental_return(unit_ids: List[str] = Query(...)):
+            stock["available"] += len(unit_ids)
+            return {}
+
+        async with client_for(app) as http:
+            report = await run_workload(http, WORKLOADS["rental_checkout_burst"], iterations=30, warmup=0)
+
+        assert report["requests"]["rental.checkout"]["requests"] == 30
+        assert "teardown" not in report["requests"]
+        assert stock["available"] == 100
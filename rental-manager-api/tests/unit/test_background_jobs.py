@@ -0,0 +1,286 @@
+"""
+Unit tests for the background job queue: chunked commits, cancellation,
+idempotency keys and the scheduler poll.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.errors import ConflictError, ValidationError
+from app.crud.background_job import BackgroundJobRepository
+from app.crud.item import ItemRepository
+from app.models.background_job import BackgroundJob, JobStatus
+from app.models.brand import Brand
+from app.models.cache_version import CacheVersion
+from app.models.category import Category
+from app.models.entity_stat import EntityStatCounter
+from app.models.item import Item
+from app.models.unit_of_measurement import UnitOfMeasurement
+from app.schemas.item import ItemBulkOperation
+from app.services.background_job import (
+    BackgroundJobRunner,
+    BackgroundJobService,
+    ChunkResult,
+    background_job_runner,
+    job_handler,
+    run_in_chunks,
+)
+from app.services.item import ItemService
+from app.services.sku_generator import SKUGenerator
+
+
+# Released by tests that need a job to stay RUNNING until they cancel it
+release = asyncio.Event()
+
+
+@job_handler("test_chunked")
+async def _chunked(session, progress):
+    async def handle_chunk(rows):
+        if "bad" in rows:
+            raise RuntimeError("chunk failed")
+        session.add_all(Brand(id=uuid4(), name=name, code=name.upper()) for name in rows)
+        return ChunkResult(succeeded=len(rows))
+
+    return await run_in_chunks(session, progress, progress.payload["names"], handle_chunk, chunk_size=2)
+
+
+@job_handler("test_blocking")
+async def _blocking(session, progress):
+    async def handle_chunk(rows):
+        session.add_all(Brand(id=uuid4(), name=name, code=name.upper()) for name in rows)
+        await release.wait()
+        return ChunkResult(succeeded=len(rows))
+
+    return await run_in_chunks(session, progress, progress.payload["names"], handle_chunk, chunk_size=1)
+
+
+@job_handler("test_other")
+async def _other(session, progress):
+    return None
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[
+                Brand.__table__,
+                Category.__table__,
+                UnitOfMeasurement.__table__,
+                Item.__table__,
+                BackgroundJob.__table__,
+                EntityStatCounter.__table__,
+                CacheVersion.__table__,
+            ],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def fetch_job(session_factory, job_id):
+    async with session_factory() as session:
+        return await BackgroundJobService(session).get_job(job_id)
+
+
+async def brand_names(session_factory):
+    async with session_factory() as session:
+        return sorted((await session.execute(select(Brand.name))).scalars())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestChunkedJobs:
+    """Test that bulk jobs commit and report progress chunk by chunk."""
+
+    async def test_failed_chunk_is_rolled_back_and_reported(self, session_factory):
+        runner = BackgroundJobRunner(session_factory)
+        names = ["a", "b", "bad", "c", "d"]
+        async with session_factory() as session:
+            job = await runner.submit(session, "test_chunked", payload={"names": names}, total_rows=len(names))
+        await runner.wait()
+
+        job = await fetch_job(session_factory, job.id)
+        assert job.status == JobStatus.COMPLETED.value
+        assert (job.processed_rows, job.succeeded_rows, job.failed_rows) == (5, 3, 2)
+        assert [error["row"] for error in job.errors] == [3, 4]
+        assert job.result == {"total": 5, "succeeded": 3, "skipped": 0, "failed": 2}
+        assert await brand_names(session_factory) == ["a", "b", "d"]
+
+    async def test_unknown_job_type_is_rejected(self, session_factory):
+        async with session_factory() as session:
+            with pytest.raises(ValidationError):
+                await BackgroundJobRunner(session_factory).submit(session, "no_such_job")
+
+    async def test_item_bulk_operation_job(self, session_factory, monkeypatch):
+        monkeypatch.setattr(background_job_runner, "_session_factory", session_factory)
+        monkeypatch.setattr(settings, "JOB_CHUNK_SIZE", 2)
+        async with session_factory() as session:
+            items = [
+                Item(id=uuid4(), item_name=f"Drill {n}", sku=f"DRL-{n}", rental_rate_per_day=Decimal("1.00"))
+                for n in range(5)
+            ]
+            session.add_all(items)
+            await session.commit()
+
+            service = ItemService(ItemRepository(session), SKUGenerator(session))
+            job = await service.start_bulk_operation_job(
+                ItemBulkOperation(item_ids=[item.id for item in items], operation="deactivate"),
+                updated_by="admin",
+                idempotency_key="deactivate-drills"
+            )
+        await background_job_runner.wait()
+
+        job = await fetch_job(session_factory, job.id)
+        assert job.status == JobStatus.COMPLETED.value
+        assert (job.total_rows, job.processed_rows, job.succeeded_rows) == (5, 5, 5)
+        assert job.created_by == "admin"
+        async with session_factory() as session:
+            active = (await session.execute(select(Item.id).where(Item.is_active == True))).all()
+        assert active == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIdempotency:
+    """Test that an idempotency key returns the original job."""
+
+    async def test_resubmission_returns_original_job(self, session_factory):
+        runner = BackgroundJobRunner(session_factory)
+        async with session_factory() as session:
+            first = await runner.submit(session, "test_chunked", payload={"names": ["a"]}, idempotency_key="k1")
+            second = await runner.submit(session, "test_chunked", payload={"names": ["b"]}, idempotency_key="k1")
+        await runner.wait()
+
+        assert second.id == first.id
+        assert await brand_names(session_factory) == ["a"]
+
+    async def test_key_reused_for_other_operation_conflicts(self, session_factory):
+        runner = BackgroundJobRunner(session_factory)
+        async with session_factory() as session:
+            await runner.submit(session, "test_chunked", payload={"names": []}, idempotency_key="k2")
+            with pytest.raises(ConflictError):
+                await runner.submit(session, "test_other", idempotency_key="k2")
+        await runner.wait()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCancellation:
+    """Test cancelling queued and running jobs."""
+
+    async def test_pending_job_is_cancelled_and_never_runs(self, session_factory):
+        async with session_factory() as session:
+            job = await BackgroundJobRepository(session).create({
+                "job_type": "test_chunked", "status": JobStatus.PENDING.value, "payload": {"names": ["a"]}
+            })
+            await session.commit()
+            job = await BackgroundJobService(session).cancel_job(job.id)
+
+        assert job.status == JobStatus.CANCELLED.value
+        runner = BackgroundJobRunner(session_factory)
+        assert await runner.poll() == 0
+        assert await brand_names(session_factory) == []
+
+    async def test_running_job_stops_at_next_checkpoint(self, session_factory):
+        release.clear()
+        runner = BackgroundJobRunner(session_factory)
+        async with session_factory() as session:
+            job = await runner.submit(session, "test_blocking", payload={"names": ["a", "b", "c"]}, total_rows=3)
+
+        while (await fetch_job(session_factory, job.id)).status != JobStatus.RUNNING.value:
+            await asyncio.sleep(0.01)
+        async with session_factory() as session:
+            cancelled = await BackgroundJobService(session).cancel_job(job.id)
+        assert cancelled.cancel_requested is True
+        release.set()
+        await runner.wait()
+
+        job = await fetch_job(session_factory, job.id)
+        assert job.status == JobStatus.CANCELLED.value
+        assert job.processed_rows == 1
+        assert await brand_names(session_factory) == ["a"]
+
+    async def test_finished_job_cannot_be_cancelled(self, session_factory):
+        runner = BackgroundJobRunner(session_factory)
+        async with session_factory() as session:
+            job = await runner.submit(session, "test_other")
+        await runner.wait()
+
+        async with session_factory() as session:
+            with pytest.raises(ValidationError):
+                await BackgroundJobService(session).cancel_job(job.id)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPoll:
+    """Test the scheduler's queue poll."""
+
+    async def test_poll_claims_queued_jobs_up_to_concurrency(self, session_factory):
+        async with session_factory() as session:
+            repository = BackgroundJobRepository(session)
+            for name in ("a", "b", "c"):
+                await repository.create({
+                    "job_type": "test_chunked", "status": JobStatus.PENDING.value, "payload": {"names": [name]}
+                })
+            await session.commit()
+
+        runner = BackgroundJobRunner(session_factory, max_concurrency=2)
+        assert await runner.poll() == 2
+        await runner.wait()
+        assert await runner.poll() == 1
+        await runner.wait()
+        assert await runner.poll() == 0
+        assert await brand_names(session_factory) == ["a", "b", "c"]
+
+    async def test_poll_skips_jobs_bound_to_another_host(self, session_factory):
+        async with session_factory() as session:
+            repository = BackgroundJobRepository(session)
+            await repository.create({
+                "job_type": "test_chunked", "status": JobStatus.PENDING.value,
+                "payload": {"names": ["a"]}, "claimable_by": "host-a"
+            })
+            await repository.create({
+                "job_type": "test_chunked", "status": JobStatus.PENDING.value, "payload": {"names": ["b"]}
+            })
+            await session.commit()
+
+        other_host = BackgroundJobRunner(session_factory, host="host-b")
+        assert await other_host.poll() == 1
+        await other_host.wait()
+        assert await other_host.poll() == 0
+        assert await brand_names(session_factory) == ["b"]
+
+        submitting_host = BackgroundJobRunner(session_factory, host="host-a")
+        assert await submitting_host.poll() == 1
+        await submitting_host.wait()
+        assert await brand_names(session_factory) == ["a", "b"]
+
+    async def test_poll_fails_stale_running_jobs(self, session_factory):
+        async with session_factory() as session:
+            job = await BackgroundJobRepository(session).create({
+                "job_type": "test_other", "status": JobStatus.RUNNING.value
+            })
+            await session.commit()
+            await session.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job.id)
+                .values(updated_at=datetime.now(timezone.utc) - timedelta(days=1))
+            )
+            await session.commit()
+
+        await BackgroundJobRunner(session_factory).poll()
+
+        job = await fetch_job(session_factory, job.id)
+        assert job.status == JobStatus.FAILED.value
+        assert job.error_message == "Worker stopped before the job finished"
@@ -0,0 +1,290 @@
+"""
+Unit tests for the staged bulk import pipeline and background import jobs.
+"""
+
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.v1.endpoints import jobs
+from app.core.dependencies import get_background_job_read_service
+from app.models.background_job import BackgroundJob, JobStatus
+from app.models.brand import Brand
+from app.models.cache_version import CacheVersion
+from app.models.category import Category
+from app.models.entity_stat import EntityStatCounter
+from app.models.item import Item
+from app.models.sku_counter import SkuCounter
+from app.models.unit_of_measurement import UnitOfMeasurement
+from app.services.background_job import BackgroundJobRunner, BackgroundJobService, job_handler
+from app.services import bulk_import
+from app.services.bulk_import import BRAND_IMPORT, ITEM_IMPORT, BulkImporter, ImportFileFormat, submit_file_import
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[
+                Brand.__table__,
+                Category.__table__,
+                UnitOfMeasurement.__table__,
+                Item.__table__,
+                BackgroundJob.__table__,
+                EntityStatCounter.__table__,
+                CacheVersion.__table__,
+                SkuCounter.__table__,
+            ],
+        )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(Brand(id=uuid4(), name="Makita", code="MAK"))
+        session.add(Item(id=uuid4(), item_name="Old Drill", sku="DRL-001", rental_rate_per_day=Decimal("1.00")))
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+async def items_by_sku(session):
+    result = await session.execute(select(Item))
+    return {item.sku: item for item in result.scalars()}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestItemImport:
+    """Test the item upsert keyed on SKU."""
+
+    async def test_inserts_updates_and_resolves_names(self, session_factory):
+        rows = [
+            {"item_name": "Drill", "sku": "drl-001", "brand_name": "makita", "rental_rate_per_day": "5"},
+            {"item_name": "Saw", "sku": "SAW-001", "brand_name": "Makita"},
+        ]
+        async with session_factory() as session:
+            report = await BulkImporter(session, ITEM_IMPORT, created_by="importer").run(rows)
+            await session.commit()
+            items = await items_by_sku(session)
+            brand_id = (await session.execute(select(Brand.id))).scalar_one()
+
+        assert (report.inserted, report.updated, report.failed) == (1, 1, 0)
+        assert items["DRL-001"].item_name == "Drill"
+        assert items["DRL-001"].rental_rate_per_day == Decimal("5.00")
+        assert items["DRL-001"].brand_id == brand_id
+        assert items["SAW-001"].brand_id == brand_id
+        assert items["SAW-001"].created_by == "importer"
+
+    async def test_key_matches_case_insensitively(self, session_factory):
+        async with session_factory() as session:
+            # Stored before SKUs were normalised to upper case
+            await session.execute(Item.__table__.insert().values(
+                id=uuid4(), item_name="Old Saw", sku="saw-001", is_active=True
+            ))
+            await session.commit()
+            report = await BulkImporter(session, ITEM_IMPORT).run([{"item_name": "Saw", "sku": "SAW-001"}])
+            await session.commit()
+            items = await items_by_sku(session)
+
+        assert (report.inserted, report.updated, report.failed) == (0, 1, 0)
+        assert items["saw-001"].item_name == "Saw"
+
+    async def test_update_keeps_fields_the_row_omits(self, session_factory):
+        async with session_factory() as session:
+            item = (await session.execute(select(Item).where(Item.sku == "DRL-001"))).scalar_one()
+            item.description = "Cordless, 18V"
+            item.notes = "Check chuck"
+            item.sale_price = Decimal("99.00")
+            item.reorder_level = 3
+            await session.commit()
+
+            report = await BulkImporter(session, ITEM_IMPORT).run(
+                [{"item_name": "Drill", "sku": "DRL-001", "description": None, "rental_rate_per_day": "5"}]
+            )
+            await session.commit()
+            session.expire_all()
+            items = await items_by_sku(session)
+
+        assert report.updated == 1
+        assert items["DRL-001"].item_name == "Drill"
+        assert items["DRL-001"].rental_rate_per_day == Decimal("5.00")
+        assert items["DRL-001"].description == "Cordless, 18V"
+        assert items["DRL-001"].notes == "Check chuck"
+        assert items["DRL-001"].sale_price == Decimal("99.00")
+        assert items["DRL-001"].reorder_level == 3
+
+    async def test_rejected_rows_are_reported(self, session_factory):
+        rows = [
+            {"item_name": "Saw", "sku": "SAW-001", "brand_name": "Nope"},
+            {"item_name": "", "sku": "X-1"},
+            {"item_name": "Hammer", "sku": "HAM-001"},
+            {"item_name": "Hammer v2", "sku": "ham-001"},
+        ]
+        async with session_factory() as session:
+            report = await BulkImporter(session, ITEM_IMPORT, chunk_size=2).run(rows)
+            await session.commit()
+            items = await items_by_sku(session)
+
+        assert report.processed_rows == 4
+        assert (report.inserted, report.failed) == (1, 3)
+        assert items["HAM-001"].item_name == "Hammer v2"
+        messages = {error["row"]: error["message"] for error in report.errors}
+        assert messages[1] == "Brand 'Nope' not found"
+        assert 2 in messages
+        assert 3 in messages
+        assert "SAW-001" not in items
+
+    async def test_missing_skus_are_allocated(self, session_factory):
+        rows = [{"item_name": "Hammer"}, {"item_name": "Mallet"}]
+        async with session_factory() as session:
+            report = await BulkImporter(session, ITEM_IMPORT).run(rows)
+            await session.commit()
+            items = await items_by_sku(session)
+
+        assert report.inserted == 2
+        generated = sorted(sku for sku, item in items.items() if item.item_name in ("Hammer", "Mallet"))
+        assert len(set(generated)) == 2
+        assert all(sku.startswith("ITEM-") for sku in generated)
+
+    async def test_validation_errors_count_each_row_once(self, session_factory):
+        rows = [{"item_name": "", "rental_rate_per_day": "-1"}]
+        async with session_factory() as session:
+            report = await BulkImporter(session, ITEM_IMPORT).run(rows)
+
+        assert report.failed == 1
+        assert len(report.errors) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBrandImport:
+    """Test that brand imports keep skip-existing semantics."""
+
+    async def test_existing_skipped_and_code_clash_rejected(self, session_factory):
+        rows = [
+            {"name": "Makita", "code": "MK2"},
+            {"name": "Bosch", "code": "MAK"},
+            {"name": "DeWalt", "code": "DW"},
+        ]
+        async with session_factory() as session:
+            report = await BulkImporter(session, BRAND_IMPORT).run(rows)
+            await session.commit()
+            brands = dict((await session.execute(select(Brand.name, Brand.code))).all())
+
+        assert (report.inserted, report.skipped, report.failed) == (1, 1, 1)
+        assert report.errors[0]["row"] == 2
+        assert brands == {"Makita": "MAK", "DeWalt": "DW"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestImportJobs:
+    """Test file imports run as background jobs."""
+
+    async def test_file_job_records_progress_and_outcome(self, session_factory, tmp_path):
+        path = tmp_path / "items.ndjson"
+        path.write_text("\n".join(json.dumps(row) for row in [
+            {"item_name": "Hammer", "sku": "HAM-001"},
+            {"item_name": "Saw", "sku": "SAW-001", "brand_name": "Nope"},
+        ]))
+        runner = BackgroundJobRunner(session_factory)
+
+        async with session_factory() as session:
+            job = await runner.submit(
+                session,
+                "item_import",
+                payload={"path": str(path), "format": "ndjson"},
+            )
+        await runner.wait()
+
+        async with session_factory() as session:
+            job = await BackgroundJobService(session).get_job(job.id)
+            items = await items_by_sku(session)
+
+        assert job.status == JobStatus.COMPLETED.value
+        assert (job.total_rows, job.processed_rows) == (2, 2)
+        assert (job.succeeded_rows, job.failed_rows) == (1, 1)
+        assert job.errors[0]["row"] == 2
+        assert job.result["inserted"] == 1
+        assert job.progress == 1.0
+        assert "HAM-001" in items
+        assert not path.exists()
+
+    async def test_file_job_is_claimed_only_on_the_submitting_host(self, session_factory, tmp_path, monkeypatch):
+        path = tmp_path / "items.ndjson"
+        path.write_text(json.dumps({"item_name": "Hammer", "sku": "HAM-001"}))
+        submitting_host = BackgroundJobRunner(session_factory, host="host-a")
+        # No free slot, so the job stays queued after the request
+        monkeypatch.setattr(submitting_host, "dispatch", lambda job_id=None: False)
+        monkeypatch.setattr(bulk_import, "background_job_runner", submitting_host)
+
+        async with session_factory() as session:
+            job = await submit_file_import(session, "item_import", path, ImportFileFormat.NDJSON)
+
+        assert job.claimable_by == "host-a"
+        assert await BackgroundJobRunner(session_factory, host="host-b").poll() == 0
+        assert path.exists()
+
+        # One slot, so poll stops claiming while the import shares the in-memory connection
+        runner = BackgroundJobRunner(session_factory, max_concurrency=1, host="host-a")
+        assert await runner.poll() == 1
+        await runner.wait()
+        async with session_factory() as session:
+            job = await BackgroundJobService(session).get_job(job.id)
+            items = await items_by_sku(session)
+
+        assert job.status == JobStatus.COMPLETED.value
+        assert "HAM-001" in items
+
+    async def test_failed_handler_marks_job_failed(self, session_factory):
+        runner = BackgroundJobRunner(session_factory)
+        async with session_factory() as session:
+            job = await runner.submit(session, "test_failing_import")
+        await runner.wait()
+
+        async with session_factory() as session:
+            job = await BackgroundJobService(session).get_job(job.id)
+
+        assert job.status == JobStatus.FAILED.value
+        assert job.error_message == "boom"
+        assert job.finished_at is not None
+
+    async def test_job_status_endpoint(self, session_factory):
+        runner = BackgroundJobRunner(session_factory)
+        async with session_factory() as session:
+            job = await runner.submit(session, "test_noop")
+        await runner.wait()
+
+        app = FastAPI()
+        app.include_router(jobs.router, prefix="/jobs")
+
+        async def service():
+            async with session_factory() as session:
+                yield BackgroundJobService(session)
+
+        app.dependency_overrides[get_background_job_read_service] = service
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            found = await client.get(f"/jobs/{job.id}")
+            missing = await client.get(f"/jobs/{uuid4()}")
+
+        assert found.status_code == 200
+        assert found.json()["status"] == "COMPLETED"
+        assert found.json()["job_type"] == "test_noop"
+        assert missing.status_code == 404
+
+
+@job_handler("test_failing_import")
+async def _failing(session, progress):
+    raise RuntimeError("boom")
+
+
+@job_handler("test_noop")
+async def _noop(session, progress):
+    return {"ok": True}
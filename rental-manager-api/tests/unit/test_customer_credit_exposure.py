@@ -0,0 +1,231 @@
+"""
+Unit tests for the customer credit exposure ledger: write-path deltas,
+the single-row credit check and the nightly reconcile.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.crud.customer_credit_exposure import CustomerCreditExposureRepository
+from app.models.cache_version import CacheVersion
+from app.models.customer import Customer
+from app.models.customer_credit_exposure import CustomerCreditExposure
+from app.models.entity_stat import EntityStatCounter
+from app.models.transaction import (
+    PaymentStatus,
+    TransactionHeader,
+    TransactionStatus,
+    TransactionType,
+)
+from app.services.transaction.sales_service import SalesService
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Customer.metadata.create_all,
+            tables=[Customer.__table__, TransactionHeader.__table__, CustomerCreditExposure.__table__,
+                    EntityStatCounter.__table__, CacheVersion.__table__],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def customer(session):
+    customer = Customer(
+        id=uuid4(),
+        customer_code="CUST-001",
+        first_name="Asha",
+        last_name="Lal",
+        email="asha@example.com",
+        phone="9000000001",
+        address_line1="1 Main Road",
+        city="Aizawl",
+        state="Mizoram",
+        postal_code="796001",
+        credit_limit=Decimal("1000.00"),
+    )
+    session.add(customer)
+    await session.commit()
+    return customer
+
+
+async def open_sale(service, customer, total, due_in_days=30, paid=Decimal("0.00")):
+    """Add a sale the way create_sale does and record it in the ledger."""
+    sale = TransactionHeader(
+        id=uuid4(),
+        transaction_type=TransactionType.SALE,
+        transaction_number=f"SAL-{uuid4().hex[:8]}",
+        status=TransactionStatus.PENDING,
+        transaction_date=datetime.now(timezone.utc),
+        due_date=date.today() + timedelta(days=due_in_days),
+        customer_id=customer.id,
+        total_amount=total,
+        paid_amount=paid,
+        payment_status=PaymentStatus.PARTIAL if paid else PaymentStatus.PENDING,
+    )
+    service.session.add(sale)
+    await service.session.flush()
+    await service._update_credit_exposure(sale, was_open=False, old_balance=Decimal("0.00"))
+    await service.session.commit()
+    return sale
+
+
+async def exposure_of(session, customer):
+    query = (
+        select(CustomerCreditExposure)
+        .where(CustomerCreditExposure.customer_id == customer.id)
+        .execution_options(populate_existing=True)
+    )
+    return (await session.execute(query)).scalar_one_or_none()
+
+
+def order(amount):
+    return [SimpleNamespace(quantity=1, unit_price=amount)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExposureUpkeep:
+    """Test that sale changes adjust the exposure row."""
+
+    async def test_opening_sales_accumulates(self, session, customer):
+        service = SalesService(session)
+
+        await open_sale(service, customer, Decimal("300.00"), due_in_days=30)
+        await open_sale(service, customer, Decimal("200.00"), due_in_days=10, paid=Decimal("50.00"))
+
+        exposure = await exposure_of(session, customer)
+        assert exposure.outstanding_balance == Decimal("450.00")
+        assert exposure.open_sales_count == 2
+        assert exposure.oldest_due_date == date.today() + timedelta(days=10)
+        assert exposure.overdue_count == 0
+
+    async def test_paying_off_oldest_sale_refreshes_due_date(self, session, customer):
+        service = SalesService(session)
+        await open_sale(service, customer, Decimal("300.00"), due_in_days=30)
+        oldest = await open_sale(service, customer, Decimal("200.00"), due_in_days=10)
+
+        old_balance = oldest.balance_due
+        oldest.add_payment(Decimal("200.00"))
+        await service._update_credit_exposure(oldest, was_open=True, old_balance=old_balance)
+        await session.commit()
+
+        exposure = await exposure_of(session, customer)
+        assert exposure.outstanding_balance == Decimal("300.00")
+        assert exposure.open_sales_count == 1
+        assert exposure.oldest_due_date == date.today() + timedelta(days=30)
+
+    async def test_cancelling_overdue_sale_clears_it(self, session, customer):
+        service = SalesService(session)
+        sale = await open_sale(service, customer, Decimal("100.00"), due_in_days=-5)
+        assert (await exposure_of(session, customer)).overdue_count == 1
+
+        sale.status = TransactionStatus.CANCELLED
+        await service._update_credit_exposure(sale, was_open=True, old_balance=sale.balance_due)
+        await session.commit()
+
+        exposure = await exposure_of(session, customer)
+        assert (exposure.outstanding_balance, exposure.open_sales_count, exposure.overdue_count) == (0, 0, 0)
+        assert exposure.oldest_due_date is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreditCheck:
+    """Test the credit check against the exposure row."""
+
+    async def test_customer_without_sales_has_full_limit(self, session, customer):
+        result = await SalesService(session)._check_customer_credit(customer.id, order(Decimal("400.00")))
+
+        assert result["approved"] is True
+        assert result["available_credit"] == Decimal("1000.00")
+
+    async def test_exceeding_limit_is_declined(self, session, customer):
+        service = SalesService(session)
+        await open_sale(service, customer, Decimal("800.00"))
+
+        result = await service._check_customer_credit(customer.id, order(Decimal("500.00")))
+
+        assert result["approved"] is False
+        assert result["reason"] == "Exceeds credit limit"
+        assert result["suggested_payment"] == Decimal("300.00")
+
+    async def test_overdue_sale_is_declined(self, session, customer):
+        service = SalesService(session)
+        await open_sale(service, customer, Decimal("100.00"), due_in_days=-3)
+
+        result = await service._check_customer_credit(customer.id, order(Decimal("50.00")))
+
+        assert result["approved"] is False
+        assert result["reason"] == "Has overdue payments"
+        assert result["oldest_overdue_date"] == date.today() - timedelta(days=3)
+
+    async def test_unknown_customer(self, session):
+        result = await SalesService(session)._check_customer_credit(uuid4(), order(Decimal("1.00")))
+
+        assert result == {"approved": False, "reason": "Customer not found"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReconcile:
+    """Test the nightly rebuild from transaction_headers."""
+
+    async def test_reconcile_corrects_drift_and_creates_missing_rows(self, session, customer):
+        service = SalesService(session)
+        await open_sale(service, customer, Decimal("300.00"), due_in_days=1)
+        await session.execute(
+            update(CustomerCreditExposure).values(outstanding_balance=Decimal("999.00"), overdue_count=4)
+        )
+        other = Customer(
+            id=uuid4(), customer_code="CUST-002", first_name="Ben", last_name="Ral",
+            email="ben@example.com", phone="9000000002", address_line1="2 Main Road",
+            city="Aizawl", state="Mizoram", postal_code="796001",
+        )
+        session.add(other)
+        session.add(TransactionHeader(
+            id=uuid4(), transaction_type=TransactionType.SALE, transaction_number="SAL-OTHER",
+            status=TransactionStatus.PENDING, transaction_date=datetime.now(timezone.utc),
+            due_date=date.today() - timedelta(days=2), customer_id=other.id,
+            total_amount=Decimal("75.00"), paid_amount=Decimal("0.00"), payment_status=PaymentStatus.PENDING,
+        ))
+        await session.commit()
+
+        # The day after tomorrow the first sale is overdue as well
+        results = await CustomerCreditExposureRepository(session).reconcile(today=date.today() + timedelta(days=2))
+        await session.commit()
+
+        assert results == {"corrected": 1, "cleared": 0, "created": 1}
+        exposure = await exposure_of(session, customer)
+        assert (exposure.outstanding_balance, exposure.overdue_count) == (Decimal("300.00"), 1)
+        assert exposure.oldest_due_date == date.today() + timedelta(days=1)
+        created = await exposure_of(session, other)
+        assert (created.outstanding_balance, created.open_sales_count, created.overdue_count) == (
+            Decimal("75.00"), 1, 1
+        )
+
+    async def test_reconcile_clears_customers_without_open_sales(self, session, customer):
+        service = SalesService(session)
+        sale = await open_sale(service, customer, Decimal("300.00"))
+        await session.execute(
+            update(TransactionHeader).where(TransactionHeader.id == sale.id).values(status=TransactionStatus.CANCELLED)
+        )
+        await session.commit()
+
+        repository = CustomerCreditExposureRepository(session)
+        assert (await repository.reconcile())["cleared"] == 1
+        assert await repository.reconcile() == {"corrected": 0, "cleared": 0, "created": 0}
+        rows = (await session.execute(select(CustomerCreditExposure.outstanding_balance))).scalars().all()
+        assert rows == [Decimal("0.00")]
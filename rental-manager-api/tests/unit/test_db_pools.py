@@ -0,0 +1,157 @@
+"""
+Unit tests for connection pool profiles, idle-only liveness pings and
+admission control of low-priority requests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import DatabaseManager, InstrumentedAsyncPool, db_manager
+from app.core.db_pools import (
+    BACKGROUND,
+    INTERACTIVE,
+    POOL_PROFILES,
+    PoolProfile,
+    auto_profile,
+    install_idle_ping,
+    pool_profile,
+)
+from app.core.metrics import db_admission_shed, db_pool_checkout_wait, db_pool_stale_connections
+from app.core.middleware import AdmissionControlMiddleware
+
+
+def profile_settings(**overrides):
+    values = dict(
+        DB_POOL_PROFILE="standard",
+        DB_MAX_CONNECTIONS=60,
+        DB_POOL_SIZE=None,
+        DB_MAX_OVERFLOW=None,
+        DB_BACKGROUND_POOL_SIZE=None,
+        DB_BACKGROUND_MAX_OVERFLOW=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=InstrumentedAsyncPool,
+        pool_size=2, max_overflow=0, pool_logging_name=INTERACTIVE,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestPoolProfiles:
+    """Test profile selection and overrides."""
+
+    def test_named_profile_with_override(self):
+        profile = pool_profile(profile_settings(DB_POOL_PROFILE="small", DB_BACKGROUND_POOL_SIZE=3))
+
+        assert profile == PoolProfile(pool_size=5, max_overflow=5, background_pool_size=3, background_max_overflow=2)
+        assert profile.pool_args(BACKGROUND) == {"pool_size": 3, "max_overflow": 2}
+        assert profile.pool_args(INTERACTIVE) == {"pool_size": 5, "max_overflow": 5}
+
+    def test_auto_profile_splits_the_budget(self):
+        profile = pool_profile(profile_settings(DB_POOL_PROFILE="auto", DB_MAX_CONNECTIONS=50))
+
+        assert profile == auto_profile(50)
+        assert profile.interactive_capacity == 38
+        assert profile.background_pool_size + profile.background_max_overflow == 12
+
+    def test_profiles_fit_their_budget(self):
+        for profile in POOL_PROFILES.values():
+            background = profile.background_pool_size + profile.background_max_overflow
+            assert 0 < background < profile.interactive_capacity
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIdlePing:
+    """Test that only idle connections are pinged at checkout."""
+
+    async def test_busy_pool_does_not_ping(self, engine, monkeypatch):
+        pings = []
+        monkeypatch.setattr(engine.dialect, "do_ping", lambda connection: pings.append(connection) or True)
+        install_idle_ping(engine, INTERACTIVE, idle_seconds=60)
+
+        for _ in range(3):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        assert pings == []
+
+    async def test_dead_idle_connection_is_replaced(self, engine, monkeypatch):
+        pings = []
+        monkeypatch.setattr(engine.dialect, "do_ping", lambda connection: pings.append(connection) and False)
+        install_idle_ping(engine, INTERACTIVE, idle_seconds=0)
+        before = db_pool_stale_connections.value(pool=INTERACTIVE)
+
+        async with engine.connect() as conn:
+            first = (await conn.get_raw_connection()).driver_connection
+        async with engine.connect() as conn:
+            second = (await conn.get_raw_connection()).driver_connection
+            assert (await conn.execute(text("SELECT 1"))).scalar_one() == 1
+
+        assert len(pings) == 1  # the fresh replacement is not pinged again
+        assert second is not first
+        assert db_pool_stale_connections.value(pool=INTERACTIVE) == before + 1
+
+    async def test_checkout_wait_labelled_by_pool(self, engine):
+        before = db_pool_checkout_wait.count(pool=INTERACTIVE)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert db_pool_checkout_wait.count(pool=INTERACTIVE) == before + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAdmissionControl:
+    """Test low-priority shedding and pool utilisation."""
+
+    async def test_interactive_utilization(self, engine):
+        manager = DatabaseManager()
+        manager.engine = engine
+        manager.pool_profile = PoolProfile(pool_size=2, max_overflow=0, background_pool_size=1, background_max_overflow=0)
+
+        async with engine.connect():
+            assert manager.interactive_utilization() == 0.5
+        assert manager.interactive_utilization() == 0.0
+
+    async def test_low_priority_requests_shed_when_busy(self, monkeypatch):
+        app = FastAPI()
+
+        @app.get("/items/export/")
+        async def export():
+            return {}
+
+        @app.get("/items/")
+        async def items():
+            return {}
+
+        app.add_middleware(AdmissionControlMiddleware, low_priority_paths=["/export"], max_utilization=0.8)
+        utilization = {"value": 0.9}
+        monkeypatch.setattr(db_manager, "interactive_utilization", lambda: utilization["value"])
+        before = db_admission_shed.value(path="/export")
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            shed = await client.get("/items/export/")
+            interactive = await client.get("/items/")
+            utilization["value"] = 0.5
+            admitted = await client.get("/items/export/")
+
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "5"
+        assert interactive.status_code == 200
+        assert admitted.status_code == 200
+        assert db_admission_shed.value(path="/export") == before + 1
@@ -0,0 +1,252 @@
+"""
+Unit tests for counter-table statistics: flush deltas, recount marks,
+the drift reconcile and the versioned snapshot cache.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.crud.cache_version import CacheVersionRepository
+from app.crud.contact_person import ContactPersonRepository
+from app.crud.entity_stats import (
+    STAT_SPECS,
+    EntityStatsRepository,
+    count_source,
+    entity_stats_cache,
+    stats_namespace,
+    track_counted_writes,
+)
+from app.crud.item import ItemRepository
+from app.models.brand import Brand
+from app.models.cache_version import CacheVersion
+from app.models.contact_person import ContactPerson
+from app.models.entity_stat import EntityStatCounter
+from app.models.item import Item
+
+ITEMS = Item.__tablename__
+
+
+@pytest_asyncio.fixture
+async def session():
+    entity_stats_cache.clear()
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[spec.model.__table__ for spec in STAT_SPECS.values()]
+            + [EntityStatCounter.__table__, CacheVersion.__table__],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        track_counted_writes(session)
+        yield session
+    await engine.dispose()
+    entity_stats_cache.clear()
+
+
+def make_item(n, **fields):
+    return Item(id=uuid4(), item_name=f"Drill {n}", sku=f"DRL-{n:03d}", **fields)
+
+
+async def stored_counters(session, entity=ITEMS):
+    result = await session.execute(
+        select(EntityStatCounter.dimension, EntityStatCounter.bucket, EntityStatCounter.count, EntityStatCounter.total)
+        .where(EntityStatCounter.entity == entity, EntityStatCounter.count != 0)
+    )
+    return {(row.dimension, row.bucket): (row.count, row.total) for row in result}
+
+
+async def source_counters(session, entity=ITEMS):
+    return await session.run_sync(lambda sync_session: count_source(sync_session, STAT_SPECS[entity]))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCounterUpkeep:
+    """Test that ORM writes keep the counters equal to a recount."""
+
+    async def test_inserts_updates_and_deletes(self, session):
+        brand = Brand(id=uuid4(), name="Bosch")
+        items = [
+            make_item(1, brand_id=brand.id, cost_price=Decimal("10.00"), sale_price=Decimal("30.00")),
+            make_item(2, brand_id=brand.id, cost_price=Decimal("20.00"), is_salable=False),
+            make_item(3, cost_price=Decimal("40.00")),
+        ]
+        session.add(brand)
+        session.add_all(items)
+        await session.commit()
+
+        stats = await ItemRepository(session).get_statistics()
+        assert (stats["total_items"], stats["active_items"], stats["salable_items"]) == (3, 3, 2)
+        assert (stats["avg_cost_price"], stats["total_inventory_value"]) == (Decimal("70.00") / 3, Decimal("70.00"))
+        assert await ItemRepository(session).get_items_by_brand() == [
+            {"brand_name": "Bosch", "item_count": 2},
+            {"brand_name": "No Brand", "item_count": 1},
+        ]
+
+        items[0].soft_delete()
+        items[1].is_salable = True
+        items[1].is_rental_blocked = True
+        items[2].status = "MAINTENANCE"
+        items[2].brand_id = brand.id
+        await session.commit()
+
+        stats = await ItemRepository(session).get_statistics()
+        assert (stats["total_items"], stats["active_items"], stats["inactive_items"]) == (3, 2, 1)
+        assert (stats["salable_items"], stats["rental_blocked_items"]) == (2, 1)
+        assert stats["avg_cost_price"] == Decimal("30.00")
+        assert await ItemRepository(session).get_items_by_status() == {"ACTIVE": 1, "MAINTENANCE": 1}
+        assert await ItemRepository(session).get_items_by_brand() == [{"brand_name": "Bosch", "item_count": 2}]
+        assert await stored_counters(session) == await source_counters(session)
+
+    async def test_counters_are_written_at_commit(self, session):
+        session.add(make_item(1))
+        await session.flush()
+        assert await stored_counters(session) == {}
+
+        await session.commit()
+        assert (await stored_counters(session))[("is_active", "true")] == (1, Decimal("0"))
+
+    async def test_rollback_discards_counter_changes(self, session):
+        session.add(make_item(1))
+        await session.commit()
+
+        session.add(make_item(2))
+        await session.flush()
+        await session.rollback()
+
+        assert (await stored_counters(session))[("is_active", "true")] == (1, Decimal("0"))
+
+    async def test_savepoint_rollback_marks_for_recount(self, session):
+        session.add(make_item(1))
+        async with session.begin_nested():
+            session.add(make_item(2))
+        savepoint = await session.begin_nested()
+        session.add(make_item(3))
+        await session.flush()
+        await savepoint.rollback()
+        await session.commit()
+
+        repository = EntityStatsRepository(session)
+        assert await repository.marked() == [ITEMS]
+        await repository.reconcile(await repository.marked())
+        assert (await stored_counters(session))[("is_active", "true")] == (2, Decimal("0"))
+
+    async def test_unloaded_previous_value_is_marked_for_recount(self, session):
+        item = make_item(1)
+        session.add(item)
+        await session.commit()
+
+        session.expire(item, ["status"])
+        item.status = "RETIRED"
+        await session.commit()
+
+        repository = EntityStatsRepository(session)
+        assert await repository.marked() == [ITEMS]
+        assert await repository.reconcile([ITEMS]) == {ITEMS: 2}
+        assert await repository.marked() == []
+        assert await ItemRepository(session).get_items_by_status() == {"RETIRED": 1}
+        assert await stored_counters(session) == await source_counters(session)
+
+    async def test_bulk_statement_is_marked_for_recount(self, session):
+        session.add_all([make_item(n) for n in range(3)])
+        await session.commit()
+        version = await CacheVersionRepository(session).get(stats_namespace(ITEMS))
+
+        await session.execute(
+            update(Item).values(is_rental_blocked=True).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+        # Nothing is recounted in the writing transaction...
+        repository = EntityStatsRepository(session)
+        assert await CacheVersionRepository(session).get(stats_namespace(ITEMS)) == version
+        assert await repository.marked() == [ITEMS]
+
+        # ...but by the reconcile of marked entities
+        await repository.reconcile(await repository.marked())
+        stats = await ItemRepository(session).get_statistics()
+        assert stats["rental_blocked_items"] == 3
+        assert await repository.marked() == []
+
+    async def test_untracked_sessions_leave_counters_alone(self, session):
+        session.add(make_item(1))
+        await session.commit()
+
+        async with AsyncSession(session.bind) as other:
+            other.add(make_item(2))
+            await other.commit()
+
+        # Until the reconcile corrects the drift
+        assert (await stored_counters(session))[("is_active", "true")] == (1, Decimal("0"))
+        assert await EntityStatsRepository(session).marked() == []
+
+    async def test_derived_and_distinct_dimensions(self, session):
+        contacts = [
+            ContactPerson(id=uuid4(), first_name="Ann", last_name="Lee", email="ann@acme.test", company="Acme", is_primary=True),
+            ContactPerson(id=uuid4(), first_name="Bob", last_name="Ray", mobile="555-0101", company="Acme"),
+            ContactPerson(id=uuid4(), first_name="Cy", last_name="Fox", phone="555-0102", company="Globex"),
+            ContactPerson(id=uuid4(), first_name="Di", last_name="Orr", email="di@solo.test"),
+            ContactPerson(id=uuid4(), first_name="Ed", last_name="Poe", company="Initech"),
+        ]
+        session.add_all(contacts)
+        await session.commit()
+        await session.delete(contacts[-1])
+        await session.commit()
+
+        stats = await ContactPersonRepository(session).get_statistics()
+
+        assert stats == {
+            "total_contacts": 4,
+            "active_contacts": 4,
+            "inactive_contacts": 0,
+            "primary_contacts": 1,
+            "companies_count": 2,
+            "with_email": 2,
+            "with_phone": 2,
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReconcileAndCache:
+    """Test drift correction and the versioned snapshot cache."""
+
+    async def test_reconcile_corrects_drift_and_drops_empty_counters(self, session):
+        session.add_all([make_item(1), make_item(2)])
+        await session.commit()
+        await session.execute(
+            update(EntityStatCounter)
+            .where(EntityStatCounter.entity == ITEMS, EntityStatCounter.dimension == "is_active")
+            .values(count=7)
+        )
+        session.add(EntityStatCounter(id=uuid4(), entity=ITEMS, dimension="status", bucket="LOST", count=0, total=0))
+        await session.commit()
+
+        results = await EntityStatsRepository(session).reconcile()
+
+        assert results[ITEMS] == 1
+        assert results[ContactPerson.__tablename__] == 0
+        assert await stored_counters(session) == await source_counters(session)
+        lost = await session.execute(select(EntityStatCounter).where(EntityStatCounter.bucket == "LOST"))
+        assert lost.scalar_one_or_none() is None
+
+    async def test_snapshot_is_reused_until_the_version_moves(self, session):
+        session.add(make_item(1))
+        await session.commit()
+        first = await entity_stats_cache.get(session, ITEMS)
+
+        # A change that does not bump the version is not seen...
+        await session.execute(update(EntityStatCounter).values(count=99))
+        assert await entity_stats_cache.get(session, ITEMS) is first
+
+        # ...while any counted write invalidates the snapshot
+        session.add(make_item(2))
+        await session.commit()
+        second = await entity_stats_cache.get(session, ITEMS)
+        assert second.version == first.version + 1
+        assert second.count("is_active") == 100
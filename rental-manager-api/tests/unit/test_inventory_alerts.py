@@ -0,0 +1,223 @@
+"""
+Unit tests for the inventory alert engine: flush-time evaluation,
+deduplication, acknowledgement and the periodic sweep.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.crud.inventory import inventory_alert
+from app.models.inventory.enums import (
+    InventoryAlertSeverity,
+    InventoryAlertStatus,
+    InventoryAlertType,
+)
+from app.models.inventory.inventory_alert import InventoryAlert
+from app.models.inventory.inventory_unit import InventoryUnit
+from app.models.inventory.stock_level import StockLevel
+from app.services.inventory.inventory_service import InventoryService
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            StockLevel.metadata.create_all,
+            tables=[StockLevel.__table__, InventoryUnit.__table__, InventoryAlert.__table__],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def make_stock(on_hand, reorder_point=Decimal("5")):
+    return StockLevel(
+        id=uuid4(),
+        item_id=uuid4(),
+        location_id=uuid4(),
+        quantity_on_hand=Decimal(on_hand),
+        reorder_point=reorder_point,
+    )
+
+
+def set_available(stock, quantity):
+    # Keep the allocation check satisfied: nothing is reserved or on rent
+    stock.quantity_on_hand = stock.quantity_available = Decimal(quantity)
+
+
+def make_unit(n, **dates):
+    unit = InventoryUnit(id=uuid4(), item_id=uuid4(), location_id=uuid4(), sku=f"DRL-{n:03d}", serial_number=f"SN{n}")
+    for name, value in dates.items():
+        setattr(unit, name, value)
+    return unit
+
+
+async def all_alerts(session):
+    result = await session.execute(
+        select(InventoryAlert).order_by(InventoryAlert.raised_at).execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFlushEvaluation:
+    """Test that stock changes raise, refresh and resolve alerts as they flush."""
+
+    async def test_low_stock_alert_lifecycle(self, session):
+        stock = make_stock(10)
+        session.add(stock)
+        await session.commit()
+        assert await all_alerts(session) == []
+
+        set_available(stock, "3")
+        await session.commit()
+        [alert] = await all_alerts(session)
+        assert (alert.alert_type, alert.severity, alert.quantity) == (
+            InventoryAlertType.LOW_STOCK.value, InventoryAlertSeverity.MEDIUM.value, Decimal("3")
+        )
+        assert alert.subject_id == stock.id
+
+        set_available(stock, "0")
+        await session.commit()
+        [alert] = await all_alerts(session)
+        assert (alert.severity, alert.quantity) == (InventoryAlertSeverity.HIGH.value, Decimal("0"))
+
+        set_available(stock, "20")
+        await session.commit()
+        [alert] = await all_alerts(session)
+        assert alert.status == InventoryAlertStatus.RESOLVED.value
+        assert alert.resolved_at is not None
+
+        # Running low again raises a fresh alert; the resolved one stays as history
+        set_available(stock, "1")
+        await session.commit()
+        statuses = [alert.status for alert in await all_alerts(session)]
+        assert statuses == [InventoryAlertStatus.RESOLVED.value, InventoryAlertStatus.OPEN.value]
+
+    async def test_unwatched_changes_do_not_evaluate(self, session):
+        stock = make_stock(2)
+        session.add(stock)
+        await session.commit()
+        await session.execute(update(InventoryAlert).values(message="edited"))
+        await session.commit()
+
+        stock.last_counted_date = datetime.now(timezone.utc)
+        await session.commit()
+
+        [alert] = await all_alerts(session)
+        assert alert.message == "edited"
+
+    async def test_rollback_discards_alerts(self, session):
+        session.add(make_stock(1))
+        await session.flush()
+        await session.rollback()
+
+        assert await all_alerts(session) == []
+
+    async def test_unit_dates_raise_alerts(self, session):
+        now = datetime.now(timezone.utc)
+        session.add_all([
+            make_unit(1, next_maintenance_date=now + timedelta(days=3)),
+            make_unit(2, warranty_expiry=now + timedelta(days=10)),
+            make_unit(3, next_maintenance_date=now + timedelta(days=60), warranty_expiry=now + timedelta(days=90)),
+        ])
+        await session.commit()
+
+        alerts = await all_alerts(session)
+        assert sorted((alert.alert_type, alert.message) for alert in alerts) == [
+            (InventoryAlertType.MAINTENANCE_DUE.value, "Maintenance due for unit DRL-001"),
+            (InventoryAlertType.WARRANTY_EXPIRING.value, "Warranty expiring for unit DRL-002"),
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAcknowledgeAndRead:
+    """Test reading and acknowledging live alerts."""
+
+    async def test_acknowledged_alert_reopens_when_stock_runs_out(self, session):
+        stock = make_stock(3)
+        session.add(stock)
+        await session.commit()
+        [alert] = await all_alerts(session)
+        user_id = uuid4()
+
+        acknowledged = await InventoryService().acknowledge_alert(session, alert_id=alert.id, acknowledged_by=user_id)
+        await session.commit()
+        assert (acknowledged.status, acknowledged.acknowledged_by) == (InventoryAlertStatus.ACKNOWLEDGED.value, user_id)
+        assert await InventoryService().get_inventory_alerts(session, include_acknowledged=False) == []
+
+        set_available(stock, "0")
+        await session.commit()
+        [alert] = await InventoryService().get_inventory_alerts(session, include_acknowledged=False)
+        assert (alert.status, alert.severity) == (InventoryAlertStatus.OPEN.value, InventoryAlertSeverity.HIGH.value)
+
+    async def test_resolved_alert_cannot_be_acknowledged(self, session):
+        stock = make_stock(3)
+        session.add(stock)
+        await session.commit()
+        set_available(stock, "9")
+        await session.commit()
+        [alert] = await all_alerts(session)
+
+        with pytest.raises(ValueError):
+            await inventory_alert.acknowledge(session, alert_id=alert.id, acknowledged_by=uuid4())
+        assert await inventory_alert.acknowledge(session, alert_id=uuid4(), acknowledged_by=uuid4()) is None
+
+    async def test_filters(self, session):
+        low, empty = make_stock(3), make_stock(0)
+        session.add_all([low, empty])
+        await session.commit()
+
+        high = await InventoryService().get_inventory_alerts(session, severity=InventoryAlertSeverity.HIGH)
+        at_location = await InventoryService().get_inventory_alerts(session, location_id=low.location_id)
+
+        assert [alert.subject_id for alert in high] == [empty.id]
+        assert [alert.subject_id for alert in at_location] == [low.id]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSweep:
+    """Test the periodic evaluation of date-based conditions."""
+
+    async def test_sweep_follows_the_clock(self, session):
+        now = datetime.now(timezone.utc)
+        unit = make_unit(1, warranty_expiry=now + timedelta(days=40))
+        session.add(unit)
+        await session.commit()
+        assert await all_alerts(session) == []
+
+        results = await inventory_alert.sweep(session, now=now + timedelta(days=15))
+        await session.commit()
+        assert results[InventoryAlertType.WARRANTY_EXPIRING.value]["raised"] == 1
+
+        # Sweeping again is idempotent
+        results = await inventory_alert.sweep(session, now=now + timedelta(days=16))
+        assert results[InventoryAlertType.WARRANTY_EXPIRING.value] == {"raised": 0, "refreshed": 0, "resolved": 0}
+
+        results = await inventory_alert.sweep(session, now=now + timedelta(days=41))
+        await session.commit()
+        assert results[InventoryAlertType.WARRANTY_EXPIRING.value]["resolved"] == 1
+
+    async def test_sweep_catches_bulk_updates(self, session):
+        stock = make_stock(10)
+        session.add(stock)
+        await session.commit()
+
+        await session.execute(
+            update(StockLevel).values(quantity_on_hand=0, quantity_available=0).execution_options(synchronize_session=False)
+        )
+        await inventory_alert.sweep(session)
+        await session.commit()
+
+        [alert] = await all_alerts(session)
+        assert (alert.subject_id, alert.severity) == (stock.id, InventoryAlertSeverity.HIGH.value)
@@ -18,7 +18,8 @@ from app.services.inventory.inventory_service import InventoryService, inventory
 from app.models.inventory.enums import (
     StockMovementType,
     InventoryUnitStatus,
-    InventoryUnitCondition
+    InventoryUnitCondition,
+    InventoryAlertSeverity
 )
 from app.schemas.inventory.stock_level import (
     StockAdjustment,
@@ -974,83 +975,43 @@ class TestInventoryService:
         db_session: AsyncSession,
         service: InventoryService
     ):
-        """Test comprehensive inventory alerts generation."""
+        """Test inventory alerts are served from the materialized alert table."""
         location_id = uuid4()
         
-        # Mock low stock items
-        low_stock_item = MagicMock()
-        low_stock_item.item_id = uuid4()
-        low_stock_item.location_id = location_id
-        low_stock_item.quantity_available = Decimal("2.00")
-        low_stock_item.reorder_point = Decimal("5.00")
+        # Mock materialized alerts
+        low_stock_alert = MagicMock()
+        low_stock_alert.alert_type = 'LOW_STOCK'
+        low_stock_alert.severity = 'high'
+        low_stock_alert.quantity = Decimal("0.00")
         
-        out_of_stock_item = MagicMock()
-        out_of_stock_item.item_id = uuid4()
-        out_of_stock_item.location_id = location_id
-        out_of_stock_item.quantity_available = Decimal("0.00")
-        out_of_stock_item.reorder_point = Decimal("10.00")
+        maintenance_alert = MagicMock()
+        maintenance_alert.alert_type = 'MAINTENANCE_DUE'
+        maintenance_alert.severity = 'medium'
+        maintenance_alert.message = "Maintenance due for unit MAINT-001"
         
-        # Mock maintenance due units
-        maintenance_unit = MagicMock()
-        maintenance_unit.id = uuid4()
-        maintenance_unit.item_id = uuid4()
-        maintenance_unit.location_id = location_id
-        maintenance_unit.sku = "MAINT-001"
-        maintenance_unit.next_maintenance_date = datetime.now() + timedelta(days=3)
-        
-        # Mock warranty expiring units
-        warranty_unit = MagicMock()
-        warranty_unit.id = uuid4()
-        warranty_unit.item_id = uuid4()
-        warranty_unit.location_id = location_id
-        warranty_unit.sku = "WARR-001"
-        warranty_unit.warranty_expiry = datetime.now().date() + timedelta(days=15)
-        
-        with patch('app.services.inventory.inventory_service.stock_level') as mock_stock_crud, \
-             patch('app.services.inventory.inventory_service.inventory_unit') as mock_unit_crud:
+        with patch('app.services.inventory.inventory_service.inventory_alert') as mock_alert_crud:
             
-            mock_stock_crud.get_low_stock_items.return_value = [low_stock_item, out_of_stock_item]
-            mock_unit_crud.get_maintenance_due.return_value = [maintenance_unit]
-            mock_unit_crud.get_expiring_warranties.return_value = [warranty_unit]
+            mock_alert_crud.get_live = AsyncMock(return_value=[low_stock_alert, maintenance_alert])
             
             alerts = await service.get_inventory_alerts(
                 db_session,
-                location_id=location_id
+                location_id=location_id,
+                severity=InventoryAlertSeverity.HIGH,
+                include_acknowledged=False
             )
             
-            assert len(alerts) == 4
-            
-            # Check alert types
-            alert_types = [alert['alert_type'] for alert in alerts]
-            assert 'LOW_STOCK' in alert_types
-            assert 'MAINTENANCE_DUE' in alert_types
-            assert 'WARRANTY_EXPIRING' in alert_types
-            
-            # Check severity levels
-            low_stock_alerts = [a for a in alerts if a['alert_type'] == 'LOW_STOCK']
-            assert len(low_stock_alerts) == 2
-            
-            # Out of stock should be high severity
-            high_severity_alerts = [a for a in low_stock_alerts if a['severity'] == 'high']
-            assert len(high_severity_alerts) == 1
-            assert high_severity_alerts[0]['quantity'] == 0.0
-            
-            # Low stock should be medium severity
-            medium_severity_alerts = [a for a in low_stock_alerts if a['severity'] == 'medium']
-            assert len(medium_severity_alerts) == 1
-            assert medium_severity_alerts[0]['quantity'] == 2.0
-            
-            # Check maintenance alert
-            maintenance_alerts = [a for a in alerts if a['alert_type'] == 'MAINTENANCE_DUE']
-            assert len(maintenance_alerts) == 1
-            assert maintenance_alerts[0]['severity'] == 'medium'
-            assert 'MAINT-001' in maintenance_alerts[0]['message']
-            
-            # Check warranty alert
-            warranty_alerts = [a for a in alerts if a['alert_type'] == 'WARRANTY_EXPIRING']
-            assert len(warranty_alerts) == 1
-            assert warranty_alerts[0]['severity'] == 'low'
-            assert 'WARR-001' in warranty_alerts[0]['message']
+            assert alerts == [low_stock_alert, maintenance_alert]
+            
+            # Filters are passed through to the indexed read
+            mock_alert_crud.get_live.assert_awaited_once_with(
+                db_session,
+                location_id=location_id,
+                alert_type=None,
+                severity=InventoryAlertSeverity.HIGH,
+                include_acknowledged=False,
+                skip=0,
+                limit=100
+            )
     
     @pytest.mark.asyncio
     async def test_get_inventory_alerts_no_alerts(
@@ -1059,12 +1020,9 @@ class TestInventoryService:
         service: InventoryService
     ):
         """Test inventory alerts when no alerts exist."""
-        with patch('app.services.inventory.inventory_service.stock_level') as mock_stock_crud, \
-             patch('app.services.inventory.inventory_service.inventory_unit') as mock_unit_crud:
+        with patch('app.services.inventory.inventory_service.inventory_alert') as mock_alert_crud:
             
-            mock_stock_crud.get_low_stock_items.return_value = []
-            mock_unit_crud.get_maintenance_due.return_value = []
-            mock_unit_crud.get_expiring_warranties.return_value = []
+            mock_alert_crud.get_live = AsyncMock(return_value=[])
             
             alerts = await service.get_inventory_alerts(db_session)
             
@@ -0,0 +1,203 @@
+"""
+Unit tests for the queue-based structured logging pipeline.
+"""
+
+import json
+import logging
+import logging.handlers
+import time
+
+import pytest
+
+from app.core.logger import TransactionLogger, render_markdown
+from app.core.logging_config import (
+    BatchingHandler,
+    DebugSamplingFilter,
+    JSONFormatter,
+    LoggingConfig,
+    LoggingManager,
+    SizeRotatingFileHandler,
+)
+
+
+def _record(level=logging.INFO, name="test", msg="message", **extra):
+    record = logging.makeLogRecord(
+        {"name": name, "levelno": level, "levelname": logging.getLevelName(level), "msg": msg}
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.mark.unit
+class TestJSONFormatter:
+    """Test JSON record rendering."""
+
+    def test_includes_extra_fields(self):
+        line = JSONFormatter().format(_record(request_id="abc", data={"qty": 2}))
+        payload = json.loads(line)
+
+        assert payload["message"] == "message"
+        assert payload["level"] == "INFO"
+        assert payload["request_id"] == "abc"
+        assert payload["data"] == {"qty": 2}
+
+    def test_includes_exception_text(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            record = _record(level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        payload = json.loads(JSONFormatter().format(record))
+        assert "ValueError: boom" in payload["exc_info"]
+
+
+@pytest.mark.unit
+class TestDebugSamplingFilter:
+    """Test sampling of high-volume DEBUG records."""
+
+    def test_keeps_every_nth_debug_record(self):
+        sampler = DebugSamplingFilter(0.25)
+        kept = [sampler.filter(_record(level=logging.DEBUG)) for _ in range(8)]
+
+        assert kept.count(True) == 2
+
+    def test_never_drops_info_and_above(self):
+        sampler = DebugSamplingFilter(0.0)
+
+        assert sampler.filter(_record(level=logging.DEBUG)) is False
+        assert sampler.filter(_record(level=logging.INFO)) is True
+        assert sampler.filter(_record(level=logging.ERROR)) is True
+
+
+@pytest.mark.unit
+class TestBatchingHandler:
+    """Test batched delivery to the target handler."""
+
+    def test_flushes_at_capacity(self):
+        target = _ListHandler()
+        handler = BatchingHandler(target, capacity=3, flush_interval=60)
+
+        handler.handle(_record())
+        handler.handle(_record())
+        assert target.records == []
+
+        handler.handle(_record())
+        assert len(target.records) == 3
+        assert target.flushes == 1
+
+    def test_flushes_immediately_on_error(self):
+        target = _ListHandler()
+        handler = BatchingHandler(target, capacity=100, flush_interval=60)
+
+        handler.handle(_record())
+        handler.handle(_record(level=logging.ERROR))
+
+        assert len(target.records) == 2
+
+    def test_partial_batch_becomes_due(self):
+        target = _ListHandler()
+        handler = BatchingHandler(target, capacity=100, flush_interval=0.01)
+
+        handler.handle(_record())
+        assert not target.records
+        time.sleep(0.02)
+
+        assert handler.is_due()
+        handler.handle(_record())
+        assert len(target.records) == 2
+
+    def test_single_stream_flush_per_batch(self, tmp_path):
+        file_handler = SizeRotatingFileHandler(tmp_path / "app.log", maxBytes=0)
+        flushes = []
+        original = file_handler.stream.flush
+        file_handler.stream.flush = lambda: (flushes.append(1), original())[1]
+        handler = BatchingHandler(file_handler, capacity=5, flush_interval=60)
+
+        for _ in range(5):
+            handler.handle(_record())
+
+        assert len(flushes) == 1
+        assert len((tmp_path / "app.log").read_text().splitlines()) == 5
+
+
+@pytest.mark.unit
+class TestLoggingManager:
+    """Test the queue pipeline end to end."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        config = LoggingConfig(
+            log_directory=str(tmp_path),
+            transaction_log_directory=str(tmp_path / "transactions"),
+            flush_interval=0.05,
+        )
+        manager = LoggingManager(config, configure_root=False)
+        yield manager
+        manager.shutdown()
+
+    def test_queued_logger_writes_json_lines(self, manager, tmp_path):
+        logger = manager.get_queued_logger("test.queued", tmp_path / "queued.log")
+
+        logger.info("first", extra={"event": "one"})
+        logger.warning("second")
+        manager.shutdown()
+
+        lines = [json.loads(l) for l in (tmp_path / "queued.log").read_text().splitlines()]
+        assert [l["message"] for l in lines] == ["first", "second"]
+        assert lines[0]["event"] == "one"
+
+    def test_time_rotation_handler(self, tmp_path):
+        config = LoggingConfig(
+            log_directory=str(tmp_path),
+            transaction_log_directory=str(tmp_path / "transactions"),
+            rotation="time",
+        )
+        manager = LoggingManager(config, configure_root=False)
+        handler = manager._build_file_handler(tmp_path / "timed.log")
+
+        target = handler.target
+        assert isinstance(target, logging.handlers.TimedRotatingFileHandler)
+        handler.close()
+        target.close()
+
+
+@pytest.mark.unit
+class TestTransactionLogger:
+    """Test structured transaction events and the offline renderer."""
+
+    def test_events_render_to_markdown(self, tmp_path):
+        tx_logger = TransactionLogger(log_dir=str(tmp_path), log_type="unittest")
+
+        tx_logger.log_transaction_start({"items": [1, 2], "customer_id": "C1"}, "TX-1")
+        tx_logger.log_validation_step("stock", True)
+        tx_logger.log_success("done", {"total": 10})
+
+        output = tmp_path / "trace.md"
+        markdown = tx_logger.render_markdown(output)
+
+        assert "# Unittest Transaction Debug Log" in markdown
+        assert "**Transaction ID:** TX-1" in markdown
+        assert "**Items Count:** 2" in markdown
+        assert "✅ PASSED Validation: stock" in markdown
+        assert "### ✅ SUCCESS: done" in markdown
+        assert output.read_text() == markdown
+
+    def test_render_missing_file(self, tmp_path):
+        markdown = render_markdown(tmp_path / "missing.jsonl")
+
+        assert markdown.startswith("# Transaction Transaction Debug Log")
@@ -0,0 +1,135 @@
+"""
+Unit tests for the event loop watchdog and blocking-callback detection.
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.loop_monitor import (
+    EventLoopBlockedError,
+    EventLoopLagMonitor,
+    assert_loop_not_blocked,
+)
+from app.core.metrics import event_loop_block_duration, event_loop_blocks
+from app.core.middleware import LoopBlockingGuardMiddleware
+
+
+def blocking_work(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEventLoopWatchdog:
+    """Test stall detection, stack capture and reporting."""
+
+    async def test_stall_captures_blocking_stack(self, caplog):
+        caplog.set_level(logging.WARNING, logger="app.core.loop_monitor")
+        monitor = EventLoopLagMonitor(interval=0.01, block_threshold=0.05)
+        blocks_before = event_loop_blocks.value()
+        durations_before = event_loop_block_duration.count()
+
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            blocking_work(0.2)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        assert len(monitor.stalls) == 1
+        stall = monitor.stalls[0]
+        assert stall.duration >= 0.1
+        assert "blocking_work" in stall.stack
+
+        assert event_loop_blocks.value() == blocks_before + 1
+        assert event_loop_block_duration.count() == durations_before + 1
+
+        records = [r for r in caplog.records if getattr(r, "event", None) == "event_loop_blocked"]
+        assert len(records) == 1
+        assert records[0].duration_ms >= 100
+        assert "blocking_work" in records[0].stack
+
+    async def test_short_callbacks_not_reported(self):
+        monitor = EventLoopLagMonitor(interval=0.01, block_threshold=0.1)
+        await monitor.start()
+        try:
+            for _ in range(5):
+                blocking_work(0.005)
+                await asyncio.sleep(0.01)
+        finally:
+            await monitor.stop()
+
+        assert list(monitor.stalls) == []
+
+    async def test_no_watchdog_without_threshold(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+        await monitor.start()
+        try:
+            assert monitor._watchdog is None
+            blocking_work(0.05)
+            await asyncio.sleep(0.03)
+        finally:
+            await monitor.stop()
+
+        assert list(monitor.stalls) == []
+        assert monitor.last_lag > 0  # the heartbeat still samples lag
+
+    async def test_stop_joins_watchdog(self):
+        monitor = EventLoopLagMonitor(interval=0.01, block_threshold=0.05)
+        await monitor.start()
+        watchdog = monitor._watchdog
+        await monitor.stop()
+
+        assert not monitor.running
+        assert not watchdog.is_alive()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBlockingBudget:
+    """Test the dev/test helpers that fail on blocking code."""
+
+    async def test_assert_loop_not_blocked_fails(self):
+        with pytest.raises(AssertionError, match="blocking_work"):
+            async with assert_loop_not_blocked(budget=0.05):
+                await asyncio.sleep(0.03)
+                blocking_work(0.2)
+
+    async def test_assert_loop_not_blocked_passes(self):
+        async with assert_loop_not_blocked(budget=0.05):
+            await asyncio.sleep(0.05)
+
+    async def test_guard_middleware_fails_blocking_handler(self):
+        monitor = EventLoopLagMonitor(interval=0.01, block_threshold=0.05)
+        app = FastAPI()
+        app.add_middleware(LoopBlockingGuardMiddleware, budget=0.05, monitor=monitor)
+
+        @app.get("/blocking")
+        async def blocking():
+            blocking_work(0.2)
+            return {}
+
+        @app.get("/ok")
+        async def ok():
+            await asyncio.sleep(0.01)
+            return {}
+
+        await monitor.start()
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                assert (await client.get("/ok")).status_code == 200
+                with pytest.raises(EventLoopBlockedError, match="GET /blocking"):
+                    await client.get("/blocking")
+
+            transport = ASGITransport(app=app, raise_app_exceptions=False)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                # The caller sees the failure, not the handler's 200
+                assert (await client.get("/blocking")).status_code == 500
+        finally:
+            await monitor.stop()
@@ -0,0 +1,137 @@
+"""
+Unit tests for runtime metrics collection and the /metrics exposition format.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import InstrumentedAsyncPool
+from app.core.loop_monitor import EventLoopLagMonitor
+from app.core.metrics import (
+    MetricsRegistry,
+    db_pool_checkout_wait,
+    http_request_duration,
+    scheduler_job_duration,
+)
+from app.core.middleware import MetricsMiddleware
+from app.core.scheduler import TaskScheduler
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test metric types and text rendering."""
+
+    def test_counter_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+
+        output = registry.render()
+        assert "# TYPE jobs_total counter" in output
+        assert 'jobs_total{kind="a"} 3' in output
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            histogram.observe(value)
+
+        output = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{le="1"} 3' in output
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in output
+        assert "latency_seconds_count 4" in output
+        assert "latency_seconds_sum 6.25" in output
+
+    def test_gauge_collect_callback(self):
+        registry = MetricsRegistry()
+        registry.gauge("pool", "Pool", ("state",), collect=lambda: {("idle",): 4})
+
+        assert 'pool{state="idle"} 4' in registry.render()
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("c", "C", ("path",)).inc(path='a"b')
+
+        assert 'c{path="a\\"b"} 1' in registry.render()
+
+    def test_duplicate_registration_rejected(self):
+        registry = MetricsRegistry()
+        registry.counter("dup", "Dup")
+
+        with pytest.raises(ValueError):
+            registry.counter("dup", "Dup")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInstrumentation:
+    """Test metric sources wired into the app."""
+
+    async def test_middleware_labels_route_template(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/things/{thing_id}")
+        async def get_thing(thing_id: int):
+            return {"id": thing_id}
+
+        before = http_request_duration.count(method="GET", route="/things/{thing_id}", status="200")
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/things/1")
+            await client.get("/things/2")
+            await client.get("/missing")
+
+        assert http_request_duration.count(method="GET", route="/things/{thing_id}", status="200") == before + 2
+        assert http_request_duration.count(method="GET", route="<unmatched>", status="404") >= 1
+
+    async def test_pool_records_checkout_wait(self):
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=InstrumentedAsyncPool)
+        before = db_pool_checkout_wait.count(pool="default")
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+
+        assert db_pool_checkout_wait.count(pool="default") == before + 1
+
+    async def test_scheduler_job_duration(self):
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        wrapped = TaskScheduler._timed("unit_test_job", job)
+        await wrapped()
+
+        assert calls == [1]
+        assert scheduler_job_duration.count(job_id="unit_test_job", outcome="success") == 1
+
+    async def test_scheduler_job_failure_outcome(self):
+        def job():
+            raise RuntimeError("fail")
+
+        wrapped = TaskScheduler._timed("unit_test_failing_job", job)
+        with pytest.raises(RuntimeError):
+            wrapped()
+
+        assert scheduler_job_duration.count(job_id="unit_test_failing_job", outcome="error") == 1
+
+    async def test_loop_lag_monitor_detects_blocking(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+        await monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.001)
+        await monitor.stop()
+
+        assert monitor.last_lag >= 0.05
+        assert not monitor.running
@@ -0,0 +1,137 @@
+"""
+Unit tests for monthly partition maintenance and chunked event retention.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.transaction import TransactionEventRepository
+from app.db.partitioning import (
+    MonthlyPartition,
+    MonthlyPartitionManager,
+    add_months,
+    month_start,
+)
+from app.models.transaction import TransactionEvent
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(TransactionEvent.metadata.create_all, tables=[TransactionEvent.__table__])
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+def make_event(timestamp: datetime, category: str = "TRANSACTION") -> TransactionEvent:
+    return TransactionEvent(
+        id=uuid4(),
+        transaction_id=uuid4(),
+        event_type="CREATED",
+        description="event",
+        event_category=category,
+        event_timestamp=timestamp,
+    )
+
+
+@pytest.mark.unit
+class TestMonthArithmetic:
+    """Test month boundary helpers."""
+
+    def test_month_start(self):
+        assert month_start(date(2025, 3, 17)) == date(2025, 3, 1)
+
+    def test_add_months_crosses_years(self):
+        assert add_months(date(2025, 11, 20), 2) == date(2026, 1, 1)
+        assert add_months(date(2025, 1, 31), -1) == date(2024, 12, 1)
+
+
+@pytest.mark.unit
+class TestMonthlyPartitionManager:
+    """Test partition naming, DDL and retention selection."""
+
+    def test_partition_for_month(self):
+        manager = MonthlyPartitionManager("transaction_events")
+
+        assert manager.partition_for(date(2025, 12, 5)) == MonthlyPartition(
+            name="transaction_events_p2025_12",
+            start=date(2025, 12, 1),
+            end=date(2026, 1, 1),
+        )
+
+    def test_create_partition_sql_uses_utc_bounds(self):
+        sql = MonthlyPartitionManager("transaction_events").create_partition_sql(date(2025, 2, 10))
+
+        assert "CREATE TABLE IF NOT EXISTS transaction_events_p2025_02 PARTITION OF transaction_events" in sql
+        assert "FROM ('2025-02-01 00:00:00+00') TO ('2025-03-01 00:00:00+00')" in sql
+
+    def test_expired_partitions_end_before_cutoff(self):
+        manager = MonthlyPartitionManager("transaction_events")
+        partitions = [manager.partition_for(date(2025, month, 1)) for month in (1, 2, 3)]
+
+        expired = manager.expired(partitions, cutoff=date(2025, 3, 1))
+
+        assert [partition.name for partition in expired] == [
+            "transaction_events_p2025_01",
+            "transaction_events_p2025_02",
+        ]
+
+    def test_retention_cutoff(self):
+        manager = MonthlyPartitionManager("transaction_events", retention_months=24)
+
+        assert manager.retention_cutoff(date(2025, 10, 18)) == date(2023, 10, 1)
+        assert MonthlyPartitionManager("t").retention_cutoff(date(2025, 10, 18)) is None
+
+    @pytest.mark.asyncio
+    async def test_maintenance_skipped_when_not_partitioned(self, session):
+        manager = MonthlyPartitionManager("transaction_events", retention_months=1)
+
+        assert await manager.maintain(session) == {"partitioned": False}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEventRetention:
+    """Test chunked retention and bounded error queries on the event repository."""
+
+    async def test_delete_old_events_in_chunks(self, session):
+        now = datetime.now(timezone.utc)
+        session.add_all(make_event(now - timedelta(days=10 * i)) for i in range(12))
+        await session.flush()
+
+        deleted = await TransactionEventRepository(session).delete_old_events(
+            now - timedelta(days=55), chunk_size=2
+        )
+
+        remaining = await session.scalar(select(func.count()).select_from(TransactionEvent))
+        assert deleted == 6
+        assert remaining == 6
+
+    async def test_delete_old_events_by_category(self, session):
+        old = datetime.now(timezone.utc) - timedelta(days=400)
+        session.add_all([make_event(old, "ERROR"), make_event(old, "PAYMENT")])
+        await session.flush()
+
+        deleted = await TransactionEventRepository(session).delete_old_events(
+            datetime.now(timezone.utc), event_category="ERROR"
+        )
+
+        assert deleted == 1
+
+    async def test_error_events_default_to_recent_window(self, session):
+        now = datetime.now(timezone.utc)
+        recent, ancient = make_event(now, "ERROR"), make_event(now - timedelta(days=1000), "ERROR")
+        session.add_all([recent, ancient])
+        await session.flush()
+        repo = TransactionEventRepository(session)
+
+        assert [event.id for event in await repo.get_error_events()] == [recent.id]
+        assert len(await repo.get_error_events(since=now - timedelta(days=2000))) == 2
+        assert len(await repo.get_error_events(transaction_id=ancient.transaction_id)) == 1
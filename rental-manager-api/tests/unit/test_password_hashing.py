@@ -0,0 +1,122 @@
+"""
+Unit tests for off-loop password hashing, backpressure and rehash-on-login.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.metrics import password_hash_rejections
+from app.core.security import PasswordHasher, PasswordHashingBusyError
+
+
+def make_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPasswordHasher:
+    """Test hashing on the dedicated executor."""
+
+    async def test_hash_and_verify_off_loop(self):
+        hasher = PasswordHasher(make_context(4), max_workers=1)
+        try:
+            hashed = await hasher.hash("S3cret!pw")
+
+            assert hashed.startswith("$2b$04$")
+            assert await hasher.verify("S3cret!pw", hashed)
+            assert not await hasher.verify("wrong", hashed)
+        finally:
+            hasher.shutdown()
+
+    async def test_runs_on_worker_thread(self):
+        seen = []
+
+        class RecordingContext:
+            def hash(self, password):
+                seen.append(threading.current_thread().name)
+                return password
+
+        hasher = PasswordHasher(RecordingContext(), max_workers=1)
+        try:
+            await hasher.hash("pw")
+        finally:
+            hasher.shutdown()
+
+        assert seen[0].startswith("password-hash")
+
+    async def test_malformed_hash_is_not_verified(self):
+        hasher = PasswordHasher(make_context(4), max_workers=1)
+        try:
+            assert await hasher.verify_and_update("pw", "not-a-hash") == (False, None)
+        finally:
+            hasher.shutdown()
+
+    async def test_rejects_when_queue_full(self):
+        release = threading.Event()
+
+        class SlowContext:
+            def hash(self, password):
+                release.wait(5)
+                return password
+
+        hasher = PasswordHasher(SlowContext(), max_workers=1, max_pending=2)
+        rejections_before = password_hash_rejections.value()
+        try:
+            running = [asyncio.create_task(hasher.hash("pw")) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            assert hasher.pending == 2
+
+            with pytest.raises(PasswordHashingBusyError):
+                await hasher.hash("pw")
+
+            release.set()
+            assert await asyncio.gather(*running) == ["pw", "pw"]
+            assert hasher.pending == 0
+        finally:
+            release.set()
+            hasher.shutdown()
+
+        assert password_hash_rejections.value() == rejections_before + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRehashOnLogin:
+    """Test transparent rehash when the bcrypt cost changes."""
+
+    async def test_outdated_cost_returns_new_hash(self):
+        old_hash = make_context(4).hash("S3cret!pw")
+        hasher = PasswordHasher(make_context(5), max_workers=1)
+        try:
+            verified, new_hash = await hasher.verify_and_update("S3cret!pw", old_hash)
+        finally:
+            hasher.shutdown()
+
+        assert verified
+        assert new_hash.startswith("$2b$05$")
+
+    async def test_current_cost_not_rehashed(self):
+        hasher = PasswordHasher(make_context(4), max_workers=1)
+        try:
+            current = await hasher.hash("S3cret!pw")
+            assert await hasher.verify_and_update("S3cret!pw", current) == (True, None)
+        finally:
+            hasher.shutdown()
+
+    async def test_wrong_password_never_rehashed(self):
+        old_hash = make_context(4).hash("S3cret!pw")
+        hasher = PasswordHasher(make_context(5), max_workers=1)
+        try:
+            assert await hasher.verify_and_update("wrong", old_hash) == (False, None)
+        finally:
+            hasher.shutdown()
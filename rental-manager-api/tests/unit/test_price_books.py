@@ -0,0 +1,253 @@
+"""
+Unit tests for effective-dated price books and their compiled per-worker lookup.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.errors import ConflictError, NotFoundError
+from app.models.cache_version import CacheVersion
+from app.models.item import Item
+from app.models.price_book import PriceBook, PriceBookEntry
+from app.models.transaction.enums import RentalPricingStrategy
+from app.schemas.price_book import PriceBookCreate, PriceBookEntriesUpsert, PriceBookUpdate
+from app.services.price_book import (
+    PRICE_BOOK_NAMESPACE,
+    CompiledPriceBooks,
+    PriceBookCache,
+    PriceBookService,
+)
+from app.services.transaction.pricing_engine import QuoteLine, RentalPricingEngine
+
+ITEM_ID = uuid4()
+LOCATION_ID = uuid4()
+
+
+def rate_row(rate: str, location_id=None, segment=None, start=date(2025, 1, 1), end=None, priority=0, **extra):
+    return SimpleNamespace(
+        item_id=ITEM_ID,
+        price_book_id=uuid4(),
+        location_id=location_id,
+        customer_segment=segment,
+        effective_from=start,
+        effective_to=end,
+        priority=priority,
+        rental_rate_per_day=Decimal(rate),
+        weekly_rate=extra.get("weekly_rate"),
+        monthly_rate=extra.get("monthly_rate"),
+        sale_price=extra.get("sale_price"),
+        security_deposit=extra.get("security_deposit"),
+    )
+
+
+@pytest.mark.unit
+class TestCompiledPriceBooks:
+    """Test rate resolution over compiled books."""
+
+    def test_most_specific_scope_wins(self):
+        compiled = CompiledPriceBooks.compile(1, [
+            rate_row("10.00"),
+            rate_row("9.00", segment="GOLD"),
+            rate_row("8.00", location_id=LOCATION_ID),
+            rate_row("7.00", location_id=LOCATION_ID, segment="GOLD"),
+        ])
+        on = date(2025, 3, 1)
+
+        assert compiled.resolve(ITEM_ID, on).rental_rate_per_day == Decimal("10.00")
+        assert compiled.resolve(ITEM_ID, on, customer_segment="GOLD").rental_rate_per_day == Decimal("9.00")
+        assert compiled.resolve(ITEM_ID, on, location_id=LOCATION_ID).rental_rate_per_day == Decimal("8.00")
+        assert compiled.resolve(ITEM_ID, on, LOCATION_ID, "GOLD").rental_rate_per_day == Decimal("7.00")
+        assert compiled.resolve(ITEM_ID, on, uuid4(), "SILVER").rental_rate_per_day == Decimal("10.00")
+
+    def test_effective_dates_and_priority(self):
+        compiled = CompiledPriceBooks.compile(1, [
+            rate_row("10.00"),
+            rate_row("12.00", start=date(2025, 6, 1), end=date(2025, 9, 1)),
+            rate_row("11.00", start=date(2025, 6, 1), end=date(2025, 9, 1), priority=-1),
+        ])
+
+        assert compiled.resolve(ITEM_ID, date(2025, 5, 31)).rental_rate_per_day == Decimal("10.00")
+        assert compiled.resolve(ITEM_ID, date(2025, 6, 1)).rental_rate_per_day == Decimal("12.00")
+        assert compiled.resolve(ITEM_ID, datetime(2025, 8, 31, 23, tzinfo=timezone.utc)).rental_rate_per_day == Decimal("12.00")
+        assert compiled.resolve(ITEM_ID, date(2025, 9, 1)).rental_rate_per_day == Decimal("10.00")
+
+    def test_unpriced_item_or_date(self):
+        compiled = CompiledPriceBooks.compile(1, [rate_row("10.00", start=date(2025, 1, 1))])
+
+        assert compiled.resolve(uuid4(), date(2025, 3, 1)) is None
+        assert compiled.resolve(ITEM_ID, date(2024, 12, 31)) is None
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[Item.__table__, PriceBook.__table__, PriceBookEntry.__table__, CacheVersion.__table__],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest_asyncio.fixture
+async def item(session):
+    item = Item(
+        id=uuid4(),
+        item_name="Scaffold tower",
+        sku="SCAF-001",
+        rental_rate_per_day=Decimal("20.00"),
+        security_deposit=Decimal("100.00"),
+    )
+    session.add(item)
+    await session.commit()
+    return item
+
+
+def book(code: str, **kwargs) -> PriceBookCreate:
+    return PriceBookCreate(name=code.title(), code=code, effective_from=date(2025, 1, 1), **kwargs)
+
+
+def entries(item_id, rate: str, **kwargs) -> PriceBookEntriesUpsert:
+    return PriceBookEntriesUpsert(entries=[{"item_id": item_id, "rental_rate_per_day": Decimal(rate), **kwargs}])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPriceBookService:
+    """Test edits, version bumps and cache invalidation."""
+
+    async def test_edit_bumps_version_and_refreshes_cache(self, session, item):
+        cache = PriceBookCache(check_interval=3600)
+        service = PriceBookService(session, cache=cache)
+
+        created = await service.create_price_book(book("standard"))
+        await service.upsert_entries(created.id, entries(item.id, "15.00"))
+        rate, version = await service.resolve_price(item.id, date(2025, 3, 1))
+        assert rate.rental_rate_per_day == Decimal("15.00")
+
+        await service.upsert_entries(created.id, entries(item.id, "16.00"))
+        rate, new_version = await service.resolve_price(item.id, date(2025, 3, 1))
+
+        assert rate.rental_rate_per_day == Decimal("16.00")
+        assert new_version == version + 1
+
+    async def test_other_workers_recompile_after_version_check(self, engine, session, item):
+        service = PriceBookService(session, cache=PriceBookCache(check_interval=3600))
+        created = await service.create_price_book(book("standard"))
+        await service.upsert_entries(created.id, entries(item.id, "15.00"))
+
+        stale_worker = PriceBookCache(check_interval=3600)
+        eager_worker = PriceBookCache(check_interval=0)
+        async with AsyncSession(engine) as other:
+            await stale_worker.get(other)
+            await eager_worker.get(other)
+
+        await service.upsert_entries(created.id, entries(item.id, "18.00"))
+
+        async with AsyncSession(engine) as other:
+            stale = (await stale_worker.get(other)).resolve(item.id, date(2025, 3, 1))
+            fresh = (await eager_worker.get(other)).resolve(item.id, date(2025, 3, 1))
+        assert stale.rental_rate_per_day == Decimal("15.00")
+        assert fresh.rental_rate_per_day == Decimal("18.00")
+
+    async def test_deleted_book_stops_applying(self, session, item):
+        service = PriceBookService(session, cache=PriceBookCache(check_interval=3600))
+        created = await service.create_price_book(book("standard"))
+        await service.upsert_entries(created.id, entries(item.id, "15.00"))
+
+        await service.delete_price_book(created.id)
+
+        with pytest.raises(NotFoundError):
+            await service.resolve_price(item.id, date(2025, 3, 1))
+
+    async def test_update_and_duplicate_code(self, session):
+        service = PriceBookService(session, cache=PriceBookCache())
+        created = await service.create_price_book(book("standard"))
+
+        updated = await service.update_price_book(created.id, PriceBookUpdate(priority=5, customer_segment="GOLD"))
+        assert updated.priority == 5
+        assert updated.customer_segment == "GOLD"
+
+        with pytest.raises(ConflictError):
+            await service.create_price_book(book("STANDARD"))
+
+        version = await session.scalar(
+            select(CacheVersion.version).where(CacheVersion.namespace == PRICE_BOOK_NAMESPACE)
+        )
+        assert version == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPricingWithPriceBooks:
+    """Test that quotes take their rates from the compiled price books."""
+
+    async def test_quote_uses_scoped_book_rates(self, session, item):
+        cache = PriceBookCache(check_interval=3600)
+        service = PriceBookService(session, cache=cache)
+        general = await service.create_price_book(book("general"))
+        gold = await service.create_price_book(book("gold", customer_segment="GOLD", location_id=LOCATION_ID))
+        await service.upsert_entries(general.id, entries(item.id, "18.00"))
+        await service.upsert_entries(gold.id, entries(item.id, "15.00", security_deposit=Decimal("50.00")))
+        pricing = RentalPricingEngine(session, price_books=cache)
+        lines = [QuoteLine(item_id=item.id, quantity=2)]
+        start, end = datetime(2025, 3, 1, tzinfo=timezone.utc), datetime(2025, 3, 3, tzinfo=timezone.utc)
+
+        walk_in = await pricing.quote(lines, start, end)
+        gold_customer = await pricing.quote(lines, start, end, location_id=LOCATION_ID, customer_segment="GOLD")
+
+        assert walk_in.lines[0].base_daily_rate == Decimal("18.00")
+        assert walk_in.lines[0].price_book_id == general.id
+        assert walk_in.security_deposit == Decimal("200.00")
+        assert gold_customer.lines[0].base_daily_rate == Decimal("15.00")
+        assert gold_customer.security_deposit == Decimal("100.00")
+
+    async def test_unpriced_item_falls_back_to_item_rate(self, session, item):
+        pricing = RentalPricingEngine(session, price_books=PriceBookCache())
+
+        quote = await pricing.quote(
+            [QuoteLine(item_id=item.id, quantity=1)],
+            datetime(2025, 3, 1, tzinfo=timezone.utc),
+            datetime(2025, 3, 2, tzinfo=timezone.utc),
+        )
+
+        assert quote.lines[0].base_daily_rate == Decimal("20.00")
+        assert quote.lines[0].price_book_id is None
+
+    async def test_tiered_quote_uses_book_weekly_and_monthly_rates(self, session, item):
+        cache = PriceBookCache(check_interval=3600)
+        service = PriceBookService(session, cache=cache)
+        created = await service.create_price_book(book("standard"))
+        await service.upsert_entries(created.id, entries(
+            item.id, "20.00", weekly_rate=Decimal("105.00"), monthly_rate=Decimal("300.00")
+        ))
+        pricing = RentalPricingEngine(session, price_books=cache)
+        start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        lines = [QuoteLine(item_id=item.id, quantity=1)]
+
+        week = await pricing.quote(lines, start, datetime(2025, 3, 8, tzinfo=timezone.utc), RentalPricingStrategy.TIERED)
+        month = await pricing.quote(lines, start, datetime(2025, 3, 31, tzinfo=timezone.utc), RentalPricingStrategy.TIERED)
+        agreed = await pricing.quote(
+            [QuoteLine(item_id=item.id, quantity=1, daily_rate=Decimal("20.00"))],
+            start, datetime(2025, 3, 8, tzinfo=timezone.utc), RentalPricingStrategy.TIERED
+        )
+
+        assert week.lines[0].applied_daily_rate == Decimal("15.00")
+        assert week.subtotal == Decimal("105.00")
+        assert month.lines[0].applied_daily_rate == Decimal("10.00")
+        # An agreed daily rate ignores the book's period rates and gets the generic tier
+        assert agreed.lines[0].applied_daily_rate == Decimal("18.00")
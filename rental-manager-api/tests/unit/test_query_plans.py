@@ -0,0 +1,158 @@
+"""
+Unit tests for the query-plan harness: deterministic datasets, statement
+capture, plan reduction and baseline comparison. EXPLAIN itself needs
+PostgreSQL and is exercised by scripts/query_plan_check.py.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from scripts import plan_datasets
+from scripts.plan_datasets import DATASETS, dataset_id, dataset_rows, item_sku, seed_datasets, table_sizes
+from scripts.query_plans import (
+    PLAN_QUERIES,
+    PlanResult,
+    capture_statements,
+    compare_with_baseline,
+    plan_shape,
+    seq_scans,
+)
+from app.models.item import Item
+
+SCALE = 1000
+
+EXPLAIN_OUTPUT = {
+    "Plan": {
+        "Node Type": "Limit",
+        "Plans": [{
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Index Scan", "Relation Name": "items", "Index Name": "idx_item_sku"},
+                {"Node Type": "Seq Scan", "Relation Name": "brands", "Parallel Aware": True},
+            ],
+        }],
+        "Shared Hit Blocks": 12,
+        "Shared Read Blocks": 3,
+    },
+    "Planning Time": 0.2,
+    "Execution Time": 1.5,
+}
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[table for table, _factory in DATASETS],
+        )
+    yield engine
+    await engine.dispose()
+
+
+def result(name, execution_ms=1.0, shape="Index Scan on items using idx_item_sku", scans=()):
+    return PlanResult(name, shape, execution_ms, 0.1, 10, 0, list(scans))
+
+
+def baseline_of(*results):
+    return {r.name: {"shape": r.shape, "execution_ms": r.execution_ms} for r in results}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDatasets:
+    """Test deterministic dataset seeding."""
+
+    async def test_rows_depend_only_on_scale_and_seed(self):
+        table, factory = DATASETS[3]
+
+        first = list(dataset_rows(table, factory, 200))
+        second = list(dataset_rows(table, factory, 200))
+        other_seed = list(dataset_rows(table, factory, 200, seed=1))
+
+        assert first == second
+        assert first != other_seed
+        assert [row["id"] for row in first] == [row["id"] for row in other_seed]
+
+    async def test_seed_replaces_tables(self, engine, monkeypatch):
+        monkeypatch.setattr(plan_datasets, "INSERT_CHUNK_SIZE", 300)
+        async with engine.begin() as conn:
+            await seed_datasets(conn, 500)
+            written = await seed_datasets(conn, SCALE)
+
+        async with engine.connect() as conn:
+            count = (await conn.execute(select(func.count()).select_from(Item))).scalar_one()
+            sku = (await conn.execute(select(Item.sku).where(Item.id == dataset_id("items", 42)))).scalar_one()
+
+        assert written == table_sizes(SCALE)
+        assert count == SCALE
+        assert sku == item_sku(42)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCapture:
+    """Test that registry entries are reduced to the statements they send."""
+
+    async def test_repository_statements_are_captured(self, engine):
+        async with engine.begin() as conn:
+            await seed_datasets(conn, SCALE)
+
+        async with async_sessionmaker(engine)() as session:
+            single = await capture_statements(session, PLAN_QUERIES["items.get_by_sku"], SCALE)
+            paged = await capture_statements(session, PLAN_QUERIES["items.get_paginated"], SCALE)
+
+        assert len(single) == 1
+        statement, parameters = single[0]
+        assert "FROM items" in statement and item_sku(SCALE // 2) in parameters
+        assert len(paged) == 2  # count and page
+
+
+@pytest.mark.unit
+class TestPlans:
+    """Test plan reduction and baseline comparison."""
+
+    def test_plan_shape_drops_costs(self):
+        assert plan_shape(EXPLAIN_OUTPUT["Plan"]) == (
+            "Limit(Nested Loop(Index Scan on items using idx_item_sku, Seq Scan on brands))"
+        )
+
+    def test_summary_of_repeated_runs(self):
+        slower = dict(EXPLAIN_OUTPUT, **{"Execution Time": 9.0})
+        faster = dict(EXPLAIN_OUTPUT, **{"Execution Time": 1.0})
+
+        summary = PlanResult.from_explain("q", [slower, EXPLAIN_OUTPUT, faster])
+
+        assert summary.execution_ms == 1.5
+        assert (summary.shared_hit_blocks, summary.shared_read_blocks) == (12, 3)
+        assert summary.seq_scans == seq_scans(EXPLAIN_OUTPUT["Plan"]) == ["brands"]
+
+    def test_unexpected_seq_scan_is_an_error(self):
+        allowed = result("items.search", scans=["items"])
+        unexpected = result("items.get_by_sku", scans=["items"])
+
+        findings = compare_with_baseline([allowed, unexpected], baseline_of(allowed, unexpected))
+
+        assert [(f.level, f.name) for f in findings] == [("error", "items.get_by_sku")]
+
+    def test_regression_needs_relative_and_absolute_slowdown(self):
+        baseline = baseline_of(result("items.get_by_sku", 1.0), result("items.get_paginated#2", 10.0))
+        current = [result("items.get_by_sku", 2.5), result("items.get_paginated#2", 20.0)]
+
+        findings = compare_with_baseline(current, baseline, tolerance=0.5, min_delta_ms=2.0)
+
+        assert [(f.level, f.name) for f in findings] == [("error", "items.get_paginated#2")]
+
+    def test_shape_change_and_missing_baseline_are_warnings(self):
+        baseline = baseline_of(result("items.get_by_sku"))
+        current = [result("items.get_by_sku", shape="Seq Scan on items"), result("customers.get_by_code")]
+
+        findings = compare_with_baseline(current, baseline)
+
+        assert [(f.level, f.name, f.message.split(":")[0]) for f in findings] == [
+            ("warning", "items.get_by_sku", "plan changed"),
+            ("warning", "customers.get_by_code", "no baseline"),
+        ]
@@ -0,0 +1,131 @@
+"""
+Unit tests for per-request SQL query profiling and N+1 detection.
+"""
+
+import logging
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.middleware import QueryProfilingMiddleware
+from app.core.query_profiler import (
+    assert_max_queries,
+    count_queries,
+    current_query_stats,
+    fingerprint,
+    query_profiler,
+)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    query_profiler.instrument(engine)
+    yield engine
+    query_profiler.uninstrument(engine)
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    """Test statement normalization."""
+
+    def test_parameters_and_literals_collapse(self):
+        assert fingerprint("SELECT * FROM items WHERE id = $1") == fingerprint(
+            "SELECT * FROM items\n  WHERE id = $2"
+        )
+        assert fingerprint("SELECT 1 WHERE code = 'A'") == "SELECT ? WHERE code = ?"
+
+    def test_in_lists_of_any_length_match(self):
+        assert fingerprint("SELECT * FROM t WHERE id IN (?, ?)") == fingerprint(
+            "SELECT * FROM t WHERE id IN (?, ?, ?, ?)"
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestQueryCounting:
+    """Test query collection against a real engine."""
+
+    async def test_counts_statements_and_repeats(self, engine):
+        with count_queries(engine) as stats:
+            async with engine.connect() as conn:
+                for i in range(3):
+                    await conn.execute(text("SELECT :v"), {"v": i})
+                await conn.execute(text("SELECT 42"))
+
+        assert stats.count == 4
+        assert stats.total_time > 0
+        assert stats.repeated(3) == [("SELECT ?", 4)]
+
+    async def test_nested_collectors_both_record(self, engine):
+        with count_queries() as outer:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                with count_queries() as inner:
+                    await conn.execute(text("SELECT 2"))
+
+        assert outer.count == 2
+        assert inner.count == 1
+
+    async def test_nothing_recorded_outside_collector(self, engine):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert current_query_stats() is None
+
+    async def test_assert_max_queries_fails_over_budget(self, engine):
+        with pytest.raises(AssertionError, match="at most 1 queries, got 2"):
+            async with assert_max_queries(1, engine):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    await conn.execute(text("SELECT 2"))
+
+    async def test_assert_max_queries_within_budget(self, engine):
+        async with assert_max_queries(1, engine) as stats:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        assert stats.count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestQueryProfilingMiddleware:
+    """Test Server-Timing headers and N+1 warnings."""
+
+    @pytest.fixture
+    def app(self, engine):
+        app = FastAPI()
+        app.add_middleware(QueryProfilingMiddleware, repeat_threshold=3)
+
+        @app.get("/items/{count}")
+        async def list_items(count: int):
+            async with engine.connect() as conn:
+                for i in range(count):
+                    await conn.execute(text("SELECT :i"), {"i": i})
+            return {"count": count}
+
+        return app
+
+    async def test_server_timing_header(self, app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/items/2")
+
+        assert response.headers["X-DB-Query-Count"] == "2"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert 'desc="2 queries"' in response.headers["Server-Timing"]
+
+    async def test_repeated_statement_logged_as_n_plus_one(self, app, caplog):
+        caplog.set_level(logging.WARNING, logger="app.core.query_profiler")
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/items/5")
+
+        warnings = [r for r in caplog.records if getattr(r, "event", None) == "n_plus_one"]
+        assert len(warnings) == 1
+        assert warnings[0].route == "/items/{count}"
+        assert warnings[0].query_count == 5
@@ -0,0 +1,261 @@
+"""
+Unit tests for read-replica routing: lag fallback, read-your-writes
+stickiness and tokens, round-robin and the read session dependency.
+
+Two in-memory SQLite engines stand in for the primary and a replica, and
+the lag probe and clock are injected.
+"""
+
+import math
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database import DatabaseManager, db_manager, get_read_db
+from app.core.metrics import db_read_routing
+from app.core.middleware import ReadYourWritesMiddleware
+from app.core.read_replicas import CONSISTENCY_COOKIE, CONSISTENCY_HEADER, Replica, ReplicaRouter, consistency_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProbe:
+    """Lag per replica name; an exception instance is raised instead."""
+
+    def __init__(self, **lags):
+        self.lags = lags
+        self.calls = 0
+
+    async def __call__(self, replica: Replica) -> float:
+        self.calls += 1
+        lag = self.lags[replica.name]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+
+async def sqlite_engine(database: str):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE source (name TEXT)"))
+        await conn.execute(text("INSERT INTO source VALUES (:name)"), {"name": database})
+    return engine
+
+
+def replica(name: str, engine) -> Replica:
+    return Replica(name=name, engine=engine, session_maker=async_sessionmaker(engine, expire_on_commit=False))
+
+
+@pytest_asyncio.fixture
+async def engines():
+    primary, secondary = await sqlite_engine("primary"), await sqlite_engine("replica")
+    yield primary, secondary
+    await primary.dispose()
+    await secondary.dispose()
+
+
+@pytest_asyncio.fixture
+async def manager(engines):
+    primary, secondary = engines
+    manager = DatabaseManager()
+    manager.engine = primary
+    manager.async_session_maker = async_sessionmaker(primary, class_=AsyncSession, expire_on_commit=False)
+    manager.replica_router = ReplicaRouter(
+        [replica("replica", secondary)], probe=FakeProbe(replica=0.5), clock=FakeClock()
+    )
+    return manager
+
+
+async def source_of(session: AsyncSession) -> str:
+    return (await session.execute(text("SELECT name FROM source"))).scalar_one()
+
+
+@pytest.mark.unit
+class TestReplicaRouter:
+    """Test replica selection."""
+
+    @pytest.mark.asyncio
+    async def test_healthy_replica_is_chosen(self, engines):
+        target = replica("a", engines[1])
+        router = ReplicaRouter([target], max_lag=5.0, probe=FakeProbe(a=1.0), clock=FakeClock())
+        before = db_read_routing.value(target="replica", reason="healthy")
+
+        assert await router.choose("client") is target
+        assert db_read_routing.value(target="replica", reason="healthy") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_lagging_or_unreachable_replicas_fall_back_to_primary(self, engines):
+        probe = FakeProbe(a=12.0, b=ConnectionRefusedError("down"))
+        router = ReplicaRouter(
+            [replica("a", engines[1]), replica("b", engines[1])], max_lag=5.0, probe=probe, clock=FakeClock()
+        )
+        before = db_read_routing.value(target="primary", reason="replica_lag")
+
+        assert await router.choose() is None
+        assert router.replicas[1].lag == math.inf
+        assert db_read_routing.value(target="primary", reason="replica_lag") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_lag_is_sampled_once_per_interval(self, engines):
+        clock, probe = FakeClock(), FakeProbe(a=9.0)
+        router = ReplicaRouter([replica("a", engines[1])], max_lag=5.0, check_interval=2.0, probe=probe, clock=clock)
+
+        assert await router.choose() is None
+        probe.lags["a"] = 0.0
+        assert await router.choose() is None  # still the cached sample
+        clock.now += 2.0
+        assert await router.choose() is router.replicas[0]
+        assert probe.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_writer_reads_from_primary_within_window(self, engines):
+        clock = FakeClock()
+        router = ReplicaRouter(
+            [replica("a", engines[1])], sticky_seconds=10.0, probe=FakeProbe(a=0.0), clock=clock
+        )
+        router.record_write("writer")
+
+        assert await router.choose("writer") is None
+        assert await router.choose("someone-else") is router.replicas[0]
+        clock.now += 10.0
+        assert await router.choose("writer") is router.replicas[0]
+
+    @pytest.mark.asyncio
+    async def test_round_robin_skips_lagging_replica(self, engines):
+        replicas = [replica(name, engines[1]) for name in ("a", "b", "c")]
+        router = ReplicaRouter(replicas, max_lag=5.0, probe=FakeProbe(a=0.0, b=60.0, c=1.0), clock=FakeClock())
+
+        chosen = [(await router.choose()).name for _ in range(4)]
+
+        assert chosen == ["a", "c", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_token_keeps_writer_on_primary_in_any_worker(self, engines):
+        clock = FakeClock()
+        worker, other = (
+            ReplicaRouter(
+                [replica("a", engines[1])], sticky_seconds=10.0, probe=FakeProbe(a=0.0), secret="key", wall_clock=clock
+            )
+            for _ in range(2)
+        )
+        token = worker.issue_token()
+
+        assert await other.choose("writer", token) is None
+        assert await other.choose("writer") is other.replicas[0]
+        clock.now += 10.0
+        assert await other.choose("writer", token) is other.replicas[0]
+
+    def test_forged_tokens_are_ignored(self):
+        clock = FakeClock()
+        router = ReplicaRouter([], secret="key", wall_clock=clock)
+        token = router.issue_token()
+        written_at, _, signature = token.rpartition(".")
+        future = f"{clock.now + 3600:.3f}"
+
+        assert router.token_written_at(token) == clock.now
+        assert ReplicaRouter([], secret="other").token_written_at(token) is None
+        assert router.token_written_at(f"{future}.{signature}") is None
+        assert router.token_written_at(f"{future}.{router._sign(future)}") is None  # from the future
+        assert router.token_written_at("garbage") is None
+
+    def test_consistency_key_prefers_token(self):
+        with_token = consistency_key({"authorization": "Bearer abc"}, "10.0.0.1")
+
+        assert with_token == consistency_key({"authorization": "Bearer abc"}, "10.0.0.2")
+        assert with_token != consistency_key({"authorization": "Bearer xyz"}, "10.0.0.1")
+        assert consistency_key({}, "10.0.0.1") == "host:10.0.0.1"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReadSessions:
+    """Test read session routing and the read-your-writes middleware."""
+
+    async def test_read_session_uses_replica(self, manager):
+        async for session in manager.get_read_session("client"):
+            assert await source_of(session) == "replica"
+
+        manager.replica_router.record_write("client")
+        async for session in manager.get_read_session("client"):
+            assert await source_of(session) == "primary"
+
+    async def test_read_session_maker(self, manager):
+        async with (await manager.read_session_maker("client"))() as session:
+            assert await source_of(session) == "replica"
+
+        manager.replica_router = None
+        async with (await manager.read_session_maker("client"))() as session:
+            assert await source_of(session) == "primary"
+
+    async def test_replica_pools_are_exported(self, manager):
+        pools = manager.pools()
+        assert pools["interactive"] is manager.engine.pool
+        assert pools["replica:replica"] is manager.replica_router.replicas[0].engine.pool
+
+    async def test_middleware_keeps_writer_on_primary(self, manager, monkeypatch):
+        monkeypatch.setattr(db_manager, "async_session_maker", manager.async_session_maker)
+        monkeypatch.setattr(db_manager, "replica_router", manager.replica_router)
+        app = FastAPI()
+
+        @app.get("/source")
+        async def read_source(db: AsyncSession = Depends(get_read_db)):
+            return {"source": await source_of(db)}
+
+        @app.post("/write")
+        async def write():
+            return {}
+
+        app.add_middleware(ReadYourWritesMiddleware)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            writer = {"Authorization": "Bearer writer"}
+            reader = {"Authorization": "Bearer reader"}
+
+            assert (await http.get("/source", headers=writer)).json() == {"source": "replica"}
+            await http.post("/write", headers=writer)
+            assert (await http.get("/source", headers=writer)).json() == {"source": "primary"}
+            http.cookies.clear()  # the reader is another client, without the writer's token
+            assert (await http.get("/source", headers=reader)).json() == {"source": "replica"}
+
+    async def test_token_keeps_writer_on_primary_across_workers(self, manager, monkeypatch):
+        monkeypatch.setattr(db_manager, "async_session_maker", manager.async_session_maker)
+        secondary = manager.replica_router.replicas[0].engine
+        workers = [
+            ReplicaRouter([replica("replica", secondary)], probe=FakeProbe(replica=0.5), secret="key")
+            for _ in range(2)
+        ]
+        app = FastAPI()
+
+        @app.get("/source")
+        async def read_source(db: AsyncSession = Depends(get_read_db)):
+            return {"source": await source_of(db)}
+
+        @app.post("/write")
+        async def write():
+            return {}
+
+        app.add_middleware(ReadYourWritesMiddleware)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            monkeypatch.setattr(db_manager, "replica_router", workers[0])
+            written = await http.post("/write")
+            token = written.headers[CONSISTENCY_HEADER]
+            monkeypatch.setattr(db_manager, "replica_router", workers[1])
+
+            # The cookie comes back by itself...
+            assert http.cookies[CONSISTENCY_COOKIE] == token
+            assert (await http.get("/source")).json() == {"source": "primary"}
+            # ...an API client echoes the header
+            http.cookies.clear()
+            assert (await http.get("/source", headers={CONSISTENCY_HEADER: token})).json() == {"source": "primary"}
+            assert (await http.get("/source")).json() == {"source": "replica"}
@@ -0,0 +1,75 @@
+"""
+Unit tests for lean read-only sessions: autocommit, no commit on exit,
+and the short-lived session the current user is read with.
+"""
+
+import logging
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.deps import get_current_user
+from app.core.database import DatabaseManager
+from app.core.db_pools import BACKGROUND
+from app.core.security import security_manager
+from app.models.unit_of_measurement import UnitOfMeasurement
+from app.models.user import User
+
+
+@pytest_asyncio.fixture
+async def manager():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.metadata.create_all, tables=[User.__table__, UnitOfMeasurement.__table__])
+    manager = DatabaseManager()
+    manager.engine = engine
+    manager.async_session_maker = manager._create_session_maker(engine)
+    manager._lean_session_maker = manager._create_session_maker(engine, lean=True)
+    yield manager
+    await engine.dispose()
+
+
+async def isolation_level(session) -> str:
+    return (await session.connection()).sync_connection.get_execution_options().get("isolation_level", "default")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReadSessions:
+    """Test lean and report read sessions."""
+
+    async def test_lean_session_runs_in_autocommit(self, manager):
+        async for session in manager.get_read_session(lean=True):
+            assert await isolation_level(session) == "AUTOCOMMIT"
+
+        async for session in manager.get_read_session(pool=BACKGROUND):
+            assert await isolation_level(session) == "default"
+
+    async def test_lean_session_discards_pending_changes(self, manager, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.core.database"):
+            async for session in manager.get_read_session(lean=True):
+                session.add(UnitOfMeasurement(id=uuid4(), name="Box"))
+
+        async with manager.async_session_maker() as session:
+            assert (await session.execute(select(UnitOfMeasurement))).first() is None
+        assert "discarded" in caplog.text
+
+    async def test_current_user_read_in_own_session(self, manager, monkeypatch):
+        user = User(
+            id=uuid4(), email="ops@example.com", username="ops", hashed_password="x",
+            first_name="Op", last_name="Erator", role="admin", is_active=True,
+        )
+        async with manager.async_session_maker() as session:
+            session.add(user)
+            await session.commit()
+        monkeypatch.setattr(security_manager, "verify_token", lambda token, token_type: user.id)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+        current = await get_current_user(credentials, manager.lean_session_maker)
+
+        assert current.id == user.id
+        assert current.username == "ops"  # loaded before its session closed
@@ -0,0 +1,162 @@
+"""
+Unit tests for set-based rental blocking: bulk toggle and auto-unblock.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.crud.entity_stats import EntityStatsRepository
+from app.crud.item import ItemRepository
+from app.models.brand import Brand
+from app.models.cache_version import CacheVersion
+from app.models.category import Category
+from app.models.entity_stat import EntityStatCounter
+from app.models.item import Item
+from app.models.item_rental_block_history import ItemRentalBlockHistory
+from app.models.unit_of_measurement import UnitOfMeasurement
+from app.services.item_rental_blocking import AUTO_UNBLOCK_REMARKS, ItemRentalBlockingService
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[
+                Brand.__table__,
+                Category.__table__,
+                UnitOfMeasurement.__table__,
+                Item.__table__,
+                ItemRentalBlockHistory.__table__,
+                EntityStatCounter.__table__,
+                CacheVersion.__table__,
+            ],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def make_item(n, blocked_days_ago=None):
+    item = Item(id=uuid4(), item_name=f"Drill {n}", sku=f"DRL-{n:03d}", rental_rate_per_day=Decimal("1.00"))
+    if blocked_days_ago is not None:
+        item.is_rental_blocked = True
+        item.rental_block_reason = "Damaged"
+        item.rental_blocked_at = datetime.now(timezone.utc) - timedelta(days=blocked_days_ago)
+    return item
+
+
+async def history_count(session):
+    return (await session.execute(select(func.count()).select_from(ItemRentalBlockHistory))).scalar_one()
+
+
+def service_for(session):
+    return ItemRentalBlockingService(session, ItemRepository(session))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkToggle:
+    """Test the chunked UPDATE ... RETURNING bulk toggle."""
+
+    async def test_blocks_items_and_records_history(self, session, monkeypatch):
+        monkeypatch.setattr(settings, "JOB_CHUNK_SIZE", 2)
+        items = [make_item(n) for n in range(3)]
+        session.add_all(items)
+        await session.commit()
+        user_id = uuid4()
+        missing = uuid4()
+
+        result = await service_for(session).bulk_toggle_rental_status(
+            [item.id for item in items] + [missing], True, "Recall", user_id
+        )
+
+        assert (result.success_count, result.failure_count) == (3, 1)
+        assert result.failed_items == [{"item_id": str(missing), "error": f"Item with id {missing} not found"}]
+        rows = (await session.execute(
+            select(Item.is_rental_blocked, Item.rental_block_reason, Item.rental_blocked_by, Item.updated_by)
+        )).all()
+        assert set(rows) == {(True, "Recall", user_id, str(user_id))}
+        assert await history_count(session) == 3
+
+    async def test_items_already_in_state_succeed_without_history(self, session):
+        items = [make_item(0, blocked_days_ago=1), make_item(1)]
+        session.add_all(items)
+        await session.commit()
+
+        result = await service_for(session).bulk_toggle_rental_status(
+            [item.id for item in items], True, None, uuid4()
+        )
+
+        assert result.success_count == 2
+        assert await history_count(session) == 1
+        reason = (await session.execute(select(Item.rental_block_reason).where(Item.id == items[1].id))).scalar_one()
+        assert reason == "Manual block"
+
+    async def test_counters_move_without_recount(self, session):
+        service = service_for(session)  # its item repository tracks the session's writes
+        items = [make_item(n) for n in range(3)]
+        session.add_all(items)
+        await session.commit()
+
+        await service.bulk_toggle_rental_status([item.id for item in items[:2]], True, None, uuid4())
+
+        repository = EntityStatsRepository(session)
+        assert await repository.marked() == []
+        stats = await repository.get(Item.__tablename__)
+        assert stats.buckets("is_rental_blocked") == {"true": 2, "false": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAutoUnblock:
+    """Test the set-based auto-unblock sweep."""
+
+    async def test_honours_auto_unblock_after_days(self, session, monkeypatch):
+        monkeypatch.setattr(settings, "JOB_CHUNK_SIZE", 2)
+        expired = [make_item(n, blocked_days_ago=100) for n in range(5)]
+        recent = make_item(9, blocked_days_ago=10)
+        session.add_all(expired + [recent])
+        await session.commit()
+
+        unblocked = await service_for(session).auto_unblock_expired_items(auto_unblock_after_days=90)
+
+        assert sorted(unblocked) == sorted(item.id for item in expired)
+        blocked = (await session.execute(select(Item.id).where(Item.is_rental_blocked == True))).scalars().all()
+        assert blocked == [recent.id]
+        history = (await session.execute(select(ItemRentalBlockHistory))).scalars().all()
+        assert len(history) == 5
+        assert {(entry.is_blocked, entry.previous_status, entry.remarks) for entry in history} == {
+            (False, True, AUTO_UNBLOCK_REMARKS)
+        }
+
+    async def test_limit_caps_one_call(self, session):
+        session.add_all(make_item(n, blocked_days_ago=100 + n) for n in range(3))
+        await session.commit()
+        service = service_for(session)
+
+        first = await service.auto_unblock_expired_items(auto_unblock_after_days=90, limit=2)
+        second = await service.auto_unblock_expired_items(auto_unblock_after_days=90, limit=2)
+
+        assert (len(first), len(second)) == (2, 1)
+
+    async def test_history_endpoint_data_reads_recorded_changes(self, session):
+        item = make_item(0, blocked_days_ago=100)
+        session.add(item)
+        await session.commit()
+        service = service_for(session)
+
+        await service.auto_unblock_expired_items(auto_unblock_after_days=90)
+        history, total = await service.get_item_rental_history(item.id)
+
+        assert total == 1
+        assert history[0]["remarks"] == AUTO_UNBLOCK_REMARKS
+        assert history[0]["is_blocked"] is False
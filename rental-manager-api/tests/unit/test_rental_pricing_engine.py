@@ -0,0 +1,206 @@
+"""
+Unit tests for the batch rental pricing engine.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.errors import NotFoundError, ValidationError
+from app.models.cache_version import CacheVersion
+from app.models.item import Item
+from app.models.price_book import PriceBook, PriceBookEntry
+from app.models.transaction.enums import RentalPricingStrategy
+from app.services.price_book import price_book_cache
+from app.services.transaction.pricing_engine import (
+    PricingRule,
+    QuoteLine,
+    RentalPricingEngine,
+    TaxRule,
+    default_rules,
+    rental_days,
+)
+
+
+def at(month: int, day: int, hour: int = 9) -> datetime:
+    return datetime(2025, month, day, hour, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[Item.__table__, PriceBook.__table__, PriceBookEntry.__table__, CacheVersion.__table__],
+        )
+    price_book_cache.clear()
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with AsyncSession(engine) as session:
+        yield session
+
+
+async def add_item(session: AsyncSession, rate: str, deposit: str = "0", **kwargs) -> Item:
+    item = Item(
+        id=uuid4(),
+        item_name=f"Item {rate}",
+        sku=f"SKU-{uuid4().hex[:8]}",
+        rental_rate_per_day=Decimal(rate),
+        security_deposit=Decimal(deposit),
+        **kwargs,
+    )
+    session.add(item)
+    await session.flush()
+    return item
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRentalPricingEngine:
+    """Test quoting whole orders with pluggable rules."""
+
+    async def test_standard_quote_totals(self, session):
+        drill = await add_item(session, "12.50", deposit="40")
+        ladder = await add_item(session, "5.00")
+
+        quote = await RentalPricingEngine(session).quote(
+            [
+                QuoteLine(item_id=drill.id, quantity=2, discount_percent=Decimal("10")),
+                QuoteLine(item_id=ladder.id, quantity=1),
+            ],
+            start_date=at(3, 1),
+            end_date=at(3, 4),
+        )
+
+        assert quote.rental_days == 3
+        assert [line.subtotal for line in quote.lines] == [Decimal("75.00"), Decimal("15.00")]
+        assert quote.lines[0].discount_amount == Decimal("7.50")
+        assert quote.lines[0].line_total == Decimal("67.50")
+        assert quote.subtotal == Decimal("90.00")
+        assert quote.discount_amount == Decimal("7.50")
+        assert quote.tax_amount == Decimal("8.25")
+        assert quote.total_amount == Decimal("90.75")
+        assert quote.security_deposit == Decimal("80.00")
+        assert quote.line_count == 2
+
+    async def test_items_are_loaded_in_one_query(self, engine, session):
+        items = [await add_item(session, "3.00") for _ in range(25)]
+        await price_book_cache.get(session)  # compiled price books are reused between quotes
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+        try:
+            quote = await RentalPricingEngine(session).quote(
+                [QuoteLine(item_id=item.id, quantity=1) for item in items],
+                start_date=at(3, 1),
+                end_date=at(3, 2),
+            )
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+        assert len(statements) == 1
+        assert quote.subtotal == Decimal("75.00")
+
+    async def test_agreed_rate_overrides_catalog_rate(self, session):
+        item = await add_item(session, "10.00")
+
+        quote = await RentalPricingEngine(session).quote(
+            [QuoteLine(item_id=item.id, quantity=1, daily_rate=Decimal("8.00"))],
+            start_date=at(3, 1),
+            end_date=at(3, 3),
+        )
+
+        assert quote.lines[0].base_daily_rate == Decimal("8.00")
+        assert quote.subtotal == Decimal("16.00")
+
+    @pytest.mark.parametrize(
+        "strategy, start, end, applied_rate",
+        [
+            (RentalPricingStrategy.STANDARD, at(7, 1), at(7, 11), Decimal("10.00")),
+            (RentalPricingStrategy.TIERED, at(3, 1), at(3, 6), Decimal("10.00")),
+            (RentalPricingStrategy.TIERED, at(3, 1), at(3, 11), Decimal("9.00")),
+            (RentalPricingStrategy.TIERED, at(3, 1), at(4, 5), Decimal("8.00")),
+            (RentalPricingStrategy.SEASONAL, at(7, 1), at(7, 3), Decimal("12.00")),
+            (RentalPricingStrategy.SEASONAL, at(12, 1), at(12, 3), Decimal("9.00")),
+            (RentalPricingStrategy.SEASONAL, at(4, 1), at(4, 3), Decimal("10.00")),
+        ],
+    )
+    async def test_strategy_rules(self, session, strategy, start, end, applied_rate):
+        item = await add_item(session, "10.00")
+
+        quote = await RentalPricingEngine(session).quote(
+            [QuoteLine(item_id=item.id, quantity=1)], start_date=start, end_date=end, strategy=strategy
+        )
+
+        assert quote.lines[0].applied_daily_rate == applied_rate
+        assert quote.subtotal == applied_rate * quote.rental_days
+
+    async def test_missing_item_raises_not_found(self, session):
+        item = await add_item(session, "10.00")
+
+        with pytest.raises(NotFoundError):
+            await RentalPricingEngine(session).quote(
+                [QuoteLine(item_id=item.id, quantity=1), QuoteLine(item_id=uuid4(), quantity=1)],
+                start_date=at(3, 1),
+                end_date=at(3, 2),
+            )
+
+    async def test_unavailable_items_are_reported(self, session):
+        available = await add_item(session, "10.00")
+        not_rentable = await add_item(session, "10.00", is_rentable=False)
+        blocked = await add_item(session, "10.00")
+        blocked.is_rental_blocked = True
+        await session.flush()
+
+        with pytest.raises(ValidationError) as exc:
+            await RentalPricingEngine(session).quote(
+                [QuoteLine(item_id=item.id, quantity=1) for item in (available, not_rentable, blocked)],
+                start_date=at(3, 1),
+                end_date=at(3, 2),
+            )
+
+        assert set(exc.value.details["unavailable_items"]) == {str(not_rentable.id), str(blocked.id)}
+
+    async def test_rejects_empty_order_and_reversed_dates(self, session):
+        item = await add_item(session, "10.00")
+        pricing = RentalPricingEngine(session)
+
+        with pytest.raises(ValidationError):
+            await pricing.quote([], start_date=at(3, 1), end_date=at(3, 2))
+        with pytest.raises(ValidationError):
+            await pricing.quote([QuoteLine(item_id=item.id, quantity=1)], start_date=at(3, 2), end_date=at(3, 1))
+
+    async def test_custom_rules(self, session):
+        item = await add_item(session, "10.00")
+
+        class WeekendSurcharge(PricingRule):
+            name = "weekend_surcharge"
+
+            def apply(self, frame):
+                frame.scale_rates(11_000)
+
+        rules = [WeekendSurcharge()] + [rule for rule in default_rules() if not isinstance(rule, TaxRule)]
+        quote = await RentalPricingEngine(session, rules=rules).quote(
+            [QuoteLine(item_id=item.id, quantity=1)], start_date=at(3, 1), end_date=at(3, 2)
+        )
+
+        assert quote.lines[0].applied_daily_rate == Decimal("11.00")
+        assert quote.tax_amount == Decimal("0.00")
+
+    def test_part_days_round_up(self):
+        assert rental_days(at(3, 1, 9), at(3, 2, 10)) == 2
+        assert rental_days(at(3, 1, 9), at(3, 1, 11)) == 1
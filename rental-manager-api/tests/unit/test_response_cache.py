@@ -0,0 +1,250 @@
+"""
+Unit tests for the catalog response cache: version bumps on writes,
+ETags and conditional GETs answered without the database.
+"""
+
+from typing import List
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.v1.endpoints import brands
+from app.core.database import db_manager
+from app.core.metrics import response_not_modified
+from app.core.response_cache import (
+    CachedRoute,
+    cached_route,
+    catalog_namespace,
+    etag_matches,
+    response_cache,
+    strong_etag,
+    track_catalog_writes,
+)
+from app.crud.cache_version import CacheVersionRepository
+from app.crud.entity_stats import track_counted_writes
+from app.models.brand import Brand
+from app.models.cache_version import CacheVersion
+from app.models.entity_stat import EntityStatCounter
+from app.schemas.brand import BrandSummary
+
+BRANDS = catalog_namespace(Brand.__tablename__)
+
+
+@pytest_asyncio.fixture
+async def engine(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Brand.metadata.create_all,
+            tables=[Brand.__table__, EntityStatCounter.__table__, CacheVersion.__table__],
+        )
+    monkeypatch.setattr(db_manager, "engine", engine)
+    monkeypatch.setattr(db_manager, "async_session_maker", db_manager._create_session_maker(engine))
+    monkeypatch.setattr(db_manager, "_lean_session_maker", db_manager._create_session_maker(engine, lean=True))
+    monkeypatch.setattr(db_manager, "replica_router", None)
+    monkeypatch.setattr(response_cache, "check_interval", 60.0)
+    response_cache.clear()
+    yield engine
+    response_cache.clear()
+    await engine.dispose()
+
+
+class Statements:
+    """Counts statements run on an engine."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._statement)
+
+    def _statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def build_app(renders: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/brands/active/", response_model=List[BrandSummary])
+    async def active_brands(cache: CachedRoute = Depends(cached_route(Brand))):
+        async def render():
+            renders.append(1)
+            result = await cache.session.execute(select(Brand).where(Brand.is_active == True).order_by(Brand.name))
+            return result.scalars().all()
+
+        return await cache.respond(List[BrandSummary], render)
+
+    return app
+
+
+def writer(engine, **kwargs) -> AsyncSession:
+    """A session tracked as the brand repository tracks its session."""
+    session = AsyncSession(engine, **kwargs)
+    track_counted_writes(session)
+    track_catalog_writes(session)
+    return session
+
+
+async def version(engine) -> int:
+    async with AsyncSession(engine) as session:
+        return await CacheVersionRepository(session).get(BRANDS)
+
+
+@pytest.mark.unit
+class TestETags:
+    """Test ETag computation and If-None-Match matching."""
+
+    def test_if_none_match(self):
+        etag = strong_etag(b'{"id":1}')
+
+        assert etag != strong_etag(b'{"id":2}')
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVersionBumps:
+    """Test that catalog writes bump their table's version."""
+
+    async def test_flushed_changes_bump_on_commit(self, engine):
+        brand = Brand(id=uuid4(), name="Bosch")
+        async with writer(engine, expire_on_commit=False) as session:
+            session.add(brand)
+            await session.commit()
+            assert await version(engine) == 1
+
+            brand.description = "Power tools"
+            await session.commit()
+            assert await version(engine) == 2
+
+            session.add(brand)  # unchanged
+            await session.commit()
+            assert await version(engine) == 2
+
+    async def test_bulk_update_bumps_and_rollback_does_not(self, engine):
+        async with writer(engine) as session:
+            await session.execute(update(Brand).values(description="Tools"))
+            await session.commit()
+            assert await version(engine) == 1
+
+            session.add(Brand(id=uuid4(), name="Makita"))
+            await session.flush()
+            await session.rollback()
+            assert await version(engine) == 1
+
+    async def test_versions_are_bumped_once_at_commit(self, engine):
+        upserts = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO cache_versions"):
+                upserts.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        async with writer(engine) as session:
+            session.add(Brand(id=uuid4(), name="Bosch"))
+            await session.flush()
+            await session.execute(update(Brand).values(description="Tools"))
+            session.add(Brand(id=uuid4(), name="Makita"))
+            assert upserts == []
+            await session.commit()
+
+        assert len(upserts) == 1
+        async with AsyncSession(engine) as session:
+            versions = dict((await session.execute(select(CacheVersion.namespace, CacheVersion.version))).all())
+        assert versions == {"catalog:brands": 1, "stats:brands": 1, "stats:brands:recount": 1}
+
+    async def test_untracked_sessions_do_not_bump(self, engine):
+        async with AsyncSession(engine) as session:
+            session.add(Brand(id=uuid4(), name="Bosch"))
+            await session.commit()
+
+        assert await version(engine) == 0
+
+    async def test_commit_makes_worker_recheck(self, engine):
+        assert await response_cache.versions((BRANDS,)) == (0,)
+
+        async with writer(engine) as session:
+            session.add(Brand(id=uuid4(), name="Bosch"))
+            await session.commit()
+
+        assert await response_cache.versions((BRANDS,)) == (1,)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConditionalGet:
+    """Test cached responses and 304s."""
+
+    async def test_repeat_requests_skip_database(self, engine):
+        async with writer(engine) as session:
+            session.add(Brand(id=uuid4(), name="Bosch"))
+            await session.commit()
+        renders, statements = [], Statements(engine)
+        before = response_not_modified.value(route="/brands/active/")
+
+        async with AsyncClient(transport=ASGITransport(app=build_app(renders)), base_url="http://test") as client:
+            first = await client.get("/brands/active/")
+            statements.count = 0
+            again = await client.get("/brands/active/")
+            conditional = await client.get("/brands/active/", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert first.json()[0]["name"] == "Bosch"
+        assert first.headers["ETag"] == strong_etag(first.content)
+        assert again.content == first.content
+        assert conditional.status_code == 304
+        assert conditional.headers["ETag"] == first.headers["ETag"]
+        assert conditional.content == b""
+        assert len(renders) == 1
+        assert statements.count == 0
+        assert response_not_modified.value(route="/brands/active/") == before + 1
+
+    async def test_write_changes_the_etag(self, engine):
+        renders = []
+        async with AsyncClient(transport=ASGITransport(app=build_app(renders)), base_url="http://test") as client:
+            first = await client.get("/brands/active/")
+            async with writer(engine) as session:
+                session.add(Brand(id=uuid4(), name="Makita"))
+                await session.commit()
+            changed = await client.get("/brands/active/", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.json() == []
+        assert changed.status_code == 200
+        assert [brand["name"] for brand in changed.json()] == ["Makita"]
+        assert changed.headers["ETag"] != first.headers["ETag"]
+        assert len(renders) == 2
+
+    async def test_entries_expire(self, engine, monkeypatch):
+        monkeypatch.setattr(response_cache, "max_age", 0.0)
+        renders = []
+        async with AsyncClient(transport=ASGITransport(app=build_app(renders)), base_url="http://test") as client:
+            first = await client.get("/brands/active/")
+            conditional = await client.get("/brands/active/", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert conditional.status_code == 304  # re-rendered, same bytes
+        assert len(renders) == 2
+
+    async def test_brands_endpoint(self, engine):
+        async with writer(engine) as session:
+            session.add(Brand(id=uuid4(), name="Bosch", code="BSH"))
+            await session.commit()
+        app = FastAPI()
+        app.include_router(brands.router, prefix="/brands")
+        statements = Statements(engine)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get("/brands/active/")
+            statements.count = 0
+            conditional = await client.get("/brands/active/", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert first.json()[0]["display_name"] == "Bosch (BSH)"
+        assert conditional.status_code == 304
+        assert statements.count == 0
@@ -0,0 +1,53 @@
+"""
+Unit tests for maintenance leader election in the task scheduler.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import db_manager
+from app.core.scheduler import MaintenanceLeader, TaskScheduler
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMaintenanceLeader:
+    """Test that maintenance jobs run in the elected process only."""
+
+    async def test_leader_only_job_skipped_elsewhere(self, monkeypatch):
+        scheduler = TaskScheduler()
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        wrapped = scheduler._leader_only("unit_test_maintenance", job)
+        leading = {"value": False}
+
+        async def is_leader():
+            return leading["value"]
+
+        monkeypatch.setattr(scheduler.leader, "is_leader", is_leader)
+
+        await wrapped()
+        leading["value"] = True
+        await wrapped()
+
+        assert calls == [1]
+
+    async def test_single_process_database_always_leads(self, monkeypatch):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        monkeypatch.setattr(db_manager, "engine", engine)
+        monkeypatch.setattr(db_manager, "background_engine", None)
+        leader = MaintenanceLeader()
+        try:
+            assert await leader.is_leader()
+            await leader.release()
+        finally:
+            await engine.dispose()
+
+    async def test_no_leader_without_database(self, monkeypatch):
+        monkeypatch.setattr(db_manager, "engine", None)
+        monkeypatch.setattr(db_manager, "background_engine", None)
+
+        assert not await MaintenanceLeader().is_leader()
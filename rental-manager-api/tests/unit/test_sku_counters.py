@@ -0,0 +1,228 @@
+"""
+Unit tests for counter-backed SKU generation: range reservation, seeding
+from existing SKUs, hand-picked SKU claims and the upper(sku) index.
+"""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.errors import ConflictError
+
+from app.models.category import Category
+from app.models.item import Item
+from app.models.sku_counter import SkuCounter
+from app.services import sku_generator as sku_generator_module
+from app.services.sku_generator import SKUGenerator, build_template, template_regex
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[
+                Category.__table__,
+                Item.__table__,
+                SkuCounter.__table__,
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+
+async def add_items(session, *skus, category_id=None):
+    items = [Item(id=uuid4(), item_name=f"Item {sku}", sku=sku, category_id=category_id) for sku in skus]
+    session.add_all(items)
+    await session.commit()
+    return [item.id for item in items]
+
+
+async def skus_by_id(session):
+    result = await session.execute(select(Item.id, Item.sku))
+    return dict(result.all())
+
+
+async def counter_value(session, template):
+    result = await session.execute(select(SkuCounter.next_value).where(SkuCounter.template == template))
+    return result.scalar_one_or_none()
+
+
+@pytest.mark.unit
+class TestTemplates:
+    """Test template building and matching."""
+
+    def test_fixed_fields_are_filled_and_volatile_ones_kept(self):
+        template = build_template(
+            "{category_code}-{date}-{counter:03d}",
+            {"category_code": "elec", "prefix": "ITEM"},
+        )
+
+        assert template == "ELEC-{date}-{counter:03d}"
+
+    def test_unknown_field_raises(self):
+        with pytest.raises(KeyError):
+            build_template("{brand_code}-{counter:03d}", {"prefix": "ITEM"})
+
+    def test_regex_captures_counter(self):
+        regex = template_regex("ELEC-{date}-{counter:03d}")
+
+        assert regex.fullmatch("ELEC-20250101-042").group("counter") == "042"
+        assert regex.fullmatch("ELEC-042") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSkuCounters:
+    """Test SKU numbering from counters."""
+
+    async def test_numbers_are_not_reused_after_delete(self, session):
+        generator = SKUGenerator(session)
+        first = await generator.generate_sku()
+        await add_items(session, first)
+        await session.execute(delete(Item).where(Item.sku == first))
+        await session.commit()
+
+        assert first == "ITEM-00001"
+        assert await generator.generate_sku() == "ITEM-00002"
+
+    async def test_bulk_reservation_is_one_counter_update(self, session, engine):
+        generator = SKUGenerator(session)
+        await generator.generate_sku(prefix="kit")
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        skus = await generator.generate_bulk_skus(3, prefix="kit")
+
+        assert skus == ["KIT-00002", "KIT-00003", "KIT-00004"]
+        assert len(statements) == 1 and statements[0].startswith("UPDATE sku_counters")
+        assert await counter_value(session, "KIT-{counter:05d}") == 5
+
+    async def test_category_counter_is_separate_from_default(self, session):
+        category = Category(id=uuid4(), name="Electronics", category_code="ELEC")
+        session.add(category)
+        await session.commit()
+        generator = SKUGenerator(session)
+
+        await generator.generate_sku()
+        skus = await generator.generate_bulk_skus(2, category_id=category.id)
+
+        assert skus == ["ELEC-00001", "ELEC-00002"]
+        assert await generator.generate_sku() == "ITEM-00002"
+
+    async def test_new_counter_starts_after_existing_skus(self, session):
+        await add_items(session, "ITEM-00007", "ITEM-00041", "ITEM-OLD", "ITEMX-00900")
+
+        assert await SKUGenerator(session).generate_sku() == "ITEM-00042"
+
+    async def test_rollback_returns_reserved_numbers(self, session):
+        generator = SKUGenerator(session)
+        await generator.generate_sku()
+        await session.commit()
+
+        await generator.generate_bulk_skus(5)
+        await session.rollback()
+
+        assert await generator.generate_sku() == "ITEM-00002"
+
+    async def test_claimed_skus_are_skipped(self, session):
+        generator = SKUGenerator(session)
+        await generator.generate_sku()
+
+        await generator.claim_skus(["item-00010", "ITEM-00004", "OTHER-99999"])
+
+        assert await generator.generate_sku() == "ITEM-00011"
+
+    async def test_allocation_skips_reserved_skus(self, session):
+        skus = await SKUGenerator(session).allocate_default_skus(3, {"ITEM-00002", "ITEM-00050"})
+
+        assert skus == ["ITEM-00001", "ITEM-00003", "ITEM-00004"]
+        assert await counter_value(session, "ITEM-{counter:05d}") == 51
+
+    async def test_sku_uniqueness_ignores_case(self, session):
+        await add_items(session, "DRL-001")
+
+        with pytest.raises(IntegrityError):
+            await session.execute(insert(Item.__table__).values(id=uuid4(), item_name="Copy", sku="drl-001"))
+
+
+@pytest.mark.unit
+class TestBatchRegeneration:
+    """Test set-based SKU regeneration."""
+
+    @pytest.mark.asyncio
+    async def test_items_are_renumbered_per_category(self, session, engine, monkeypatch):
+        monkeypatch.setattr(sku_generator_module, "SKU_REWRITE_CHUNK_SIZE", 2)
+        category = Category(id=uuid4(), name="Electronics", category_code="ELEC")
+        session.add(category)
+        await session.commit()
+        plain = await add_items(session, "OLD-1", "OLD-2")
+        electronic = await add_items(session, "OLD-3", "OLD-4", "OLD-5", category_id=category.id)
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        result = await SKUGenerator(session).regenerate_skus(plain + electronic + [uuid4()])
+
+        assert await skus_by_id(session) == {
+            plain[0]: "ITEM-00001", plain[1]: "ITEM-00002",
+            electronic[0]: "ELEC-00001", electronic[1]: "ELEC-00002", electronic[2]: "ELEC-00003",
+        }
+        assert [change.old_sku for change in result.changes] == ["OLD-1", "OLD-2", "OLD-3", "OLD-4", "OLD-5"]
+        assert len(result.missing_items) == 1 and result.conflicts == []
+        item_updates = [sql for sql in statements if sql.startswith("UPDATE items")]
+        assert len(item_updates) == 3  # one per chunk of rewrites
+
+    @pytest.mark.asyncio
+    async def test_dry_run_leaves_items_and_counters_alone(self, session):
+        item_ids = await add_items(session, "OLD-1", "OLD-2")
+        generator = SKUGenerator(session)
+
+        preview = await generator.regenerate_skus(item_ids, dry_run=True)
+        applied = await generator.regenerate_skus(item_ids)
+
+        assert preview.dry_run and not applied.dry_run
+        assert [(c.old_sku, c.new_sku) for c in preview.changes] == [("OLD-1", "ITEM-00001"), ("OLD-2", "ITEM-00002")]
+        assert preview.changes == applied.changes
+
+    @pytest.mark.asyncio
+    async def test_clash_with_another_item_is_refused(self, session):
+        item_ids = await add_items(session, "OLD-1")
+        await add_items(session, "FIXED")
+        generator = SKUGenerator(session)
+
+        preview = await generator.regenerate_skus(item_ids, pattern="fixed", dry_run=True)
+        with pytest.raises(ConflictError, match="FIXED"):
+            await generator.regenerate_skus(item_ids, pattern="fixed")
+        await session.rollback()
+
+        assert preview.conflicts == ["FIXED"]
+        assert (await skus_by_id(session))[item_ids[0]] == "OLD-1"
+
+    @pytest.mark.asyncio
+    async def test_batch_result_keeps_mapping_shape(self, session):
+        item_ids = await add_items(session, "OLD-1")
+        missing = uuid4()
+
+        results = await SKUGenerator(session).batch_regenerate_skus(item_ids + [missing], pattern="BATCH-{counter:03d}")
+
+        assert results == {str(item_ids[0]): "BATCH-001", str(missing): f"ERROR: Item with ID {missing} not found"}
+
+    def test_postgresql_rewrite_joins_a_values_list(self):
+        new_skus = sku_generator_module._sku_values([(uuid4(), "ITEM-00001")])
+        statement = update(Item).where(Item.id == new_skus.c.item_id).values(sku=new_skus.c.sku)
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "FROM (VALUES" in sql and "AS new_skus (item_id, sku)" in sql
@@ -0,0 +1,88 @@
+"""
+Unit tests for the cached hot-lookup statements: values bind per call and
+every call shares one compiled-cache entry.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.crud import statements
+from app.crud.inventory.stock_level import stock_level as crud_stock_level
+from app.crud.item import ItemRepository
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.inventory.inventory_alert import InventoryAlert
+from app.models.inventory.stock_level import StockLevel
+from app.models.item import Item
+from app.models.unit_of_measurement import UnitOfMeasurement
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[
+                Brand.__table__,
+                Category.__table__,
+                UnitOfMeasurement.__table__,
+                Item.__table__,
+                StockLevel.__table__,
+                InventoryAlert.__table__,
+            ],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestCachedStatements:
+    """Test lambda-statement lookups."""
+
+    @pytest.mark.asyncio
+    async def test_item_lookups_bind_each_call(self, session):
+        brand = Brand(id=uuid4(), name="Bosch")
+        items = [Item(id=uuid4(), item_name=f"Drill {n}", sku=f"DRL-{n:03d}", brand_id=brand.id) for n in range(3)]
+        session.add(brand)
+        session.add_all(items)
+        await session.commit()
+        session.expunge_all()
+        repository = ItemRepository(session)
+
+        by_id = [await repository.get_by_id(item.id, include_relations=True) for item in items]
+        by_sku = [await repository.get_by_sku(f"drl-{n:03d}") for n in range(3)]
+
+        assert [item.item_name for item in by_id] == ["Drill 0", "Drill 1", "Drill 2"]
+        assert by_id[1].brand.name == "Bosch"
+        assert [item.id for item in by_sku] == [item.id for item in items]
+        assert await repository.get_by_id(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_stock_level_lookup(self, session):
+        item_id, first, second = uuid4(), uuid4(), uuid4()
+        session.add_all([
+            StockLevel(id=uuid4(), item_id=item_id, location_id=first, quantity_on_hand=Decimal("3")),
+            StockLevel(id=uuid4(), item_id=item_id, location_id=second, quantity_on_hand=Decimal("8")),
+        ])
+        await session.commit()
+
+        found = [
+            await crud_stock_level.get_by_item_location(session, item_id=item_id, location_id=location_id)
+            for location_id in (first, second, uuid4())
+        ]
+
+        assert [level.quantity_on_hand if level else None for level in found] == [3, 8, None]
+
+    def test_calls_share_one_cache_key(self):
+        first = statements.item_by_id(uuid4(), include_relations=True)._generate_cache_key()
+        second = statements.item_by_id(uuid4(), include_relations=True)._generate_cache_key()
+        bare = statements.item_by_id(uuid4())._generate_cache_key()
+
+        assert first.key == second.key != bare.key
+        assert first.bindparams[0].effective_value != second.bindparams[0].effective_value
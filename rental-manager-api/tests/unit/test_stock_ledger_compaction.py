@@ -0,0 +1,182 @@
+"""
+Unit tests for stock movement ledger compaction into monthly balance snapshots.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.inventory import stock_balance_snapshot, stock_movement
+from app.models.inventory import StockBalanceSnapshot, StockMovement, StockMovementType
+
+ITEM_ID = uuid4()
+LOCATION_ID = uuid4()
+TODAY = date(2025, 4, 15)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            StockMovement.metadata.create_all,
+            tables=[StockMovement.__table__, StockBalanceSnapshot.__table__],
+        )
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+class Ledger:
+    """Appends consistent movements for one stock position."""
+
+    def __init__(self, session: AsyncSession, location_id=LOCATION_ID):
+        self.session = session
+        self.location_id = location_id
+        self.stock_level_id = uuid4()
+        self.quantity = Decimal("0")
+
+    async def move(self, when: datetime, change: int, movement_type: StockMovementType) -> StockMovement:
+        movement = StockMovement(
+            id=uuid4(),
+            stock_level_id=self.stock_level_id,
+            item_id=ITEM_ID,
+            location_id=self.location_id,
+            movement_type=movement_type,
+            quantity_change=Decimal(change),
+            quantity_before=self.quantity,
+            quantity_after=self.quantity + change,
+            movement_date=when,
+        )
+        self.quantity += change
+        self.session.add(movement)
+        await self.session.flush()
+        return movement
+
+
+def at(month: int, day: int, hour: int = 12) -> datetime:
+    return datetime(2025, month, day, hour, tzinfo=timezone.utc)
+
+
+async def seed(session: AsyncSession) -> Ledger:
+    ledger = Ledger(session)
+    await ledger.move(at(1, 5), 10, StockMovementType.PURCHASE)
+    await ledger.move(at(1, 20), -3, StockMovementType.RENTAL_OUT)
+    await ledger.move(at(2, 2), 3, StockMovementType.RENTAL_RETURN)
+    await ledger.move(at(2, 14), -4, StockMovementType.SALE)
+    await ledger.move(at(3, 9), 5, StockMovementType.PURCHASE)
+    await ledger.move(at(4, 1), -2, StockMovementType.RENTAL_OUT)
+    return ledger
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStockLedgerCompaction:
+    """Test rolling closed months into per-(item, location, month) snapshots."""
+
+    async def test_compact_month_totals_and_balances(self, session):
+        await seed(session)
+
+        assert await stock_balance_snapshot.compact_month(session, month=date(2025, 2, 1)) == 1
+
+        snapshot = await session.scalar(select(StockBalanceSnapshot))
+        assert snapshot.period_start == date(2025, 2, 1)
+        assert snapshot.opening_quantity == Decimal("7")
+        assert snapshot.closing_quantity == Decimal("6")
+        assert snapshot.movement_count == 2
+        assert snapshot.total_increase == Decimal("3")
+        assert snapshot.total_decrease == Decimal("4")
+        assert snapshot.movements_by_type == {
+            StockMovementType.RENTAL_RETURN.value: 1,
+            StockMovementType.SALE.value: 1,
+        }
+
+    async def test_compact_closed_periods_skips_open_month(self, session):
+        await seed(session)
+
+        result = await stock_balance_snapshot.compact_closed_periods(session, today=TODAY)
+
+        assert result["compacted_months"] == ["2025-01-01", "2025-02-01", "2025-03-01"]
+        assert result["watermark"] == "2025-04-01"
+        periods = await session.scalars(
+            select(StockBalanceSnapshot.period_start).order_by(StockBalanceSnapshot.period_start)
+        )
+        assert list(periods) == [date(2025, 1, 1), date(2025, 2, 1), date(2025, 3, 1)]
+
+    async def test_recompaction_absorbs_late_movements(self, session):
+        ledger = await seed(session)
+        await stock_balance_snapshot.compact_closed_periods(session, today=TODAY)
+
+        # Recorded after March was compacted, dated in March
+        await ledger.move(at(3, 31, 23), 1, StockMovementType.ADJUSTMENT_POSITIVE)
+        result = await stock_balance_snapshot.compact_closed_periods(session, today=TODAY)
+
+        assert result["compacted_months"] == ["2025-03-01"]
+        march = await session.scalar(
+            select(StockBalanceSnapshot).where(StockBalanceSnapshot.period_start == date(2025, 3, 1))
+        )
+        assert march.movement_count == 2
+        assert await session.scalar(select(func.count()).select_from(StockBalanceSnapshot)) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLedgerQueries:
+    """Test that summaries and history combine snapshots with the open ledger."""
+
+    @pytest.mark.parametrize(
+        "date_from, date_to",
+        [
+            (None, None),
+            (at(1, 10), None),
+            (at(2, 1, 0), at(3, 31, 23)),
+            (None, at(3, 1, 0)),
+            (at(1, 15), at(2, 10)),
+        ],
+    )
+    async def test_summary_matches_uncompacted_ledger(self, session, date_from, date_to):
+        await seed(session)
+        raw = await stock_movement.get_summary(
+            session, item_id=ITEM_ID, date_from=date_from, date_to=date_to
+        )
+
+        await stock_balance_snapshot.compact_closed_periods(session, today=TODAY)
+
+        assert await stock_movement.get_summary(
+            session, item_id=ITEM_ID, date_from=date_from, date_to=date_to
+        ) == raw
+
+    async def test_summary_reads_compacted_months_from_snapshots(self, session):
+        await seed(session)
+        raw = await stock_movement.get_summary(session, item_id=ITEM_ID)
+        await stock_balance_snapshot.compact_closed_periods(session, today=TODAY)
+
+        # Once January is compacted its ledger rows are no longer read
+        for movement in await session.scalars(
+            select(StockMovement).where(StockMovement.movement_date < at(2, 1, 0))
+        ):
+            await session.delete(movement)
+        await session.flush()
+
+        summary = await stock_movement.get_summary(session, item_id=ITEM_ID)
+        assert summary == raw
+        assert summary["total_movements"] == 6
+        assert summary["net_change"] == 9.0
+
+    async def test_item_ledger_reads_movements_after_watermark(self, session):
+        await seed(session)
+        second_location = Ledger(session, location_id=uuid4())
+        await second_location.move(at(2, 3), 8, StockMovementType.TRANSFER_IN)
+        await stock_balance_snapshot.compact_closed_periods(session, today=TODAY)
+
+        ledger = await stock_movement.get_item_ledger(session, item_id=ITEM_ID)
+
+        assert ledger["compacted_through"] == date(2025, 3, 1)
+        closing = {snapshot.location_id: snapshot.closing_quantity for snapshot in ledger["balances"]}
+        assert closing == {LOCATION_ID: Decimal("11"), second_location.location_id: Decimal("8")}
+        assert [movement.quantity_change for movement in ledger["movements"]] == [Decimal("-2")]
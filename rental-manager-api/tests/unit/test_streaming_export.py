@@ -0,0 +1,134 @@
+"""
+Unit tests for streaming CSV / NDJSON exports.
+"""
+
+import csv
+import gzip
+import io
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.v1.endpoints import brands
+from app.core.dependencies import get_brand_read_service
+from app.core.streaming_export import ExportFormat, get_export_session_factory, iter_export
+from app.crud.brand import BrandRepository
+from app.crud.item import ItemRepository
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.item import Item
+from app.models.unit_of_measurement import UnitOfMeasurement
+from app.services.brand import BrandService
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Item.metadata.create_all,
+            tables=[Brand.__table__, Category.__table__, UnitOfMeasurement.__table__, Item.__table__],
+        )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        brand = Brand(id=uuid4(), name="Makita", code="MAK")
+        session.add(brand)
+        session.add(Brand(id=uuid4(), name="Retired", code="RET", is_active=False))
+        await session.flush()
+        for n in range(25):
+            session.add(Item(
+                id=uuid4(),
+                item_name=f"Drill {n:02d}",
+                sku=f"DRL-{n:03d}",
+                brand_id=brand.id,
+                rental_rate_per_day=Decimal("12.50"),
+                notes="needs, quoting" if n == 0 else None,
+            ))
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIterExport:
+    """Test chunked encoding of export queries."""
+
+    async def test_csv_has_header_and_every_row(self, session_factory):
+        query = ItemRepository(None).export_query()
+
+        body = await collect(iter_export(session_factory, query, chunk_size=10))
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+
+        assert len(rows) == 25
+        assert rows[0]["item_name"] == "Drill 00"
+        assert rows[0]["brand_name"] == "Makita"
+        assert rows[0]["notes"] == "needs, quoting"
+        assert rows[0]["rental_rate_per_day"] == "12.50"
+        assert rows[1]["notes"] == ""
+        assert rows[0]["status"] == "ACTIVE"
+
+    async def test_chunks_are_yielded_per_partition(self, session_factory):
+        query = ItemRepository(None).export_query()
+
+        chunks = [chunk async for chunk in iter_export(session_factory, query, chunk_size=10)]
+
+        # Header, then 10 + 10 + 5 rows
+        assert len(chunks) == 4
+        assert chunks[0].startswith(b"id,item_name,sku")
+
+    async def test_ndjson(self, session_factory):
+        query = ItemRepository(None).export_query(filters={"sku": "DRL-00"})
+
+        body = await collect(iter_export(session_factory, query, ExportFormat.NDJSON))
+        records = [json.loads(line) for line in body.decode().splitlines()]
+
+        assert len(records) == 10
+        assert records[0]["sku"] == "DRL-000"
+        assert records[0]["rental_rate_per_day"] == "12.50"
+        assert records[0]["is_rentable"] is True
+        assert records[1]["notes"] is None
+
+    async def test_gzip_round_trip(self, session_factory):
+        query = BrandRepository(None).export_query(include_inactive=True)
+
+        body = await collect(iter_export(session_factory, query, compress=True))
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(body).decode())))
+
+        assert [row["name"] for row in rows] == ["Makita", "Retired"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExportEndpoint:
+    """Test the streaming export endpoint."""
+
+    async def test_brand_export_download(self, session_factory):
+        app = FastAPI()
+        app.include_router(brands.router, prefix="/brands")
+        app.dependency_overrides[get_export_session_factory] = lambda: session_factory
+        app.dependency_overrides[get_brand_read_service] = lambda: BrandService(BrandRepository(None))
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            plain = await client.get("/brands/export/stream")
+            packed = await client.get("/brands/export/stream", params={"format": "ndjson", "gzip": True})
+
+        assert plain.status_code == 200
+        assert plain.headers["content-type"].startswith("text/csv")
+        assert 'filename="brands-' in plain.headers["content-disposition"]
+        assert plain.text.splitlines()[1].split(",")[1] == "Makita"
+        assert len(plain.text.splitlines()) == 2
+
+        assert packed.headers["content-type"] == "application/gzip"
+        assert packed.headers["content-disposition"].endswith('.ndjson.gz"')
+        assert json.loads(gzip.decompress(packed.content))["code"] == "MAK"